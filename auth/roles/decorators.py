@@ -1,7 +1,7 @@
 from functools import wraps
 from rest_framework.exceptions import PermissionDenied
 from django.http import JsonResponse
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from auth.user.authentication import CachedJWTAuthentication
 from .permissions import HasAppPermission, PermissionAction
 
 def has_app_permission(app_label: str, action: PermissionAction):
@@ -21,7 +21,7 @@ def has_app_permission(app_label: str, action: PermissionAction):
                 user = getattr(request, "user", None)
                 if not getattr(user, "is_authenticated", False):
                     try:
-                        auth_result = JWTAuthentication().authenticate(request)
+                        auth_result = CachedJWTAuthentication().authenticate(request)
                         if auth_result:
                             request.user = auth_result[0]
                     except Exception:
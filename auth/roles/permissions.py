@@ -1,9 +1,72 @@
+from functools import lru_cache
+
 from rest_framework import permissions
 from rest_framework.exceptions import PermissionDenied
 from typing import Literal, NoReturn
 
 PermissionAction = Literal['view', 'create', 'update', 'delete']
 
+PERMISSION_FIELDS = {
+    'view': 'can_view',
+    'create': 'can_add',
+    'update': 'can_update',
+    'delete': 'can_delete',
+}
+
+
+def normalize_label(label: str) -> str:
+    normalized = (
+        str(label)
+        .strip()
+        .lower()
+        .replace(' ', '_')
+        .replace('-', '_')
+        .replace('/', '_')
+    )
+    while '__' in normalized:
+        normalized = normalized.replace('__', '_')
+    return normalized.strip('_')
+
+
+@lru_cache(maxsize=1024)
+def label_aliases(label: str) -> frozenset:
+    normalized = normalize_label(label)
+    aliases = {normalized}
+
+    # Singular/plural compatibility for legacy DB permissions
+    if normalized.endswith('s'):
+        aliases.add(normalized[:-1])
+    else:
+        aliases.add(f"{normalized}s")
+
+    # Common legacy canonical forms
+    if normalized in {'role', 'roles'}:
+        aliases.update({'role', 'roles'})
+    if normalized in {'user', 'users'}:
+        aliases.update({'user', 'users'})
+
+    return frozenset(aliases)
+
+
+def compile_role_permissions(role) -> dict:
+    """
+    Normalized, alias-expanded label sets of a role keyed by permission field.
+
+    Compiled once per Role instance and kept on it, so cached principals carry
+    their permission sets and checks are plain set lookups.
+    """
+    compiled = getattr(role, '_compiled_permissions', None)
+    if compiled is None:
+        compiled = {}
+        for field in PERMISSION_FIELDS.values():
+            labels = set()
+            for label in getattr(role, field, []) or []:
+                labels.update(label_aliases(label))
+            compiled[field] = frozenset(labels)
+        role._compiled_permissions = compiled
+    return compiled
+
+
 class HasAppPermission(permissions.BasePermission):
     """
     Strictly typed permission checker that raises PermissionDenied.
@@ -13,12 +76,7 @@ class HasAppPermission(permissions.BasePermission):
     def __init__(self, app_label: str, action: PermissionAction):
         self.app_label = app_label
         self.action = action
-        self._permission_fields = {
-            'view': 'can_view',
-            'create': 'can_add',
-            'update': 'can_update',
-            'delete': 'can_delete'
-        }
+        self._permission_fields = PERMISSION_FIELDS
 
     def __call__(self) -> 'HasAppPermission':
         return self
@@ -29,35 +87,10 @@ class HasAppPermission(permissions.BasePermission):
         raise PermissionDenied(detail=detail, code=code)
 
     def _normalize_label(self, label: str) -> str:
-        normalized = (
-            str(label)
-            .strip()
-            .lower()
-            .replace(' ', '_')
-            .replace('-', '_')
-            .replace('/', '_')
-        )
-        while '__' in normalized:
-            normalized = normalized.replace('__', '_')
-        return normalized.strip('_')
+        return normalize_label(label)
 
     def _label_aliases(self, label: str) -> set[str]:
-        normalized = self._normalize_label(label)
-        aliases = {normalized}
-
-        # Singular/plural compatibility for legacy DB permissions
-        if normalized.endswith('s'):
-            aliases.add(normalized[:-1])
-        else:
-            aliases.add(f"{normalized}s")
-
-        # Common legacy canonical forms
-        if normalized in {'role', 'roles'}:
-            aliases.update({'role', 'roles'})
-        if normalized in {'user', 'users'}:
-            aliases.update({'user', 'users'})
-
-        return aliases
+        return set(label_aliases(label))
 
     def has_permission(self, request, view) -> bool:  # type: ignore[override]
         # Authentication check
@@ -88,14 +121,10 @@ class HasAppPermission(permissions.BasePermission):
             )
 
         # Permission check with normalization and legacy aliases
-        allowed_labels = getattr(role, permission_field, []) or []
-        normalized_allowed = set()
-        for label in allowed_labels:
-            normalized_allowed.update(self._label_aliases(label))
-
-        required_labels = self._label_aliases(self.app_label)
+        normalized_allowed = compile_role_permissions(role)[permission_field]
+        required_labels = label_aliases(self.app_label)
 
-        if not (required_labels & normalized_allowed):
+        if normalized_allowed.isdisjoint(required_labels):
            
             # # Backward compatibility:
             # # Some existing roles (e.g., Licensee) were configured with
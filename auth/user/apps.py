@@ -3,3 +3,7 @@ from django.apps import AppConfig
 class AppNameConfig(AppConfig):
     name = 'auth.user';
     verbose_name = 'user';
+
+    def ready(self):
+        from .signals import connect_principal_cache_signals
+        connect_principal_cache_signals()
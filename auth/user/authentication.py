@@ -0,0 +1,98 @@
+"""
+JWT authentication with the user principal cached in the shared cache (Redis).
+
+`CachedJWTAuthentication` resolves the token's user from the cache, loading it
+once with its role, district and subdivision and the role's compiled permission
+sets for the access-token lifetime. Cache keys carry two version counters from
+`utils.cache_versions`: one per user (bumped when that user is saved or
+deleted) and one for everything a principal embeds (bumped when a role,
+district or subdivision changes), so an edit is visible on the next request.
+"""
+import logging
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from auth.roles.permissions import compile_role_permissions
+from utils.cache_versions import bump_version, get_versions
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_KEY_PREFIX = 'auth:principal'
+PRINCIPALS_VERSION = 'auth_principals'
+
+
+def user_version_name(user_id) -> str:
+    return f"auth_user:{user_id}"
+
+
+def invalidate_user_principal(user_id):
+    bump_version(user_version_name(user_id))
+
+
+def invalidate_all_principals():
+    bump_version(PRINCIPALS_VERSION)
+
+
+def _principal_timeout():
+    return int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def _load_user(self, user_id):
+        try:
+            user = (
+                self.user_model.objects.select_related('role', 'district', 'subdivision')
+                .get(**{api_settings.USER_ID_FIELD: user_id})
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if user.role is not None:
+            compile_role_permissions(user.role)
+        return user
+
+    def _cached_user(self, user_id):
+        user_version = user_version_name(user_id)
+        versions = get_versions(user_version, PRINCIPALS_VERSION)
+        if None in versions.values():
+            return self._load_user(user_id)
+
+        key = (
+            f"{PRINCIPAL_KEY_PREFIX}:{user_id}:"
+            f"{versions[user_version]}:{versions[PRINCIPALS_VERSION]}"
+        )
+        try:
+            user = cache.get(key)
+        except Exception:
+            logger.warning("Cache unavailable while reading principal %s", user_id, exc_info=True)
+            return self._load_user(user_id)
+        if user is not None:
+            return user
+
+        user = self._load_user(user_id)
+        try:
+            cache.set(key, user, timeout=_principal_timeout())
+        except Exception:
+            logger.warning("Cache unavailable while storing principal %s", user_id, exc_info=True)
+        return user
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = self._cached_user(user_id)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
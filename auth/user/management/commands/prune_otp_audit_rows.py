@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from auth.user.otp import prune_otp_audit_rows
+
+
+class Command(BaseCommand):
+    help = 'Delete OTP audit rows older than the OTP expiry and send-limit window'
+
+    def handle(self, *args, **options):
+        deleted = prune_otp_audit_rows()
+        self.stdout.write(f'Deleted {deleted} OTP audit rows')
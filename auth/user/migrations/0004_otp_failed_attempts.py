@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-19 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0003_alter_customuser_middle_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='otp',
+            name='failed_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -195,6 +195,7 @@ class OTP(models.Model):
     otp = models.CharField(max_length=128)
     created_at = models.DateTimeField(auto_now_add=True)
     used = models.BooleanField(default=False)
+    failed_attempts = models.PositiveSmallIntegerField(default=0)
 
     @property
     def _expiry_seconds(self):
@@ -1,53 +1,175 @@
-import random
+"""
+OTP issue/verify backed by the shared cache (Redis).
+
+An issued OTP lives in the cache under its otp_id as a keyed HMAC-SHA256 digest
+with the OTP expiry as TTL, next to a failed-attempt counter. Send limits are
+INCR counters per phone number that expire with the limit window. The `OTP`
+table only records an audit row per send (marked used on successful
+verification); it is read only when the cache is unavailable, and then counts
+wrong guesses itself. Rows past both the expiry and the send window are pruned by the
+`prune_otp_audit_rows` command, keeping the send path free of deletes.
+"""
+import logging
+import secrets
 from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Case, F, Value, When
 from django.utils import timezone
-from django.db import transaction
+from django.utils.crypto import constant_time_compare, salted_hmac
+
 from auth.user.models import OTP
-from django.core.cache import cache
-from django.contrib.auth.hashers import make_password, check_password
+
+logger = logging.getLogger(__name__)
+
+OTP_KEY_PREFIX = 'otp'
+HMAC_SALT = 'auth.user.otp'
+
+
+def _expiry_seconds():
+    return getattr(settings, 'OTP_EXPIRY_SECONDS', 600)
+
+
+def _max_attempts():
+    return getattr(settings, 'OTP_MAX_ATTEMPTS', 5)
+
+
+def _send_limit():
+    return getattr(settings, 'OTP_SEND_LIMIT', 3)
+
+
+def _send_window_seconds():
+    return getattr(settings, 'OTP_SEND_WINDOW_SECONDS', 15 * 60)
+
+
+def _code_key(otp_id):
+    return f"{OTP_KEY_PREFIX}:code:{otp_id}"
+
+
+def _attempts_key(otp_id):
+    return f"{OTP_KEY_PREFIX}:attempts:{otp_id}"
+
+
+def _sends_key(phone_number):
+    return f"{OTP_KEY_PREFIX}:sends:{phone_number}"
+
+
+def otp_digest(otp_id, phone_number, otp_value) -> str:
+    """HMAC-SHA256 of the OTP bound to its id and phone number, keyed by SECRET_KEY."""
+    message = f"{otp_id}:{phone_number}:{str(otp_value).strip()}"
+    return salted_hmac(HMAC_SALT, message, algorithm='sha256').hexdigest()
+
+
+def _check_send_limit(phone_number):
+    key = _sends_key(phone_number)
+    try:
+        cache.add(key, 0, timeout=_send_window_seconds())
+        sends = cache.incr(key)
+    except Exception:
+        logger.warning("Cache unavailable for OTP send limit; counting audit rows", exc_info=True)
+        window_start = timezone.now() - timedelta(seconds=_send_window_seconds())
+        sends = OTP.objects.filter(phone_number=phone_number, created_at__gte=window_start).count() + 1
+
+    if sends > _send_limit():
+        minutes = _send_window_seconds() // 60
+        raise ValueError(f"Too many OTP requests. Please try again after {minutes} minutes.")
+
+
+def _retention_seconds():
+    return max(_expiry_seconds(), _send_window_seconds())
+
+
+def prune_otp_audit_rows(phone_number=None):
+    """Delete audit rows too old to verify or to count towards the send limit. Returns the number deleted."""
+    cutoff = timezone.now() - timedelta(seconds=_retention_seconds())
+    stale = OTP.objects.filter(created_at__lt=cutoff)
+    if phone_number is not None:
+        stale = stale.filter(phone_number=phone_number)
+    return stale.delete()[0]
+
 
 def get_new_otp(phone_number):
+    _check_send_limit(phone_number)
+
+    raw_otp_value = str(1000 + secrets.randbelow(9000))
+    otp_obj = OTP(phone_number=phone_number)
+    otp_obj.otp = otp_digest(otp_obj.id, phone_number, raw_otp_value)
+    otp_obj.save()
 
-    fifteen_minutes_ago = timezone.now() - timedelta(minutes=15)
-    recent_otps_count = OTP.objects.filter(
-        phone_number=phone_number,
-        created_at__gte=fifteen_minutes_ago
-    ).count()
-
-    if recent_otps_count >= 3:
-        raise ValueError("Too many OTP requests. Please try again after 15 minutes.")
-    
-    OTP.objects.filter(
-        phone_number=phone_number,
-        created_at__lt=fifteen_minutes_ago,
-        used=False
-    ).delete()
-
-    raw_otp_value = str(random.randint(1000, 9999))
-    hashed_otp = make_password(raw_otp_value)
-    otp_obj = OTP.objects.create(phone_number=phone_number, otp=hashed_otp)
+    try:
+        cache.set(
+            _code_key(otp_obj.id),
+            {'phone_number': phone_number, 'digest': otp_obj.otp},
+            timeout=_expiry_seconds(),
+        )
+    except Exception:
+        logger.warning("Cache unavailable while storing OTP %s", otp_obj.id, exc_info=True)
 
     return otp_obj, raw_otp_value
 
-@transaction.atomic
-def verify_otp(otp_id, phone_number, otp_input):
+
+def _record_failed_attempt(otp_id):
+    """Count a wrong guess; returns True once the OTP has used up its attempts."""
+    key = _attempts_key(otp_id)
+    try:
+        cache.add(key, 0, timeout=_expiry_seconds())
+        attempts = cache.incr(key)
+    except Exception:
+        logger.warning("Cache unavailable while counting OTP attempts %s", otp_id, exc_info=True)
+        return False
+    if attempts >= _max_attempts():
+        cache.delete_many([_code_key(otp_id), _attempts_key(otp_id)])
+        return True
+    return False
+
+
+def _verify_from_audit_row(otp_id, phone_number, otp_input):
+    """Fallback used only when the cache cannot be reached."""
     try:
         otp_obj = OTP.objects.get(id=otp_id, phone_number=phone_number, used=False)
-        if otp_obj.is_expired():
-            otp_obj.delete()
-            return False, "OTP expired."
-        if not check_password(str(otp_input), otp_obj.otp):
-            return False, "Incorrect OTP."
-        
-        otp_obj.used = True
-        otp_obj.save()
-        otp_obj.delete()
-    
-        return True, "OTP verified."
-        
-    except OTP.DoesNotExist:
+    except (OTP.DoesNotExist, ValidationError):
         return False, "Invalid OTP or already used."
-    
+    if otp_obj.is_expired():
+        return False, "OTP expired."
+    if not constant_time_compare(otp_digest(otp_id, phone_number, otp_input), otp_obj.otp):
+        # Count the guess in the row; the guess that reaches the limit also retires the OTP.
+        max_attempts = _max_attempts()
+        OTP.objects.filter(pk=otp_obj.pk, used=False, failed_attempts__lt=max_attempts).update(
+            failed_attempts=F('failed_attempts') + 1,
+            used=Case(When(failed_attempts__gte=max_attempts - 1, then=Value(True)), default=Value(False)),
+        )
+        if OTP.objects.filter(pk=otp_obj.pk, used=True).exists():
+            return False, "Too many incorrect attempts. Please request a new OTP."
+        return False, "Incorrect OTP."
+    if not OTP.objects.filter(pk=otp_obj.pk, used=False).update(used=True):
+        return False, "Invalid OTP or already used."
+    return True, "OTP verified."
+
+
+def verify_otp(otp_id, phone_number, otp_input):
+    try:
+        entry = cache.get(_code_key(otp_id))
+    except Exception:
+        logger.warning("Cache unavailable while verifying OTP %s", otp_id, exc_info=True)
+        return _verify_from_audit_row(otp_id, phone_number, otp_input)
+
+    if entry is None or entry['phone_number'] != phone_number:
+        return False, "Invalid OTP, expired or already used."
+
+    if not constant_time_compare(otp_digest(otp_id, phone_number, otp_input), entry['digest']):
+        if _record_failed_attempt(otp_id):
+            return False, "Too many incorrect attempts. Please request a new OTP."
+        return False, "Incorrect OTP."
+
+    # Single use: whoever deletes the key first wins.
+    if not cache.delete(_code_key(otp_id)):
+        return False, "Invalid OTP, expired or already used."
+    cache.delete(_attempts_key(otp_id))
+    OTP.objects.filter(pk=otp_id).update(used=True)
+    return True, "OTP verified."
+
 
 def mark_phone_as_verified(phone_number: str):
     """Mark this phone as verified for 10 minutes"""
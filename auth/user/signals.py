@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from auth.roles.models import Role
+from models.masters.core.models import District, Subdivision
+
+from .authentication import invalidate_all_principals, invalidate_user_principal
+from .models import CustomUser
+
+
+def invalidate_principal(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user_principal(user_id))
+
+
+def invalidate_principals(sender, **kwargs):
+    transaction.on_commit(invalidate_all_principals)
+
+
+def connect_principal_cache_signals():
+    """Drop cached JWT principals when a user or anything embedded in one changes."""
+    post_save.connect(invalidate_principal, sender=CustomUser, dispatch_uid='principal_cache_save_user')
+    post_delete.connect(invalidate_principal, sender=CustomUser, dispatch_uid='principal_cache_delete_user')
+    for model in (Role, District, Subdivision):
+        name = model._meta.model_name
+        post_save.connect(invalidate_principals, sender=model, dispatch_uid=f'principal_cache_save_{name}')
+        post_delete.connect(invalidate_principals, sender=model, dispatch_uid=f'principal_cache_delete_{name}')
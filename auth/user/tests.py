@@ -1,3 +1,129 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from auth.roles.models import Role
+from auth.roles.permissions import HasAppPermission
+from auth.user.authentication import CachedJWTAuthentication
+from auth.user.models import OTP, CustomUser
+from auth.user.otp import get_new_otp, verify_otp
+from models.masters.core.models import District, State, Subdivision
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    OTP_MAX_ATTEMPTS=3,
+    OTP_SEND_LIMIT=2,
+)
+class OtpStoreTests(TestCase):
+    phone_number = '9999999901'
+
+    def setUp(self):
+        cache.clear()
+
+    def test_otp_is_single_use_and_audited(self):
+        otp_obj, raw_otp = get_new_otp(self.phone_number)
+        self.assertEqual(len(otp_obj.otp), 64)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(verify_otp(otp_obj.id, '9999999902', raw_otp)[0], False)
+        self.assertEqual(verify_otp(otp_obj.id, self.phone_number, raw_otp), (True, "OTP verified."))
+        self.assertFalse(verify_otp(otp_obj.id, self.phone_number, raw_otp)[0])
+        self.assertTrue(OTP.objects.get(pk=otp_obj.pk).used)
+
+    def test_wrong_guesses_discard_otp(self):
+        otp_obj, raw_otp = get_new_otp(self.phone_number)
+        wrong = '0000' if raw_otp != '0000' else '1111'
+        for _ in range(3):
+            self.assertFalse(verify_otp(otp_obj.id, self.phone_number, wrong)[0])
+        self.assertFalse(verify_otp(otp_obj.id, self.phone_number, raw_otp)[0])
+
+    def test_send_limit(self):
+        get_new_otp(self.phone_number)
+        get_new_otp(self.phone_number)
+        with self.assertRaises(ValueError):
+            get_new_otp(self.phone_number)
+
+    def test_audit_row_fallback_limits_wrong_guesses(self):
+        otp_obj, raw_otp = get_new_otp(self.phone_number)
+        wrong = '0000' if raw_otp != '0000' else '1111'
+        with mock.patch('auth.user.otp.cache.get', side_effect=ConnectionError):
+            self.assertEqual(verify_otp(otp_obj.id, self.phone_number, wrong), (False, "Incorrect OTP."))
+            self.assertEqual(verify_otp(otp_obj.id, self.phone_number, wrong), (False, "Incorrect OTP."))
+            self.assertEqual(
+                verify_otp(otp_obj.id, self.phone_number, wrong),
+                (False, "Too many incorrect attempts. Please request a new OTP."),
+            )
+            self.assertFalse(verify_otp(otp_obj.id, self.phone_number, raw_otp)[0])
+        otp_obj.refresh_from_db()
+        self.assertEqual((otp_obj.failed_attempts, otp_obj.used), (3, True))
+
+    def test_old_audit_rows_are_pruned(self):
+        old, _ = get_new_otp(self.phone_number)
+        other, _ = get_new_otp('9999999902')
+        OTP.objects.filter(pk__in=[old.pk, other.pk]).update(created_at=timezone.now() - timedelta(hours=1))
+
+        cache.clear()
+        current, _ = get_new_otp(self.phone_number)
+        # Sending never deletes; pruning is left to the command.
+        self.assertEqual(set(OTP.objects.values_list('pk', flat=True)), {old.pk, other.pk, current.pk})
+
+        call_command('prune_otp_audit_rows', stdout=StringIO())
+        self.assertEqual(list(OTP.objects.values_list('pk', flat=True)), [current.pk])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CachedPrincipalTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        subdivision = Subdivision.objects.create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=district,
+        )
+        self.role = Role.objects.create(name='officer', can_view=['Company Registrations'])
+        self.user = CustomUser.objects.create_user(
+            email='officer@example.com', first_name='Officer', last_name='User', phone_number='9999999911',
+            district=district, subdivision=subdivision, address='Gangtok', password='password123', role=self.role,
+        )
+        token = AccessToken.for_user(self.user)
+        self.request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def _authenticate(self):
+        return CachedJWTAuthentication().authenticate(self.request)[0]
+
+    def _check(self, user, app_label, action='view'):
+        self.request.user = user
+        return HasAppPermission(app_label, action).has_permission(self.request, None)
+
+    def test_principal_and_permissions_are_served_from_cache(self):
+        self._authenticate()
+        with self.assertNumQueries(0):
+            user = self._authenticate()
+            self.assertEqual(user.role.name, 'officer')
+            self.assertEqual(user.district.district, 'Gangtok')
+            self.assertTrue(self._check(user, 'company_registration'))
+            with self.assertRaises(PermissionDenied):
+                self._check(user, 'company_registration', 'create')
+
+    def test_role_and_user_saves_invalidate_the_principal(self):
+        self._authenticate()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.role.can_add = ['company_registration']
+            self.role.save()
+        self.assertTrue(self._check(self._authenticate(), 'company_registration', 'create'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
@@ -33,6 +33,7 @@ from auth.user.otp import (
 )
 from models.transactional.license_renewal_application.models import LicenseApplication
 from models.transactional.logs.models import UserActivity
+from models.transactional.logs.activity_writer import record_activity
 from models.transactional.logs.signals import get_client_ip
 from models.transactional.new_license_application.models import NewLicenseApplication
 from models.masters.supply_chain.profile.models import UserManufacturingUnit
@@ -652,7 +653,7 @@ class UserUpdateView(generics.UpdateAPIView):
 
         self.perform_update(serializer)
 
-        UserActivity.objects.create(
+        record_activity(
             user=request.user,
             activity_type=UserActivity.ActivityType.USER_UPDATE,
             target_user=instance,
@@ -674,7 +675,7 @@ class UserDeleteView(generics.DestroyAPIView):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
 
-        UserActivity.objects.create(
+        record_activity(
             user=request.user,
             activity_type=UserActivity.ActivityType.USER_DELETE,
             target_user=instance,
@@ -705,7 +706,7 @@ class UserToggleActiveView(generics.UpdateAPIView):
         instance.is_active = new_status
         instance.save(update_fields=['is_active'])
 
-        UserActivity.objects.create(
+        record_activity(
             user=request.user,
             activity_type=UserActivity.ActivityType.USER_UPDATE,
             target_user=instance,
@@ -843,7 +844,7 @@ class LoginAPI(APIView):
         try:
             user = validated_data.get('user') or None
             if user:
-                UserActivity.objects.create(
+                record_activity(
                     user=user,
                     activity_type=UserActivity.ActivityType.LOGIN,
                     ip_address=_safe_ip_address(request),
@@ -883,7 +884,7 @@ class LogoutAPI(APIView):
             RefreshToken(refresh_token).blacklist()
             try:
                 # JWT logout does not trigger Django's `user_logged_out` signal.
-                UserActivity.objects.create(
+                record_activity(
                     user=request.user,
                     activity_type=UserActivity.ActivityType.LOGOUT,
                     ip_address=_safe_ip_address(request),
@@ -898,7 +899,7 @@ class LogoutAPI(APIView):
         except TokenError:
             # Token might already be blacklisted; still record logout attempt for auditing.
             try:
-                UserActivity.objects.create(
+                record_activity(
                     user=request.user,
                     activity_type=UserActivity.ActivityType.LOGOUT,
                     ip_address=_safe_ip_address(request),
@@ -1001,7 +1002,7 @@ def verify_otp_api(request):
         # OTP/JWT login does not trigger Django's `user_logged_in` signal.
         # Track login explicitly for OTP-based login too.
         try:
-            UserActivity.objects.create(
+            record_activity(
                 user=user,
                 activity_type=UserActivity.ActivityType.LOGIN,
                 ip_address=_safe_ip_address(request),
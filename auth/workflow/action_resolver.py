@@ -0,0 +1,124 @@
+"""
+Shared lookup of workflow transitions for serializers that expose allowed actions.
+
+A `WorkflowActionResolver` lives in the serializer context for one response.
+`WorkflowActionListSerializer` primes it with the current stages of every row
+before a `many=True` pass, so all rows are answered from a single transition
+query instead of one (or more) queries per row. Single-object serializers load
+a stage's transitions on first use.
+"""
+from django.db import models
+from django.db.models import Q
+from rest_framework import serializers
+
+from .models import WorkflowStage, WorkflowTransition
+from .services import WorkflowService
+
+RESOLVER_CONTEXT_KEY = 'workflow_action_resolver'
+
+
+class WorkflowActionResolver:
+    def __init__(self):
+        self._outgoing = {}
+        self._incoming = {}
+        self._stages_by_workflow = {}
+
+    def prime(self, stage_ids):
+        """Load outgoing and incoming transitions for every stage id not loaded yet."""
+        missing = {stage_id for stage_id in stage_ids if stage_id is not None and stage_id not in self._outgoing}
+        if not missing:
+            return
+        for stage_id in missing:
+            self._outgoing[stage_id] = []
+            self._incoming[stage_id] = []
+        transitions = (
+            WorkflowTransition.objects.filter(Q(from_stage_id__in=missing) | Q(to_stage_id__in=missing))
+            .select_related('to_stage')
+            .order_by('id')
+        )
+        for transition in transitions:
+            if transition.from_stage_id in missing:
+                self._outgoing[transition.from_stage_id].append(transition)
+            if transition.to_stage_id in missing:
+                self._incoming[transition.to_stage_id].append(transition)
+
+    def outgoing(self, stage):
+        """Transitions leaving `stage` (a WorkflowStage or its id)."""
+        stage_id = getattr(stage, 'pk', stage)
+        self.prime([stage_id])
+        return self._outgoing.get(stage_id, [])
+
+    def incoming(self, stage):
+        """Transitions entering `stage` (a WorkflowStage or its id)."""
+        stage_id = getattr(stage, 'pk', stage)
+        self.prime([stage_id])
+        return self._incoming.get(stage_id, [])
+
+    def has_outgoing(self, stage):
+        return bool(self.outgoing(stage))
+
+    def actions(self, stage, role_matches=None):
+        """Transition actions leaving `stage` whose condition passes `role_matches`, in transition order."""
+        actions = []
+        for transition in self.outgoing(stage):
+            cond = transition.condition or {}
+            if role_matches is not None and not role_matches(cond):
+                continue
+            action = cond.get('action')
+            if action:
+                actions.append(action)
+        return actions
+
+    def entry_actions(self, stage, workflow_id=None):
+        """Unique upper-cased actions of transitions entering `stage`."""
+        actions = []
+        for transition in self.incoming(stage):
+            if workflow_id is not None and transition.workflow_id != workflow_id:
+                continue
+            action = (transition.condition or {}).get('action')
+            if action:
+                actions.append(str(action).upper())
+        return list(dict.fromkeys(actions))
+
+    def workflow_stages(self, workflow_id):
+        """All stages of a workflow, loaded once per resolver."""
+        if workflow_id not in self._stages_by_workflow:
+            self._stages_by_workflow[workflow_id] = list(
+                WorkflowStage.objects.filter(workflow_id=workflow_id).order_by('id')
+            )
+        return self._stages_by_workflow[workflow_id]
+
+    def initial_stage(self, workflow_id):
+        return next((stage for stage in self.workflow_stages(workflow_id) if stage.is_initial), None)
+
+    def stage_by_name(self, workflow_id, name):
+        return next((stage for stage in self.workflow_stages(workflow_id) if stage.name == name), None)
+
+    @staticmethod
+    def action_configs(actions):
+        return [WorkflowService.get_action_config(action_name) for action_name in actions]
+
+
+def get_action_resolver(context) -> WorkflowActionResolver:
+    """Resolver shared by every serializer using `context` (one per response)."""
+    if context is None:
+        return WorkflowActionResolver()
+    resolver = context.get(RESOLVER_CONTEXT_KEY)
+    if resolver is None:
+        resolver = WorkflowActionResolver()
+        context[RESOLVER_CONTEXT_KEY] = resolver
+    return resolver
+
+
+class WorkflowActionListSerializer(serializers.ListSerializer):
+    """
+    List serializer that primes the action resolver with the current stage of
+    every row. Use as `Meta.list_serializer_class`.
+    """
+
+    def to_representation(self, data):
+        rows = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        get_action_resolver(self.context).prime(
+            getattr(row, 'current_stage_id', None) for row in rows
+        )
+        return super().to_representation(rows)
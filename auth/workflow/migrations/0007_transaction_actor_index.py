@@ -0,0 +1,21 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('roles', '0002_backfill_company_registration_create'),
+        ('workflow', '0006_seed_license_renewal_workflow'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['content_type', 'performed_by', 'object_id'], name='workflow_tx_ct_actor_obj_idx'),
+        ),
+    ]
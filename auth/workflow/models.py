@@ -67,7 +67,11 @@ class Transaction(models.Model):
     timestamp = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        indexes = [models.Index(fields=['content_type', 'object_id'])]
+        indexes = [
+            models.Index(fields=['content_type', 'object_id']),
+            # "Applications this role has acted on" lookups for dashboards.
+            models.Index(fields=['content_type', 'performed_by', 'object_id'], name='workflow_tx_ct_actor_obj_idx'),
+        ]
         ordering = ['-timestamp']
 
 
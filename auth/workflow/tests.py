@@ -1,3 +1,82 @@
+from datetime import timedelta
+
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
+from django.utils import timezone
+
+from .action_resolver import WorkflowActionResolver
+from .models import Objection, Rejection, Transaction, Workflow, WorkflowStage, WorkflowTransition
+from .timeline import WorkflowTimeline
+
+
+class WorkflowActionResolverTests(TestCase):
+    def setUp(self):
+        workflow = Workflow.objects.create(name='Test Workflow')
+        self.submitted = WorkflowStage.objects.create(workflow=workflow, name='Submitted', is_initial=True)
+        self.forwarded = WorkflowStage.objects.create(workflow=workflow, name='Forwarded')
+        self.approved = WorkflowStage.objects.create(workflow=workflow, name='Approved', is_final=True)
+        WorkflowTransition.objects.create(
+            workflow=workflow, from_stage=self.submitted, to_stage=self.forwarded,
+            condition={'action': 'FORWARD', 'role': 'oic'},
+        )
+        WorkflowTransition.objects.create(
+            workflow=workflow, from_stage=self.forwarded, to_stage=self.approved,
+            condition={'action': 'APPROVE', 'role': 'commissioner'},
+        )
+
+    def test_primed_stages_are_answered_without_queries(self):
+        resolver = WorkflowActionResolver()
+        with self.assertNumQueries(1):
+            resolver.prime([self.submitted.id, self.forwarded.id, self.approved.id])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.actions(self.submitted.id), ['FORWARD'])
+            self.assertEqual(
+                resolver.actions(self.forwarded, lambda cond: cond.get('role') == 'oic'), []
+            )
+            self.assertEqual(resolver.entry_actions(self.approved.id), ['APPROVE'])
+            self.assertFalse(resolver.has_outgoing(self.approved))
+
+
+class WorkflowTimelineTests(TestCase):
+    def setUp(self):
+        workflow = Workflow.objects.create(name='Timeline Workflow')
+        self.draft = WorkflowStage.objects.create(workflow=workflow, name='Draft', is_initial=True)
+        self.applied = WorkflowStage.objects.create(workflow=workflow, name='Applied')
+        self.review = WorkflowStage.objects.create(workflow=workflow, name='Under Review')
+        # Any model can carry a workflow; two workflows stand in for applications here.
+        self.reapplied = Workflow.objects.create(name='Reapplied')
+        self.fresh = Workflow.objects.create(name='Fresh')
+        self.start = timezone.now() - timedelta(days=10)
+
+    def _at(self, model, days, **fields):
+        row = model.objects.create(content_type=ContentType.objects.get_for_model(fields.pop('target')), **fields)
+        date_field = {Transaction: 'timestamp', Objection: 'raised_on', Rejection: 'rejected_on'}[model]
+        model.objects.filter(pk=row.pk).update(**{date_field: self.start + timedelta(days=days)})
+
+    def test_current_run_of_many_objects_in_three_queries(self):
+        a, b = self.reapplied, self.fresh
+        self._at(Transaction, 0, target=a, object_id=str(a.pk), stage=self.applied, remarks='first run')
+        self._at(Objection, 1, target=a, object_id=str(a.pk), stage=self.applied, field_name='x', remarks='old')
+        self._at(Rejection, 2, target=a, object_id=str(a.pk), stage=self.review, remarks='rejected')
+        self._at(Transaction, 3, target=a, object_id=str(a.pk), stage=self.draft, remarks='Application submitted')
+        self._at(Transaction, 4, target=a, object_id=str(a.pk), stage=self.review, remarks='forwarded')
+        self._at(Objection, 5, target=a, object_id=str(a.pk), stage=self.review, field_name='x', remarks='new')
+        self._at(Transaction, 1, target=b, object_id=str(b.pk), stage=self.draft, remarks=None)
+        self._at(Transaction, 2, target=b, object_id=str(b.pk), stage=self.review, remarks='checked')
+        self._at(Rejection, 3, target=b, object_id=str(b.pk), stage=self.review, remarks='rejected')
+
+        ContentType.objects.get_for_model(Workflow)
+        with self.assertNumQueries(3):
+            timeline = WorkflowTimeline.for_objects([a, b])
+
+        self.assertEqual([h['remarks'] for h in timeline.history(a)], ['Application submitted', 'forwarded'])
+        self.assertEqual(timeline.history(a)[0]['action_by'], 'System')
+        self.assertEqual([o['objection_remarks'] for o in timeline.objection_list(a)], ['new'])
+        self.assertEqual(timeline.rejection_list(a), [])
+        self.assertEqual(timeline.run_start(a), self.start + timedelta(days=3))
 
-# Create your tests here.
+        self.assertEqual([h['remarks'] for h in timeline.history(b)], ['No remarks provided.', 'checked'])
+        self.assertEqual([r['rejection_remarks'] for r in timeline.rejection_list(b)], ['rejected'])
+        self.assertIsNone(timeline.run_start(b))
+        self.assertEqual(WorkflowTimeline.for_objects([]).serialize(a), {'history': [], 'objections': [], 'rejections': []})
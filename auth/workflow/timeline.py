@@ -0,0 +1,157 @@
+"""
+Workflow timelines (transactions, objections, rejections) for many applications at once.
+
+An application's current run starts at its latest "applied" transaction (stage
+name containing "applied" or remarks containing "submitted"); earlier runs are
+hidden. `WorkflowTimeline.for_objects` loads every application's current-run
+transactions, objections and rejections in three queries, whatever the number
+and kind of applications:
+
+    timeline = WorkflowTimeline.for_objects([app, *renewals])
+    data = {**fields, **timeline.serialize(app)}
+
+The run start is found in SQL: a window `MAX` over each application's
+transactions gives the latest boundary, and rows before it are filtered out.
+"""
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Case, DateTimeField, F, Max, Q, Value, When, Window
+
+from .models import Objection, Rejection, Transaction
+
+# Run start of an application with no "applied" transaction: its whole history is current.
+NO_BOUNDARY = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+RUN_BOUNDARY = Q(stage__name__icontains="applied") | Q(remarks__icontains="submitted")
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _key(obj):
+    return ContentType.objects.get_for_model(obj).id, str(obj.pk)
+
+
+def _format(value):
+    return value.strftime(TIMESTAMP_FORMAT) if value else "N/A"
+
+
+def _actor(user):
+    if user is None:
+        return "System", "System"
+    return user.username, f"{user.first_name} {user.last_name}".strip()
+
+
+class WorkflowTimeline:
+    """Current-run history, objections and rejections keyed by (content_type_id, object_id)."""
+
+    def __init__(self, transactions, objections, rejections, run_starts):
+        self.transactions = transactions
+        self.objections = objections
+        self.rejections = rejections
+        self.run_starts = run_starts
+
+    @classmethod
+    def for_objects(cls, objects):
+        by_type = defaultdict(set)
+        for obj in objects:
+            if obj is not None:
+                content_type_id, object_id = _key(obj)
+                by_type[content_type_id].add(object_id)
+        if not by_type:
+            return cls({}, {}, {}, {})
+        scope = Q()
+        for content_type_id, object_ids in by_type.items():
+            scope |= Q(content_type_id=content_type_id, object_id__in=object_ids)
+
+        run_start = Window(
+            Max(Case(When(RUN_BOUNDARY, then=F("timestamp")), default=Value(NO_BOUNDARY), output_field=DateTimeField())),
+            partition_by=[F("content_type_id"), F("object_id")],
+        )
+        current = (
+            Transaction.objects.filter(scope)
+            .select_related("stage", "performed_by", "forwarded_to")
+            .annotate(run_start=run_start)
+            .filter(timestamp__gte=F("run_start"))
+            .order_by("timestamp", "id")
+        )
+        transactions = defaultdict(list)
+        run_starts = {}
+        for tx in current:
+            key = (tx.content_type_id, tx.object_id)
+            transactions[key].append(tx)
+            run_starts[key] = tx.run_start
+
+        def current_run(rows, date_field):
+            grouped = defaultdict(list)
+            for row in rows:
+                key = (row.content_type_id, row.object_id)
+                if getattr(row, date_field) >= run_starts.get(key, NO_BOUNDARY):
+                    grouped[key].append(row)
+            return grouped
+
+        objections = current_run(
+            Objection.objects.filter(scope).select_related("stage", "raised_by").order_by("-raised_on", "-id"),
+            "raised_on",
+        )
+        rejections = current_run(
+            Rejection.objects.filter(scope).select_related("stage", "rejected_by").order_by("-rejected_on", "-id"),
+            "rejected_on",
+        )
+        return cls(transactions, objections, rejections, run_starts)
+
+    def run_start(self, obj):
+        """When `obj`'s current run started, or None if it has never been applied."""
+        start = self.run_starts.get(_key(obj))
+        return None if start in (None, NO_BOUNDARY) else start
+
+    def history(self, obj):
+        hist = []
+        for tx in self.transactions.get(_key(obj), ()):
+            action_by, action_by_name = _actor(tx.performed_by)
+            hist.append({
+                "stage": tx.stage.name if tx.stage else "N/A",
+                "forwarded_to": tx.forwarded_to.name if tx.forwarded_to else "N/A",
+                "action_by": action_by,
+                "action_by_name": action_by_name,
+                "remarks": tx.remarks or "No remarks provided.",
+                "created_at": _format(tx.timestamp),
+            })
+        return hist
+
+    def objection_list(self, obj):
+        objs = []
+        for ob in self.objections.get(_key(obj), ()):
+            objection_by, objection_by_name = _actor(ob.raised_by)
+            objs.append({
+                "objection_remarks": ob.remarks or "",
+                "objection_by": objection_by,
+                "objection_by_name": objection_by_name,
+                "stage": ob.stage.name if ob.stage else "N/A",
+                "reply_remarks": ob.after_content or "No reply submitted yet.",
+                "is_resolved": ob.is_resolved,
+                "created_at": _format(ob.raised_on),
+            })
+        return objs
+
+    def rejection_list(self, obj):
+        rejections = []
+        for rejection in self.rejections.get(_key(obj), ()):
+            rejected_by, rejected_by_name = _actor(rejection.rejected_by)
+            rejections.append({
+                "rejection_remarks": rejection.remarks or "",
+                "rejected_by": rejected_by,
+                "rejected_by_name": rejected_by_name,
+                "stage": rejection.stage.name if rejection.stage else "N/A",
+                "created_at": _format(rejection.rejected_on),
+            })
+        return rejections
+
+    def serialize(self, obj):
+        """The "history", "objections" and "rejections" entries of a single-window detail response."""
+        return {
+            "history": self.history(obj),
+            "objections": self.objection_list(obj),
+            "rejections": self.rejection_list(obj),
+        }
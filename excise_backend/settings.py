@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 
@@ -19,6 +20,10 @@ from datetime import timedelta
 BASE_DIR = Path(__file__).resolve().parent.parent
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 MEDIA_URL = "/media/"
+# How permission-checked views hand over uploaded files (see utils/protected_media.py):
+# "django" streams them with Range support, "nginx" uses X-Accel-Redirect, "sendfile" uses X-Sendfile.
+PROTECTED_MEDIA_SERVER = os.getenv("PROTECTED_MEDIA_SERVER", "django")
+PROTECTED_MEDIA_INTERNAL_URL = os.getenv("PROTECTED_MEDIA_INTERNAL_URL", "/protected-media/")
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -91,6 +96,7 @@ INSTALLED_APPS = [
     'models.transactional.logs',
     'models.transactional.wallet',
     'models.transactional.payment_gateway',
+    'models.transactional.media_derivatives',
     'models.transactional.supply_chain.ena_transit_permit_details',
     'models.transactional.supply_chain.ena_revalidation_details',
     'models.transactional.supply_chain.ena_requisition_details',  
@@ -113,6 +119,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'utils.query_profiler.QueryProfilerMiddleware',
 ]
 
 ROOT_URLCONF = 'excise_backend.urls'
@@ -137,19 +144,24 @@ WSGI_APPLICATION = 'excise_backend.wsgi.application'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'auth.user.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_RENDERER_CLASSES': (
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
+        'utils.camel_case.CamelCaseJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
-        'djangorestframework_camel_case.parser.CamelCaseJSONParser',
+        'utils.camel_case.CamelCaseJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ),
+    'DEFAULT_PAGINATION_CLASS': 'utils.pagination.KeysetPagination',
+    'PAGE_SIZE': 50,
 }   
 
+# Upper bound for `?page_size=` on paginated list endpoints.
+KEYSET_PAGINATION_MAX_PAGE_SIZE = 200
+
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
@@ -189,6 +201,9 @@ FILE_UPLOAD_MAX_MEMORY_SIZE = 2621440
 
 # OTP Configuration
 OTP_EXPIRY_SECONDS = 600  # 10 minutes
+OTP_MAX_ATTEMPTS = 5  # wrong guesses before an OTP is discarded
+OTP_SEND_LIMIT = 3  # OTPs per phone number per window
+OTP_SEND_WINDOW_SECONDS = 15 * 60
 
 # Redis cache configuration for CAPTCHA storage
 CACHES = {
@@ -262,11 +277,35 @@ SIMPLE_JWT = {
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
 }
 
+# User activity audit rows are batched by a background writer (models/transactional/logs/activity_writer.py).
+# Under `manage.py test` they are written synchronously so they stay inside the test transaction.
+USER_ACTIVITY_ASYNC = os.getenv("USER_ACTIVITY_ASYNC", "0" if "test" in sys.argv else "1") == "1"
+USER_ACTIVITY_BATCH_SIZE = 100
+USER_ACTIVITY_FLUSH_INTERVAL_MS = 500
+USER_ACTIVITY_QUEUE_SIZE = 10000
+# Rows older than this are removed by `manage.py prune_user_activity`.
+USER_ACTIVITY_RETENTION_DAYS = int(os.getenv("USER_ACTIVITY_RETENTION_DAYS", "365"))
+
+# Per-endpoint query counts and timings (utils/query_profiler.py), readable by admins at
+# /transactional/logs/query-profile/. Off unless QUERY_PROFILER_ENABLED=1.
+QUERY_PROFILER_ENABLED = os.getenv("QUERY_PROFILER_ENABLED", "0") == "1"
+QUERY_PROFILER_BUFFER_SIZE = int(os.getenv("QUERY_PROFILER_BUFFER_SIZE", "500"))
+
 # Payment gateway (BillDesk) defaults for local/UAT.
 BILLDESK_GATEWAY_URL = os.getenv(
     "BILLDESK_GATEWAY_URL",
     "https://uat1.billdesk.com/u2/payments/ve1_2/orders/create",
 ).strip()
+# Transaction status API used by `manage.py reconcile_billdesk_payments`, and the
+# client class it calls (payment_gateway.reconciliation.GatewayClient).
+BILLDESK_TRANSACTION_URL = os.getenv(
+    "BILLDESK_TRANSACTION_URL",
+    "https://uat1.billdesk.com/u2/payments/ve1_2/transactions/get",
+).strip()
+BILLDESK_RECONCILE_CLIENT = os.getenv(
+    "BILLDESK_RECONCILE_CLIENT",
+    "models.transactional.payment_gateway.reconciliation.BilldeskClient",
+).strip()
 
 # # Local testing: simulate BillDesk ProcessPayment and callback without hitting BillDesk servers.
 # # Default to mock in DEBUG to avoid hanging redirects to external UAT/Prod gateways during local dev.
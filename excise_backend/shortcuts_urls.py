@@ -27,6 +27,7 @@ urlpatterns = [
     path('master-factories/', liquor_data_views.master_factory_list, name='short-master-factories'),
     path('brands/', liquor_data_views.BrandSizeListView.as_view(), name='short-brand-sizes'),
     path('rates/', liquor_data_views.LiquorRatesView.as_view(), name='short-liquor-rates'),
+    path('rates/batch/', liquor_data_views.LiquorRatesBatchView.as_view(), name='short-liquor-rates-batch'),
 
     # Transactional (short aliases)
     path(
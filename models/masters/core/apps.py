@@ -3,3 +3,8 @@ from django.apps import AppConfig
 class AppNameConfig(AppConfig):
     name = 'models.masters.core'
     verbose_name = 'core'
+
+    def ready(self):
+        from .signals import connect_master_cache_signals, connect_timer_signals
+        connect_master_cache_signals()
+        connect_timer_signals()
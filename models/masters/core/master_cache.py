@@ -0,0 +1,150 @@
+"""
+Versioned cache for core master data responses.
+
+Every master table has a version counter (utils.cache_versions) that is bumped
+whenever one of its rows is saved or deleted (see signals.py). List endpoints
+cache their serialized payload under the versions of the tables they read plus
+their filter values, and send an ETag built from the same inputs so clients can
+revalidate with If-None-Match and receive a 304 without the payload being
+rebuilt or transferred.
+
+If the cache is unavailable the payload is built from the database as before.
+"""
+import hashlib
+import json
+import logging
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+from utils.cache_versions import bump_version, get_versions
+
+logger = logging.getLogger(__name__)
+
+PAYLOAD_KEY_PREFIX = 'masters:payload'
+PAYLOAD_TIMEOUT = 24 * 60 * 60
+
+# Payload name -> tables (model_name) whose rows appear in the serialized output.
+MASTER_TABLES = {
+    'license_categories': ('licensecategory',),
+    'license_types': ('licensetype',),
+    'states': ('state',),
+    'districts': ('district', 'state'),
+    'subdivisions': ('subdivision', 'district', 'policestation'),
+    'police_stations': ('policestation', 'subdivision'),
+    'license_subcategories': ('licensesubcategory',),
+    'license_titles': ('licensetitle',),
+    'roads': ('road', 'district'),
+    'locations': ('location', 'district'),
+    'license_fees': ('licensefee', 'licensecategory', 'licensesubcategory', 'location', 'district'),
+    'license_fee_categories': ('licensefee', 'licensecategory'),
+    'license_fee_subcategories': ('licensefee', 'licensesubcategory'),
+    'license_fee_locations': ('licensefee', 'location', 'district'),
+    'location_categories': ('locationcategory', 'locationsubcategory'),
+    'location_subcategories': ('locationsubcategory', 'locationcategory'),
+    'wards': ('ward', 'location', 'district'),
+    'additional_charge_configs': ('additionalchargeconfig', 'licensecategory'),
+    'fixed_fees': ('masterfixedfee',),
+}
+
+
+def table_version_name(table: str) -> str:
+    return f"masters:{table}"
+
+
+def invalidate_table(table: str):
+    """Invalidate every cached payload that reads `table`."""
+    bump_version(table_version_name(table))
+
+
+def _table_versions(names):
+    tables = sorted({table for name in names for table in MASTER_TABLES[name]})
+    versions = get_versions(*(table_version_name(table) for table in tables))
+    if any(version is None for version in versions.values()):
+        return None
+    return {table: versions[table_version_name(table)] for table in tables}
+
+
+def _fingerprint(*parts) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _normalize_filters(filters: dict) -> dict:
+    return {key: str(value).strip() for key, value in filters.items() if value not in (None, '')}
+
+
+def _etag(request, fingerprint: str) -> str:
+    # The cached payload is shared across renderers; the ETag is not.
+    renderer = getattr(getattr(request, 'accepted_renderer', None), 'format', '')
+    return f'W/"{_fingerprint(fingerprint, renderer)}"'
+
+
+def _etag_matches(request, etag: str) -> bool:
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    candidates = {value.strip() for value in header.split(',')}
+    return '*' in candidates or etag in candidates
+
+
+def _cached_payload(name, versions, filters, build):
+    key = f"{PAYLOAD_KEY_PREFIX}:{name}:{_fingerprint(versions, filters)}"
+    try:
+        payload = cache.get(key)
+    except Exception:
+        logger.warning("Cache unavailable while reading master payload %s", name, exc_info=True)
+        return build(**filters)
+    if payload is None:
+        payload = build(**filters)
+        try:
+            cache.set(key, payload, timeout=PAYLOAD_TIMEOUT)
+        except Exception:
+            logger.warning("Cache unavailable while storing master payload %s", name, exc_info=True)
+    return payload
+
+
+def cached_master_response(request, name, build, **filters):
+    """
+    Response for a master list endpoint.
+
+    `build(**filters)` returns the serialized payload and is only called on a
+    cache miss. Returns 304 when the client's If-None-Match matches.
+    """
+    filters = _normalize_filters(filters)
+    versions = _table_versions([name])
+    if versions is None:
+        return Response(build(**filters))
+
+    etag = _etag(request, _fingerprint(name, versions, filters))
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if _etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(_cached_payload(name, versions, filters, build), headers=headers)
+
+
+def cached_snapshot_response(request, builders: dict):
+    """
+    Response holding several unfiltered master payloads at once.
+
+    `builders` maps payload names to their builders. Each payload shares its
+    cache entry with the corresponding list endpoint.
+    """
+    versions = _table_versions(builders)
+    if versions is None:
+        return Response({
+            'versions': {},
+            'masters': {name: build() for name, build in builders.items()},
+        })
+
+    etag = _etag(request, _fingerprint('snapshot', sorted(builders), versions))
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if _etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    masters = {}
+    for name, build in builders.items():
+        table_versions = {table: versions[table] for table in MASTER_TABLES[name]}
+        masters[name] = _cached_payload(name, table_versions, {}, build)
+    return Response({'versions': versions, 'masters': masters}, headers=headers)
@@ -0,0 +1,47 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from . import models as masters_model
+from .master_cache import invalidate_table
+from .timers import invalidate_timers
+
+
+def invalidate_master_table(sender, **kwargs):
+    transaction.on_commit(partial(invalidate_table, sender._meta.model_name))
+
+
+def connect_master_cache_signals():
+    """Bump a master table's cache version whenever one of its rows changes."""
+    for model in (
+        masters_model.LicenseCategory,
+        masters_model.LicenseType,
+        masters_model.State,
+        masters_model.District,
+        masters_model.Subdivision,
+        masters_model.PoliceStation,
+        masters_model.LicenseTitle,
+        masters_model.LicenseSubcategory,
+        masters_model.Road,
+        masters_model.LocationCategory,
+        masters_model.LocationSubcategory,
+        masters_model.Location,
+        masters_model.Ward,
+        masters_model.LicenseFee,
+        masters_model.AdditionalChargeConfig,
+        masters_model.MasterFixedFee,
+    ):
+        post_save.connect(invalidate_master_table, sender=model, dispatch_uid=f'master_cache_save_{model._meta.model_name}')
+        post_delete.connect(invalidate_master_table, sender=model, dispatch_uid=f'master_cache_delete_{model._meta.model_name}')
+
+
+def invalidate_timer_config(sender, **kwargs):
+    transaction.on_commit(invalidate_timers)
+
+
+def connect_timer_signals():
+    """Drop every process's parsed timers whenever a timer row changes."""
+    model = masters_model.SupplyChainTimerConfig
+    post_save.connect(invalidate_timer_config, sender=model, dispatch_uid='timer_config_save')
+    post_delete.connect(invalidate_timer_config, sender=model, dispatch_uid='timer_config_delete')
@@ -1,3 +1,171 @@
-from django.test import TestCase
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+import io
+import uuid
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from djangorestframework_camel_case.parser import CamelCaseJSONParser as LibraryParser
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer as LibraryRenderer
+from rest_framework.test import APIClient
+
+from auth.roles.models import Role
+from auth.user.models import CustomUser
+from utils.camel_case import CamelCaseJSONParser, CamelCaseJSONRenderer
+
+from . import timers
+from .models import District, State, Subdivision, SupplyChainTimerConfig
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class MasterCacheTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+            District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=self.state)
+
+    def test_district_list_is_cached_and_revalidated(self):
+        url = reverse('core_urls:district-list')
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data), 1)
+        etag = resp['ETag']
+
+        with self.assertNumQueries(0):
+            resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)
+
+        with self.assertNumQueries(0):
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+
+        # A write to the table moves its version, so the old ETag no longer matches.
+        with self.captureOnCommitCallbacks(execute=True):
+            District.objects.create(district="Namchi", district_code=226, is_active=True, state_code=self.state)
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data), 2)
+        self.assertNotEqual(resp['ETag'], etag)
+
+    def _user(self, role, index):
+        district = District.objects.get(district_code=225)
+        subdivision = Subdivision.objects.get_or_create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=district,
+        )[0]
+        return CustomUser.objects.create_user(
+            email=f'viewer{index}@example.com', first_name='Master', last_name='Viewer',
+            phone_number=f'99999999{index:02d}', district=district, subdivision=subdivision,
+            address='Gangtok', password='password123', role=role,
+        )
+
+    def test_snapshot_requires_masters_view_permission(self):
+        url = reverse('core_urls:masters-snapshot')
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_authenticate(user=self._user(Role.objects.create(name='clerk', can_view=['wallet']), 1))
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_snapshot_shares_list_payloads(self):
+        self.client.force_authenticate(user=self._user(Role.objects.create(name='viewer', can_view=['masters']), 2))
+        self.client.get(reverse('core_urls:district-list'))
+        resp = self.client.get(reverse('core_urls:masters-snapshot'))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data['masters']['districts']), 1)
+        self.assertEqual(len(resp.data['masters']['states']), 1)
+
+        resp = self.client.get(reverse('core_urls:masters-snapshot'), HTTP_IF_NONE_MATCH=resp['ETag'])
+        self.assertEqual(resp.status_code, 304)
+
+
+class TimerUnitParsingTests(SimpleTestCase):
+    def test_units_and_aliases(self):
+        cases = {
+            ('10', 'second'): timedelta(seconds=10),
+            (10, 'Secs'): timedelta(seconds=10),
+            (10, 's'): timedelta(seconds=10),
+            (5, 'mins'): timedelta(minutes=5),
+            (5, ' Minute '): timedelta(minutes=5),
+            (2, 'hrs'): timedelta(hours=2),
+            (2, 'hours'): timedelta(hours=2),
+            (3, 'days'): timedelta(days=3),
+            (2, 'wk'): timedelta(weeks=2),
+            (2, 'weeks'): timedelta(weeks=2),
+            (1, 'mo'): timedelta(days=30),
+            (1, 'mos'): timedelta(days=30),
+            (2, 'months'): timedelta(days=60),
+            (1, 'yr'): timedelta(days=365),
+            (1, 'years'): timedelta(days=365),
+        }
+        for (value, unit), expected in cases.items():
+            with self.subTest(value=value, unit=unit):
+                self.assertEqual(timers.parse_duration(value, unit), expected)
+
+    def test_unusable_values(self):
+        self.assertIsNone(timers.parse_duration(10, 'fortnight'))
+        self.assertIsNone(timers.parse_duration(10, ''))
+        self.assertIsNone(timers.parse_duration('ten', 'second'))
+        self.assertEqual(timers.parse_duration(-5, 'minute'), timedelta(0))
+        self.assertEqual(timers.parse_duration(None, 'minute'), timedelta(0))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class TimerConfigTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            SupplyChainTimerConfig.objects.create(code='ACTIVATION', delay_value=2, delay_unit='minute')
+            SupplyChainTimerConfig.objects.create(code='RENEWAL', delay_value=3, delay_unit='month')
+            SupplyChainTimerConfig.objects.create(code='VALIDITY', delay_value=10, delay_unit='second', validity_period_days=45)
+            SupplyChainTimerConfig.objects.create(code='DEADLINE', delay_value=1020, delay_unit='minute')
+            SupplyChainTimerConfig.objects.create(code='OFF', delay_value=1, delay_unit='day', is_active=False)
+
+    def test_accessors(self):
+        self.assertEqual(timers.get_seconds('ACTIVATION', 10), 120)
+        self.assertEqual(timers.get_seconds('MISSING', 10), 10)
+        self.assertEqual(timers.get_days('RENEWAL', 90), 90)
+        self.assertEqual(timers.get_days('VALIDITY', 90), 45)
+        self.assertEqual(timers.get_days('OFF', 7), 7)
+        self.assertEqual(timers.get_time_of_day('DEADLINE', 0), time(17, 0))
+        self.assertEqual(timers.get_time_of_day('MISSING', 9 * 60 + 30), time(9, 30))
+
+    def test_reads_are_memoized_until_a_timer_changes(self):
+        timers.get_timers()
+        with self.assertNumQueries(0):
+            self.assertEqual(timers.get_seconds('ACTIVATION', 10), 120)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            timer = SupplyChainTimerConfig.objects.get(code='ACTIVATION')
+            timer.delay_unit = 'hour'
+            timer.save()
+        self.assertEqual(timers.get_seconds('ACTIVATION', 10), 2 * 60 * 60)
+
+
+class CamelCaseRenderingTests(SimpleTestCase):
+    payload = {
+        'serial_ranges': [
+            {
+                'from_serial': 1, 'to_serial': 500, 'created_at': datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+                'issue_date': date(2026, 1, 2), 'cut_off': time(17, 0), 'validity': timedelta(hours=1),
+                'amount': Decimal('10.50'), 'ratio': 0.25, 'token': uuid.UUID(int=1), 'note': 'Line\u2028 é',
+            },
+        ],
+        'meta_data': {'nested_key_1': [1e-05, 1e+16, 2 ** 70, None, True], 'plain': 'x_y'},
+        'count': 1,
+    }
+
+    def test_output_matches_library_byte_for_byte(self):
+        for payload in (self.payload, self.payload['serial_ranges'], self.payload['meta_data']):
+            for media_type, context in (('application/json', {}), ('application/json; indent=2', {}), (None, {'indent': 4})):
+                with self.subTest(media_type=media_type, context=context):
+                    self.assertEqual(
+                        CamelCaseJSONRenderer().render(payload, media_type, context),
+                        LibraryRenderer().render(payload, media_type, context),
+                    )
+
+    def test_parser_matches_library(self):
+        body = b'{"serialRanges": [{"fromSerial": 1, "HTTPStatus": "ok", "value2X": [{"innerKey": 1}]}], "a": 12345678901234567890123}'
+        context = {'encoding': 'utf-8'}
+        self.assertEqual(
+            CamelCaseJSONParser().parse(io.BytesIO(body), None, context),
+            LibraryParser().parse(io.BytesIO(body), None, context),
+        )
@@ -0,0 +1,168 @@
+"""
+Timer configuration (public.timer) parsed once per process.
+
+Hot paths (requisition approval, revalidation backfill, hologram SLA, renewal
+reminders) used to query and parse their timer row on every call, each with its
+own reading of `delay_unit`. `get_timers()` loads every active row in one query
+and parses it into a `Timer` with a `timedelta` duration; the result is kept in
+process memory for the current `TIMERS_VERSION` (utils.cache_versions), which is
+bumped whenever a timer row is saved or deleted (see signals.py). Reads are
+therefore free of queries until a timer changes. If the cache is unavailable the
+rows are reloaded on every call.
+"""
+from collections import namedtuple
+from datetime import time, timedelta
+import threading
+
+from utils.cache_versions import bump_version, get_version
+
+from .models import SupplyChainTimerConfig
+
+TIMERS_VERSION = 'supply_chain_timers'
+
+# Months and years are converted with fixed lengths.
+UNIT_DURATIONS = {
+    SupplyChainTimerConfig.TIMER_UNIT_SECOND: timedelta(seconds=1),
+    SupplyChainTimerConfig.TIMER_UNIT_MINUTE: timedelta(minutes=1),
+    SupplyChainTimerConfig.TIMER_UNIT_HOUR: timedelta(hours=1),
+    SupplyChainTimerConfig.TIMER_UNIT_DAY: timedelta(days=1),
+    SupplyChainTimerConfig.TIMER_UNIT_WEEK: timedelta(weeks=1),
+    SupplyChainTimerConfig.TIMER_UNIT_MONTH: timedelta(days=30),
+    SupplyChainTimerConfig.TIMER_UNIT_YEAR: timedelta(days=365),
+}
+
+UNIT_ALIASES = {
+    's': SupplyChainTimerConfig.TIMER_UNIT_SECOND,
+    'sec': SupplyChainTimerConfig.TIMER_UNIT_SECOND,
+    'min': SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
+    'h': SupplyChainTimerConfig.TIMER_UNIT_HOUR,
+    'hr': SupplyChainTimerConfig.TIMER_UNIT_HOUR,
+    'd': SupplyChainTimerConfig.TIMER_UNIT_DAY,
+    'w': SupplyChainTimerConfig.TIMER_UNIT_WEEK,
+    'wk': SupplyChainTimerConfig.TIMER_UNIT_WEEK,
+    'mo': SupplyChainTimerConfig.TIMER_UNIT_MONTH,
+    'mon': SupplyChainTimerConfig.TIMER_UNIT_MONTH,
+    'y': SupplyChainTimerConfig.TIMER_UNIT_YEAR,
+    'yr': SupplyChainTimerConfig.TIMER_UNIT_YEAR,
+}
+
+# Units coarse enough to express a period in days; finer units on a day-based
+# timer are the model defaults, and `validity_period_days` is used instead.
+DAY_UNITS = (
+    SupplyChainTimerConfig.TIMER_UNIT_HOUR,
+    SupplyChainTimerConfig.TIMER_UNIT_DAY,
+    SupplyChainTimerConfig.TIMER_UNIT_WEEK,
+    SupplyChainTimerConfig.TIMER_UNIT_MONTH,
+    SupplyChainTimerConfig.TIMER_UNIT_YEAR,
+)
+
+Timer = namedtuple('Timer', 'code description delay_value delay_unit unit duration validity_period_days')
+
+_lock = threading.Lock()
+_loaded = (None, {})
+
+
+def normalize_unit(unit):
+    """Canonical unit name for a stored `delay_unit` ('mins', 'Hrs', 'mo', ...), or None if unknown."""
+    token = str(unit or '').lower().strip()
+    if token in UNIT_DURATIONS or token in UNIT_ALIASES:
+        return UNIT_ALIASES.get(token, token)
+    if token.endswith('s'):
+        token = token[:-1]
+    if token in UNIT_DURATIONS or token in UNIT_ALIASES:
+        return UNIT_ALIASES.get(token, token)
+    return None
+
+
+def parse_duration(value, unit):
+    """`value` `unit`s as a timedelta; negative values count as 0. None if either part is unusable."""
+    unit = normalize_unit(unit)
+    if unit is None:
+        return None
+    try:
+        value = max(0, int(value or 0))
+    except (TypeError, ValueError):
+        return None
+    return UNIT_DURATIONS[unit] * value
+
+
+def _parse(row):
+    unit = normalize_unit(row.delay_unit)
+    return Timer(
+        code=row.code,
+        description=row.description,
+        delay_value=row.delay_value,
+        delay_unit=row.delay_unit,
+        unit=unit,
+        duration=parse_duration(row.delay_value, unit),
+        validity_period_days=row.validity_period_days,
+    )
+
+
+def _load():
+    rows = SupplyChainTimerConfig.objects.filter(is_active=True).order_by('updated_at', 'id')
+    return {row.code: _parse(row) for row in rows}
+
+
+def get_timers():
+    """Active timers by code."""
+    global _loaded
+    version = get_version(TIMERS_VERSION)
+    if version is None:
+        return _load()
+    loaded_version, timers = _loaded
+    if loaded_version == version:
+        return timers
+    with _lock:
+        if _loaded[0] != version:
+            _loaded = (version, _load())
+        return _loaded[1]
+
+
+def get_timer(code):
+    """The active `Timer` for `code`, or None."""
+    return get_timers().get(code)
+
+
+def invalidate_timers():
+    global _loaded
+    _loaded = (None, {})
+    bump_version(TIMERS_VERSION)
+
+
+def get_duration(code, default):
+    """Configured delay for `code`; `default` (a timedelta) when it is missing or its unit is unknown."""
+    timer = get_timer(code)
+    if timer is None or timer.duration is None:
+        return default
+    return timer.duration
+
+
+def get_seconds(code, default_seconds):
+    """Configured delay for `code` in whole seconds."""
+    return int(get_duration(code, timedelta(seconds=default_seconds)).total_seconds())
+
+
+def get_days(code, default_days):
+    """
+    Period for `code` in whole days. Uses the delay when it is set in hours or
+    coarser units, otherwise `validity_period_days`, otherwise `default_days`.
+    """
+    timer = get_timer(code)
+    if timer is None:
+        return int(default_days)
+    if timer.unit in DAY_UNITS and timer.duration:
+        return timer.duration.days
+    if timer.validity_period_days is not None:
+        return max(0, int(timer.validity_period_days))
+    return int(default_days)
+
+
+def get_time_of_day(code, default_minutes):
+    """
+    Time of day for `code`, with the delay read as an offset from midnight
+    (e.g. delay_value=1020, delay_unit=minute for 5:00 PM).
+    """
+    duration = get_duration(code, timedelta(minutes=default_minutes))
+    minutes = int(round(duration.total_seconds() / 60)) % (24 * 60)
+    return time(hour=minutes // 60, minute=minutes % 60)
@@ -38,6 +38,8 @@ from .serializers.renewalapplicationconfig_serializer import RenewalApplicationC
 from .serializers.supplychaintimerconfig_serializer import SupplyChainTimerConfigSerializer
 from .serializers.additionalchargeconfig_serializer import AdditionalChargeConfigSerializer
 from .serializers.fixedfee_serializer import MasterFixedFeeSerializer
+from .master_cache import cached_master_response, cached_snapshot_response
+from .timers import get_timer
 
 # NOTE: LicenseeProfile views have been moved to auth.user.views.
 # Endpoints are now served under /api/users/licensee-profiles/
@@ -69,11 +71,7 @@ def timer_config(request):
     }
     default_seconds = int(default_seconds_by_code.get(code, 4 * 60))
 
-    cfg = (
-        masters_model.SupplyChainTimerConfig.objects.filter(code=code, is_active=True)
-        .order_by('-updated_at', '-id')
-        .first()
-    )
+    cfg = get_timer(code)
     if not cfg:
         return Response(
             {
@@ -86,48 +84,15 @@ def timer_config(request):
             status=status.HTTP_200_OK,
         )
 
-    unit = str(getattr(cfg, 'delay_unit', '') or '').lower().strip()
-    value = int(getattr(cfg, 'delay_value', 0) or 0)
-    if value < 0:
-        value = 0
-
-    # Accept common plural/alias forms stored in DB.
-    if unit.endswith('s'):
-        unit = unit[:-1]
-    unit_aliases = {
-        'sec': masters_model.SupplyChainTimerConfig.TIMER_UNIT_SECOND,
-        'secs': masters_model.SupplyChainTimerConfig.TIMER_UNIT_SECOND,
-        'min': masters_model.SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
-        'mins': masters_model.SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
-        'hr': masters_model.SupplyChainTimerConfig.TIMER_UNIT_HOUR,
-        'hrs': masters_model.SupplyChainTimerConfig.TIMER_UNIT_HOUR,
-        'mon': masters_model.SupplyChainTimerConfig.TIMER_UNIT_MONTH,
-        'mos': masters_model.SupplyChainTimerConfig.TIMER_UNIT_MONTH,
-    }
-    unit = unit_aliases.get(unit, unit)
-
-    multiplier = 1
-    if unit == masters_model.SupplyChainTimerConfig.TIMER_UNIT_MINUTE:
-        multiplier = 60
-    elif unit == masters_model.SupplyChainTimerConfig.TIMER_UNIT_HOUR:
-        multiplier = 60 * 60
-    elif unit == masters_model.SupplyChainTimerConfig.TIMER_UNIT_DAY:
-        multiplier = 24 * 60 * 60
-    elif unit == getattr(masters_model.SupplyChainTimerConfig, "TIMER_UNIT_WEEK", "week"):
-        multiplier = 7 * 24 * 60 * 60
-    elif unit == masters_model.SupplyChainTimerConfig.TIMER_UNIT_MONTH:
-        multiplier = 30 * 24 * 60 * 60
-    elif unit == getattr(masters_model.SupplyChainTimerConfig, "TIMER_UNIT_YEAR", "year"):
-        multiplier = 365 * 24 * 60 * 60
-
-    seconds = max(0, value * multiplier)
+    # Unknown units are read as seconds.
+    seconds = int(cfg.duration.total_seconds()) if cfg.duration is not None else max(0, cfg.delay_value)
     return Response(
         {
             'code': cfg.code,
             'description': cfg.description,
             'delay_value': cfg.delay_value,
             'delay_unit': cfg.delay_unit,
-            'is_active': cfg.is_active,
+            'is_active': True,
             'delay_seconds': seconds,
             'delay_ms': seconds * 1000,
             'source': 'db',
@@ -144,9 +109,12 @@ def timer_config(request):
 @api_view(['GET'])
 def license_category_list(request):
     """List all license categories."""
+    return cached_master_response(request, 'license_categories', _license_category_payload)
+
+
+def _license_category_payload():
     queryset = masters_model.LicenseCategory.objects.all()
-    serializer = LicenseCategorySerializer(queryset, many=True)
-    return Response(serializer.data)
+    return LicenseCategorySerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -194,9 +162,12 @@ def license_category_delete(request, pk):
 @api_view(['GET'])
 def license_type_list(request):
     """List all license types."""
+    return cached_master_response(request, 'license_types', _license_type_payload)
+
+
+def _license_type_payload():
     queryset = masters_model.LicenseType.objects.all()
-    serializer = LicenseTypeSerializer(queryset, many=True)
-    return Response(serializer.data)
+    return LicenseTypeSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -244,9 +215,12 @@ def license_type_delete(request, pk):
 @api_view(['GET'])
 def state_list(request):
     """List all active states."""
+    return cached_master_response(request, 'states', _state_payload)
+
+
+def _state_payload():
     queryset = masters_model.State.objects.filter(is_active=True)
-    serializer = StateSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return StateSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -299,12 +273,16 @@ def state_delete(request, pk):
 @api_view(['GET'])
 def district_list(request):
     """List all active districts, optionally filtered by state_code."""
-    queryset = masters_model.District.objects.filter(is_active=True)
-    state_code = request.query_params.get('state_code')
+    return cached_master_response(
+        request, 'districts', _district_payload, state_code=request.query_params.get('state_code')
+    )
+
+
+def _district_payload(state_code=None):
+    queryset = masters_model.District.objects.filter(is_active=True).select_related('state_code')
     if state_code:
         queryset = queryset.filter(state_code=state_code)
-    serializer = DistrictSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return DistrictSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -364,12 +342,16 @@ def district_delete(request, pk):
 @api_view(['GET'])
 def subdivision_list(request):
     """List all active subdivisions, optionally filtered by district_code."""
-    queryset = masters_model.Subdivision.objects.filter(is_active=True)
-    district_code = request.query_params.get('district_code')
+    return cached_master_response(
+        request, 'subdivisions', _subdivision_payload, district_code=request.query_params.get('district_code')
+    )
+
+
+def _subdivision_payload(district_code=None):
+    queryset = masters_model.Subdivision.objects.filter(is_active=True).select_related('district_code')
     if district_code:
         queryset = queryset.filter(district_code=district_code)
-    serializer = SubdivisionSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return SubdivisionSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -427,12 +409,17 @@ def subdivision_delete(request, pk):
 @api_view(['GET'])
 def policestation_list(request):
     """List active police stations, optionally filtered by subdivision_code."""
-    queryset = masters_model.PoliceStation.objects.filter(is_active=True)
-    subdivision_code = request.query_params.get('subdivision_code')
+    return cached_master_response(
+        request, 'police_stations', _policestation_payload,
+        subdivision_code=request.query_params.get('subdivision_code'),
+    )
+
+
+def _policestation_payload(subdivision_code=None):
+    queryset = masters_model.PoliceStation.objects.filter(is_active=True).select_related('subdivision_code')
     if subdivision_code:
         queryset = queryset.filter(subdivision_code=subdivision_code)
-    serializer = PoliceStationSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return PoliceStationSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -485,12 +472,17 @@ def policestation_delete(request, pk):
 @api_view(['GET'])
 def license_subcategory_list(request):
     """List all license subcategories, optionally filtered by ?category_id="""
+    return cached_master_response(
+        request, 'license_subcategories', _license_subcategory_payload,
+        category_id=request.query_params.get('category_id'),
+    )
+
+
+def _license_subcategory_payload(category_id=None):
     queryset = masters_model.LicenseSubcategory.objects.all()
-    category_id = request.query_params.get('category_id')
     if category_id:
         queryset = queryset.filter(category_id=category_id)
-    serializer = LicenseSubcategorySerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return LicenseSubcategorySerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -542,9 +534,12 @@ def license_subcategory_delete(request, pk):
 @api_view(['GET'])
 def license_title_list(request):
     """List all license titles."""
+    return cached_master_response(request, 'license_titles', _license_title_payload)
+
+
+def _license_title_payload():
     queryset = masters_model.LicenseTitle.objects.all()
-    serializer = LicenseTitleSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return LicenseTitleSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -596,12 +591,16 @@ def license_title_delete(request, pk):
 @api_view(['GET'])
 def road_list(request):
     """List all roads, optionally filtered by district_code."""
-    queryset = masters_model.Road.objects.all()
-    district_code = request.query_params.get('district_code')
+    return cached_master_response(
+        request, 'roads', _road_payload, district_code=request.query_params.get('district_code')
+    )
+
+
+def _road_payload(district_code=None):
+    queryset = masters_model.Road.objects.select_related('district')
     if district_code:
         queryset = queryset.filter(district_id=district_code)
-    serializer = RoadSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return RoadSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -654,12 +653,16 @@ def road_delete(request, pk):
 @api_view(['GET'])
 def location_list(request):
     """List all active locations, optionally filtered by district_code."""
-    queryset = masters_model.Location.objects.filter(is_active=True)
-    district_code = request.query_params.get('district_code')
+    return cached_master_response(
+        request, 'locations', _location_payload, district_code=request.query_params.get('district_code')
+    )
+
+
+def _location_payload(district_code=None):
+    queryset = masters_model.Location.objects.filter(is_active=True).select_related('district_code')
     if district_code:
         queryset = queryset.filter(district_code=district_code)
-    serializer = LocationSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return LocationSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -712,18 +715,25 @@ def location_delete(request, pk):
 @api_view(['GET'])
 def license_fee_list(request):
     """List all active license fees, optionally filtered by category, subcategory, or location."""
-    queryset = masters_model.LicenseFee.objects.filter(is_active=True)
-    category_id = request.query_params.get('license_category')
-    subcategory_id = request.query_params.get('license_subcategory')
-    location_code = request.query_params.get('location_code')
+    return cached_master_response(
+        request, 'license_fees', _license_fee_payload,
+        category_id=request.query_params.get('license_category'),
+        subcategory_id=request.query_params.get('license_subcategory'),
+        location_code=request.query_params.get('location_code'),
+    )
+
+
+def _license_fee_payload(category_id=None, subcategory_id=None, location_code=None):
+    queryset = masters_model.LicenseFee.objects.filter(is_active=True).select_related(
+        'license_category', 'license_subcategory', 'location_code__district_code', 'created_by'
+    )
     if category_id:
         queryset = queryset.filter(license_category_id=category_id)
     if subcategory_id:
         queryset = queryset.filter(license_subcategory_id=subcategory_id)
     if location_code:
         queryset = queryset.filter(location_code=location_code)
-    serializer = LicenseFeeSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return LicenseFeeSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -817,6 +827,10 @@ def license_fee_available_categories(request):
     Return only the LicenseCategory records that have at least one active
     license_fee row.  Used to populate the Category dropdown in the approval dialog.
     """
+    return cached_master_response(request, 'license_fee_categories', _license_fee_category_payload)
+
+
+def _license_fee_category_payload():
     category_ids = (
         masters_model.LicenseFee.objects
         .filter(is_active=True)
@@ -824,8 +838,7 @@ def license_fee_available_categories(request):
         .distinct()
     )
     categories = masters_model.LicenseCategory.objects.filter(id__in=category_ids).order_by('license_category')
-    serializer = LicenseCategorySerializer(categories, many=True)
-    return Response(serializer.data)
+    return LicenseCategorySerializer(categories, many=True).data
 
 
 @permission_classes([AllowAny])
@@ -846,6 +859,12 @@ def license_fee_available_subcategories(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
+    return cached_master_response(
+        request, 'license_fee_subcategories', _license_fee_subcategory_payload, category_id=category_id
+    )
+
+
+def _license_fee_subcategory_payload(category_id):
     subcategory_ids = (
         masters_model.LicenseFee.objects
         .filter(license_category_id=category_id, is_active=True)
@@ -853,8 +872,7 @@ def license_fee_available_subcategories(request):
         .distinct()
     )
     subcategories = masters_model.LicenseSubcategory.objects.filter(id__in=subcategory_ids).order_by('description')
-    serializer = LicenseSubcategorySerializer(subcategories, many=True, context={'request': request})
-    return Response(serializer.data)
+    return LicenseSubcategorySerializer(subcategories, many=True).data
 
 
 @permission_classes([AllowAny])
@@ -878,6 +896,13 @@ def license_fee_available_locations(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
+    return cached_master_response(
+        request, 'license_fee_locations', _license_fee_location_payload,
+        category_id=category_id, subcategory_id=subcategory_id,
+    )
+
+
+def _license_fee_location_payload(category_id, subcategory_id):
     location_codes = (
         masters_model.LicenseFee.objects
         .filter(
@@ -888,9 +913,12 @@ def license_fee_available_locations(request):
         .values_list('location_code_id', flat=True)
         .distinct()
     )
-    locations = masters_model.Location.objects.filter(location_code__in=location_codes, is_active=True).order_by('location_description')
-    serializer = LocationSerializer(locations, many=True, context={'request': request})
-    return Response(serializer.data)
+    locations = (
+        masters_model.Location.objects.filter(location_code__in=location_codes, is_active=True)
+        .select_related('district_code')
+        .order_by('location_description')
+    )
+    return LocationSerializer(locations, many=True).data
 
 
 #################################################
@@ -901,9 +929,12 @@ def license_fee_available_locations(request):
 @api_view(['GET'])
 def locationcategory_list(request):
     """List all active location categories."""
-    queryset = masters_model.LocationCategory.objects.filter(is_active=True)
-    serializer = LocationCategorySerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return cached_master_response(request, 'location_categories', _locationcategory_payload)
+
+
+def _locationcategory_payload():
+    queryset = masters_model.LocationCategory.objects.filter(is_active=True).select_related('created_by')
+    return LocationCategorySerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -956,12 +987,17 @@ def locationcategory_delete(request, pk):
 @api_view(['GET'])
 def locationsubcategory_list(request):
     """List all active location subcategories, optionally filtered by category."""
-    queryset = masters_model.LocationSubcategory.objects.filter(is_active=True)
-    category_id = request.query_params.get('category_id')
+    return cached_master_response(
+        request, 'location_subcategories', _locationsubcategory_payload,
+        category_id=request.query_params.get('category_id'),
+    )
+
+
+def _locationsubcategory_payload(category_id=None):
+    queryset = masters_model.LocationSubcategory.objects.filter(is_active=True).select_related('category', 'created_by')
     if category_id:
         queryset = queryset.filter(category_id=category_id)
-    serializer = LocationSubcategorySerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return LocationSubcategorySerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -1014,12 +1050,18 @@ def locationsubcategory_delete(request, pk):
 @api_view(['GET'])
 def ward_list(request):
     """List all active wards, optionally filtered by location_code."""
-    queryset = masters_model.Ward.objects.filter(is_active=True)
-    location_code = request.query_params.get('location_code')
+    return cached_master_response(
+        request, 'wards', _ward_payload, location_code=request.query_params.get('location_code')
+    )
+
+
+def _ward_payload(location_code=None):
+    queryset = masters_model.Ward.objects.filter(is_active=True).select_related(
+        'location_code__district_code', 'created_by'
+    )
     if location_code:
         queryset = queryset.filter(location_code=location_code)
-    serializer = WardSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data)
+    return WardSerializer(queryset, many=True).data
 
 @permission_classes([HasAppPermission('masters', 'create')])
 @api_view(['POST'])
@@ -1119,12 +1161,17 @@ def timer_config_update(request):
 @api_view(['GET'])
 @permission_classes([HasAppPermission('masters', 'view')])
 def additional_charge_config_list(request):
-    category_id = request.query_params.get('category_id')
-    qs = masters_model.AdditionalChargeConfig.objects.all()
+    return cached_master_response(
+        request, 'additional_charge_configs', _additional_charge_config_payload,
+        category_id=request.query_params.get('category_id'),
+    )
+
+
+def _additional_charge_config_payload(category_id=None):
+    qs = masters_model.AdditionalChargeConfig.objects.select_related('category')
     if category_id:
         qs = qs.filter(category_id=category_id)
-    serializer = AdditionalChargeConfigSerializer(qs, many=True)
-    return Response(serializer.data)
+    return AdditionalChargeConfigSerializer(qs, many=True).data
 
 @api_view(['POST'])
 @permission_classes([HasAppPermission('masters', 'create')])
@@ -1163,9 +1210,12 @@ def additional_charge_config_delete(request, pk):
 @api_view(['GET'])
 @permission_classes([HasAppPermission('masters', 'view')])
 def fixed_fee_list(request):
+    return cached_master_response(request, 'fixed_fees', _fixed_fee_payload)
+
+
+def _fixed_fee_payload():
     qs = masters_model.MasterFixedFee.objects.all().order_by('fee_code')
-    serializer = MasterFixedFeeSerializer(qs, many=True)
-    return Response(serializer.data)
+    return MasterFixedFeeSerializer(qs, many=True).data
 
 
 @api_view(['GET'])
@@ -1187,4 +1237,34 @@ def fixed_fee_update(request, pk):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+#################################################
+#           Master Data Snapshot                #
+#################################################
+
+@api_view(['GET'])
+@permission_classes([HasAppPermission('masters', 'view')])
+def masters_snapshot(request):
+    """
+    All unfiltered master lists in one response, for warming frontend caches.
 
+    Supports If-None-Match like the individual list endpoints.
+    """
+    return cached_snapshot_response(request, {
+        'license_categories': _license_category_payload,
+        'license_types': _license_type_payload,
+        'states': _state_payload,
+        'districts': _district_payload,
+        'subdivisions': _subdivision_payload,
+        'police_stations': _policestation_payload,
+        'license_subcategories': _license_subcategory_payload,
+        'license_titles': _license_title_payload,
+        'roads': _road_payload,
+        'locations': _location_payload,
+        'location_categories': _locationcategory_payload,
+        'location_subcategories': _locationsubcategory_payload,
+        'wards': _ward_payload,
+        'license_fees': _license_fee_payload,
+        'license_fee_categories': _license_fee_category_payload,
+        'additional_charge_configs': _additional_charge_config_payload,
+        'fixed_fees': _fixed_fee_payload,
+    })
@@ -0,0 +1,116 @@
+"""
+Active licensee directory used by distributor and transit forms.
+
+`License.source_application` is a generic relation, so resolving it per row
+costs a query per license. `resolve_source_details` loads `establishment_name`
+and `mode_of_operation` for a page of licenses with one IN-query per source
+model, and `filter_by_mode` applies the `mode` filter in SQL.
+
+The non-licensee listing is cached per (district, category, mode) under a
+version counter bumped whenever a license or new license application changes
+(see signals.py), with a short TTL so licenses drop out soon after expiring.
+"""
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import CharField, Q
+from django.db.models.functions import Cast
+
+from utils.cache_versions import bump_version, get_version
+
+ACTIVE_LICENSEES_VERSION = 'active_licensees'
+ACTIVE_LICENSEES_TIMEOUT = 5 * 60
+
+SOURCE_FIELDS = ('establishment_name', 'mode_of_operation')
+SOURCE_MODELS = (
+    'new_license_application.NewLicenseApplication',
+    'license_renewal_application.LicenseApplication',
+    'salesman_barman.SalesmanBarmanModel',
+)
+
+
+def _source_fields(model):
+    names = {field.name for field in model._meta.concrete_fields}
+    return [name for name in SOURCE_FIELDS if name in names]
+
+
+def _source_models():
+    for label in SOURCE_MODELS:
+        try:
+            yield apps.get_model(label)
+        except LookupError:
+            continue
+
+
+def filter_by_mode(licenses, mode):
+    """
+    Keep licenses whose source application has `mode_of_operation` equal to
+    `mode` (capitalized), plus licenses without a source application.
+    """
+    wanted = str(mode).capitalize()
+    condition = Q(source_content_type__isnull=True)
+    for model in _source_models():
+        if 'mode_of_operation' not in _source_fields(model):
+            continue
+        object_ids = (
+            model.objects.filter(mode_of_operation=wanted)
+            .annotate(source_key=Cast('pk', CharField()))
+            .values('source_key')
+        )
+        condition |= Q(
+            source_content_type=ContentType.objects.get_for_model(model),
+            source_object_id__in=object_ids,
+        )
+    return licenses.filter(condition)
+
+
+def resolve_source_details(licenses):
+    """
+    `{(source_content_type_id, source_object_id): {field: value}}` for the
+    source applications of `licenses`, one query per source model.
+    """
+    object_ids = {}
+    for license in licenses:
+        if license.source_content_type_id and license.source_object_id:
+            object_ids.setdefault(license.source_content_type_id, set()).add(str(license.source_object_id))
+
+    details = {}
+    for content_type_id, ids in object_ids.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        fields = _source_fields(model) if model is not None else []
+        if not fields:
+            continue
+        rows = model.objects.filter(pk__in=ids).values_list('pk', *fields)
+        for pk, *values in rows:
+            details[(content_type_id, str(pk))] = dict(zip(fields, values))
+    return details
+
+
+def cache_key(district_code, license_category, mode):
+    """Cache key for a listing, or None when the cache is unavailable."""
+    version = get_version(ACTIVE_LICENSEES_VERSION)
+    if version is None:
+        return None
+    return f"license:active:{version}:{district_code or ''}:{license_category or ''}:{str(mode or '').lower()}"
+
+
+def get_cached(key):
+    if key is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception:
+        return None
+
+
+def set_cached(key, data):
+    if key is None:
+        return
+    try:
+        cache.set(key, data, timeout=ACTIVE_LICENSEES_TIMEOUT)
+    except Exception:
+        pass
+
+
+def invalidate_active_licensees():
+    bump_version(ACTIVE_LICENSEES_VERSION)
@@ -3,7 +3,7 @@ from .models import License
 from auth.user.models import CustomUser
 from django.utils import timezone
 from datetime import timedelta
-from models.masters.core.models import SupplyChainTimerConfig
+from models.masters.core.timers import get_days
 
 
 class LicenseSerializer(serializers.ModelSerializer):
@@ -193,45 +193,6 @@ class MyLicenseDetailsSerializer(serializers.ModelSerializer):
                 return str(src.role).strip()
         return None
 
-    def _get_timer_days(self, code: str, default_days: int) -> int:
-        cfg = (
-            SupplyChainTimerConfig.objects.filter(code=code, is_active=True)
-            .order_by("-updated_at", "-id")
-            .first()
-        )
-        if not cfg:
-            return int(default_days)
-
-        unit = str(getattr(cfg, "delay_unit", "") or "").lower().strip()
-        value = getattr(cfg, "delay_value", None)
-        try:
-            value_int = max(0, int(value or 0))
-        except (TypeError, ValueError):
-            value_int = 0
-
-        if value_int > 0 and unit:
-            if unit.endswith("s"):
-                unit = unit[:-1]
-            if unit == "day":
-                return value_int
-            if unit in ("week", "wk"):
-                return value_int * 7
-            if unit in ("month", "mon", "mo"):
-                return value_int * 30
-            if unit in ("year", "yr"):
-                return value_int * 365
-            if unit in ("hour", "hr"):
-                return max(0, value_int // 24)
-
-        days = getattr(cfg, "validity_period_days", None)
-        if days is not None:
-            try:
-                return max(0, int(days))
-            except (TypeError, ValueError):
-                return int(default_days)
-
-        return int(default_days)
-
     def _license_is_valid_now(self, obj) -> bool:
         now_dt = timezone.now()
         if not bool(getattr(obj, "is_active", True)):
@@ -248,7 +209,7 @@ class MyLicenseDetailsSerializer(serializers.ModelSerializer):
 
     def _renewal_window(self, obj):
         now_dt = timezone.now()
-        reminder_days = self._get_timer_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
+        reminder_days = get_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
         valid_up_to = getattr(obj, "valid_up_to", None)
         if not valid_up_to:
             return reminder_days, None, None, False
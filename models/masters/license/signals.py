@@ -1,15 +1,31 @@
 from datetime import date, datetime, time
-from django.db.models.signals import post_save
+from django.db import transaction as db_transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from auth.workflow.models import Transaction
+from models.transactional.new_license_application.models import NewLicenseApplication
+from .active_licensees import SOURCE_FIELDS, invalidate_active_licensees
 from .models import License
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@receiver(post_save, sender=License)
+@receiver(post_delete, sender=License)
+def invalidate_active_licensees_on_license_change(sender, instance, **kwargs):
+    db_transaction.on_commit(invalidate_active_licensees)
+
+
+@receiver(post_save, sender=NewLicenseApplication)
+def invalidate_active_licensees_on_application_change(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(SOURCE_FIELDS):
+        return
+    db_transaction.on_commit(invalidate_active_licensees)
+
+
 def _stage_is_commissioner_approval(stage) -> bool:
     """
     New license applications: license + wallet_balances (0 balance) are issued only when
@@ -97,3 +97,63 @@ class LicenseIssuanceStageRulesTests(TestCase):
         )
         self.assertFalse(_stage_should_issue_license(txn3, application_model="newlicenseapplication"))
 
+
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+from models.masters.core.models import PoliceStation, Subdivision
+from models.masters.license.active_licensees import filter_by_mode, resolve_source_details
+from models.masters.license.models import License
+
+
+class ActiveLicenseesSourceResolutionTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        self.district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        self.subdivision = Subdivision.objects.create(subdivision="Gangtok", subdivision_code=1553, is_active=True, district_code=self.district)
+        self.police_station = PoliceStation.objects.create(police_station="Gangtok PS", subdivision_code=self.subdivision)
+        self.category = LicenseCategory.objects.create(license_category="Distillery")
+        self.subcategory = LicenseSubcategory.objects.create(description="Distillery", category=self.category)
+        self.license_type = LicenseType.objects.create(license_type="Manufacturing")
+        self.workflow = Workflow.objects.create(name="License Approval")
+        self.stage = WorkflowStage.objects.create(workflow=self.workflow, name="approved", is_final=True)
+        self.content_type = ContentType.objects.get_for_model(NewLicenseApplication)
+
+    def _issue(self, application_id, establishment_name, mode_of_operation):
+        NewLicenseApplication.objects.create(
+            application_id=application_id, workflow=self.workflow, current_stage=self.stage,
+            license_type=self.license_type, license_category=self.category,
+            license_sub_category=self.subcategory, establishment_name=establishment_name, mode_of_operation=mode_of_operation,
+            site_type="New", applicant_name="Applicant", father_husband_name="Father", dob="2000-01-01",
+            gender="Male", nationality="Indian", residential_status="Resident",
+            present_address="Address", permanent_address="Address", pan="ABCDE1234F",
+            email="test@example.com", mobile_number="9999999999", has_sikkim_certificate="Yes",
+            has_excise_license="No", criminal_conviction="No", site_district=self.district,
+            site_subdivision=self.subdivision, police_station=self.police_station,
+            location_category="Urban", location_name="Gangtok", ward_name="Ward 1",
+            business_address="Business Address", road_name="Road 1", pin_code="737101",
+            construction_type="Permanent", site_owned="Yes", noc_obtained="Yes",
+        )
+        return License.objects.create(
+            license_id=f"NA/225/2026-27/{application_id[-4:]}", source_content_type=self.content_type,
+            source_object_id=application_id, source_type="new_license_application",
+            license_category=self.category, excise_district=self.district,
+            valid_up_to=timezone.now() + timedelta(days=30),
+        )
+
+    def test_source_applications_resolve_in_one_query_and_mode_filters_in_sql(self):
+        self._issue("NLA/225/2026-27/0001", "Alpine Distillery", "Self")
+        self._issue("NLA/225/2026-27/0002", "Valley Spirits", "Lease")
+        licenses = list(License.objects.all())
+
+        with self.assertNumQueries(1):
+            details = resolve_source_details(licenses)
+        self.assertEqual(
+            details[(self.content_type.id, "NLA/225/2026-27/0002")],
+            {"establishment_name": "Valley Spirits", "mode_of_operation": "Lease"},
+        )
+
+        self_run = filter_by_mode(License.objects.all(), "self")
+        self.assertEqual(list(self_run.values_list("source_object_id", flat=True)), ["NLA/225/2026-27/0001"])
@@ -14,6 +14,7 @@ from rest_framework import status, generics
 from auth.roles.permissions import HasAppPermission
 from django.core import signing
 from .models import License, LicenseValidationToken
+from .active_licensees import cache_key, filter_by_mode, get_cached, resolve_source_details, set_cached
 from .master_license_form_terms import MasterLicenseFormTerms
 from models.transactional.new_license_application.models import NewLicenseApplication
 from .serializers import LicenseSerializer, LicenseDetailSerializer, MyLicenseDetailsSerializer
@@ -194,7 +195,6 @@ def active_licensees(request):
         ).select_related(
             'excise_district',
             'license_category',
-            'source_content_type'
         )
     else:
         licensees = License.objects.filter(
@@ -203,7 +203,6 @@ def active_licensees(request):
         ).select_related(
             'excise_district',
             'license_category',
-            'source_content_type'
         )
 
     if district_code:
@@ -212,30 +211,26 @@ def active_licensees(request):
     if license_category:
         licensees = licensees.filter(license_category_id=license_category)
 
-    data = []
-
-    for license in licensees:
-        source_app = license.source_application
-        establishment_name = str(getattr(license, "license_id", "") or "")
-        mode_of_operation = "N/A"
-
-        if source_app:
-            if hasattr(source_app, 'establishment_name'):
-                establishment_name = source_app.establishment_name or establishment_name
+    if mode:
+        licensees = filter_by_mode(licensees, mode)
 
-            if hasattr(source_app, 'mode_of_operation'):
-                mode_of_operation = source_app.mode_of_operation or mode_of_operation
+    key = None if is_licensee_role else cache_key(district_code, license_category, mode)
+    data = get_cached(key)
+    if data is not None:
+        return Response(data, status=status.HTTP_200_OK)
 
-            if mode:
-                mode_formatted = mode.capitalize()
-                if mode_of_operation != mode_formatted:
-                    continue
+    licensees = list(licensees)
+    source_details = resolve_source_details(licensees)
+    current_time = now()
+    data = []
 
-            if mode and mode_of_operation == "N/A":
-                continue
+    for license in licensees:
+        details = source_details.get((license.source_content_type_id, str(license.source_object_id or '')), {})
+        establishment_name = details.get('establishment_name') or str(getattr(license, "license_id", "") or "")
+        mode_of_operation = details.get('mode_of_operation') or "N/A"
 
         status_str = "Active"
-        if (license.valid_up_to and license.valid_up_to < now()) or not license.is_active:
+        if (license.valid_up_to and license.valid_up_to < current_time) or not license.is_active:
             status_str = "Expired"
             if "expired" not in establishment_name.lower():
                 establishment_name = f"{establishment_name} (Expired)"
@@ -251,6 +246,8 @@ def active_licensees(request):
             "mode_of_operation": mode_of_operation,
             "status": status_str
         })
+
+    set_cached(key, data)
     return Response(data, status=status.HTTP_200_OK)
 
 
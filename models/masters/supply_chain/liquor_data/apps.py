@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class LiquorDataConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'models.masters.supply_chain.liquor_data'
+
+    def ready(self):
+        import models.masters.supply_chain.liquor_data.signals
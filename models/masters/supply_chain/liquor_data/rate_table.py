@@ -0,0 +1,135 @@
+"""
+Process-local liquor rate table.
+
+Built from `BrandWarehouse` (rates) joined to `LiquorData` (brand owner) in two
+queries and kept per worker process. A version counter in the shared cache is
+bumped whenever warehouse rates or brand masters change (see signals.py), so
+every worker rebuilds its table on the next lookup after an edit. While the
+cache is unreachable there is no version to compare, so a table is reused for
+UNVERSIONED_TABLE_TTL seconds before it is rebuilt.
+"""
+import re
+import threading
+import time
+
+from models.transactional.supply_chain.brand_warehouse.models import BrandWarehouse
+from utils.cache_versions import bump_version, get_version
+from .models import LiquorData
+
+RATE_TABLE_VERSION = 'liquor_rates'
+
+# Seconds a table built without a shared version is reused.
+UNVERSIONED_TABLE_TTL = 30
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_brand_name(value) -> str:
+    return _WHITESPACE_RE.sub(' ', str(value or '').strip()).casefold()
+
+
+class LiquorRateTable:
+    def __init__(self, version=None):
+        self.version = version
+        self.built_at = time.monotonic()
+        # size_ml -> [(normalized brand name, rate payload, liquor_data_id)], most recently updated first
+        self._by_size = {}
+        # (normalized brand name, size_ml) -> first row of the list above with that exact name
+        self._exact = {}
+        self._owner_by_liquor_data_id = {}
+        self._owner_by_name_size = {}
+
+    @classmethod
+    def build(cls, version=None):
+        table = cls(version)
+        warehouses = (
+            BrandWarehouse.objects.filter(brand__isnull=False, capacity_size__isnull=False)
+            .select_related('brand', 'capacity_size', 'liquor_type', 'factory')
+            .order_by('-updated_at', '-id')
+        )
+        for warehouse_row in warehouses:
+            size_ml = int(warehouse_row.capacity_size.size_ml or 0)
+            name = normalize_brand_name(warehouse_row.brand_name)
+            entry = (name, cls._rate_payload(warehouse_row), warehouse_row.liquor_data_id)
+            table._by_size.setdefault(size_ml, []).append(entry)
+            table._exact.setdefault((name, size_ml), entry)
+
+        # BrandWarehouse does not store brand_owner, so fall back to LiquorData.
+        owners = (
+            LiquorData.objects.exclude(brand_owner__isnull=True)
+            .exclude(brand_owner='')
+            .order_by('-updated_at', '-id')
+            .values_list('id', 'brand_name', 'pack_size_ml', 'brand_owner')
+        )
+        for liquor_data_id, brand_name, pack_size_ml, brand_owner in owners:
+            owner = str(brand_owner).strip()
+            table._owner_by_liquor_data_id[liquor_data_id] = owner
+            table._owner_by_name_size.setdefault((normalize_brand_name(brand_name), pack_size_ml), owner)
+        return table
+
+    def is_current(self, version) -> bool:
+        if version is None:
+            return time.monotonic() - self.built_at < UNVERSIONED_TABLE_TTL
+        return self.version == version
+
+    @staticmethod
+    def _rate_payload(warehouse_row):
+        return {
+            'brandId': warehouse_row.brand_id,
+            'brand': warehouse_row.brand_name,
+            'size': f"{warehouse_row.capacity_size}ml",
+            'educationCess': float(warehouse_row.education_cess_rs_per_case or 0),
+            'exciseDuty': float(warehouse_row.excise_duty_rs_per_case or 0),
+            'additionalExcise': float(warehouse_row.additional_excise_duty_rs_per_case or 0),
+            'liquorType': warehouse_row.brand_type,
+            'exFactoryPrice': float(warehouse_row.ex_factory_price_rs_per_case or 0),
+            'manufacturingUnitName': warehouse_row.distillery_name,
+            'additionalExcise12_5': float(warehouse_row.additional_excise_duty_12_5_percent_rs_per_case or 0),
+            'bottlingFee': 0,
+            'exportFee': 0,
+            'mrpPerBottle': float(warehouse_row.mrp_rs_per_bottle or 0),
+            'totalPricePerCase': 0,
+        }
+
+    def lookup(self, brand_name, pack_size_ml: int):
+        """
+        Rates for a brand + pack size, or None.
+
+        Prefer an exact (normalized) name match, then fall back to contains for
+        legacy name variations.
+        """
+        name = normalize_brand_name(brand_name)
+        if not name:
+            return None
+        entry = self._exact.get((name, pack_size_ml))
+        if entry is None:
+            entry = next((row for row in self._by_size.get(pack_size_ml, ()) if name in row[0]), None)
+        if entry is None:
+            return None
+
+        _, payload, liquor_data_id = entry
+        brand_owner = self._owner_by_liquor_data_id.get(liquor_data_id) if liquor_data_id else None
+        if not brand_owner:
+            brand_owner = self._owner_by_name_size.get((name, pack_size_ml), '')
+        return {**payload, 'brandOwner': brand_owner}
+
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def get_rate_table() -> LiquorRateTable:
+    """Current rate table, rebuilt when the shared version counter has moved (or, without one, has aged out)."""
+    global _table
+    version = get_version(RATE_TABLE_VERSION)
+    table = _table
+    if table is not None and table.is_current(version):
+        return table
+    with _table_lock:
+        if _table is None or not _table.is_current(version):
+            _table = LiquorRateTable.build(version)
+        return _table
+
+
+def invalidate_rate_table():
+    bump_version(RATE_TABLE_VERSION)
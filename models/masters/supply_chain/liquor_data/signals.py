@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from models.transactional.supply_chain.brand_warehouse.models import BrandWarehouse
+from .models import LiquorData, MasterBrandList, MasterFactoryList, MasterLiquorType
+from .rate_table import invalidate_rate_table
+
+# Stock movements save these fields only; they do not change rates.
+STOCK_ONLY_FIELDS = {'current_stock', 'status', 'updated_at', 'is_sync'}
+
+
+@receiver(post_save, sender=BrandWarehouse)
+def invalidate_rates_on_warehouse_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= STOCK_ONLY_FIELDS:
+        return
+    transaction.on_commit(invalidate_rate_table)
+
+
+@receiver(post_delete, sender=BrandWarehouse)
+@receiver(post_save, sender=LiquorData)
+@receiver(post_delete, sender=LiquorData)
+@receiver(post_save, sender=MasterBrandList)
+@receiver(post_save, sender=MasterFactoryList)
+@receiver(post_save, sender=MasterLiquorType)
+def invalidate_rates_on_master_change(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_rate_table)
@@ -0,0 +1,79 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from models.transactional.supply_chain.brand_warehouse.models import BrandWarehouse
+
+from . import rate_table
+from .models import LiquorData, MasterBrandList, MasterLiquorCapacity
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class LiquorRateTableTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        rate_table._table = None
+        self.addCleanup(setattr, rate_table, '_table', None)
+        size = MasterLiquorCapacity.objects.create(size_ml=750)
+        owner = LiquorData.objects.create(brand_name='Old Monk', pack_size_ml=750, brand_owner='Mohan Meakin')
+        self.warehouse = BrandWarehouse.objects.create(
+            license_id='NLI/1', brand=MasterBrandList.objects.create(brand_name='Old Monk'),
+            capacity_size=size, liquor_data_id=owner.pk, mrp_rs_per_bottle=Decimal('450.00'),
+        )
+        BrandWarehouse.objects.create(
+            license_id='NLI/1', brand=MasterBrandList.objects.create(brand_name='Old Monk Supreme Rum'),
+            capacity_size=size, mrp_rs_per_bottle=Decimal('700.00'),
+        )
+
+    def test_batch_matches_exact_then_substring_names(self):
+        resp = APIClient().post(
+            reverse('supply_chain_masters:liquor-rates-batch'),
+            {'items': [
+                {'brandName': '  old   MONK ', 'packSizeMl': 750},
+                {'brandName': 'Supreme', 'packSizeMl': '750'},
+                {'brandName': 'Old Monk', 'packSizeMl': 180},
+                {'brandName': 'Old Monk', 'packSizeMl': 'large'},
+            ]},
+            format='json',
+        )
+        self.assertEqual(resp.status_code, 200)
+        exact, substring, missing, invalid = resp.data['data']
+        self.assertEqual(
+            (exact['data']['brand'], exact['data']['mrpPerBottle'], exact['data']['brandOwner']),
+            ('Old Monk', 450.0, 'Mohan Meakin'),
+        )
+        self.assertEqual((substring['pack_size_ml'], substring['data']['brand']), (750, 'Old Monk Supreme Rum'))
+        self.assertEqual(missing['found'], False)
+        self.assertEqual(invalid['error'], 'pack_size_ml must be a valid number')
+
+        resp = APIClient().post(reverse('supply_chain_masters:liquor-rates-batch'), {'items': []}, format='json')
+        self.assertEqual(resp.status_code, 400)
+
+    def test_rate_edits_rebuild_the_table_and_stock_moves_do_not(self):
+        table = rate_table.get_rate_table()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.warehouse.current_stock = 5
+            self.warehouse.save(update_fields=['current_stock', 'updated_at'])
+        self.assertIs(rate_table.get_rate_table(), table)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.warehouse.mrp_rs_per_bottle = Decimal('475.00')
+            self.warehouse.save()
+        self.assertEqual(rate_table.get_rate_table().lookup('Old Monk', 750)['mrpPerBottle'], 475.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            LiquorData.objects.get(pk=self.warehouse.liquor_data_id).delete()
+        self.assertEqual(rate_table.get_rate_table().lookup('Old Monk', 750)['brandOwner'], '')
+
+    def test_table_is_reused_for_a_while_without_a_shared_version(self):
+        with mock.patch.object(rate_table, 'get_version', return_value=None):
+            table = rate_table.get_rate_table()
+            with self.assertNumQueries(0):
+                self.assertIs(rate_table.get_rate_table(), table)
+
+            table.built_at -= rate_table.UNVERSIONED_TABLE_TTL
+            self.assertIsNot(rate_table.get_rate_table(), table)
@@ -14,4 +14,5 @@ urlpatterns = [
     path('bottle-types/<int:pk>/', views.MasterBottleTypeDetailView.as_view(), name='master-bottle-type-detail'),
     path('brands/', views.BrandSizeListView.as_view(), name='brand-size-list'),
     path('rates/', views.LiquorRatesView.as_view(), name='liquor-rates'),
+    path('rates/batch/', views.LiquorRatesBatchView.as_view(), name='liquor-rates-batch'),
 ]
@@ -3,7 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from django.db.models import Q, Max, Count
+from django.db.models import Max, Count
 import logging
 from models.transactional.supply_chain.brand_warehouse.models import BrandWarehouse
 from auth.roles.permissions import HasAppPermission  # type: ignore
@@ -13,8 +13,8 @@ from .models import (
     MasterBottleType,
     MasterBrandList,
     MasterFactoryList,
-    LiquorData,
 )
+from .rate_table import get_rate_table
 from .serializers import (
     MasterLiquorTypeSerializer,
     MasterLiquorCapacitySerializer,
@@ -159,39 +159,11 @@ class BrandSizeListView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class LiquorRatesView(APIView):
-    @staticmethod
-    def _resolve_brand_owner(warehouse_row, normalized_brand: str, pack_size_ml: int) -> str:
-        """
-        Resolve brand owner for a given brand + pack size.
-
-        BrandWarehouse does not store brand_owner, so fall back to LiquorData.
-        """
-        try:
-            liquor_data_id = getattr(warehouse_row, 'liquor_data_id', None)
-            if liquor_data_id:
-                row = LiquorData.objects.filter(id=liquor_data_id).first()
-                if row and row.brand_owner:
-                    return str(row.brand_owner).strip()
-        except Exception:
-            pass
-
-        try:
-            row = (
-                LiquorData.objects.filter(
-                    brand_name__iexact=normalized_brand,
-                    pack_size_ml=pack_size_ml,
-                )
-                .exclude(brand_owner__isnull=True)
-                .exclude(brand_owner='')
-                .order_by('-updated_at', '-id')
-                .first()
-            )
-            if row and row.brand_owner:
-                return str(row.brand_owner).strip()
-        except Exception:
-            pass
+    """
+    Rates for one brand + pack size.
 
-        return ''
+    Served from the process-local rate table (see rate_table.py).
+    """
 
     def get(self, request):
         try:
@@ -215,46 +187,14 @@ class LiquorRatesView(APIView):
                     'error': 'pack_size_ml must be a valid number'
                 }, status=status.HTTP_400_BAD_REQUEST)
 
-            normalized_brand = brand_name.strip()
-            base_qs = BrandWarehouse.objects.filter(capacity_size__size_ml=pack_size_ml)
+            response_data = get_rate_table().lookup(brand_name, pack_size_ml)
 
-            # Prefer exact match first, then fall back to contains for legacy name variations.
-            warehouse_row = base_qs.filter(brand__brand_name__iexact=normalized_brand).first()
-            if not warehouse_row:
-                warehouse_row = base_qs.filter(
-                    Q(brand__brand_name__icontains=normalized_brand) |
-                    Q(brand__brand_name__istartswith=normalized_brand)
-                ).first()
-
-            logger.debug("LiquorRatesView warehouse query result: %s", warehouse_row)
-
-            if not warehouse_row:
+            if not response_data:
                 return Response({
                     'success': False,
                     'error': f'No data found for brand: {brand_name} and size: {pack_size_ml}ml'
                 }, status=status.HTTP_404_NOT_FOUND)
 
-            response_data = {
-                'brandId': warehouse_row.brand_id,
-                'brand': warehouse_row.brand_name,
-                'size': f"{warehouse_row.capacity_size}ml",
-                'educationCess': float(warehouse_row.education_cess_rs_per_case or 0),
-                'exciseDuty': float(warehouse_row.excise_duty_rs_per_case or 0),
-                'additionalExcise': float(warehouse_row.additional_excise_duty_rs_per_case or 0),
-                
-                # New fields
-                'brandOwner': self._resolve_brand_owner(warehouse_row, normalized_brand, pack_size_ml),
-                'liquorType': warehouse_row.brand_type,
-                'exFactoryPrice': float(warehouse_row.ex_factory_price_rs_per_case or 0),
-                'manufacturingUnitName': warehouse_row.distillery_name,
-
-                'additionalExcise12_5': float(warehouse_row.additional_excise_duty_12_5_percent_rs_per_case or 0),
-                'bottlingFee': 0,
-                'exportFee': 0,
-                'mrpPerBottle': float(warehouse_row.mrp_rs_per_bottle or 0),
-                'totalPricePerCase': 0
-            }
-
             logger.debug("LiquorRatesView response payload built for brand=%r size_ml=%s", brand_name, pack_size_ml)
 
             return Response({
@@ -270,6 +210,59 @@ class LiquorRatesView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class LiquorRatesBatchView(APIView):
+    """
+    Rates for many (brand, pack size) pairs in one round trip.
+
+    Body: {"items": [{"brandName": "...", "packSizeMl": 750}, ...]}
+    Results are returned in request order; lines without rates carry an error
+    instead of failing the whole batch.
+    """
+    MAX_ITEMS = 200
+
+    def post(self, request):
+        items = request.data.get('items') if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            return Response({
+                'success': False,
+                'error': 'items must be a non-empty list of {brandName, packSizeMl}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.MAX_ITEMS:
+            return Response({
+                'success': False,
+                'error': f'At most {self.MAX_ITEMS} items are allowed per request'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        table = get_rate_table()
+        results = []
+        for item in items:
+            item = item if isinstance(item, dict) else {}
+            brand_name = str(item.get('brand_name') or '').strip()
+            result = {'brand_name': brand_name, 'pack_size_ml': item.get('pack_size_ml')}
+            try:
+                pack_size_ml = int(item.get('pack_size_ml'))
+            except (TypeError, ValueError):
+                results.append({**result, 'found': False, 'error': 'pack_size_ml must be a valid number'})
+                continue
+            result['pack_size_ml'] = pack_size_ml
+
+            rates = table.lookup(brand_name, pack_size_ml) if brand_name else None
+            if rates:
+                results.append({**result, 'found': True, 'data': rates})
+            else:
+                results.append({
+                    **result,
+                    'found': False,
+                    'error': f'No data found for brand: {brand_name} and size: {pack_size_ml}ml',
+                })
+
+        return Response({
+            'success': True,
+            'data': results,
+            'total': len(results),
+        })
+
+
 class MasterLiquorCapacityListView(APIView):
     """
     Master table endpoint for pack sizes (ml).
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AppNameConfig(AppConfig):
     name = 'models.transactional'
     verbose_name = 'transactional'
+
+    def ready(self):
+        from .dashboards import connect_dashboard_signals
+        connect_dashboard_signals()
@@ -0,0 +1,8 @@
+"""
+Synthetic data and a repeatable benchmark suite for the hot paths.
+
+``manage.py seed_benchmark_data`` fills a local database (see `seed`) and
+``manage.py run_benchmarks`` drives the scenarios in `scenarios` through the
+services and the Django test client, writing p50/p95 latency and query counts
+to JSON and flagging regressions against an earlier run.
+"""
@@ -0,0 +1,126 @@
+"""
+Runs benchmark scenarios and compares result files.
+
+Every iteration runs in its own transaction, wrapped in a `QueryRecorder`, and
+is rolled back afterwards. Latencies are wall-clock milliseconds for the step
+(commit/rollback excluded). Results are plain dicts so they can be written to
+and read back from JSON.
+"""
+import time
+from collections import Counter
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from utils.query_profiler import QueryRecorder
+
+from .scenarios import SCENARIOS
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of `values` (0-100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _measure(step, index):
+    recorder = QueryRecorder()
+    with transaction.atomic():
+        with connection.execute_wrapper(recorder):
+            started = time.perf_counter()
+            try:
+                status = step(index)
+            except Exception as exc:
+                status = type(exc).__name__
+            elapsed = time.perf_counter() - started
+        transaction.set_rollback(True)
+    return elapsed * 1000, recorder, status
+
+
+def run_scenario(name, fixtures, iterations=20, warmup=2):
+    step = SCENARIOS[name](fixtures)
+    for index in range(warmup):
+        _measure(step, index)
+
+    timings = []
+    queries = []
+    statuses = Counter()
+    duplicates = []
+    for index in range(warmup, warmup + iterations):
+        elapsed_ms, recorder, status = _measure(step, index)
+        timings.append(elapsed_ms)
+        queries.append(recorder.queries)
+        statuses[str(status)] += 1
+        duplicates = recorder.duplicates()
+
+    return {
+        'iterations': iterations,
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'mean_ms': round(sum(timings) / len(timings), 3),
+        'max_ms': round(max(timings), 3),
+        'queries': int(percentile(queries, 50)),
+        'max_queries': max(queries),
+        'statuses': dict(statuses),
+        'errors': sum(count for status, count in statuses.items() if not status.startswith('2')),
+        'duplicates': duplicates,
+    }
+
+
+def run(fixtures, names=None, iterations=20, warmup=2, meta=None):
+    names = names or list(SCENARIOS)
+    unknown = sorted(set(names) - set(SCENARIOS))
+    if unknown:
+        raise KeyError(f"Unknown scenario(s): {', '.join(unknown)}")
+    return {
+        'meta': {
+            'created_at': timezone.now().isoformat(),
+            'iterations': iterations,
+            'warmup': warmup,
+            'database': {'vendor': connection.vendor, 'version': getattr(connection, 'pg_version', None)},
+            **(meta or {}),
+        },
+        'results': {name: run_scenario(name, fixtures, iterations, warmup) for name in names},
+    }
+
+
+def compare(baseline, current, max_slowdown=0.25, min_delta_ms=2.0):
+    """
+    One row per scenario in either run. A scenario regresses when its p95 grew
+    by more than `max_slowdown` (a fraction) and by more than `min_delta_ms`,
+    when its median query count grew at all, or when it failed more often.
+    """
+    before, after = baseline.get('results', {}), current.get('results', {})
+    rows = []
+    for name in sorted(set(before) | set(after)):
+        old, new = before.get(name), after.get(name)
+        row = {'name': name}
+        if old is None or new is None:
+            row['verdict'] = 'new' if old is None else 'missing'
+            rows.append(row)
+            continue
+
+        delta_ms = new['p95_ms'] - old['p95_ms']
+        change = delta_ms / old['p95_ms'] if old['p95_ms'] else 0.0
+        row.update({
+            'baseline_p95_ms': old['p95_ms'],
+            'current_p95_ms': new['p95_ms'],
+            'change': round(change, 3),
+            'baseline_queries': old['queries'],
+            'current_queries': new['queries'],
+        })
+        slower = change > max_slowdown and delta_ms > min_delta_ms
+        faster = change < -max_slowdown and -delta_ms > min_delta_ms
+        if slower or new['queries'] > old['queries'] or new['errors'] > old['errors']:
+            row['verdict'] = 'regression'
+        elif faster or new['queries'] < old['queries']:
+            row['verdict'] = 'improved'
+        else:
+            row['verdict'] = 'ok'
+        rows.append(row)
+    return rows
@@ -0,0 +1,136 @@
+"""
+Benchmark scenarios for the hot paths.
+
+A scenario is a function taking the seeded `Fixtures` and returning a `step(index)`
+callable; each call performs one operation and returns an HTTP-style status code.
+The runner calls steps inside a transaction it rolls back, so writes (allocations,
+permit submissions, stage changes, wallet credits) never accumulate between
+iterations or runs.
+"""
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from auth.workflow.services import WorkflowService
+from models.transactional.supply_chain.hologram.models import HologramRollsDetails, HologramSerialRange
+from models.transactional.supply_chain.hologram.views import HologramRequestViewSet
+from models.transactional.wallet.wallet_service import credit_wallet_balance
+
+from .seed import SIZES_ML, WALLET_TYPES
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    def register(factory):
+        SCENARIOS[name] = factory
+        return factory
+    return register
+
+
+def _client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _get(view_name, user):
+    client = _client(user)
+    url = reverse(view_name)
+
+    def step(index):
+        return client.get(url).status_code
+    return step
+
+
+@scenario('hologram.allocate_fifo')
+def allocate_fifo(fixtures):
+    roll_id = fixtures.roll.pk
+    # Enough to consume two free ranges whole and split the third.
+    counts = list(
+        HologramSerialRange.objects.filter(roll_id=roll_id, status=HologramSerialRange.STATUS_AVAILABLE)
+        .order_by('from_serial')
+        .values_list('count', flat=True)[:3]
+    )
+    quantity = sum(counts[:2]) + max(counts[2] // 2, 1) if len(counts) == 3 else max(sum(counts) // 2, 1)
+    viewset = HologramRequestViewSet()
+
+    def step(index):
+        roll = HologramRollsDetails.objects.get(pk=roll_id)
+        result = viewset.allocate_holograms_fifo(roll, quantity, f'BENCH/ALLOC/{index:05d}', fixtures.anchor)
+        return 200 if result['success'] else 409
+    return step
+
+
+@scenario('transit_permit.submit')
+def submit_transit_permit(fixtures):
+    client = _client(fixtures.licensee)
+    url = reverse('supply_chain:submit-transit-permit')
+    payload = {
+        'soleDistributor': 'Bench Distributor',
+        'date': fixtures.anchor.isoformat(),
+        'depotAddress': 'Bench Depot',
+        'vehicleNumber': 'SK01B0001',
+        'products': [{'brand': fixtures.warehouse.brand.brand_name, 'size': str(SIZES_ML[0]), 'cases': 2}],
+    }
+
+    def step(index):
+        return client.post(url, payload, format='json').status_code
+    return step
+
+
+@scenario('workflow.advance_stage')
+def advance_stage(fixtures):
+    request_id = fixtures.hologram_request.pk
+    model = type(fixtures.hologram_request)
+
+    def step(index):
+        application = model.objects.select_related('current_stage', 'workflow').get(pk=request_id)
+        WorkflowService.advance_stage(
+            application, fixtures.officer, fixtures.approve_stage, context={'action': 'APPROVE'}, remarks='Benchmark'
+        )
+        return 200
+    return step
+
+
+@scenario('wallet.credit_balance')
+def credit_balance(fixtures):
+    head_of_account = WALLET_TYPES['excise'][1]
+
+    def step(index):
+        credit_wallet_balance(
+            transaction_id=f'BENCH-CREDIT-{index:05d}',
+            licensee_id=fixtures.license_id,
+            wallet_type='excise',
+            head_of_account=head_of_account,
+            amount=Decimal('1000.00'),
+            user_id=fixtures.licensee.username,
+        )
+        return 200
+    return step
+
+
+@scenario('dashboard.workflows')
+def workflow_dashboard(fixtures):
+    return _get('workflows:dashboard-counts', fixtures.officer)
+
+
+@scenario('dashboard.new_license_application')
+def new_license_dashboard(fixtures):
+    return _get('new_license_application:dashboard-counts', fixtures.licensee)
+
+
+@scenario('dashboard.license_renewal_application')
+def license_renewal_dashboard(fixtures):
+    return _get('license_renewal_application:dashboard-counts', fixtures.licensee)
+
+
+@scenario('dashboard.salesman_barman')
+def salesman_barman_dashboard(fixtures):
+    return _get('salesman_barman:sb-dashboard-counts', fixtures.licensee)
+
+
+@scenario('dashboard.company_registration')
+def company_registration_dashboard(fixtures):
+    return _get('company_registration:dashboard-counts', fixtures.licensee)
@@ -0,0 +1,648 @@
+"""
+Deterministic synthetic data for the benchmark suite.
+
+`Seeder` creates N licensees, each with a user, an active manufacturing
+license, a manufacturing unit, excise/education cess/hologram wallets with a
+recharge history, brand warehouse rows, hologram procurements whose rolls are
+split into AVAILABLE/IN_USE serial ranges, hologram requests and new license
+applications with their workflow transactions. The same `seed` always produces
+the same rows.
+
+Rows are written with `bulk_create`, so model signals do not fire; the
+`seed_benchmark_data` command rebuilds the derived hologram tables afterwards
+and `Seeder` invalidates the license caches itself. Everything seeded carries
+the `TAG` marker (usernames, license ids, reference numbers) so `flush` removes
+it without touching real data. Shared masters the seeder had to create
+(workflows, roles, liquor types, capacities) are left in place.
+"""
+import random
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from auth.roles.models import Role
+from auth.user.models import CustomUser
+from auth.workflow.constants import WORKFLOW_IDS
+from auth.workflow.models import StagePermission, Transaction, Workflow, WorkflowStage, WorkflowTransition
+from models.masters.core.models import (
+    District,
+    LicenseCategory,
+    LicenseSubcategory,
+    LicenseType,
+    PoliceStation,
+    State,
+    Subdivision,
+)
+from models.masters.license.active_licensees import invalidate_active_licensees
+from models.masters.license.models import License
+from models.masters.supply_chain.liquor_data.models import (
+    MasterBrandList,
+    MasterFactoryList,
+    MasterLiquorCapacity,
+    MasterLiquorType,
+)
+from models.masters.supply_chain.profile.models import UserManufacturingUnit
+from models.masters.supply_chain.transit_permit.models import BrandMlInCases
+from models.transactional.new_license_application.models import NewLicenseApplication
+from models.transactional.supply_chain.access_control import invalidate_license_scopes
+from models.transactional.supply_chain.brand_warehouse.models import BrandWarehouse, BrandWarehouseUtilization
+from models.transactional.supply_chain.ena_transit_permit_details.models import EnaTransitPermitDetail
+from models.transactional.supply_chain.hologram.models import (
+    DailyHologramRegister,
+    HologramMonthlyStockLedger,
+    HologramProcurement,
+    HologramRequest,
+    HologramRequestSla,
+    HologramRollsDetails,
+    HologramSerialRange,
+)
+from models.transactional.wallet.models import MasterWalletType, WalletBalance, WalletTransaction
+
+TAG = 'BENCH'
+EMAIL_DOMAIN = 'bench.invalid'
+DISTRICT_CODE = 990
+SUBDIVISION_CODE = 99001
+POLICE_STATION_CODE = 99901
+OFFICER_USERNAME = f'{TAG}OIC'
+
+WALLET_TYPES = {
+    'excise': ('Excise Duty', '0039-00-105-45-01'),
+    'education_cess': ('Education Cess', '0045-00-112-45-03'),
+    'hologram': ('Hologram Fee', '0039-00-800-45-01'),
+}
+SIZES_ML = (750, 375, 180)
+BOTTLES_PER_CASE = {750: 12, 375: 24, 180: 48}
+LIQUOR_TYPES = ('Whisky', 'Rum', 'Brandy', 'Vodka', 'Gin')
+SERIAL_BASE = 10_000_000
+
+DEFAULTS = {
+    'licensees': 100,
+    'brands': 5,
+    'procurements': 2,
+    'rolls': 3,
+    'ranges': 20,
+    'requests': 10,
+    'applications': 3,
+    'wallet_transactions': 20,
+}
+
+# Minimal workflows, only created when the database has none with these ids.
+WORKFLOWS = {
+    'LICENSE_APPROVAL': (
+        'License Approval',
+        ['Applied', 'Objection', 'Awaiting Payment', 'approved', 'rejected'],
+        [('Applied', 'Awaiting Payment', 'APPROVE'), ('Applied', 'Objection', 'OBJECTION'),
+         ('Awaiting Payment', 'approved', 'PAY'), ('Applied', 'rejected', 'REJECT')],
+    ),
+    'HOLOGRAM_REQUEST': (
+        'Hologram Request',
+        ['Submitted', 'Approved by OIC', 'Rejected by OIC'],
+        [('Submitted', 'Approved by OIC', 'APPROVE'), ('Submitted', 'Rejected by OIC', 'REJECT')],
+    ),
+    'TRANSIT_PERMIT': (
+        'Transit Permit',
+        ['Ready for Payment', 'Forwarded to Officer In-Charge', 'Approved by Officer In-Charge'],
+        [('Ready for Payment', 'Forwarded to Officer In-Charge', 'PAY'),
+         ('Forwarded to Officer In-Charge', 'Approved by Officer In-Charge', 'APPROVE')],
+    ),
+}
+
+Fixtures = namedtuple('Fixtures', [
+    'licensee', 'license_id', 'officer', 'roll', 'hologram_request', 'approve_stage', 'warehouse', 'anchor',
+])
+
+
+def license_id_for(index):
+    return f'NA/{DISTRICT_CODE}/{TAG}/{index:05d}'
+
+
+def _tagged_license_ids():
+    return License.objects.filter(license_id__contains=f'/{TAG}/').values('license_id')
+
+
+def _aware(day, hour=10):
+    return timezone.make_aware(datetime.combine(day, time(hour)))
+
+
+def _initial_stage(workflow):
+    return (
+        WorkflowStage.objects.filter(workflow=workflow, is_initial=True).order_by('id').first()
+        or WorkflowStage.objects.filter(workflow=workflow).order_by('id').first()
+    )
+
+
+def _ensure_workflow(key):
+    name, stage_names, transitions = WORKFLOWS[key]
+    workflow, created = Workflow.objects.get_or_create(id=WORKFLOW_IDS[key], defaults={'name': name})
+    if not created and WorkflowStage.objects.filter(workflow=workflow).exists():
+        return workflow
+    stages = {
+        stage_name: WorkflowStage.objects.create(workflow=workflow, name=stage_name, is_initial=index == 0)
+        for index, stage_name in enumerate(stage_names)
+    }
+    for from_name, to_name, action in transitions:
+        WorkflowTransition.objects.create(
+            workflow=workflow, from_stage=stages[from_name], to_stage=stages[to_name], condition={'action': action}
+        )
+    return workflow
+
+
+def approve_transition(workflow):
+    """The APPROVE transition out of `workflow`'s initial stage (or its first transition)."""
+    initial = _initial_stage(workflow)
+    transitions = list(
+        WorkflowTransition.objects.filter(workflow=workflow, from_stage=initial).select_related('to_stage').order_by('id')
+    )
+    for transition in transitions:
+        if str((transition.condition or {}).get('action') or '').strip().upper() == 'APPROVE':
+            return transition
+    return transitions[0] if transitions else None
+
+
+def _officer_role(condition):
+    condition = condition or {}
+    if condition.get('role_id') is not None:
+        role = Role.objects.filter(id=condition['role_id']).first()
+        if role:
+            return role
+    name = str(condition.get('role') or 'oic').strip()
+    return Role.objects.filter(name__iexact=name).order_by('id').first() or Role.objects.create(name=name)
+
+
+def is_seeded():
+    return CustomUser.objects.filter(username__startswith=TAG, email__endswith=f'@{EMAIL_DOMAIN}').exists()
+
+
+def dataset_size():
+    """Row counts of the seeded data, recorded next to benchmark results."""
+    license_ids = _tagged_license_ids()
+    return {
+        'licensees': License.objects.filter(license_id__in=license_ids).count(),
+        'brand_warehouses': BrandWarehouse.objects.filter(license_id__in=license_ids).count(),
+        'hologram_rolls': HologramRollsDetails.objects.filter(license_id__in=license_ids).count(),
+        'hologram_ranges': HologramSerialRange.objects.filter(roll__license_id__in=license_ids).count(),
+        'hologram_requests': HologramRequest.objects.filter(license_id__in=license_ids).count(),
+        'applications': NewLicenseApplication.objects.filter(application_id__startswith=f'{TAG}/').count(),
+        'wallet_balances': WalletBalance.objects.filter(licensee_id__in=license_ids).count(),
+        'wallet_transactions': WalletTransaction.objects.filter(licensee_id__in=license_ids).count(),
+        'workflow_transactions': Transaction.objects.filter(performed_by__username__startswith=TAG).count(),
+    }
+
+
+@transaction.atomic
+def flush():
+    """Delete every seeded row; returns the number of rows deleted."""
+    license_ids = _tagged_license_ids()
+    users = CustomUser.objects.filter(username__startswith=TAG, email__endswith=f'@{EMAIL_DOMAIN}')
+    requests = HologramRequest.objects.filter(license_id__in=license_ids)
+    applications = NewLicenseApplication.objects.filter(application_id__startswith=f'{TAG}/')
+    request_type = ContentType.objects.get_for_model(HologramRequest)
+    application_type = ContentType.objects.get_for_model(NewLicenseApplication)
+
+    deleted = 0
+    for queryset in (
+        Transaction.objects.filter(
+            Q(content_type=request_type, object_id__in=[str(pk) for pk in requests.values_list('pk', flat=True)])
+            | Q(content_type=application_type, object_id__in=applications.values('application_id'))
+            | Q(performed_by__in=users)
+        ),
+        DailyHologramRegister.objects.filter(licensee__licensee_id__in=license_ids),
+        HologramRequestSla.objects.filter(hologram_request__in=requests),
+        requests,
+        HologramSerialRange.objects.filter(roll__license_id__in=license_ids),
+        HologramRollsDetails.objects.filter(license_id__in=license_ids),
+        HologramProcurement.objects.filter(license_id__in=license_ids),
+        HologramMonthlyStockLedger.objects.filter(license_id__in=license_ids),
+        WalletTransaction.objects.filter(licensee_id__in=license_ids),
+        WalletBalance.objects.filter(licensee_id__in=license_ids),
+        EnaTransitPermitDetail.objects.filter(licensee_id__in=license_ids),
+        BrandWarehouseUtilization.objects.filter(brand_warehouse__license_id__in=license_ids),
+        BrandWarehouse.objects.all_with_deleted().filter(license_id__in=license_ids),
+        MasterBrandList.objects.filter(brand_name__startswith=f'{TAG} '),
+        MasterFactoryList.objects.filter(factory_name__startswith=f'{TAG} '),
+        applications,
+        UserManufacturingUnit.objects.filter(licensee_id__in=license_ids),
+        License.objects.filter(license_id__in=license_ids),
+        users,
+    ):
+        deleted += queryset.delete()[0]
+    transaction.on_commit(invalidate_active_licensees)
+    transaction.on_commit(invalidate_license_scopes)
+    return deleted
+
+
+def load_fixtures():
+    """The seeded objects the benchmark scenarios drive; raises LookupError when nothing is seeded."""
+    licensee = (
+        CustomUser.objects.filter(username__startswith=TAG, email__endswith=f'@{EMAIL_DOMAIN}')
+        .exclude(username=OFFICER_USERNAME)
+        .select_related('role')
+        .order_by('username')
+        .first()
+    )
+    officer = CustomUser.objects.filter(username=OFFICER_USERNAME).select_related('role').first()
+    if licensee is None or officer is None:
+        raise LookupError('No benchmark data found; run `manage.py seed_benchmark_data` first.')
+
+    license_id = license_id_for(int(licensee.username[len(TAG):]))
+    roll = (
+        HologramRollsDetails.objects.filter(license_id=license_id)
+        .order_by('-available', 'id')
+        .first()
+    )
+    request_workflow = Workflow.objects.get(id=WORKFLOW_IDS['HOLOGRAM_REQUEST'])
+    transition = approve_transition(request_workflow)
+    if transition is None:
+        raise LookupError('The hologram request workflow has no transition out of its initial stage.')
+    hologram_request = (
+        HologramRequest.objects.filter(license_id__contains=f'/{TAG}/', current_stage=transition.from_stage)
+        .select_related('current_stage', 'workflow')
+        .order_by('id')
+        .first()
+    )
+    warehouse = (
+        BrandWarehouse.objects.filter(license_id=license_id, capacity_size__size_ml=SIZES_ML[0])
+        .select_related('brand', 'capacity_size')
+        .order_by('id')
+        .first()
+    )
+    return Fixtures(
+        licensee=licensee,
+        license_id=license_id,
+        officer=officer,
+        roll=roll,
+        hologram_request=hologram_request,
+        approve_stage=transition.to_stage,
+        warehouse=warehouse,
+        anchor=timezone.localdate(),
+    )
+
+
+class Seeder:
+    """Builds the synthetic dataset; sizes are per licensee except `licensees` and `brands`."""
+
+    def __init__(self, seed=0, anchor=None, batch_size=1000, **sizes):
+        self.sizes = {**DEFAULTS, **{key: value for key, value in sizes.items() if value is not None}}
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.anchor = anchor or timezone.localdate()
+        self.batch_size = batch_size
+        self.counts = {}
+
+    def _create(self, model, objects):
+        created = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        label = model._meta.db_table
+        self.counts[label] = self.counts.get(label, 0) + len(created)
+        return created
+
+    @transaction.atomic
+    def run(self):
+        self._masters()
+        users = self._users()
+        licenses, units = self._licenses(users)
+        self._wallets(users, units)
+        self._warehouses(units)
+        self._holograms(users, units)
+        self._applications(users)
+        transaction.on_commit(invalidate_active_licensees)
+        transaction.on_commit(invalidate_license_scopes)
+        return self.counts
+
+    def _masters(self):
+        state, _ = State.objects.get_or_create(state_code=11, defaults={'state': 'Sikkim'})
+        self.district, _ = District.objects.get_or_create(
+            district_code=DISTRICT_CODE, defaults={'district': 'Bench District', 'state_code': state}
+        )
+        self.subdivision, _ = Subdivision.objects.get_or_create(
+            subdivision_code=SUBDIVISION_CODE,
+            defaults={'subdivision': 'Bench Subdivision', 'district_code': self.district},
+        )
+        self.police_station, _ = PoliceStation.objects.get_or_create(
+            police_station_code=POLICE_STATION_CODE,
+            defaults={'police_station': 'Bench PS', 'subdivision_code': self.subdivision},
+        )
+        self.category = (
+            LicenseCategory.objects.filter(license_category__iexact='Manufacturing').order_by('id').first()
+            or LicenseCategory.objects.create(license_category='Manufacturing')
+        )
+        self.subcategory = (
+            LicenseSubcategory.objects.filter(category=self.category, description__iexact='Distillery').order_by('id').first()
+            or LicenseSubcategory.objects.create(category=self.category, description='Distillery')
+        )
+        self.license_type = (
+            LicenseType.objects.filter(license_type__iexact='Manufacturing').order_by('id').first()
+            or LicenseType.objects.create(license_type='Manufacturing')
+        )
+        self.licensee_role = (
+            Role.objects.filter(name__iexact='licensee').order_by('id').first() or Role.objects.create(name='licensee')
+        )
+        for code, (name, _) in WALLET_TYPES.items():
+            MasterWalletType.objects.get_or_create(code=code, defaults={'name': name})
+        for size_ml in SIZES_ML:
+            MasterLiquorCapacity.objects.get_or_create(size_ml=size_ml)
+            BrandMlInCases.objects.get_or_create(ml=size_ml, defaults={'pieces_in_case': BOTTLES_PER_CASE[size_ml]})
+        self.capacities = {row.size_ml: row for row in MasterLiquorCapacity.objects.filter(size_ml__in=SIZES_ML)}
+        self.liquor_types = [MasterLiquorType.objects.get_or_create(liquor_type=name)[0] for name in LIQUOR_TYPES]
+        self.brands = [
+            MasterBrandList.objects.get_or_create(
+                brand_name=f'{TAG} Brand {index:02d}',
+                defaults={'liquor_type': self.liquor_types[index % len(self.liquor_types)]},
+            )[0]
+            for index in range(self.sizes['brands'])
+        ]
+
+        self.workflows = {key: _ensure_workflow(key) for key in WORKFLOWS}
+        self.stages = {
+            key: list(WorkflowStage.objects.filter(workflow=workflow).order_by('id'))
+            for key, workflow in self.workflows.items()
+        }
+        transition = approve_transition(self.workflows['HOLOGRAM_REQUEST'])
+        self.officer_role = _officer_role(transition.condition if transition else None)
+        StagePermission.objects.get_or_create(
+            stage=transition.from_stage if transition else _initial_stage(self.workflows['HOLOGRAM_REQUEST']),
+            role=self.officer_role,
+            defaults={'can_process': True},
+        )
+
+    def _user(self, username, email, phone_number, first_name, last_name, role):
+        return CustomUser(
+            username=username,
+            email=email,
+            phone_number=phone_number,
+            first_name=first_name,
+            last_name=last_name,
+            district=self.district,
+            subdivision=self.subdivision,
+            address='Bench address',
+            role=role,
+            password=make_password(None),
+        )
+
+    def _users(self):
+        officer = self._user(
+            OFFICER_USERNAME, f'oic@{EMAIL_DOMAIN}', '5999999999', 'Bench', 'Officer', self.officer_role
+        )
+        users = [
+            self._user(
+                f'{TAG}{index:05d}', f'licensee{index:05d}@{EMAIL_DOMAIN}', f'5{index:09d}',
+                'Bench', f'Licensee {index:05d}', self.licensee_role,
+            )
+            for index in range(self.sizes['licensees'])
+        ]
+        created = self._create(CustomUser, [officer] + users)
+        self.officer = created[0]
+        return created[1:]
+
+    def _licenses(self, users):
+        licenses = []
+        units = []
+        for index, user in enumerate(users):
+            license_id = license_id_for(index)
+            issued = self.anchor - timedelta(days=self.rng.randint(30, 300))
+            licenses.append(License(
+                license_id=license_id,
+                source_type='new_license_application',
+                applicant=user,
+                license_category=self.category,
+                license_sub_category=self.subcategory,
+                excise_district=self.district,
+                issue_date=_aware(issued),
+                valid_up_to=_aware(issued + timedelta(days=365)),
+                is_active=True,
+            ))
+            units.append(UserManufacturingUnit(
+                user=user,
+                manufacturing_unit_name=f'{TAG} Distillery {index:05d}',
+                licensee_id=license_id,
+                license_type='Distillery',
+            ))
+        return self._create(License, licenses), self._create(UserManufacturingUnit, units)
+
+    def _wallets(self, users, units):
+        now = timezone.now()
+        balances = []
+        histories = []
+        for user, unit in zip(users, units):
+            for code, (_, head_of_account) in WALLET_TYPES.items():
+                opening = Decimal(self.rng.randint(5_000_000, 10_000_000))
+                balance = WalletBalance(
+                    licensee_id=unit.licensee_id,
+                    licensee_name=unit.manufacturing_unit_name,
+                    manufacturing_unit=unit.manufacturing_unit_name,
+                    user_id=user.username,
+                    module_type='distillery',
+                    wallet_type_id=code,
+                    head_of_account=head_of_account,
+                    opening_balance=opening,
+                    current_balance=opening,
+                    last_updated_at=now,
+                    created_at=now,
+                )
+                balances.append(balance)
+                histories.append([])
+            for number in range(self.sizes['wallet_transactions']):
+                position = len(balances) - len(WALLET_TYPES) + self.rng.randrange(len(WALLET_TYPES))
+                histories[position].append(
+                    (number, Decimal(self.rng.randint(1_000, 500_000)), self.rng.randint(0, 365))
+                )
+
+        balances = self._create(WalletBalance, balances)
+        transactions = []
+        for balance, history in zip(balances, histories):
+            running = balance.opening_balance
+            for number, amount, days_ago in history:
+                transactions.append(WalletTransaction(
+                    wallet_balance=balance,
+                    transaction_id=f'{TAG}-{balance.user_id}-{number:04d}',
+                    licensee_id=balance.licensee_id,
+                    licensee_name=balance.licensee_name,
+                    user_id=balance.user_id,
+                    module_type=balance.module_type,
+                    wallet_type_id=balance.wallet_type_id,
+                    head_of_account=balance.head_of_account,
+                    entry_type='CR',
+                    transaction_type='recharge',
+                    amount=amount,
+                    balance_before=running,
+                    balance_after=running + amount,
+                    reference_no=f'{TAG}-{balance.user_id}-{number:04d}',
+                    source_module='billdesk',
+                    payment_status='success',
+                    created_at=now - timedelta(days=days_ago),
+                ))
+                running += amount
+            balance.total_credit = running - balance.opening_balance
+            balance.current_balance = running
+        WalletBalance.objects.bulk_update(balances, ['total_credit', 'current_balance'], batch_size=self.batch_size)
+        self._create(WalletTransaction, transactions)
+
+    def _warehouses(self, units):
+        factories = self._create(MasterFactoryList, [
+            MasterFactoryList(factory_name=f'{TAG} {unit.manufacturing_unit_name}', source_object_id=unit.licensee_id)
+            for unit in units
+        ])
+        rows = []
+        for unit, factory in zip(units, factories):
+            for brand in self.brands:
+                for size_ml in SIZES_ML:
+                    rows.append(BrandWarehouse(
+                        factory=factory,
+                        license_id=unit.licensee_id,
+                        liquor_type=brand.liquor_type,
+                        brand=brand,
+                        capacity_size=self.capacities[size_ml],
+                        current_stock=self.rng.randint(50_000, 200_000),
+                        max_capacity=500_000,
+                        ex_factory_price_rs_per_case=Decimal(self.rng.randint(800, 4000)),
+                        excise_duty_rs_per_case=Decimal(self.rng.randint(200, 1500)),
+                        education_cess_rs_per_case=Decimal(self.rng.randint(10, 100)),
+                        additional_excise_duty_rs_per_case=Decimal(self.rng.randint(0, 300)),
+                    ))
+        self._create(BrandWarehouse, rows)
+
+    def _holograms(self, users, units):
+        procurements = []
+        for index, unit in enumerate(units):
+            for number in range(self.sizes['procurements']):
+                procurements.append(HologramProcurement(
+                    ref_no=f'{TAG}/HPR/{index:05d}/{number:02d}',
+                    licensee=unit,
+                    license_id=unit.licensee_id,
+                    manufacturing_unit=unit.manufacturing_unit_name,
+                    date=_aware(self.anchor - timedelta(days=self.rng.randint(30, 200))),
+                    payment_status='success',
+                ))
+        procurements = self._create(HologramProcurement, procurements)
+
+        rolls = []
+        roll_ranges = []
+        serial = SERIAL_BASE
+        for procurement in procurements:
+            for number in range(self.sizes['rolls']):
+                ranges = []
+                start = serial
+                for _ in range(self.sizes['ranges']):
+                    count = self.rng.randint(50, 500)
+                    status = HologramSerialRange.STATUS_AVAILABLE if self.rng.random() < 0.7 else HologramSerialRange.STATUS_IN_USE
+                    ranges.append((serial, serial + count - 1, count, status))
+                    serial += count
+                available = sum(count for *_, count, status in ranges if status == HologramSerialRange.STATUS_AVAILABLE)
+                total = serial - start
+                rolls.append(HologramRollsDetails(
+                    procurement=procurement,
+                    license_id=procurement.license_id,
+                    received_date=procurement.date + timedelta(days=7),
+                    carton_number=f'{procurement.ref_no}/{number:02d}',
+                    type=HologramRollsDetails.TYPE_LOCAL,
+                    from_serial=str(start),
+                    to_serial=str(serial - 1),
+                    total_count=total,
+                    available=available,
+                    used=total - available,
+                    status=HologramRollsDetails.STATUS_IN_USE if available < total else HologramRollsDetails.STATUS_AVAILABLE,
+                ))
+                roll_ranges.append(ranges)
+        rolls = self._create(HologramRollsDetails, rolls)
+        self._create(HologramSerialRange, [
+            HologramSerialRange(
+                roll=roll,
+                license_id=roll.license_id,
+                from_serial=str(from_serial),
+                to_serial=str(to_serial),
+                count=count,
+                status=status,
+                used_date=self.anchor if status == HologramSerialRange.STATUS_IN_USE else None,
+                reference_no=f'{TAG}/ISSUED' if status == HologramSerialRange.STATUS_IN_USE else '',
+            )
+            for roll, ranges in zip(rolls, roll_ranges)
+            for from_serial, to_serial, count, status in ranges
+        ])
+
+        workflow = self.workflows['HOLOGRAM_REQUEST']
+        stages = self.stages['HOLOGRAM_REQUEST']
+        requests = []
+        for index, unit in enumerate(units):
+            for number in range(self.sizes['requests']):
+                requests.append(HologramRequest(
+                    ref_no=f'{TAG}/HQR/{index:05d}/{number:03d}',
+                    licensee=unit,
+                    license_id=unit.licensee_id,
+                    submission_date=_aware(self.anchor - timedelta(days=self.rng.randint(0, 60))),
+                    usage_date=self.anchor + timedelta(days=self.rng.randint(-10, 10)),
+                    quantity=self.rng.randint(100, 5000),
+                    workflow=workflow,
+                    current_stage=stages[0] if self.rng.random() < 0.6 else self.rng.choice(stages),
+                ))
+        requests = self._create(HologramRequest, requests)
+        self._transactions(requests, users, self.sizes['requests'])
+
+    def _applications(self, users):
+        workflow = self.workflows['LICENSE_APPROVAL']
+        stages = self.stages['LICENSE_APPROVAL']
+        applications = []
+        for index, user in enumerate(users):
+            for number in range(self.sizes['applications']):
+                applications.append(NewLicenseApplication(
+                    application_id=f'{TAG}/NA/{index:05d}/{number:02d}',
+                    workflow=workflow,
+                    current_stage=self.rng.choice(stages),
+                    applicant=user,
+                    license_type=self.license_type,
+                    license_category=self.category,
+                    license_sub_category=self.subcategory,
+                    establishment_name=f'{TAG} Establishment {index:05d}',
+                    site_type='New',
+                    applicant_name=f'Bench Licensee {index:05d}',
+                    father_husband_name='Bench Parent',
+                    dob='1980-01-01',
+                    gender='Male',
+                    nationality='Indian',
+                    residential_status='Resident',
+                    present_address='Bench address',
+                    permanent_address='Bench address',
+                    pan='ABCDE1234F',
+                    email=user.email,
+                    mobile_number=user.phone_number,
+                    mode_of_operation='Self',
+                    has_sikkim_certificate='Yes',
+                    has_excise_license='No',
+                    criminal_conviction='No',
+                    site_district=self.district,
+                    site_subdivision=self.subdivision,
+                    police_station=self.police_station,
+                    location_category='Urban',
+                    location_name='Bench',
+                    ward_name='Ward 1',
+                    business_address='Bench address',
+                    road_name='Road 1',
+                    pin_code='737101',
+                    construction_type='Permanent',
+                    site_owned='Yes',
+                    noc_obtained='Yes',
+                    is_application_fee_paid=True,
+                ))
+        applications = self._create(NewLicenseApplication, applications)
+        self._transactions(applications, users, self.sizes['applications'])
+
+    def _transactions(self, objects, users, per_user):
+        if not objects:
+            return
+        content_type = ContentType.objects.get_for_model(objects[0])
+        self._create(Transaction, [
+            Transaction(
+                content_type=content_type,
+                object_id=str(obj.pk),
+                performed_by=users[position // per_user],
+                forwarded_by=self.licensee_role,
+                forwarded_to=self.officer_role,
+                stage=obj.current_stage,
+                remarks='Seeded for benchmarks',
+            )
+            for position, obj in enumerate(objects)
+        ])
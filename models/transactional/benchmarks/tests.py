@@ -0,0 +1,72 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from models.masters.license.models import License
+from models.transactional.supply_chain.hologram.models import HologramSerialRange
+from models.transactional.wallet.models import WalletBalance
+
+from . import runner, seed
+from .scenarios import SCENARIOS
+
+SIZES = dict(licensees=2, brands=2, procurements=1, rolls=1, ranges=6, requests=3, applications=2, wallet_transactions=4)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class BenchmarkSuiteTests(TestCase):
+    def setUp(self):
+        seed.Seeder(seed=7, **SIZES).run()
+
+    def test_seeding_is_deterministic(self):
+        first = list(HologramSerialRange.objects.order_by('from_serial').values_list('from_serial', 'count', 'status'))
+        balances = list(WalletBalance.objects.order_by('licensee_id', 'wallet_type').values_list('current_balance', flat=True))
+        seed.flush()
+        self.assertFalse(seed.is_seeded())
+        self.assertFalse(License.objects.filter(license_id__contains='/BENCH/').exists())
+
+        seed.Seeder(seed=7, **SIZES).run()
+        self.assertEqual(
+            list(HologramSerialRange.objects.order_by('from_serial').values_list('from_serial', 'count', 'status')), first
+        )
+        self.assertEqual(
+            list(WalletBalance.objects.order_by('licensee_id', 'wallet_type').values_list('current_balance', flat=True)),
+            balances,
+        )
+
+    def test_every_scenario_runs_and_rolls_back(self):
+        balance = WalletBalance.objects.get(licensee_id=seed.license_id_for(0), wallet_type='excise').current_balance
+        results = runner.run(seed.load_fixtures(), iterations=2, warmup=1)
+
+        self.assertEqual(set(results['results']), set(SCENARIOS))
+        for name, row in results['results'].items():
+            self.assertEqual(row['errors'], 0, f"{name}: {row['statuses']}")
+            self.assertGreater(row['queries'], 0, name)
+        self.assertEqual(
+            WalletBalance.objects.get(licensee_id=seed.license_id_for(0), wallet_type='excise').current_balance, balance
+        )
+
+    def test_compare_flags_slower_and_chattier_scenarios(self):
+        baseline = {'results': {
+            'a': {'p95_ms': 10.0, 'queries': 5, 'errors': 0},
+            'b': {'p95_ms': 10.0, 'queries': 5, 'errors': 0},
+            'c': {'p95_ms': 1.0, 'queries': 5, 'errors': 0},
+        }}
+        current = {'results': {
+            'a': {'p95_ms': 20.0, 'queries': 5, 'errors': 0},
+            'b': {'p95_ms': 10.5, 'queries': 6, 'errors': 0},
+            'c': {'p95_ms': 2.0, 'queries': 5, 'errors': 0},
+            'd': {'p95_ms': 1.0, 'queries': 1, 'errors': 0},
+        }}
+        verdicts = {row['name']: row['verdict'] for row in runner.compare(baseline, current)}
+        # c doubled but stays under the 2 ms noise floor.
+        self.assertEqual(verdicts, {'a': 'regression', 'b': 'regression', 'c': 'ok', 'd': 'new'})
+
+    def test_seed_command_replaces_data_only_when_asked(self):
+        options = {**SIZES, 'licensees': 1, 'force': True, 'stdout': StringIO()}
+        with self.assertRaisesMessage(CommandError, 'already exists'):
+            call_command('seed_benchmark_data', **options)
+
+        call_command('seed_benchmark_data', flush=True, **options)
+        self.assertEqual(seed.dataset_size()['licensees'], 1)
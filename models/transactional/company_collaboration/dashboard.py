@@ -0,0 +1,73 @@
+"""
+Dashboard tabs for company collaborations (see models.transactional.dashboards).
+
+Collaborations move through fixed stage names rather than a configured workflow,
+so the tabs are spelled out with the stage constants from views.py. Officer
+"approved"/"rejected" tabs only include applications the officer's role has
+acted on.
+"""
+from django.db.models import Q
+
+from models.transactional.dashboards import LEGACY_TABS, TABS, WorkflowDashboard, in_stages, nothing
+
+from .models import CompanyCollaboration
+from .serializers import CompanyCollaborationSerializer
+from .views import (
+    OBJECTION_STAGES,
+    OFFICER_PENDING_STAGES,
+    ROLE_STAGE_MAP,
+    STAGE_APPLICANT_APPLIED,
+    STAGE_APPROVED,
+    STAGE_REJECTED,
+)
+
+APPROVED = Q(current_stage__name=STAGE_APPROVED, is_approved=True)
+REJECTED = Q(current_stage__name=STAGE_REJECTED)
+
+
+def officer_buckets(ctx):
+    pending_stages = ROLE_STAGE_MAP[ctx.role]['pending']
+    acted = ctx.acted_by_role()
+    return ctx.objects, {
+        'pending': in_stages(pending_stages),
+        'approved': ~in_stages(pending_stages + [STAGE_REJECTED]) & acted,
+        'rejected': REJECTED & acted,
+    }
+
+
+def licensee_buckets(ctx):
+    return ctx.mine, {
+        'applied': in_stages(OFFICER_PENDING_STAGES),
+        'objection': in_stages(OBJECTION_STAGES),
+        'approved': APPROVED,
+        'rejected': REJECTED,
+    }
+
+
+def admin_buckets(ctx):
+    return ctx.objects, {
+        'total': Q(),
+        'applied': Q(current_stage__name=STAGE_APPLICANT_APPLIED),
+        'in_review': in_stages(OFFICER_PENDING_STAGES),
+        'objection': in_stages(OBJECTION_STAGES),
+        'approved': APPROVED,
+        'rejected': REJECTED,
+    }
+
+
+def other_buckets(ctx):
+    return ctx.objects, nothing('pending', 'approved', 'rejected')
+
+
+DASHBOARD = WorkflowDashboard(
+    CompanyCollaboration,
+    group_spec={
+        tuple(ROLE_STAGE_MAP): officer_buckets,
+        'licensee': licensee_buckets,
+        ('site_admin', 'single_window'): admin_buckets,
+        '*': other_buckets,
+    },
+    serializer=CompanyCollaborationSerializer,
+    tabs=TABS + ('in_review', 'total'),
+    legacy_tabs=LEGACY_TABS + ('in_review',),
+)
@@ -12,9 +12,6 @@ from auth.roles.permissions import HasAppPermission
 from auth.workflow.models import Workflow, WorkflowStage
 from auth.workflow.permissions import HasStagePermission
 from auth.workflow.services import WorkflowService
-from auth.workflow.models import Transaction as WorkflowTransaction
-from django.db.models import OuterRef, Exists
-from django.contrib.contenttypes.models import ContentType
 
 from .models import CompanyCollaboration
 from .serializers import CompanyCollaborationSerializer
@@ -459,71 +456,8 @@ def workflow_action(request, application_id):
 @api_view(['GET'])
 @permission_classes([HasCompanyCollaborationViewPermission, HasStagePermission])
 def dashboard_counts(request):
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    base_qs = CompanyCollaboration.objects
-
-    # ── Officer roles ────────────────────────────────────────────────────
-    if role in ROLE_STAGE_MAP:
-        stages = ROLE_STAGE_MAP[role]
-        
-        content_type = ContentType.objects.get_for_model(CompanyCollaboration)
-        role_id = getattr(getattr(request.user, 'role', None), 'id', None)
-        
-        acted_by_role = Exists(
-            WorkflowTransaction.objects.filter(
-                content_type=content_type, 
-                object_id=OuterRef('application_id'),
-                performed_by__role_id=role_id
-            )
-        )
-        
-        pending_stages = stages['pending']
-        
-        counts = {
-            'pending':  base_qs.filter(current_stage__name__in=pending_stages).count(),
-            'approved': (
-                base_qs.exclude(current_stage__name__in=pending_stages + [STAGE_REJECTED])
-                .annotate(_acted_by_role=acted_by_role)
-                .filter(_acted_by_role=True)
-                .count()
-            ),
-            'rejected': (
-                base_qs.filter(current_stage__name=STAGE_REJECTED)
-                .annotate(_acted_by_role=acted_by_role)
-                .filter(_acted_by_role=True)
-                .count()
-            ),
-        }
-
-    # ── Applicant / licensee ─────────────────────────────────────────────
-    elif role == 'licensee':
-        mine = base_qs.filter(applicant=request.user)
-        counts = {
-            'applied':   mine.filter(current_stage__name__in=OFFICER_PENDING_STAGES).count(),
-            'objection': mine.filter(current_stage__name__in=OBJECTION_STAGES).count(),
-            'approved':  mine.filter(current_stage__name=STAGE_APPROVED, is_approved=True).count(),
-            'rejected':  mine.filter(current_stage__name=STAGE_REJECTED).count(),
-        }
-
-    # ── Admin / single window ────────────────────────────────────────────
-    elif role in ['site_admin', 'single_window']:
-        counts = {
-            'total':     base_qs.count(),
-            'applied':   base_qs.filter(current_stage__name=STAGE_APPLICANT_APPLIED).count(),
-            'in_review': base_qs.filter(current_stage__name__in=OFFICER_PENDING_STAGES).count(),
-            'objection': base_qs.filter(current_stage__name__in=OBJECTION_STAGES).count(),
-            'approved':  base_qs.filter(current_stage__name=STAGE_APPROVED, is_approved=True).count(),
-            'rejected':  base_qs.filter(current_stage__name=STAGE_REJECTED).count(),
-        }
-
-    else:
-        return Response({
-            "pending": 0,
-            "approved": 0,
-            "rejected": 0,
-        })
-
-    return Response(counts)
+    from .dashboard import DASHBOARD
+    return DASHBOARD.counts_response(request)
 
 
 # ---------------------------------------------------------------------------
@@ -534,67 +468,5 @@ def dashboard_counts(request):
 @permission_classes([HasCompanyCollaborationViewPermission, HasStagePermission])
 @parser_classes([JSONParser])
 def application_group(request):
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    base_qs = CompanyCollaboration.objects
-
-    def _serialize(qs):
-        return CompanyCollaborationSerializer(qs, many=True).data
-
-    # ── Officer roles ────────────────────────────────────────────────────
-    if role in ROLE_STAGE_MAP:
-        stages = ROLE_STAGE_MAP[role]
-        
-        content_type = ContentType.objects.get_for_model(CompanyCollaboration)
-        role_id = getattr(getattr(request.user, 'role', None), 'id', None)
-        
-        acted_by_role = Exists(
-            WorkflowTransaction.objects.filter(
-                content_type=content_type, 
-                object_id=OuterRef('application_id'),
-                performed_by__role_id=role_id
-            )
-        )
-        
-        pending_stages = stages['pending']
-        
-        return Response({
-            'pending':  _serialize(base_qs.filter(current_stage__name__in=pending_stages)),
-            'approved': _serialize(
-                base_qs.exclude(current_stage__name__in=pending_stages + [STAGE_REJECTED])
-                .annotate(_acted_by_role=acted_by_role)
-                .filter(_acted_by_role=True)
-            ),
-            'rejected': _serialize(
-                base_qs.filter(current_stage__name=STAGE_REJECTED)
-                .annotate(_acted_by_role=acted_by_role)
-                .filter(_acted_by_role=True)
-            ),
-        })
-
-    # ── Applicant / licensee ─────────────────────────────────────────────
-    if role == 'licensee':
-        mine = base_qs.filter(applicant=request.user)
-        return Response({
-            'applied':   _serialize(mine.filter(current_stage__name__in=OFFICER_PENDING_STAGES)),
-            'objection': _serialize(mine.filter(current_stage__name__in=OBJECTION_STAGES)),
-            'approved':  _serialize(mine.filter(current_stage__name=STAGE_APPROVED)),
-            'rejected':  _serialize(mine.filter(current_stage__name=STAGE_REJECTED)),
-        })
-
-    # ── Admin / single window ────────────────────────────────────────────
-    if role in ['site_admin', 'single_window']:
-        return Response({
-            'applied':   _serialize(base_qs.filter(current_stage__name=STAGE_APPLICANT_APPLIED)),
-            'in_review': _serialize(base_qs.filter(current_stage__name__in=OFFICER_PENDING_STAGES)),
-            'objection': _serialize(base_qs.filter(current_stage__name__in=OBJECTION_STAGES)),
-            'approved':  _serialize(base_qs.filter(current_stage__name=STAGE_APPROVED)),
-            'rejected':  _serialize(base_qs.filter(current_stage__name=STAGE_REJECTED)),
-        })
-
-    return Response({
-        "applied": [],
-        "pending": [],
-        "objection": [],
-        "approved": [],
-        "rejected": []
-    })
+    from .dashboard import DASHBOARD
+    return DASHBOARD.group_response(request)
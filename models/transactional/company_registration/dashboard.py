@@ -0,0 +1,50 @@
+"""
+Dashboard tabs for company registrations (see models.transactional.dashboards).
+
+Officer "approved" covers the stages reachable from the role's own stages, i.e.
+registrations the role has passed on.
+"""
+from auth.workflow.constants import WORKFLOW_IDS
+from models.transactional.dashboards import COUNTS, LEGACY, WorkflowDashboard, in_stages, nothing
+from models.transactional.helpers import _collect_reachable_stage_names
+
+from .models import CompanyRegistration
+from .serializers import CompanyRegistrationSerializer
+
+
+def licensee_buckets(ctx):
+    return ctx.mine, ctx.standard_buckets(separate_payment=ctx.purpose != LEGACY)
+
+
+def admin_buckets(ctx):
+    return ctx.objects, ctx.standard_buckets(separate_payment=False)
+
+
+def officer_buckets(ctx):
+    if not ctx.role_stages:
+        return ctx.objects, nothing('pending', 'approved', 'rejected')
+
+    stages = ctx.stages
+    pending_stages = ctx.role_stages | stages['objection']
+    forward_stages = _collect_reachable_stage_names(ctx.workflow_id, ctx.role_stages) - pending_stages - stages['rejected']
+    buckets = {
+        'pending': in_stages(pending_stages),
+        'objection': in_stages(stages['objection']),
+        'approved': in_stages(forward_stages),
+        'rejected': in_stages(stages['rejected']),
+    }
+    if ctx.purpose == COUNTS:
+        del buckets['objection']
+    return ctx.objects, buckets
+
+
+DASHBOARD = WorkflowDashboard(
+    CompanyRegistration,
+    group_spec={
+        'licensee': licensee_buckets,
+        ('site_admin', 'single_window'): admin_buckets,
+        '*': officer_buckets,
+    },
+    workflow=WORKFLOW_IDS['COMPANY_REGISTRATION'],
+    serializer=CompanyRegistrationSerializer,
+)
@@ -6,12 +6,11 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django.core.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework import status
-from auth.workflow.constants import WORKFLOW_IDS
 from auth.roles.permissions import HasAppPermission
 from auth.workflow.permissions import HasStagePermission
 from auth.workflow.models import Workflow, StagePermission, WorkflowStage
 from auth.workflow.services import WorkflowService
-from models.transactional.helpers import _get_stage_sets, _normalize_role, _get_role_stage_names, _collect_reachable_stage_names
+from .dashboard import DASHBOARD
 from .models import CompanyRegistration
 from .serializers import CompanyRegistrationSerializer
 
@@ -126,158 +125,12 @@ def dashboard_counts(request):
         deactivate_all_expired_licenses()
     except Exception:
         pass
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    workflow_id = WORKFLOW_IDS['COMPANY_REGISTRATION']
-    stage_sets = _get_stage_sets(workflow_id)
-    all_qs = CompanyRegistration.objects.all()
-
-    if role == 'licensee':
-        base_qs = CompanyRegistration.objects.filter(applicant=request.user)
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        approved_stages = set(stage_sets['approved'])
-        rejected_stages = set(stage_sets['rejected'])
-        payment_stages = set(stage_sets['payment'])
-        pending_stages = set(stage_sets['all']) - applied_stages - approved_stages - rejected_stages - objection_stages - payment_stages
-
-        return Response({
-            # Licensee UX: application is considered "Pending" until application-fee payment succeeds.
-            "applied": base_qs.filter(current_stage__name__in=applied_stages).count(),
-            "pending": base_qs.filter(current_stage__name__in=pending_stages).count(),
-            "objection": base_qs.filter(current_stage__name__in=objection_stages).count(),
-            "approved": base_qs.filter(current_stage__name__in=approved_stages).count(),
-            "rejected": base_qs.filter(current_stage__name__in=rejected_stages).count(),
-            "awaiting_payment": base_qs.filter(current_stage__name__in=payment_stages).count(),
-        })
-
-    if role in ['site_admin', 'single_window']:
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        approved_stages = set(stage_sets['approved'])
-        rejected_stages = set(stage_sets['rejected'])
-        pending_stages = set(stage_sets['all']) - applied_stages - approved_stages - rejected_stages - objection_stages
-
-        return Response({
-            "applied": all_qs.filter(current_stage__name__in=applied_stages).count(),
-            "pending": all_qs.filter(current_stage__name__in=pending_stages).count(),
-            "objection": all_qs.filter(current_stage__name__in=objection_stages).count(),
-            "approved": all_qs.filter(current_stage__name__in=approved_stages).count(),
-            "rejected": all_qs.filter(current_stage__name__in=rejected_stages).count(),
-        })
-
-    role_stage_names = _get_role_stage_names(request.user, workflow_id)
-    if not role_stage_names:
-        return Response({
-            "pending": 0,
-            "approved": 0,
-            "rejected": 0,
-        })
-
-    role_objection_stages = set(stage_sets['objection'])
-    pending_stages = set(role_stage_names) | role_objection_stages
-
-    reachable_from_role = _collect_reachable_stage_names(workflow_id, set(role_stage_names))
-    role_rejected_stages = set(stage_sets['rejected'])
-    forward_stages = set(reachable_from_role) - pending_stages - role_rejected_stages
-
-    return Response({
-        "pending": all_qs.filter(current_stage__name__in=pending_stages).count(),
-        "approved": all_qs.filter(current_stage__name__in=forward_stages).count(),
-        "rejected": all_qs.filter(current_stage__name__in=role_rejected_stages).count(),
-    })
+    return DASHBOARD.counts_response(request)
 
 
 @api_view(['GET'])
 # @permission_classes([HasAppPermission('company_registration', 'view')])
 @parser_classes([JSONParser])
 def application_group(request):
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    workflow_id = WORKFLOW_IDS['COMPANY_REGISTRATION']
-    stage_sets = _get_stage_sets(workflow_id)
-    all_qs = CompanyRegistration.objects.all()
-
-    if role == 'licensee':
-        base_qs = CompanyRegistration.objects.filter(applicant=request.user)
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        approved_stages = set(stage_sets['approved'])
-        rejected_stages = set(stage_sets['rejected'])
-        pending_stages = set(stage_sets['all']) - applied_stages - approved_stages - rejected_stages - objection_stages
-
-        return Response({
-            "applied": CompanyRegistrationSerializer(
-                base_qs.filter(current_stage__name__in=applied_stages), many=True
-            ).data,
-            "pending": CompanyRegistrationSerializer(
-                base_qs, many=True
-            ).data,
-            "objection": CompanyRegistrationSerializer(
-                base_qs.filter(current_stage__name__in=objection_stages), many=True
-            ).data,
-            "approved": CompanyRegistrationSerializer(
-                base_qs.filter(current_stage__name__in=approved_stages), many=True
-            ).data,
-            "rejected": CompanyRegistrationSerializer(
-                base_qs.filter(current_stage__name__in=rejected_stages), many=True
-            ).data
-        })
-
-    if role in ['site_admin', 'single_window']:
-        
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        approved_stages = set(stage_sets['approved'])
-        rejected_stages = set(stage_sets['rejected'])
-        pending_stages = set(stage_sets['all']) - applied_stages - approved_stages - rejected_stages - objection_stages
-
-        return Response({
-            "applied": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=applied_stages), many=True
-            ).data,
-            "pending": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=pending_stages), many=True
-            ).data,
-            "objection": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=objection_stages), many=True
-            ).data,
-            "approved": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=approved_stages), many=True
-            ).data,
-            "rejected": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=rejected_stages), many=True
-            ).data
-        })
-
-    role_stage_names = _get_role_stage_names(request.user, workflow_id)
-    if role_stage_names:
-        
-        role_objection_stages = set(stage_sets['objection'])
-        pending_stages = set(role_stage_names) | role_objection_stages
-        reachable_from_role = _collect_reachable_stage_names(workflow_id, set(role_stage_names))
-        role_rejected_stages = set(stage_sets['rejected'])
-        forward_stages = set(reachable_from_role) - pending_stages - role_rejected_stages
-
-        return Response({
-            "applied": [],
-            "pending": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=pending_stages), many=True
-            ).data,
-            "objection": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=role_objection_stages), many=True
-            ).data,
-            "approved": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=forward_stages), many=True
-            ).data,
-            "rejected": CompanyRegistrationSerializer(
-                all_qs.filter(current_stage__name__in=role_rejected_stages), many=True
-            ).data
-        })
-
-    return Response({
-        "applied": [],
-        "pending": [],
-        "objection": [],
-        "approved": [],
-        "rejected": []
-    })
+    return DASHBOARD.group_response(request)
 
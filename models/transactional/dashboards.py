@@ -0,0 +1,297 @@
+"""
+Workflow dashboards shared by the application modules.
+
+Every application module shows the same two endpoints: tab counts
+(`dashboard-counts/`) and the applications in a tab (`list-by-status/`). A
+module describes its tabs once, as a `WorkflowDashboard` in its `dashboard.py`:
+
+    DASHBOARD = WorkflowDashboard(
+        CompanyRegistration,
+        group_spec={'licensee': licensee_buckets, '*': officer_buckets},
+        workflow=WORKFLOW_IDS['COMPANY_REGISTRATION'],
+        serializer=CompanyRegistrationSerializer,
+    )
+
+`group_spec` maps a role (or a tuple of roles, or '*' for any other role) to a
+function taking a `DashboardContext` and returning `(base_queryset, {tab: Q})`.
+Counts are computed from that in one query (`COUNT(...) FILTER (WHERE ...)` per
+tab) and cached for `DASHBOARD_TIMEOUT` seconds per role, or per user for roles
+that only see their own applications. The cache is versioned per model and the
+version is bumped when an application is saved or deleted and when a workflow
+`Transaction` is recorded against one (see `connect_dashboard_signals`).
+
+`list-by-status/?bucket=<tab>` lists one tab with keyset pagination
+(utils.pagination). Without `bucket` every tab is listed unpaginated, as before.
+
+Modules are registered by importing their `dashboard` module, which
+`models.transactional` does for every installed app on startup.
+"""
+from functools import cached_property, partial
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction as db_transaction
+from django.db.models import Count, Q
+from django.db.models.signals import post_delete, post_save
+from rest_framework import status
+from rest_framework.response import Response
+
+from auth.workflow.models import Transaction as WorkflowTransaction
+from utils.cache_versions import bump_version, get_version
+from utils.pagination import KeysetPagination
+
+from .helpers import _get_role_stage_names, _get_stage_sets, _normalize_role
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_TIMEOUT = 60
+COUNTS_KEY_PREFIX = 'dashboards:counts'
+
+TABS = ('applied', 'pending', 'objection', 'approved', 'rejected', 'awaiting_payment')
+LEGACY_TABS = ('applied', 'pending', 'objection', 'approved', 'rejected')
+STAGE_SET_NAMES = ('all', 'initial', 'objection', 'approved', 'rejected', 'payment')
+
+# What a spec is being asked for: tab counts, one paginated tab, or every tab at once.
+COUNTS, LIST, LEGACY = 'counts', 'list', 'legacy'
+
+# A tab that never contains anything; counts as 0 without touching the table.
+NOTHING = Q(pk__in=[])
+
+REGISTRY = {}
+
+
+def in_stages(names):
+    return Q(current_stage__name__in=names)
+
+
+def nothing(*tabs):
+    return {tab: NOTHING for tab in tabs}
+
+
+def default_role_resolver(user):
+    role = getattr(user, 'role', None)
+    return _normalize_role(role.name if role else None)
+
+
+def version_name(app_label, model_name):
+    return f"dashboards:{app_label}.{model_name}"
+
+
+def bucket_counts(base_qs, buckets):
+    """Counts for every bucket in one query."""
+    if not buckets:
+        return {}
+    return base_qs.aggregate(**{name: Count('pk', filter=q) for name, q in buckets.items()})
+
+
+class DashboardContext:
+    """The requesting user as seen by a bucket spec."""
+
+    def __init__(self, dashboard, user, role, purpose=COUNTS):
+        self.dashboard = dashboard
+        self.user = user
+        self.role = role
+        self.purpose = purpose
+
+    @cached_property
+    def workflow_id(self):
+        return self.dashboard.resolve_workflow_id()
+
+    @property
+    def objects(self):
+        """All applications of the module (in its workflow when it has one)."""
+        qs = self.dashboard.model._default_manager.all()
+        if self.dashboard.filter_workflow and self.workflow_id is not None:
+            qs = qs.filter(workflow_id=self.workflow_id)
+        return qs
+
+    @property
+    def mine(self):
+        return self.objects.filter(applicant=self.user)
+
+    @cached_property
+    def stages(self):
+        """`_get_stage_sets` for the workflow, as sets (empty without a workflow)."""
+        if self.workflow_id is None:
+            return {name: set() for name in STAGE_SET_NAMES}
+        stage_sets = _get_stage_sets(self.workflow_id)
+        return {name: set(stage_sets[name]) for name in STAGE_SET_NAMES}
+
+    @cached_property
+    def role_stages(self):
+        """Stages the user's role processes."""
+        if self.workflow_id is None:
+            return set()
+        return set(self.dashboard.role_stage_resolver(self.user, self.workflow_id))
+
+    @cached_property
+    def role_id(self):
+        return getattr(getattr(self.user, 'role', None), 'id', None)
+
+    def acted_by_role(self):
+        """
+        Applications the user's role has acted on: an IN over the role's workflow
+        transactions, backed by the (content_type, performed_by, object_id) index.
+        """
+        if self.role_id is None:
+            return NOTHING
+        object_ids = WorkflowTransaction.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.dashboard.model),
+            performed_by__role_id=self.role_id,
+        ).values('object_id')
+        return Q(pk__in=object_ids)
+
+    def standard_buckets(self, separate_payment=True):
+        """
+        Tabs straight from the workflow's stage sets: initial stages are
+        "applied", anything not yet settled is "pending". With `separate_payment`
+        payment stages get their own "awaiting_payment" tab.
+        """
+        stages = self.stages
+        settled = stages['initial'] | stages['objection'] | stages['approved'] | stages['rejected']
+        payment = stages['payment'] if separate_payment else set()
+        buckets = {
+            'applied': in_stages(stages['initial']),
+            'pending': in_stages(stages['all'] - settled - payment),
+            'objection': in_stages(stages['objection']),
+            'approved': in_stages(stages['approved']),
+            'rejected': in_stages(stages['rejected']),
+        }
+        if separate_payment:
+            buckets['awaiting_payment'] = in_stages(payment)
+        return buckets
+
+
+class WorkflowDashboard:
+    """
+    Tab counts and listings for one application model.
+
+    - `role_resolver(user)` returns the role name looked up in `group_spec`.
+    - `workflow` is a workflow id or a callable returning one (or None).
+    - `filter_workflow` restricts `ctx.objects` to that workflow.
+    - `role_stages(user, workflow_id)` overrides how a role's stages are found.
+    - `list_queryset(qs)` adds what the serializer needs (select_related, annotations).
+    - `per_user_roles` are roles whose counts depend on the user, not just the role.
+    """
+
+    def __init__(self, model, role_resolver=None, group_spec=None, *, workflow=None, filter_workflow=False,
+                 role_stages=None, serializer=None, list_queryset=None, tabs=TABS, legacy_tabs=LEGACY_TABS,
+                 per_user_roles=('licensee',), timeout=DASHBOARD_TIMEOUT):
+        self.model = model
+        self.role_resolver = role_resolver or default_role_resolver
+        self.group_spec = group_spec or {}
+        self.workflow = workflow
+        self.filter_workflow = filter_workflow
+        self.role_stage_resolver = role_stages or _get_role_stage_names
+        self.serializer = serializer
+        self.list_queryset = list_queryset or (lambda qs: qs)
+        self.tabs = tuple(tabs)
+        self.legacy_tabs = tuple(legacy_tabs)
+        self.per_user_roles = tuple(per_user_roles)
+        self.timeout = timeout
+        self.version_name = version_name(model._meta.app_label, model._meta.model_name)
+
+        REGISTRY[model._meta.label_lower] = self
+        uid = f'dashboard_{model._meta.label_lower}'
+        post_save.connect(self._invalidate, sender=model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(self._invalidate, sender=model, dispatch_uid=f'{uid}_delete')
+
+    def _invalidate(self, sender, **kwargs):
+        db_transaction.on_commit(self.invalidate)
+
+    def invalidate(self):
+        bump_version(self.version_name)
+
+    def resolve_workflow_id(self):
+        workflow = self.workflow() if callable(self.workflow) else self.workflow
+        return getattr(workflow, 'id', workflow)
+
+    def _spec_for(self, role):
+        for roles, spec in self.group_spec.items():
+            if role == roles or (isinstance(roles, tuple) and role in roles):
+                return spec
+        return self.group_spec.get('*')
+
+    def context(self, user, purpose=COUNTS):
+        return DashboardContext(self, user, self.role_resolver(user), purpose)
+
+    def buckets(self, ctx):
+        """`(base_queryset, {tab: Q})` for `ctx`."""
+        spec = self._spec_for(ctx.role)
+        if spec is None:
+            return self.model._default_manager.none(), {}
+        return spec(ctx)
+
+    def _counts_key(self, ctx, version):
+        scope = f"user:{ctx.user.pk}" if ctx.role in self.per_user_roles else f"role:{ctx.role_id}"
+        return f"{COUNTS_KEY_PREFIX}:{self.version_name}:{version}:{ctx.role}:{scope}"
+
+    def counts(self, user):
+        """Tab counts for `user`, cached briefly."""
+        ctx = self.context(user)
+        version = get_version(self.version_name)
+        if version is None:
+            return bucket_counts(*self.buckets(ctx))
+
+        key = self._counts_key(ctx, version)
+        try:
+            counts = cache.get(key)
+        except Exception:
+            logger.warning("Cache unavailable while reading dashboard counts %s", key, exc_info=True)
+            return bucket_counts(*self.buckets(ctx))
+        if counts is None:
+            counts = bucket_counts(*self.buckets(ctx))
+            try:
+                cache.set(key, counts, timeout=self.timeout)
+            except Exception:
+                logger.warning("Cache unavailable while storing dashboard counts %s", key, exc_info=True)
+        return counts
+
+    def counts_response(self, request):
+        return Response(self.counts(request.user))
+
+    def _serialize(self, queryset):
+        return self.serializer(self.list_queryset(queryset), many=True).data
+
+    def group_response(self, request):
+        """One tab with keyset pagination (`?bucket=`), or every tab unpaginated."""
+        bucket = str(request.query_params.get('bucket') or '').strip().lower()
+        if not bucket:
+            base_qs, buckets = self.buckets(self.context(request.user, LEGACY))
+            response = {tab: [] for tab in self.legacy_tabs}
+            for name, condition in buckets.items():
+                if name in self.legacy_tabs:
+                    response[name] = self._serialize(base_qs.filter(condition))
+            return Response(response)
+
+        if bucket not in self.tabs:
+            return Response({"detail": f"Unknown bucket '{bucket}'."}, status=status.HTTP_400_BAD_REQUEST)
+        base_qs, buckets = self.buckets(self.context(request.user, LIST))
+        queryset = base_qs.filter(buckets[bucket]) if bucket in buckets else base_qs.none()
+        queryset = self.list_queryset(queryset).order_by('-created_at')
+
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        if page is None:
+            return Response(self.serializer(queryset, many=True).data)
+        counts = self.counts(request.user)
+        count = counts[bucket] if bucket in counts else queryset.count()
+        response = paginator.get_paginated_response(self.serializer(page, many=True).data)
+        response.data = {'bucket': bucket, 'count': count, **response.data}
+        return response
+
+
+def invalidate_for_transaction(sender, instance, created, **kwargs):
+    if not created or not instance.content_type_id:
+        return
+    content_type = ContentType.objects.get_for_id(instance.content_type_id)
+    db_transaction.on_commit(partial(bump_version, version_name(content_type.app_label, content_type.model)))
+
+
+def connect_dashboard_signals():
+    """Register every app's `dashboard` module and expire counts when a workflow step is recorded."""
+    from django.utils.module_loading import autodiscover_modules
+
+    autodiscover_modules('dashboard')
+    post_save.connect(invalidate_for_transaction, sender=WorkflowTransaction, dispatch_uid='dashboard_transaction_save')
@@ -0,0 +1,46 @@
+"""
+Dashboard tabs for license renewal applications (see models.transactional.dashboards).
+
+Officers see renewals that are with their role now or have reached their role
+since the latest submission (`_renewal_queryset_visible_to_role`).
+"""
+from models.transactional.dashboards import LEGACY, LEGACY_TABS, NOTHING, WorkflowDashboard, in_stages, nothing
+
+from .models import LicenseApplication
+from .serializers import LicenseApplicationSerializer
+from .views import _get_renewal_workflow, _renewal_queryset_visible_to_role, _renewal_role_stage_names
+
+
+def licensee_buckets(ctx):
+    if ctx.workflow_id is None:
+        return ctx.objects.none(), nothing(*LEGACY_TABS)
+    return ctx.mine, ctx.standard_buckets(separate_payment=ctx.purpose != LEGACY)
+
+
+def officer_buckets(ctx):
+    if ctx.workflow_id is None or not ctx.role_stages:
+        return ctx.objects.none(), nothing(*LEGACY_TABS)
+
+    stages = ctx.stages
+    visible = _renewal_queryset_visible_to_role(ctx.objects, ctx.user, ctx.role_stages)
+    return visible, {
+        'applied': NOTHING,
+        'pending': in_stages(ctx.role_stages),
+        'objection': in_stages(stages['objection']),
+        'approved': ~in_stages(ctx.role_stages | stages['objection'] | stages['rejected']),
+        'rejected': in_stages(stages['rejected']),
+    }
+
+
+DASHBOARD = WorkflowDashboard(
+    LicenseApplication,
+    group_spec={
+        'licensee': licensee_buckets,
+        '*': officer_buckets,
+    },
+    workflow=_get_renewal_workflow,
+    filter_workflow=True,
+    role_stages=_renewal_role_stage_names,
+    serializer=LicenseApplicationSerializer,
+    list_queryset=lambda qs: qs.select_related('current_stage', 'workflow'),
+)
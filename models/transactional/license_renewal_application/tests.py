@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -214,6 +214,7 @@ class LicenseRenewalPrintResetTests(TestCase):
 
 from django.contrib.auth import get_user_model
 
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
 class LicenseRenewalDashboardCountsTests(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -13,7 +13,7 @@ from auth.workflow.models import Workflow
 from auth.workflow.services import WorkflowService
 from models.masters.license.models import License
 from models.transactional.helpers import _normalize_role, _get_stage_sets, _get_role_stage_names
-from models.masters.core.models import SupplyChainTimerConfig
+from models.masters.core.timers import get_days
 from models.transactional.wallet.wallet_initializer import _resolve_hoa_code
 from models.transactional.wallet.wallet_service import debit_wallet_balance
 import secrets
@@ -55,7 +55,7 @@ def initiate_renewal(request, license_id):
         return Response({"detail": "You can only renew your own license."}, status=status.HTTP_403_FORBIDDEN)
 
     now_dt = timezone.now()
-    reminder_days = _get_timer_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
+    reminder_days = get_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
 
     # Best-effort: keep license status consistent once it crosses expiry.
     if getattr(old_license, "valid_up_to", None) and old_license.valid_up_to < now_dt and getattr(old_license, "is_active", True):
@@ -240,48 +240,6 @@ def _require_licensee_user(request):
         raise PermissionDenied("Only licensees can pay fees.")
 
 
-def _get_timer_days(code: str, default_days: int) -> int:
-    cfg = (
-        SupplyChainTimerConfig.objects.filter(code=code, is_active=True)
-        .order_by("-updated_at", "-id")
-        .first()
-    )
-    if not cfg:
-        return int(default_days)
-
-    unit = str(getattr(cfg, "delay_unit", "") or "").lower().strip()
-    value = getattr(cfg, "delay_value", None)
-    try:
-        value_int = max(0, int(value or 0))
-    except (TypeError, ValueError):
-        value_int = 0
-
-    # Prefer configured unit/value (so changing delay_value/unit takes effect immediately),
-    # fallback to validity_period_days if unit/value are missing or not meaningful.
-    if value_int > 0 and unit:
-        if unit.endswith("s"):
-            unit = unit[:-1]
-        if unit == "day":
-            return value_int
-        if unit in ("week", "wk"):
-            return value_int * 7
-        if unit in ("month", "mon", "mo"):
-            return value_int * 30
-        if unit in ("year", "yr"):
-            return value_int * 365
-        if unit in ("hour", "hr"):
-            return max(0, value_int // 24)
-
-    days = getattr(cfg, "validity_period_days", None)
-    if days is not None:
-        try:
-            return max(0, int(days))
-        except (TypeError, ValueError):
-            return int(default_days)
-
-    return int(default_days)
-
-
 def _extend_license_validity(lic: License) -> License:
     from models.masters.core.models import RenewalApplicationConfig
     from datetime import date, datetime, time as dt_time
@@ -934,112 +892,12 @@ def dashboard_counts(request):
     except Exception:
         pass
 
-    wf = _get_renewal_workflow()
-    if not wf:
-        return Response({"applied": 0, "pending": 0, "objection": 0, "approved": 0, "rejected": 0})
-
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    stage_sets = _get_stage_sets(wf.id)
-    all_qs = LicenseApplication.objects.filter(workflow_id=wf.id)
-
-    applied_stages = set(stage_sets["initial"])
-    objection_stages = set(stage_sets["objection"])
-    approved_stages = set(stage_sets["approved"])
-    rejected_stages = set(stage_sets["rejected"])
-    payment_stages = set(stage_sets["payment"])
-    pending_stages = set(stage_sets["all"]) - applied_stages - approved_stages - rejected_stages - objection_stages - payment_stages
-
-    if role == "licensee":
-        base_qs = all_qs.filter(applicant=request.user)
-        return Response(
-            {
-                "applied": base_qs.filter(current_stage__name__in=applied_stages).count(),
-                "pending": base_qs.filter(current_stage__name__in=pending_stages).count(),
-                "objection": base_qs.filter(current_stage__name__in=objection_stages).count(),
-                "approved": base_qs.filter(current_stage__name__in=approved_stages).count(),
-                "rejected": base_qs.filter(current_stage__name__in=rejected_stages).count(),
-                "awaiting_payment": base_qs.filter(current_stage__name__in=payment_stages).count(),
-            }
-        )
-
-    role_stage_names = _renewal_role_stage_names(request.user, wf.id)
-    if not role_stage_names:
-        return Response({"applied": 0, "pending": 0, "objection": 0, "approved": 0, "rejected": 0})
-
-    visible_qs = _renewal_queryset_visible_to_role(all_qs, request.user, role_stage_names)
-    pending_for_role = set(role_stage_names)
-    return Response(
-        {
-            "applied": 0,
-            "pending": visible_qs.filter(current_stage__name__in=pending_for_role).count(),
-            "objection": visible_qs.filter(current_stage__name__in=objection_stages).count(),
-            "approved": visible_qs.exclude(
-                current_stage__name__in=pending_for_role | objection_stages | rejected_stages
-            ).count(),
-            "rejected": visible_qs.filter(current_stage__name__in=rejected_stages).count(),
-        }
-    )
+    from .dashboard import DASHBOARD
+    return DASHBOARD.counts_response(request)
 
 
 @permission_classes([IsAuthenticated])
 @api_view(["GET"])
 def application_group(request):
-    wf = _get_renewal_workflow()
-    if not wf:
-        return Response({"applied": [], "pending": [], "objection": [], "approved": [], "rejected": []})
-
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    stage_sets = _get_stage_sets(wf.id)
-    all_qs = LicenseApplication.objects.filter(workflow_id=wf.id).select_related("current_stage", "workflow")
-
-    applied_stages = set(stage_sets["initial"])
-    objection_stages = set(stage_sets["objection"])
-    approved_stages = set(stage_sets["approved"])
-    rejected_stages = set(stage_sets["rejected"])
-    pending_stages = set(stage_sets["all"]) - applied_stages - approved_stages - rejected_stages - objection_stages
-
-    if role == "licensee":
-        base_qs = all_qs.filter(applicant=request.user)
-        return Response(
-            {
-                "applied": LicenseApplicationSerializer(
-                    base_qs.filter(current_stage__name__in=applied_stages), many=True
-                ).data,
-                "pending": LicenseApplicationSerializer(
-                    base_qs.filter(current_stage__name__in=pending_stages), many=True
-                ).data,
-                "objection": LicenseApplicationSerializer(
-                    base_qs.filter(current_stage__name__in=objection_stages), many=True
-                ).data,
-                "approved": LicenseApplicationSerializer(
-                    base_qs.filter(current_stage__name__in=approved_stages), many=True
-                ).data,
-                "rejected": LicenseApplicationSerializer(
-                    base_qs.filter(current_stage__name__in=rejected_stages), many=True
-                ).data,
-            }
-        )
-
-    role_stage_names = _renewal_role_stage_names(request.user, wf.id)
-    if not role_stage_names:
-        return Response({"applied": [], "pending": [], "objection": [], "approved": [], "rejected": []})
-
-    visible_qs = _renewal_queryset_visible_to_role(all_qs, request.user, role_stage_names)
-    pending_for_role = set(role_stage_names)
-    return Response(
-        {
-            "applied": [],
-            "pending": LicenseApplicationSerializer(
-                visible_qs.filter(current_stage__name__in=pending_for_role), many=True
-            ).data,
-            "objection": LicenseApplicationSerializer(
-                visible_qs.filter(current_stage__name__in=objection_stages), many=True
-            ).data,
-            "approved": LicenseApplicationSerializer(
-                visible_qs.exclude(current_stage__name__in=pending_for_role | objection_stages | rejected_stages), many=True
-            ).data,
-            "rejected": LicenseApplicationSerializer(
-                visible_qs.filter(current_stage__name__in=rejected_stages), many=True
-            ).data,
-        }
-    )
+    from .dashboard import DASHBOARD
+    return DASHBOARD.group_response(request)
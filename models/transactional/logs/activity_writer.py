@@ -0,0 +1,150 @@
+"""
+Background writer for `UserActivity` audit rows.
+
+`record_activity(**fields)` is what request code calls instead of
+`UserActivity.objects.create(...)`. Once the surrounding transaction commits,
+the row is put on a bounded in-process queue, and a daemon thread writes
+queued rows with `bulk_create` every `USER_ACTIVITY_BATCH_SIZE` rows or every
+`USER_ACTIVITY_FLUSH_INTERVAL_MS` milliseconds, whichever comes first.
+
+When the queue is full the caller writes a batch itself, so a login storm slows
+down to the database's pace instead of dropping audit rows. Pending rows are
+flushed at interpreter exit. With `USER_ACTIVITY_ASYNC` off (the default under
+`manage.py test`) rows are written synchronously.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import UserActivity
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ActivityWriter:
+    def __init__(self, batch_size=100, flush_interval=0.5, max_queue=10000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._queue = queue.Queue(maxsize=self.max_queue)
+        self._thread = None
+
+    def _ensure_started(self):
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked worker: the parent's thread and queue did not come along.
+                self._reset()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='user-activity-writer', daemon=True)
+                self._thread.start()
+
+    def enqueue(self, activity):
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(activity)
+        except queue.Full:
+            # Backpressure: the caller pays for a write instead of losing the row.
+            self._write(self._drain(self.batch_size - 1) + [activity])
+
+    def _drain(self, limit):
+        batch = []
+        while len(batch) < limit:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+        return batch
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            stopping = item is _STOP
+            if item is not None and not stopping:
+                batch.append(item)
+            if batch and (stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+            if stopping:
+                return
+
+    def _write(self, batch):
+        if not batch:
+            return
+        try:
+            UserActivity.objects.bulk_create(batch, batch_size=self.batch_size)
+        except Exception:
+            logger.warning("Batched write of %d user activities failed; retrying one by one", len(batch), exc_info=True)
+            for activity in batch:
+                try:
+                    activity.save(force_insert=True)
+                except Exception:
+                    logger.exception("Dropping user activity %s for user %s", activity.activity_type, activity.user_id)
+        finally:
+            if threading.current_thread() is self._thread:
+                # The writer thread owns its connection; do not keep it idle between flushes.
+                connection.close()
+
+    def flush(self):
+        """Write everything queued so far from the calling thread."""
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self, timeout=5.0):
+        """Stop the background thread after it has written what is queued."""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid() or not thread.is_alive():
+            self.flush()
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        thread.join(timeout)
+        self.flush()
+
+
+writer = ActivityWriter(
+    batch_size=getattr(settings, 'USER_ACTIVITY_BATCH_SIZE', 100),
+    flush_interval=getattr(settings, 'USER_ACTIVITY_FLUSH_INTERVAL_MS', 500) / 1000,
+    max_queue=getattr(settings, 'USER_ACTIVITY_QUEUE_SIZE', 10000),
+)
+atexit.register(writer.shutdown)
+
+
+def record_activity(**fields):
+    """Record a `UserActivity` row; fields are the model's constructor arguments."""
+    activity = UserActivity(**fields)
+    if not getattr(settings, 'USER_ACTIVITY_ASYNC', True):
+        activity.save(force_insert=True)
+        return
+    # Rows reference users that may have been created in the current transaction.
+    transaction.on_commit(lambda: writer.enqueue(activity))
@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from models.transactional.logs.models import UserActivity
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete user activity rows older than the retention window "
+        "(USER_ACTIVITY_RETENTION_DAYS), in batches so the table is never locked for long."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=getattr(settings, 'USER_ACTIVITY_RETENTION_DAYS', 365),
+            help='Keep this many days of activity.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows deleted per statement.'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the rows that would be deleted.'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        expired = UserActivity.objects.filter(timestamp__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f"[DRY-RUN] {expired.count()} activity row(s) older than {cutoff:%Y-%m-%d} would be deleted.")
+            return
+
+        deleted = 0
+        batch_size = max(1, options['batch_size'])
+        while True:
+            ids = list(expired.order_by().values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            count, _ = UserActivity.objects.filter(id__in=ids).delete()
+            deleted += count
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} activity row(s) older than {cutoff:%Y-%m-%d}."))
@@ -2,6 +2,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from django.contrib.auth.signals import user_logged_in, user_logged_out
+from .activity_writer import record_activity
 from .models import UserActivity
 
 User = get_user_model()
@@ -9,7 +10,7 @@ User = get_user_model()
 @receiver(post_save, sender=User)
 def track_registration(sender, instance, created, **kwargs):
     if created:
-        UserActivity.objects.create(
+        record_activity(
             user=instance,
             activity_type=UserActivity.ActivityType.REGISTRATION,
             metadata={
@@ -20,7 +21,7 @@ def track_registration(sender, instance, created, **kwargs):
 
 @receiver(user_logged_in)
 def track_login(sender, request, user, **kwargs):
-    UserActivity.objects.create(
+    record_activity(
         user=user,
         activity_type=UserActivity.ActivityType.LOGIN,
         ip_address=get_client_ip(request),
@@ -33,7 +34,7 @@ def track_login(sender, request, user, **kwargs):
 
 @receiver(user_logged_out)
 def track_logout(sender, request, user, **kwargs):
-    UserActivity.objects.create(
+    record_activity(
         user=user,
         activity_type=UserActivity.ActivityType.LOGOUT,
         ip_address=get_client_ip(request),
@@ -1,3 +1,100 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from models.masters.core.models import District, State, Subdivision
+from utils.query_profiler import fingerprint, profiles
+
+from .activity_writer import ActivityWriter, record_activity
+from .models import UserActivity
+
+
+class UserActivityWriterTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        subdivision = Subdivision.objects.create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=district,
+        )
+        self.user = get_user_model().objects.create_user(
+            email='audit@example.com', first_name='Audit', last_name='User', phone_number='9999999911',
+            district=district, subdivision=subdivision, address='Gangtok', password='password123',
+        )
+        UserActivity.objects.all().delete()
+
+    def test_queued_activities_are_written_in_one_batch(self):
+        writer = ActivityWriter(batch_size=10, max_queue=10)
+        for _ in range(3):
+            writer._queue.put_nowait(UserActivity(user=self.user, activity_type=UserActivity.ActivityType.LOGIN))
+
+        with self.assertNumQueries(1):
+            writer.flush()
+        self.assertEqual(UserActivity.objects.filter(user=self.user).count(), 3)
+
+    def test_full_queue_writes_from_the_caller(self):
+        writer = ActivityWriter(batch_size=10, max_queue=1)
+        writer._ensure_started = lambda: None
+        writer.enqueue(UserActivity(user=self.user, activity_type=UserActivity.ActivityType.LOGIN))
+        writer.enqueue(UserActivity(user=self.user, activity_type=UserActivity.ActivityType.LOGOUT))
+
+        self.assertEqual(UserActivity.objects.filter(user=self.user).count(), 2)
+        self.assertTrue(writer._queue.empty())
+
+    @override_settings(USER_ACTIVITY_ASYNC=False)
+    def test_synchronous_fallback_writes_immediately(self):
+        record_activity(user=self.user, activity_type=UserActivity.ActivityType.LOGIN, metadata={'auth_method': 'jwt'})
+        self.assertTrue(UserActivity.objects.filter(user=self.user, metadata__auth_method='jwt').exists())
+
+    def test_prune_removes_rows_past_retention(self):
+        UserActivity.objects.create(
+            user=self.user, activity_type=UserActivity.ActivityType.LOGIN,
+            timestamp=timezone.now() - timedelta(days=400),
+        )
+        recent = UserActivity.objects.create(user=self.user, activity_type=UserActivity.ActivityType.LOGIN)
+
+        call_command('prune_user_activity', days=365, batch_size=1, stdout=StringIO())
+        self.assertEqual(list(UserActivity.objects.values_list('id', flat=True)), [recent.id])
+
+
+@override_settings(QUERY_PROFILER_ENABLED=True)
+class QueryProfilerTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        subdivision = Subdivision.objects.create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=district,
+        )
+        self.admin = get_user_model().objects.create_user(
+            email='profiler@example.com', first_name='Profiler', last_name='Admin', phone_number='9999999913',
+            district=district, subdivision=subdivision, address='Gangtok', password='password123', is_staff=True,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+        profiles.clear()
+
+    def test_requests_are_profiled_per_url_name(self):
+        self.client.get(reverse('logs:user-activity-list'))
+        resp = self.client.get(reverse('logs:query-profile'), {'view_name': 'logs:user-activity-list'})
+
+        self.assertEqual(resp.status_code, 200)
+        [row] = resp.data['summary']
+        self.assertEqual(row['requests'], 1)
+        self.assertGreaterEqual(row['max_queries'], 1)
+        self.assertEqual(resp.data['samples'][0]['status'], 200)
+
+    def test_profile_is_admin_only(self):
+        self.admin.is_staff = False
+        self.admin.save(update_fields=['is_staff'])
+        self.assertEqual(self.client.get(reverse('logs:query-profile')).status_code, 403)
+
+    def test_fingerprint_folds_literals_and_in_lists(self):
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s) AND code = 12'),
+            fingerprint('SELECT * FROM t WHERE id IN (%s) AND code = 7'),
+        )
@@ -2,10 +2,12 @@
 from django.urls import path
 from .views import (
     user_activity_list,
-    track_custom_activity
+    track_custom_activity,
+    query_profile,
 )
 
 urlpatterns = [
     path('activities/', user_activity_list, name='user-activity-list'),
     path('activities/track/', track_custom_activity, name='track-activity'),
+    path('query-profile/', query_profile, name='query-profile'),
 ]
@@ -4,9 +4,10 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from django.db.models import Q
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
 from auth.roles.permissions import HasAppPermission
+from utils.query_profiler import profiles
 from .models import UserActivity
 from .serializer import UserActivitySerializer
 
@@ -107,3 +108,18 @@ def track_custom_activity(request):
     serializer.is_valid(raise_exception=True)
     serializer.save()
     return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def query_profile(request):
+    """Recent per-endpoint query counts and timings recorded by QueryProfilerMiddleware."""
+    if request.method == 'DELETE':
+        profiles.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    view_name = request.query_params.get('view_name')
+    return Response({
+        'summary': profiles.summary(view_name),
+        'samples': profiles.samples(view_name)[-100:],
+    })
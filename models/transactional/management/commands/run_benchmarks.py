@@ -0,0 +1,82 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from models.transactional.benchmarks import runner, seed
+from models.transactional.benchmarks.scenarios import SCENARIOS
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the hot paths against data from `seed_benchmark_data` and write p50/p95 latency "
+        "and query counts to JSON. With --compare (or --baseline), fail on regressions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scenario', action='append', dest='scenarios', choices=sorted(SCENARIOS),
+                            help='Run only this scenario (repeatable).')
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--output', default='benchmark-results.json', help='Where to write the results.')
+        parser.add_argument('--baseline', help='Compare this run against an earlier results file.')
+        parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                            help='Compare two results files without running anything.')
+        parser.add_argument('--max-slowdown', type=float, default=0.25,
+                            help='Allowed relative p95 growth before a scenario counts as a regression.')
+        parser.add_argument('--min-delta-ms', type=float, default=2.0,
+                            help='Ignore p95 changes smaller than this (noise floor).')
+
+    def handle(self, *args, **options):
+        if options['compare']:
+            baseline, current = (self._load(path) for path in options['compare'])
+            return self._report(runner.compare(baseline, current, options['max_slowdown'], options['min_delta_ms']))
+
+        try:
+            fixtures = seed.load_fixtures()
+        except LookupError as exc:
+            raise CommandError(str(exc))
+
+        results = runner.run(
+            fixtures,
+            names=options['scenarios'],
+            iterations=max(1, options['iterations']),
+            warmup=max(0, options['warmup']),
+            meta={'dataset': seed.dataset_size()},
+        )
+        with open(options['output'], 'w') as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+
+        self.stdout.write(f"{'scenario':40} {'p50 ms':>10} {'p95 ms':>10} {'queries':>8} {'errors':>7}")
+        for name, row in results['results'].items():
+            self.stdout.write(
+                f"{name:40} {row['p50_ms']:>10.2f} {row['p95_ms']:>10.2f} {row['queries']:>8} {row['errors']:>7}"
+            )
+        self.stdout.write(f"Results written to {options['output']}.")
+
+        if options['baseline']:
+            self._report(runner.compare(
+                self._load(options['baseline']), results, options['max_slowdown'], options['min_delta_ms']
+            ))
+
+    def _load(self, path):
+        try:
+            with open(path) as handle:
+                return json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read results file {path}: {exc}")
+
+    def _report(self, rows):
+        for row in rows:
+            if 'change' in row:
+                line = (
+                    f"{row['name']:40} p95 {row['baseline_p95_ms']:.2f} -> {row['current_p95_ms']:.2f} ms "
+                    f"({row['change']:+.0%}), queries {row['baseline_queries']} -> {row['current_queries']}"
+                )
+            else:
+                line = f"{row['name']:40} only in {'current' if row['verdict'] == 'new' else 'baseline'} run"
+            style = self.style.ERROR if row['verdict'] == 'regression' else self.style.SUCCESS
+            self.stdout.write(style(f"[{row['verdict']}] {line}"))
+
+        regressions = [row['name'] for row in rows if row['verdict'] == 'regression']
+        if regressions:
+            raise CommandError(f"{len(regressions)} regression(s): {', '.join(regressions)}")
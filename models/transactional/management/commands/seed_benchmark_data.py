@@ -0,0 +1,59 @@
+from datetime import date
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from models.transactional.benchmarks import seed
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed deterministic synthetic licensees, warehouses, hologram stock, workflow transactions "
+        "and wallet rows for `run_benchmarks`. Local databases only."
+    )
+
+    def add_arguments(self, parser):
+        for name, default in seed.DEFAULTS.items():
+            parser.add_argument(
+                f"--{name.replace('_', '-')}",
+                type=int,
+                default=default,
+                help=f"Default {default}" + ('' if name in ('licensees', 'brands') else ' per licensee') + '.',
+            )
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed produces the same rows.')
+        parser.add_argument(
+            '--anchor-date',
+            type=date.fromisoformat,
+            default=None,
+            help='Date the generated history is relative to (YYYY-MM-DD, default today).'
+        )
+        parser.add_argument('--flush', action='store_true', help='Delete previously seeded rows first.')
+        parser.add_argument('--flush-only', action='store_true', help='Delete previously seeded rows and stop.')
+        parser.add_argument('--force', action='store_true', help='Run even when DEBUG is off.')
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError("Refusing to seed benchmark data with DEBUG off; pass --force for a non-debug local database.")
+
+        if options['flush'] or options['flush_only']:
+            deleted = seed.flush()
+            self.stdout.write(f"Deleted {deleted} seeded row(s).")
+            if options['flush_only']:
+                return
+        elif seed.is_seeded():
+            raise CommandError("Benchmark data already exists; pass --flush to replace it.")
+
+        seeder = seed.Seeder(
+            seed=options['seed'],
+            anchor=options['anchor_date'],
+            **{name: options[name] for name in seed.DEFAULTS},
+        )
+        counts = seeder.run()
+        for table, count in sorted(counts.items()):
+            self.stdout.write(f"  {table}: {count}")
+
+        # bulk_create skipped the signals that maintain these.
+        call_command('rebuild_hologram_request_sla', stdout=self.stdout)
+        call_command('backfill_hologram_stock_ledger', stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(f"Seeded {options['licensees']} licensee(s) with seed {options['seed']}."))
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class AppNameConfig(AppConfig):
+    name = 'models.transactional.media_derivatives'
+    label = 'media_derivatives'
+    verbose_name = 'media_derivatives'
+
+    def ready(self):
+        from .signals import connect_media_derivative_signals
+        connect_media_derivative_signals()
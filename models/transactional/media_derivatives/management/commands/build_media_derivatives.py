@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from models.transactional.media_derivatives.services import ensure_derivatives, file_fields, get_derivatives
+from models.transactional.media_derivatives.signals import UPLOAD_MODELS
+
+
+class Command(BaseCommand):
+    help = (
+        "Checksum and thumbnail application uploads that have no media derivative yet "
+        "(files uploaded before derivatives were built on upload)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the files that would be processed.'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = bool(options.get('dry_run'))
+        pending = 0
+        for model in UPLOAD_MODELS:
+            for instance in model.objects.iterator(chunk_size=500):
+                files = file_fields(instance)
+                existing = get_derivatives(files)
+                missing = [f for f in files if f.name not in existing]
+                if not missing:
+                    continue
+                pending += len(missing)
+                if not dry_run:
+                    ensure_derivatives(missing)
+
+        verb = "would be processed" if dry_run else "processed"
+        self.stdout.write(self.style.SUCCESS(f"{pending} upload(s) {verb}."))
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaDerivative',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_name', models.CharField(max_length=500, unique=True)),
+                ('source_checksum', models.CharField(db_index=True, max_length=64)),
+                ('source_size', models.PositiveBigIntegerField(default=0)),
+                ('mime_type', models.CharField(blank=True, default='', max_length=100)),
+                ('thumbnail', models.FileField(blank=True, default='', max_length=500, upload_to='')),
+                ('thumbnail_checksum', models.CharField(blank=True, default='', max_length=64)),
+                ('thumbnail_width', models.PositiveIntegerField(blank=True, null=True)),
+                ('thumbnail_height', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'media_derivative',
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class MediaDerivative(models.Model):
+    """
+    Checksum and size-bounded thumbnail of an uploaded file, keyed by the
+    original's storage name. Non-image documents get a row without a thumbnail.
+    """
+    source_name = models.CharField(max_length=500, unique=True)
+    source_checksum = models.CharField(max_length=64, db_index=True)
+    source_size = models.PositiveBigIntegerField(default=0)
+    mime_type = models.CharField(max_length=100, blank=True, default='')
+
+    thumbnail = models.FileField(max_length=500, blank=True, default='')
+    thumbnail_checksum = models.CharField(max_length=64, blank=True, default='')
+    thumbnail_width = models.PositiveIntegerField(null=True, blank=True)
+    thumbnail_height = models.PositiveIntegerField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'media_derivative'
+
+    def __str__(self):
+        return self.source_name
+
+    @property
+    def has_thumbnail(self):
+        return bool(self.thumbnail)
@@ -0,0 +1,163 @@
+"""
+Upload-time derivatives for application documents and photos.
+
+`build_derivatives(instance)` runs after an application with file fields is
+saved (see `signals.py`). For every uploaded file without a `MediaDerivative`
+it records the SHA-256 checksum and, for images, stores a JPEG thumbnail with
+EXIF orientation applied, bounded to `MEDIA_THUMBNAIL_SIZE`. Thumbnails are
+named after the original's checksum, so identical uploads share one.
+
+Views read derivatives with `get_derivatives(files)` (one query, no storage
+round-trips) and embed `thumbnail_data_url(derivative)` instead of the
+original. Files uploaded before this existed are processed on first use by
+`ensure_derivatives`.
+"""
+import base64
+import hashlib
+import logging
+import mimetypes
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, models, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .models import MediaDerivative
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZE = tuple(getattr(settings, 'MEDIA_THUMBNAIL_SIZE', (480, 480)))
+THUMBNAIL_QUALITY = 82
+THUMBNAIL_DIR = 'derivatives'
+CHUNK_SIZE = 64 * 1024
+
+
+def file_fields(instance):
+    """Non-empty FieldFiles of a model instance."""
+    files = []
+    for field in instance._meta.concrete_fields:
+        if isinstance(field, models.FileField):
+            field_file = getattr(instance, field.attname, None)
+            if field_file and getattr(field_file, 'name', None):
+                files.append(field_file)
+    return files
+
+
+def _read_source(field_file):
+    digest = hashlib.sha256()
+    buffer = BytesIO()
+    with field_file.storage.open(field_file.name, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+            buffer.write(chunk)
+    buffer.seek(0)
+    return digest.hexdigest(), buffer
+
+
+def _render_thumbnail(buffer):
+    try:
+        image = Image.open(buffer)
+        image.draft('RGB', THUMBNAIL_SIZE)
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        return None
+
+    out = BytesIO()
+    image.save(out, format='JPEG', quality=THUMBNAIL_QUALITY, optimize=True)
+    return out.getvalue(), image.size
+
+
+def build_derivative(field_file):
+    """Checksum `field_file` and store its thumbnail. Raises if the file cannot be read."""
+    checksum, buffer = _read_source(field_file)
+    size = buffer.getbuffer().nbytes
+    derivative = MediaDerivative(
+        source_name=field_file.name,
+        source_checksum=checksum,
+        source_size=size,
+        mime_type=mimetypes.guess_type(field_file.name)[0] or '',
+    )
+
+    shared = (
+        MediaDerivative.objects.filter(source_checksum=checksum)
+        .exclude(thumbnail='')
+        .first()
+    )
+    if shared is not None:
+        derivative.thumbnail = shared.thumbnail.name
+        derivative.thumbnail_checksum = shared.thumbnail_checksum
+        derivative.thumbnail_width = shared.thumbnail_width
+        derivative.thumbnail_height = shared.thumbnail_height
+    else:
+        rendered = _render_thumbnail(buffer)
+        if rendered is not None:
+            data, (width, height) = rendered
+            name = f"{THUMBNAIL_DIR}/{checksum[:2]}/{checksum}_{THUMBNAIL_SIZE[0]}.jpg"
+            derivative.thumbnail = field_file.storage.save(name, ContentFile(data))
+            derivative.thumbnail_checksum = hashlib.sha256(data).hexdigest()
+            derivative.thumbnail_width = width
+            derivative.thumbnail_height = height
+
+    try:
+        with transaction.atomic():
+            derivative.save()
+    except IntegrityError:
+        # Built concurrently by another request.
+        return MediaDerivative.objects.get(source_name=field_file.name)
+    return derivative
+
+
+def get_derivatives(field_files):
+    """Existing derivatives for `field_files`, keyed by storage name."""
+    names = {f.name for f in field_files if f and getattr(f, 'name', None)}
+    if not names:
+        return {}
+    return {d.source_name: d for d in MediaDerivative.objects.filter(source_name__in=names)}
+
+
+def ensure_derivatives(field_files):
+    """
+    Derivatives for `field_files`, building the missing ones. Files that cannot
+    be read (e.g. missing from storage) are left out of the result.
+    """
+    derivatives = get_derivatives(field_files)
+    for field_file in field_files:
+        if not field_file or not getattr(field_file, 'name', None) or field_file.name in derivatives:
+            continue
+        try:
+            derivatives[field_file.name] = build_derivative(field_file)
+        except Exception:
+            logger.warning("Could not build media derivative for %s", field_file.name, exc_info=True)
+    return derivatives
+
+
+def build_derivatives(instance):
+    return ensure_derivatives(file_fields(instance))
+
+
+def pick_available(field_files):
+    """First of `field_files` that has been processed, as `(field_file, derivative)`."""
+    field_files = [f for f in field_files if f and getattr(f, 'name', None)]
+    derivatives = ensure_derivatives(field_files)
+    for field_file in field_files:
+        derivative = derivatives.get(field_file.name)
+        if derivative is not None:
+            return field_file, derivative
+    return None, None
+
+
+def thumbnail_data_url(derivative) -> str:
+    if derivative is None or not derivative.has_thumbnail:
+        return ""
+    try:
+        with derivative.thumbnail.open('rb') as handle:
+            raw = handle.read()
+    except Exception:
+        logger.warning("Thumbnail %s is missing from storage", derivative.thumbnail.name, exc_info=True)
+        return ""
+    return f"data:image/jpeg;base64,{base64.b64encode(raw).decode('ascii')}"
+
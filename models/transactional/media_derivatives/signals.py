@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.db.models import FileField
+from django.db.models.signals import post_save
+
+from models.transactional.new_license_application.models import NewLicenseApplication
+from models.transactional.salesman_barman.models import SalesmanBarmanModel
+from models.transactional.site_enquiry.models import SiteEnquiryReport
+
+from .services import build_derivatives
+
+UPLOAD_MODELS = (NewLicenseApplication, SalesmanBarmanModel, SiteEnquiryReport)
+
+
+def _touches_files(sender, update_fields):
+    if update_fields is None:
+        return True
+    return any(isinstance(sender._meta.get_field(name), FileField) for name in update_fields)
+
+
+def build_upload_derivatives(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw or not _touches_files(sender, update_fields):
+        return
+    transaction.on_commit(lambda: build_derivatives(instance))
+
+
+def connect_media_derivative_signals():
+    """Checksum and thumbnail application uploads once the saving transaction commits."""
+    for model in UPLOAD_MODELS:
+        post_save.connect(
+            build_upload_derivatives,
+            sender=model,
+            dispatch_uid=f'media_derivatives_{model._meta.label_lower}',
+        )
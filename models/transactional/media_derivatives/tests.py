@@ -0,0 +1,97 @@
+import hashlib
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models.fields.files import FieldFile
+from django.test import RequestFactory, TestCase, override_settings
+from PIL import Image
+
+from utils.protected_media import serve_protected_file
+
+from .models import MediaDerivative
+from .services import THUMBNAIL_SIZE, ensure_derivatives, get_derivatives, thumbnail_data_url
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class MediaDerivativeTests(TestCase):
+    def _upload(self, name, data):
+        stored = default_storage.save(name, ContentFile(data))
+        return FieldFile(None, MediaDerivative._meta.get_field('thumbnail'), stored)
+
+    def _rotated_photo(self):
+        # 2000x1000 landscape pixels tagged "rotate 90 CW" (orientation 6).
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        out = BytesIO()
+        Image.new('RGB', (2000, 1000), 'red').save(out, format='JPEG', exif=exif)
+        return out.getvalue()
+
+    def test_thumbnail_is_bounded_and_upright(self):
+        data = self._rotated_photo()
+        photo = self._upload('uploads/photo.jpg', data)
+
+        derivative = ensure_derivatives([photo])[photo.name]
+
+        self.assertEqual(derivative.source_checksum, hashlib.sha256(data).hexdigest())
+        self.assertEqual(derivative.source_size, len(data))
+        self.assertLessEqual(max(derivative.thumbnail_width, derivative.thumbnail_height), max(THUMBNAIL_SIZE))
+        self.assertGreater(derivative.thumbnail_height, derivative.thumbnail_width)
+        with derivative.thumbnail.open('rb') as handle:
+            self.assertEqual(hashlib.sha256(handle.read()).hexdigest(), derivative.thumbnail_checksum)
+        self.assertTrue(thumbnail_data_url(derivative).startswith('data:image/jpeg;base64,'))
+
+    def test_existing_derivatives_are_read_without_storage(self):
+        data = self._rotated_photo()
+        first = self._upload('uploads/a.jpg', data)
+        second = self._upload('uploads/b.jpg', data)
+        document = self._upload('uploads/proof.pdf', b'%PDF-1.4 not an image')
+        ensure_derivatives([first, second, document])
+
+        with self.assertNumQueries(1):
+            derivatives = get_derivatives([first, second, document])
+        self.assertEqual(derivatives[first.name].thumbnail.name, derivatives[second.name].thumbnail.name)
+        self.assertFalse(derivatives[document.name].has_thumbnail)
+        self.assertEqual(thumbnail_data_url(derivatives[document.name]), '')
+
+    def test_missing_files_are_skipped(self):
+        missing = FieldFile(None, MediaDerivative._meta.get_field('thumbnail'), 'uploads/gone.jpg')
+        with self.assertLogs('models.transactional.media_derivatives.services', 'WARNING'):
+            self.assertEqual(ensure_derivatives([missing]), {})
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ProtectedMediaTests(TestCase):
+    def setUp(self):
+        stored = default_storage.save('uploads/scan.pdf', ContentFile(b'0123456789'))
+        self.upload = FieldFile(None, MediaDerivative._meta.get_field('thumbnail'), stored)
+        self.factory = RequestFactory()
+
+    @override_settings(PROTECTED_MEDIA_SERVER='nginx', PROTECTED_MEDIA_INTERNAL_URL='/protected-media/')
+    def test_nginx_transfer_is_offloaded(self):
+        response = serve_protected_file(self.factory.get('/'), self.upload, etag='abc')
+
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.upload.name}')
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], '"abc"')
+        self.assertIn('Last-Modified', response)
+
+    def test_conditional_get_returns_not_modified(self):
+        response = serve_protected_file(self.factory.get('/', HTTP_IF_NONE_MATCH='"abc"'), self.upload, etag='abc')
+        self.assertEqual(response.status_code, 304)
+
+    @override_settings(PROTECTED_MEDIA_SERVER='django')
+    def test_django_fallback_serves_ranges(self):
+        response = serve_protected_file(self.factory.get('/', HTTP_RANGE='bytes=2-5'), self.upload)
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 2-5/10')
+        self.assertEqual(b''.join(response.streaming_content), b'2345')
@@ -0,0 +1,65 @@
+"""
+Dashboard tabs for new license applications (see models.transactional.dashboards).
+
+Licensee applications stay "pending" until the application fee is paid. Officer
+tabs ("approved"/"rejected") only include applications the officer's role has
+acted on.
+"""
+from django.db.models import Q
+
+from auth.workflow.constants import WORKFLOW_IDS
+from models.transactional.dashboards import COUNTS, LEGACY, WorkflowDashboard, in_stages, nothing
+
+from .models import NewLicenseApplication
+from .serializers import NewLicenseApplicationSerializer
+
+
+def licensee_buckets(ctx):
+    # The legacy all-tabs listing has no "awaiting_payment" tab.
+    buckets = ctx.standard_buckets(separate_payment=ctx.purpose != LEGACY)
+    paid = Q(is_application_fee_paid=True)
+    buckets = {name: paid & condition for name, condition in buckets.items()}
+    buckets['pending'] |= Q(is_application_fee_paid=False)
+    return ctx.mine, buckets
+
+
+def admin_buckets(ctx):
+    return ctx.objects, ctx.standard_buckets(separate_payment=False)
+
+
+def officer_buckets(ctx):
+    if not ctx.role_stages:
+        return ctx.objects, nothing('pending', 'approved', 'rejected')
+
+    stages = ctx.stages
+    pending_stages = ctx.role_stages | stages['objection']
+    acted = ctx.acted_by_role()
+    buckets = {
+        'pending': in_stages(pending_stages),
+        'objection': in_stages(stages['objection']),
+        'approved': ~in_stages(pending_stages | stages['rejected']) & acted,
+        'rejected': in_stages(stages['rejected']) & acted,
+    }
+    if ctx.purpose == COUNTS:
+        # Officers only see their own queue and what their role has decided.
+        del buckets['objection']
+    return ctx.objects, buckets
+
+
+def _list_queryset(qs):
+    from .views import _with_application_fee_payment_annotations, _with_site_enquiry_revert_annotations
+
+    return _with_site_enquiry_revert_annotations(_with_application_fee_payment_annotations(qs))
+
+
+DASHBOARD = WorkflowDashboard(
+    NewLicenseApplication,
+    group_spec={
+        'licensee': licensee_buckets,
+        'site_admin': admin_buckets,
+        '*': officer_buckets,
+    },
+    workflow=WORKFLOW_IDS['LICENSE_APPROVAL'],
+    serializer=NewLicenseApplicationSerializer,
+    list_queryset=_list_queryset,
+)
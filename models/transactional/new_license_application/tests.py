@@ -1,10 +1,14 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.contrib.contenttypes.models import ContentType
 
-from auth.workflow.models import Workflow, WorkflowStage
+from auth.workflow.models import StagePermission, Transaction as WorkflowTransaction, Workflow, WorkflowStage
 from auth.roles.models import Role
+from utils.testing import QueryBudgetMixin
+from models.transactional.dashboards import bucket_counts
+from .dashboard import DASHBOARD
 from .models import NewLicenseApplication
 from models.masters.core.models import (
     District,
@@ -16,7 +20,8 @@ from models.masters.core.models import (
     PoliceStation
 )
 
-class NewLicenseDashboardCountsTests(TestCase):
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class NewLicenseDashboardCountsTests(QueryBudgetMixin, TestCase):
     def setUp(self):
         self.client = APIClient()
         self.user_model = get_user_model()
@@ -113,3 +118,80 @@ class NewLicenseDashboardCountsTests(TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.data.get("awaiting_payment"), 0)
         self.assertEqual(resp.data.get("pending"), 1)
+
+    def test_dashboard_counts_are_one_query(self):
+        self._create_application('NA/225/2026-27/0003', self.stages['Applied'])
+        self._create_application('NA/225/2026-27/0004', self.stages['Objection'])
+        base_qs, buckets = DASHBOARD.buckets(DASHBOARD.context(self.licensee_user))
+
+        with self.assertNumQueries(1):
+            counts = bucket_counts(base_qs, buckets)
+        self.assertEqual(counts['pending'], 1)
+        self.assertEqual(counts['objection'], 1)
+        self.assertEqual(counts['approved'], 0)
+
+    def test_officer_counts_only_applications_their_role_acted_on(self):
+        officer_role = Role.objects.create(name='oic')
+        officer = self.user_model.objects.create_user(
+            password='password123', email='oic@example.com', role=officer_role,
+            district=self.district, subdivision=self.subdivision, phone_number="9999999902",
+            first_name="Officer", last_name="User", address="Test address 2",
+        )
+        StagePermission.objects.create(stage=self.stages['Applied'], role=officer_role)
+        self._create_application('NA/225/2026-27/0005', self.stages['Applied'])
+        acted = self._create_application('NA/225/2026-27/0006', self.stages['approved'])
+        self._create_application('NA/225/2026-27/0007', self.stages['approved'])
+        WorkflowTransaction.objects.create(
+            content_type=ContentType.objects.get_for_model(NewLicenseApplication),
+            object_id=acted.application_id, performed_by=officer, stage=self.stages['Applied'],
+        )
+
+        self.client.force_authenticate(user=officer)
+        resp = self.client.get(reverse("new_license_application:dashboard-counts"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data, {"pending": 1, "approved": 1, "rejected": 0})
+
+    def test_application_group_pages_one_bucket(self):
+        for index in range(3):
+            self._create_application(f'NA/225/2026-27/001{index}', self.stages['Awaiting Payment'])
+
+        url = reverse("new_license_application:applications-by-status")
+        resp = self.client.get(url, {"bucket": "awaiting_payment", "page_size": 2})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 3)
+        self.assertEqual(len(resp.data["results"]), 2)
+        self.assertIsNotNone(resp.data["next"])
+
+        resp = self.client.get(resp.data["next"])
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data["results"]), 1)
+        self.assertIsNone(resp.data["next"])
+
+        resp = self.client.get(url, {"bucket": "unknown"})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_counts_are_cached_until_a_workflow_step_is_recorded(self):
+        application = self._create_application('NA/225/2026-27/0020', self.stages['Applied'])
+        url = reverse("new_license_application:dashboard-counts")
+        self.client.get(url)
+
+        # Moving the application without recording a step keeps the cached counts.
+        NewLicenseApplication.objects.filter(pk=application.pk).update(current_stage=self.stages['Objection'])
+        resp = self.client.get(url)
+        self.assertEqual((resp.data["pending"], resp.data["objection"]), (1, 0))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkflowTransaction.objects.create(
+                content_type=ContentType.objects.get_for_model(NewLicenseApplication),
+                object_id=application.application_id, performed_by=self.licensee_user, stage=self.stages['Objection'],
+            )
+        resp = self.client.get(url)
+        self.assertEqual((resp.data["pending"], resp.data["objection"]), (0, 1))
+
+    def test_application_group_query_budget(self):
+        self.assert_query_budget(
+            "new_license_application:applications-by-status",
+            5,
+            lambda index: self._create_application(f'NA/225/2026-27/01{index:02d}', self.stages['Applied']),
+            params={"bucket": "applied"},
+        )
@@ -12,7 +12,6 @@ from auth.roles.permissions import HasAppPermission
 from auth.workflow.permissions import HasStagePermission
 from auth.workflow.services import WorkflowService
 from auth.workflow.models import Workflow
-from auth.workflow.models import Transaction as WorkflowTransaction
 from auth.workflow.constants import WORKFLOW_IDS
 from .models import NewLicenseApplication
 from models.masters.license.models import License, LicenseValidationToken
@@ -22,10 +21,9 @@ from models.masters.core.models import Location
 from django.core.exceptions import ValidationError, PermissionDenied
 from django.utils import timezone
 from django.contrib.contenttypes.models import ContentType
-from django.http import FileResponse, HttpResponse
+from django.http import HttpResponse
 from io import BytesIO
 import base64
-import mimetypes
 from PIL import Image
 from utils.qrcodegen import QrCode
 from models.transactional.wallet.wallet_initializer import _resolve_hoa_code
@@ -36,10 +34,14 @@ from django.core import signing
 from urllib.parse import quote
 import secrets
 import hashlib
-from models.transactional.helpers import _normalize_role, _get_stage_sets, _get_role_stage_names
-from models.masters.core.models import LicenseFee, SupplyChainTimerConfig
+from models.transactional.helpers import _normalize_role
+from models.transactional.media_derivatives.services import pick_available, thumbnail_data_url
+from utils.protected_media import serve_protected_file
+from models.masters.core.models import LicenseFee
+from models.masters.core.timers import get_days
 from models.transactional.wallet.wallet_service import debit_wallet_balance
 from .payment_status import sync_new_license_payment_status
+from .dashboard import DASHBOARD
 import logging
 import secrets
 from decimal import Decimal
@@ -521,49 +523,8 @@ def initiate_renewal(request, license_id):
     if old_app.applicant != request.user:
         return Response({"detail": "You can only renew your own license."}, status=status.HTTP_403_FORBIDDEN)
 
-    def get_timer_days(code: str, default_days: int) -> int:
-        cfg = (
-            SupplyChainTimerConfig.objects.filter(code=code, is_active=True)
-            .order_by("-updated_at", "-id")
-            .first()
-        )
-        if not cfg:
-            return int(default_days)
-
-        unit = str(getattr(cfg, "delay_unit", "") or "").lower().strip()
-        value = getattr(cfg, "delay_value", None)
-        try:
-            value_int = max(0, int(value or 0))
-        except (TypeError, ValueError):
-            value_int = 0
-
-        # Prefer configured unit/value (so changing delay_value/unit takes effect immediately),
-        # fallback to validity_period_days if unit/value are missing or not meaningful.
-        if value_int > 0 and unit:
-            if unit.endswith("s"):
-                unit = unit[:-1]
-            if unit == "day":
-                return value_int
-            if unit in ("week", "wk"):
-                return value_int * 7
-            if unit in ("month", "mon", "mo"):
-                return value_int * 30
-            if unit in ("year", "yr"):
-                return value_int * 365
-            if unit in ("hour", "hr"):
-                return max(0, value_int // 24)
-
-        days = getattr(cfg, "validity_period_days", None)
-        if days is not None:
-            try:
-                return max(0, int(days))
-            except (TypeError, ValueError):
-                return int(default_days)
-
-        return int(default_days)
-
     now_dt = timezone.now()
-    reminder_days = get_timer_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
+    reminder_days = get_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
 
     # Best-effort: keep license status consistent once it crosses expiry.
     if getattr(old_license, "valid_up_to", None) and old_license.valid_up_to < now_dt and getattr(old_license, "is_active", True):
@@ -787,33 +748,22 @@ def final_license_detail(request, application_id):
         if getattr(application, "renewal_of", None) and getattr(application.renewal_of, "source_application", None):
             src = application.renewal_of.source_application
             candidates.append(getattr(src, "pass_photo", None))
-        for c in candidates:
-            try:
-                if c and getattr(c, "name", None) and c.storage.exists(c.name):
-                    return c
-            except Exception:
-                continue
-        return None
+        return pick_available(candidates)
 
     photo_url = ""
+    photo_thumbnail_url = ""
     photo_exists = False
     passport_photo_data_url = ""
-    passport_file = _pick_passport_file()
-    if passport_file and hasattr(passport_file, "url"):
-        try:
-            photo_url = request.build_absolute_uri(passport_file.url)
-        except Exception:
-            photo_url = ""
-
+    passport_file, passport_derivative = _pick_passport_file()
+    if passport_file:
         photo_exists = True
         try:
-            with passport_file.open("rb") as f:
-                raw = f.read()
-            mime = mimetypes.guess_type(passport_file.name)[0] or "application/octet-stream"
-            b64 = base64.b64encode(raw).decode("ascii")
-            passport_photo_data_url = f"data:{mime};base64,{b64}"
+            photo_url = request.build_absolute_uri(passport_file.url)
+            if passport_derivative.has_thumbnail:
+                photo_thumbnail_url = request.build_absolute_uri(passport_derivative.thumbnail.url)
         except Exception:
-            passport_photo_data_url = ""
+            pass
+        passport_photo_data_url = thumbnail_data_url(passport_derivative)
 
     def make_qr_data_url(payload: str) -> str:
         qr = QrCode.encode_text(str(payload), QrCode.Ecc.MEDIUM)
@@ -897,6 +847,7 @@ def final_license_detail(request, application_id):
         "district": application.site_district.district if application.site_district else "",
         "modeOfOperation": build_mode_display(),
         "passportPhotoUrl": photo_url,
+        "passportPhotoThumbnailUrl": photo_thumbnail_url,
         "passportPhotoExists": photo_exists,
         "passportPhotoDataUrl": passport_photo_data_url,
         "licenseFee": "",
@@ -960,26 +911,17 @@ def final_license_passport_photo(request, application_id):
         if getattr(application, "renewal_of", None) and getattr(application.renewal_of, "source_application", None):
             src = application.renewal_of.source_application
             candidates.append(getattr(src, "pass_photo", None))
-        for c in candidates:
-            try:
-                if c and getattr(c, "name", None) and c.storage.exists(c.name):
-                    return c
-            except Exception:
-                continue
-        return None
+        return pick_available(candidates)
 
-    passport_file = _pick_passport_file()
+    passport_file, passport_derivative = _pick_passport_file()
     if not passport_file:
         return Response({"detail": "Photo not available."}, status=status.HTTP_404_NOT_FOUND)
 
     try:
-        f = passport_file.open("rb")
-    except Exception:
+        return serve_protected_file(request, passport_file, etag=passport_derivative.source_checksum)
+    except OSError:
         return Response({"detail": "Photo not available."}, status=status.HTTP_404_NOT_FOUND)
 
-    mime = mimetypes.guess_type(passport_file.name)[0] or "application/octet-stream"
-    return FileResponse(f, content_type=mime)
-
 
 @permission_classes([HasAppPermission('new_license_application', 'view')])
 @api_view(['GET'])
@@ -1481,92 +1423,7 @@ def dashboard_counts(request):
     except Exception:
         pass
 
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    workflow_id = WORKFLOW_IDS['LICENSE_APPROVAL']
-    stage_sets = _get_stage_sets(workflow_id)
-    all_qs = NewLicenseApplication.objects.all()
-
-    if role == 'licensee':
-        base_qs = NewLicenseApplication.objects.filter(applicant=request.user)
-        unpaid_qs = base_qs.filter(is_application_fee_paid=False)
-        paid_qs = base_qs.filter(is_application_fee_paid=True)
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        approved_stages = set(stage_sets['approved'])
-        rejected_stages = set(stage_sets['rejected'])
-        payment_stages = set(stage_sets['payment'])
-        pending_stages = set(stage_sets['all']) - applied_stages - approved_stages - rejected_stages - objection_stages - payment_stages
-
-        return Response({
-            # Licensee UX: application is considered "Pending" until application-fee payment succeeds.
-            "applied": paid_qs.filter(current_stage__name__in=applied_stages).count(),
-            "pending": unpaid_qs.count() + paid_qs.filter(current_stage__name__in=pending_stages).count(),
-            "objection": paid_qs.filter(current_stage__name__in=objection_stages).count(),
-            "approved": paid_qs.filter(current_stage__name__in=approved_stages).count(),
-            "rejected": paid_qs.filter(current_stage__name__in=rejected_stages).count(),
-            "awaiting_payment": paid_qs.filter(current_stage__name__in=payment_stages).count(),
-        })
-
-    if role in ['site_admin']:
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        approved_stages = set(stage_sets['approved'])
-        rejected_stages = set(stage_sets['rejected'])
-        pending_stages = set(stage_sets['all']) - applied_stages - approved_stages - rejected_stages - objection_stages
-
-        return Response({
-            "applied": all_qs.filter(current_stage__name__in=applied_stages).count(),
-            "pending": all_qs.filter(current_stage__name__in=pending_stages).count(),
-            "objection": all_qs.filter(current_stage__name__in=objection_stages).count(),
-            "approved": all_qs.filter(current_stage__name__in=approved_stages).count(),
-            "rejected": all_qs.filter(current_stage__name__in=rejected_stages).count(),
-        })
-
-    role_stage_names = _get_role_stage_names(request.user, workflow_id)
-    if not role_stage_names:
-        return Response({
-            "pending": 0,
-            "approved": 0,
-            "rejected": 0,
-        })
-
-    from django.contrib.contenttypes.models import ContentType
-    from django.db.models import OuterRef, Exists, Q
-
-    content_type = ContentType.objects.get_for_model(NewLicenseApplication)
-    role_id = getattr(getattr(request.user, 'role', None), 'id', None)
-    
-    acted_by_role = Exists(
-        WorkflowTransaction.objects.filter(
-            content_type=content_type, 
-            object_id=OuterRef('application_id'),
-            performed_by__role_id=role_id
-        )
-    )
-
-    role_objection_stages = set(stage_sets['objection'])
-    pending_stages = set(role_stage_names) | role_objection_stages
-    role_rejected_stages = set(stage_sets['rejected'])
-
-    pending_count = all_qs.filter(current_stage__name__in=pending_stages).count()
-    approved_count = (
-        all_qs.exclude(current_stage__name__in=pending_stages | role_rejected_stages)
-        .annotate(_acted_by_role=acted_by_role)
-        .filter(_acted_by_role=True)
-        .count()
-    )
-    rejected_count = (
-        all_qs.filter(current_stage__name__in=role_rejected_stages)
-        .annotate(_acted_by_role=acted_by_role)
-        .filter(_acted_by_role=True)
-        .count()
-    )
-
-    return Response({
-        "pending": pending_count,
-        "approved": approved_count,
-        "rejected": rejected_count,
-    })
+    return DASHBOARD.counts_response(request)
 
 # Application Grouping
 
@@ -1574,125 +1431,5 @@ def dashboard_counts(request):
 @api_view(['GET'])
 @parser_classes([JSONParser])
 def application_group(request):
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    workflow_id = WORKFLOW_IDS['LICENSE_APPROVAL']
-    stage_sets = _get_stage_sets(workflow_id)
-    all_qs = NewLicenseApplication.objects.all()
-
-    if role == 'licensee':
-        base_qs = _with_site_enquiry_revert_annotations(
-            _with_application_fee_payment_annotations(NewLicenseApplication.objects.filter(applicant=request.user))
-        )
-        unpaid_qs = base_qs.filter(is_application_fee_paid=False)
-        paid_qs = base_qs.filter(is_application_fee_paid=True)
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        approved_stages = set(stage_sets['approved'])
-        rejected_stages = set(stage_sets['rejected'])
-        pending_stages = set(stage_sets['all']) - applied_stages - approved_stages - rejected_stages - objection_stages
-
-        from django.db.models import Q
-        pending_qs = base_qs.filter(
-            Q(is_application_fee_paid=False)
-            | (Q(is_application_fee_paid=True) & Q(current_stage__name__in=pending_stages))
-        )
-
-        return Response({
-            "applied": NewLicenseApplicationSerializer(
-                paid_qs.filter(current_stage__name__in=applied_stages), many=True
-            ).data,
-            "pending": NewLicenseApplicationSerializer(
-                pending_qs, many=True
-            ).data,
-            "objection": NewLicenseApplicationSerializer(
-                paid_qs.filter(current_stage__name__in=objection_stages), many=True
-            ).data,
-            "approved": NewLicenseApplicationSerializer(
-                paid_qs.filter(current_stage__name__in=approved_stages), many=True
-            ).data,
-            "rejected": NewLicenseApplicationSerializer(
-                paid_qs.filter(current_stage__name__in=rejected_stages), many=True
-            ).data
-        })
-
-    if role in ['site_admin']:
-        all_qs = _with_site_enquiry_revert_annotations(_with_application_fee_payment_annotations(all_qs))
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        approved_stages = set(stage_sets['approved'])
-        rejected_stages = set(stage_sets['rejected'])
-        pending_stages = set(stage_sets['all']) - applied_stages - approved_stages - rejected_stages - objection_stages
-
-        return Response({
-            "applied": NewLicenseApplicationSerializer(
-                all_qs.filter(current_stage__name__in=applied_stages), many=True
-            ).data,
-            "pending": NewLicenseApplicationSerializer(
-                all_qs.filter(current_stage__name__in=pending_stages), many=True
-            ).data,
-            "objection": NewLicenseApplicationSerializer(
-                all_qs.filter(current_stage__name__in=objection_stages), many=True
-            ).data,
-            "approved": NewLicenseApplicationSerializer(
-                all_qs.filter(current_stage__name__in=approved_stages), many=True
-            ).data,
-            "rejected": NewLicenseApplicationSerializer(
-                all_qs.filter(current_stage__name__in=rejected_stages), many=True
-            ).data
-        })
-
-    role_stage_names = _get_role_stage_names(request.user, workflow_id)
-    if role_stage_names:
-        all_qs = _with_site_enquiry_revert_annotations(_with_application_fee_payment_annotations(all_qs))
-        from django.contrib.contenttypes.models import ContentType
-        from django.db.models import OuterRef, Exists, Q
-
-        content_type = ContentType.objects.get_for_model(NewLicenseApplication)
-        role_id = getattr(getattr(request.user, 'role', None), 'id', None)
-        
-        acted_by_role = Exists(
-            WorkflowTransaction.objects.filter(
-                content_type=content_type, 
-                object_id=OuterRef('application_id'),
-                performed_by__role_id=role_id
-            )
-        )
-
-        role_objection_stages = set(stage_sets['objection'])
-        pending_stages = set(role_stage_names) | role_objection_stages
-        role_rejected_stages = set(stage_sets['rejected'])
-        
-        approved_qs = (
-            all_qs.exclude(current_stage__name__in=pending_stages | role_rejected_stages)
-            .annotate(_acted_by_role=acted_by_role)
-            .filter(_acted_by_role=True)
-        )
-        rejected_qs = (
-            all_qs.filter(current_stage__name__in=role_rejected_stages)
-            .annotate(_acted_by_role=acted_by_role)
-            .filter(_acted_by_role=True)
-        )
-
-        return Response({
-             "applied": [],
-             "pending": NewLicenseApplicationSerializer(
-                 all_qs.filter(current_stage__name__in=pending_stages), many=True
-             ).data,
-             "objection": NewLicenseApplicationSerializer(
-                 all_qs.filter(current_stage__name__in=role_objection_stages), many=True
-             ).data,
-             "approved": NewLicenseApplicationSerializer(
-                 approved_qs, many=True
-             ).data,
-             "rejected": NewLicenseApplicationSerializer(
-                 rejected_qs, many=True
-             ).data
-        })
-
-    return Response({
-         "applied": [],
-         "pending": [],
-         "objection": [],
-         "approved": [],
-         "rejected": []
-    })
+    # One tab at a time with ?bucket=pending (keyset paginated), or every tab.
+    return DASHBOARD.group_response(request)
@@ -0,0 +1,144 @@
+"""
+Durable inbox for BillDesk transaction responses.
+
+`billdesk_webhook` and `billdesk_response` only `enqueue` the raw JWS and return.
+Rows are unique per (orderid, transaction_id, auth_status), so retries and the
+webhook/browser pair for one payment are stored once. The key is only taken from
+payloads whose signature verifies: anything else is stored under its digest as
+"failed" and never applied, so a forged browser POST cannot claim the key of a
+genuine event.
+
+`process_due` claims due rows with ``SELECT ... FOR UPDATE SKIP LOCKED`` and runs
+`_process_billdesk_transaction` for each inside a savepoint: the row is marked
+processed in the same transaction as the payment's effects, and a failure rolls
+the effects back and schedules a retry with backoff. Several workers
+(`process_payment_webhooks`) can drain the inbox concurrently.
+"""
+from datetime import timedelta
+import hashlib
+import logging
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .billdesk_utils import verify_billdesk_jws
+from .models import PaymentGatewayParameters, PaymentWebhookInbox
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = timedelta(seconds=30)
+RETRY_MAX_DELAY = timedelta(hours=1)
+
+
+def active_gateway():
+    return (
+        PaymentGatewayParameters.objects.filter(is_active=True, payment_gateway_name__iexact="Billdesk")
+        .order_by("sl_no")
+        .first()
+    )
+
+
+def _verified(payload: str) -> bool:
+    gateway = active_gateway()
+    encryption_key = str(getattr(gateway, "encryption_key", "") or "").strip()
+    return bool(encryption_key) and verify_billdesk_jws(payload, encryption_key)
+
+
+def event_key(payload: str):
+    """
+    (orderid, transaction_id, auth_status) for a signed JWS. Payloads that do not
+    verify or decode are keyed by their digest, with an empty orderid.
+    """
+    from .views import _decode_jws_payload
+
+    data = {}
+    if _verified(payload):
+        try:
+            data = _decode_jws_payload(payload)
+        except Exception:
+            data = {}
+    if not isinstance(data, dict) or not data.get("orderid"):
+        return "", hashlib.sha256(payload.encode("utf-8")).hexdigest(), ""
+    return (
+        str(data.get("orderid") or "")[:100],
+        str(data.get("transactionid") or "")[:100],
+        str(data.get("auth_status") or "")[:20],
+    )
+
+
+def enqueue(payload: str, source: str):
+    """Store `payload` unless the same event is already in the inbox. Returns `(entry, created)`."""
+    orderid, transaction_id, auth_status = event_key(payload)
+    defaults = {"payload": payload, "source": source}
+    if not orderid:
+        logger.warning("Rejected BillDesk %s payload with an invalid signature or body", source)
+        defaults.update(state=PaymentWebhookInbox.STATE_FAILED, last_error="Invalid signature or payload")
+    try:
+        with transaction.atomic():
+            return PaymentWebhookInbox.objects.get_or_create(
+                orderid=orderid,
+                transaction_id=transaction_id,
+                auth_status=auth_status,
+                defaults=defaults,
+            )
+    except IntegrityError:
+        # A concurrent delivery of the same event won the insert.
+        return PaymentWebhookInbox.objects.get(
+            orderid=orderid, transaction_id=transaction_id, auth_status=auth_status
+        ), False
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return min(RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0)), RETRY_MAX_DELAY)
+
+
+def _process(entry, max_attempts):
+    from .views import _process_billdesk_transaction
+
+    entry.attempts += 1
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            result = _process_billdesk_transaction(entry.payload)
+        if result is False:
+            raise ValueError("Payload could not be decoded")
+    except Exception as exc:
+        logger.exception("BillDesk inbox entry %s failed (attempt %s)", entry.pk, entry.attempts)
+        entry.last_error = f"{type(exc).__name__}: {exc}"
+        if entry.attempts >= max_attempts:
+            entry.state = PaymentWebhookInbox.STATE_FAILED
+        else:
+            entry.next_attempt_at = now + retry_delay(entry.attempts)
+    else:
+        entry.state = PaymentWebhookInbox.STATE_PROCESSED
+        entry.processed_at = now
+        entry.last_error = ""
+    entry.save(update_fields=["attempts", "state", "last_error", "next_attempt_at", "processed_at"])
+    return entry.state
+
+
+def process_due(batch_size=DEFAULT_BATCH_SIZE, max_attempts=DEFAULT_MAX_ATTEMPTS, ids=None):
+    """
+    Process up to `batch_size` due rows, skipping rows another worker holds.
+    With `ids`, those pending rows are processed whatever their retry schedule.
+    Returns `{state: count}` for the rows handled.
+    """
+    handled = {}
+    with transaction.atomic():
+        due = PaymentWebhookInbox.objects.filter(state=PaymentWebhookInbox.STATE_PENDING)
+        if ids is not None:
+            due = due.filter(pk__in=ids)
+        else:
+            due = due.filter(next_attempt_at__lte=timezone.now())
+        for entry in due.select_for_update(skip_locked=True).order_by("next_attempt_at", "id")[:batch_size]:
+            state = _process(entry, max_attempts)
+            handled[state] = handled.get(state, 0) + 1
+    return handled
+
+
+def process_now(entry):
+    """Process `entry` in this request unless a worker already has it."""
+    if entry.state == PaymentWebhookInbox.STATE_PENDING:
+        process_due(batch_size=1, ids=[entry.pk])
@@ -0,0 +1,54 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from models.transactional.payment_gateway.inbox import DEFAULT_BATCH_SIZE, DEFAULT_MAX_ATTEMPTS, process_due
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply pending BillDesk transaction responses from the webhook inbox. "
+        "Several workers can run at once; each row is claimed with SKIP LOCKED."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Rows claimed per transaction.'
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=DEFAULT_MAX_ATTEMPTS,
+            help='Attempts before a row is marked failed.'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling the inbox instead of exiting once it is drained.'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=5.0,
+            help='Seconds to wait between polls when the inbox is empty (with --loop).'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        max_attempts = max(1, options['max_attempts'])
+        totals = {}
+        while True:
+            handled = process_due(batch_size=batch_size, max_attempts=max_attempts)
+            for state, count in handled.items():
+                totals[state] = totals.get(state, 0) + count
+            if handled:
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['sleep'])
+
+        summary = ", ".join(f"{count} {state}" for state, count in sorted(totals.items())) or "nothing due"
+        self.stdout.write(self.style.SUCCESS(f"Webhook inbox: {summary}."))
@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from models.transactional.payment_gateway.reconciliation import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RATE,
+    reconcile,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Ask BillDesk for the status of payments still pending after --older-than minutes "
+        "and settle the ones it has decided, as a late webhook would."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            type=int,
+            default=30,
+            help='Only check payments initiated at least this many minutes ago.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Pending transactions read per query.'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=None,
+            help='Check at most this many transactions.'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_CONCURRENCY,
+            help='Status requests in flight at once.'
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=DEFAULT_RATE,
+            help='Status requests per second (0 for no limit).'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            summary = reconcile(
+                older_than=timedelta(minutes=max(0, options['older_than'])),
+                batch_size=max(1, options['batch_size']),
+                limit=options['limit'],
+                concurrency=max(1, options['concurrency']),
+                rate=max(0.0, options['rate']),
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(
+            "Checked {checked}: {settled} settled, {pending} still pending, "
+            "{not_found} unknown to BillDesk, {errors} error(s).".format(**summary)
+        ))
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-19 19:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_gateway', '0009_seed_additional_new_license_charges'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='paymentbilldesktransaction',
+            index=models.Index(fields=['transaction_date', 'utr'], name='sems_paymen_transac_fd42e3_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.7 on 2026-10-19 19:41
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_gateway', '0010_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentWebhookInbox',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('orderid', models.CharField(blank=True, default='', max_length=100)),
+                ('transaction_id', models.CharField(blank=True, default='', max_length=100)),
+                ('auth_status', models.CharField(blank=True, default='', max_length=20)),
+                ('payload', models.TextField()),
+                ('source', models.CharField(choices=[('webhook', 'Webhook'), ('response', 'Browser response')], max_length=20)),
+                ('state', models.CharField(choices=[('pending', 'Pending'), ('processed', 'Processed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'sems_payment_webhook_inbox',
+                'indexes': [models.Index(condition=models.Q(('state', 'pending')), fields=['next_attempt_at', 'id'], name='payment_webhook_inbox_due_idx')],
+                'constraints': [models.UniqueConstraint(fields=('orderid', 'transaction_id', 'auth_status'), name='payment_webhook_inbox_event_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.7 on 2026-10-19 19:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_gateway', '0011_payment_webhook_inbox'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='paymentwebhookinbox',
+            name='source',
+            field=models.CharField(choices=[('webhook', 'Webhook'), ('response', 'Browser response'), ('reconcile', 'Status reconciliation')], max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='paymentbilldesktransaction',
+            index=models.Index(fields=['payment_status', 'transaction_date', 'utr'], name='billdesk_tx_status_date_idx'),
+        ),
+    ]
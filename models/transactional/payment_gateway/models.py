@@ -82,6 +82,10 @@ class PaymentBilldeskTransaction(models.Model):
 
     class Meta:
         db_table = "sems_payment_transaction_billdesk"
+        indexes = [
+            models.Index(fields=["transaction_date", "utr"]),
+            models.Index(fields=["payment_status", "transaction_date", "utr"], name="billdesk_tx_status_date_idx"),
+        ]
 
     def __str__(self):
         return f"{self.utr} ({self.payment_status})"
@@ -169,3 +173,60 @@ class PaymentModuleHoa(models.Model):
     class Meta:
         db_table = "sems_module_hoa"
 
+
+class PaymentWebhookInbox(models.Model):
+    """
+    A BillDesk transaction response (webhook or browser return) as received.
+
+    Rows are keyed by the event they describe, so BillDesk retries and the
+    webhook/browser pair for the same payment collapse into one row, which the
+    `process_payment_webhooks` worker processes once.
+    """
+    STATE_PENDING = "pending"
+    STATE_PROCESSED = "processed"
+    STATE_FAILED = "failed"
+    STATE_CHOICES = [
+        (STATE_PENDING, "Pending"),
+        (STATE_PROCESSED, "Processed"),
+        (STATE_FAILED, "Failed"),
+    ]
+
+    SOURCE_WEBHOOK = "webhook"
+    SOURCE_RESPONSE = "response"
+    SOURCE_RECONCILE = "reconcile"
+    SOURCE_CHOICES = [
+        (SOURCE_WEBHOOK, "Webhook"),
+        (SOURCE_RESPONSE, "Browser response"),
+        (SOURCE_RECONCILE, "Status reconciliation"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    orderid = models.CharField(max_length=100, blank=True, default="")
+    transaction_id = models.CharField(max_length=100, blank=True, default="")
+    auth_status = models.CharField(max_length=20, blank=True, default="")
+    payload = models.TextField()
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES)
+    state = models.CharField(max_length=20, choices=STATE_CHOICES, default=STATE_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    received_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "sems_payment_webhook_inbox"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["orderid", "transaction_id", "auth_status"], name="payment_webhook_inbox_event_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at", "id"],
+                name="payment_webhook_inbox_due_idx",
+                condition=models.Q(state="pending"),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.orderid or '-'} {self.auth_status or '-'} ({self.state})"
@@ -0,0 +1,212 @@
+"""
+Reconciliation of BillDesk payments that never received a callback.
+
+`reconcile` walks pending `PaymentBilldeskTransaction` rows older than a cutoff
+in keyset batches over (payment_status, transaction_date, utr), asks the gateway
+for each order's status and applies terminal answers through the webhook inbox
+(`inbox.enqueue` + `inbox.process_now`), i.e. exactly the path a late webhook
+would take. Gateway calls run on a bounded thread pool behind a `RateLimiter`;
+database work stays on the calling thread.
+
+The gateway is reached through a `GatewayClient`, chosen by the
+BILLDESK_RECONCILE_CLIENT setting. `FakeGatewayClient` answers from a dict and
+is what the tests use.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from . import inbox
+from .billdesk_utils import generate_billdesk_jws
+from .models import PaymentBilldeskTransaction, PaymentWebhookInbox
+
+try:
+    import requests  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    requests = None
+
+logger = logging.getLogger(__name__)
+
+AUTH_SUCCESS = "0300"
+AUTH_FAILURE = "0399"
+# Anything else ("0002" awaiting bank confirmation, ...) is still in flight;
+# `_process_billdesk_transaction` would record it as a failure, so it is left alone.
+TERMINAL_AUTH_STATUSES = (AUTH_SUCCESS, AUTH_FAILURE)
+
+DEFAULT_OLDER_THAN = timedelta(minutes=30)
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 5.0
+
+
+class GatewayClient:
+    """Looks up one order at the gateway. `status(orderid)` returns the signed response JWS, or None if unknown."""
+
+    def __init__(self, gateway):
+        self.gateway = gateway
+
+    def status(self, orderid):
+        raise NotImplementedError
+
+
+class BilldeskClient(GatewayClient):
+    """BillDesk transaction status API (BILLDESK_TRANSACTION_URL)."""
+
+    timeout = 15
+
+    def status(self, orderid):
+        if requests is None:
+            raise RuntimeError("The requests package is required to query BillDesk.")
+        merchant_id = str(self.gateway.merchantid or "").strip()
+        token = generate_billdesk_jws(
+            merchant_id.lower(),
+            str(self.gateway.encryption_key or "").strip(),
+            {"mercid": merchant_id, "orderid": orderid},
+        )
+        response = requests.post(
+            settings.BILLDESK_TRANSACTION_URL,
+            data=token,
+            headers={
+                "Content-Type": "application/jose",
+                "Accept": "application/jose",
+                "BD-Traceid": f"{orderid}R{int(time.time())}"[:35],
+                "BD-Timestamp": str(int(time.time() * 1000)),
+            },
+            timeout=self.timeout,
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.text.strip() or None
+
+
+class FakeGatewayClient(GatewayClient):
+    """
+    Answers from `statuses` ({orderid: auth_status}) with responses signed by the
+    gateway's key, as BillDesk would. Unlisted orders are unknown.
+    """
+
+    def __init__(self, gateway, statuses=None):
+        super().__init__(gateway)
+        self.statuses = dict(statuses or {})
+        self.calls = []
+
+    def status(self, orderid):
+        self.calls.append(orderid)
+        auth_status = self.statuses.get(orderid)
+        if auth_status is None:
+            return None
+        merchant_id = str(self.gateway.merchantid or "").strip()
+        return generate_billdesk_jws(
+            merchant_id.lower(),
+            str(self.gateway.encryption_key or "").strip(),
+            {"mercid": merchant_id, "orderid": orderid, "transactionid": f"FAKE{orderid}", "auth_status": auth_status},
+        )
+
+
+def get_client(gateway):
+    return import_string(settings.BILLDESK_RECONCILE_CLIENT)(gateway)
+
+
+class RateLimiter:
+    """Spaces calls at most `rate` per second across threads (no limit if `rate` is falsy)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def pending_batches(cutoff, batch_size, limit=None):
+    """Pending transactions dated before `cutoff`, oldest first, in lists of `batch_size`."""
+    qs = (
+        PaymentBilldeskTransaction.objects.filter(payment_status="P", transaction_date__lt=cutoff)
+        .only("utr", "transaction_date")
+        .order_by("transaction_date", "utr")
+    )
+    seen = 0
+    last = None
+    while limit is None or seen < limit:
+        page = qs
+        if last is not None:
+            page = page.filter(
+                Q(transaction_date__gt=last.transaction_date)
+                | Q(transaction_date=last.transaction_date, utr__gt=last.utr)
+            )
+        size = batch_size if limit is None else min(batch_size, limit - seen)
+        batch = list(page[:size])
+        if not batch:
+            return
+        seen += len(batch)
+        last = batch[-1]
+        yield batch
+
+
+def reconcile(older_than=DEFAULT_OLDER_THAN, batch_size=DEFAULT_BATCH_SIZE, limit=None,
+              concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, client=None):
+    """
+    Query the gateway for stale pending payments and settle the ones it has
+    decided. Returns counts: checked, settled, pending (still in flight),
+    not_found, errors.
+    """
+    summary = {"checked": 0, "settled": 0, "pending": 0, "not_found": 0, "errors": 0}
+    if client is None:
+        gateway = inbox.active_gateway()
+        if gateway is None:
+            raise ValueError("No active Billdesk configuration found in Payment_Gateway_Parameters.")
+        client = get_client(gateway)
+    limiter = RateLimiter(rate)
+
+    def lookup(orderid):
+        limiter.wait()
+        try:
+            return client.status(orderid), None
+        except Exception as exc:
+            return None, exc
+
+    cutoff = timezone.now() - older_than
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for batch in pending_batches(cutoff, batch_size, limit):
+            orderids = [tx.utr for tx in batch]
+            for orderid, (payload, error) in zip(orderids, pool.map(lookup, orderids)):
+                summary["checked"] += 1
+                if error is not None:
+                    logger.warning("BillDesk status lookup failed for %s: %s", orderid, error)
+                    summary["errors"] += 1
+                    continue
+                if payload is None:
+                    summary["not_found"] += 1
+                    continue
+                orderid_seen, _, auth_status = inbox.event_key(payload)
+                if not orderid_seen:
+                    logger.warning("BillDesk status response for %s failed verification", orderid)
+                    summary["errors"] += 1
+                    continue
+                if auth_status not in TERMINAL_AUTH_STATUSES:
+                    summary["pending"] += 1
+                    continue
+                entry, _ = inbox.enqueue(payload, PaymentWebhookInbox.SOURCE_RECONCILE)
+                inbox.process_now(entry)
+                entry.refresh_from_db(fields=["state"])
+                if entry.state == PaymentWebhookInbox.STATE_PROCESSED:
+                    summary["settled"] += 1
+                else:
+                    summary["errors"] += 1
+    return summary
@@ -0,0 +1,192 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from auth.roles.models import Role
+from auth.user.models import CustomUser
+from models.masters.core.models import District, State, Subdivision
+from utils.testing import QueryBudgetMixin
+
+from . import inbox, reconciliation
+from .billdesk_utils import generate_billdesk_jws
+from .models import MasterPaymentModule, PaymentBilldeskTransaction, PaymentGatewayParameters, PaymentWebhookInbox
+
+
+class BilldeskTransactionListTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        self.district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        self.subdivision = Subdivision.objects.create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=self.district
+        )
+        admin = self._user('admin@example.com', '9999999931', Role.objects.create(id=1, name='site_admin'))
+        MasterPaymentModule.objects.create(module_code='003', module_desc='Label Registration Fee')
+        self.client.force_authenticate(user=admin)
+
+    def _user(self, email, phone, role=None):
+        return CustomUser.objects.create_user(
+            password='password123', email=email, role=role, district=self.district, subdivision=self.subdivision,
+            phone_number=phone, first_name="Payer", last_name="User", address="Gangtok",
+        )
+
+    def _transaction(self, index):
+        payer = self._user(f'payer{index}@example.com', f'98000000{index:02d}')
+        PaymentBilldeskTransaction.objects.create(
+            utr=f'UTR{index:04d}',
+            transaction_id_no_hoa=f'TXN{index:04d}',
+            payer_id=payer.username,
+            payment_module_code='003',
+            transaction_amount=Decimal('100.00'),
+            payment_status='S',
+        )
+
+    def test_list_query_budget(self):
+        self.assert_query_budget('payment_gateway:billdesk-transactions-list', 8, self._transaction)
+
+    def test_names_and_purpose_are_resolved(self):
+        self._transaction(1)
+        resp = self.client.get('/transactional/payment-gateway/billdesk/transactions/')
+        self.assertEqual(resp.status_code, 200)
+        row = resp.data['results'][0]
+        self.assertEqual(row['applicant_name'], 'Payer User')
+        self.assertEqual(row['purpose'], 'Label Registration Fee')
+
+
+def _jws(**claims):
+    return generate_billdesk_jws('merchant', 'secret', claims)
+
+
+def _billdesk_gateway():
+    return PaymentGatewayParameters.objects.create(
+        sl_no=1, payment_gateway_name='Billdesk', merchantid='MERCHANT', securityid='merchant',
+        encryption_key='secret', return_url='https://example.com/return/',
+    )
+
+
+@mock.patch('models.transactional.payment_gateway.views._process_billdesk_transaction', return_value={'success': True})
+class PaymentWebhookInboxTests(TestCase):
+    success = _jws(orderid='UTR0001', transactionid='BD1', auth_status='0300')
+
+    def setUp(self):
+        _billdesk_gateway()
+
+    def test_webhook_acknowledges_without_processing(self, process):
+        url = reverse('payment_gateway:billdesk-webhook')
+        for _ in range(2):
+            resp = self.client.post(url, data=self.success, content_type='text/plain')
+            self.assertEqual(resp.status_code, 200)
+        process.assert_not_called()
+
+        entry = PaymentWebhookInbox.objects.get()
+        self.assertEqual((entry.orderid, entry.transaction_id, entry.auth_status), ('UTR0001', 'BD1', '0300'))
+        self.assertEqual(entry.state, PaymentWebhookInbox.STATE_PENDING)
+
+    def test_each_event_is_processed_once(self, process):
+        inbox.enqueue(self.success, PaymentWebhookInbox.SOURCE_WEBHOOK)
+        inbox.enqueue(_jws(orderid='UTR0001', transactionid='BD1', auth_status='0399'), PaymentWebhookInbox.SOURCE_WEBHOOK)
+
+        self.assertEqual(inbox.process_due(), {PaymentWebhookInbox.STATE_PROCESSED: 2})
+        self.assertEqual(inbox.process_due(), {})
+        self.assertEqual(process.call_count, 2)
+
+        # The browser return for an event the webhook already applied does nothing.
+        resp = self.client.post(reverse('payment_gateway:billdesk-response'), {'transaction_response': self.success})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(process.call_count, 2)
+        self.assertEqual(PaymentWebhookInbox.objects.count(), 2)
+
+    def test_unsigned_payload_cannot_claim_an_event(self, process):
+        header, body, _ = self.success.split('.')
+        forged = f"{header}.{body}.forged"
+        resp = self.client.post(reverse('payment_gateway:billdesk-response'), {'transaction_response': forged})
+        self.assertEqual(resp.status_code, 200)
+        process.assert_not_called()
+        rejected = PaymentWebhookInbox.objects.get()
+        self.assertEqual(rejected.state, PaymentWebhookInbox.STATE_FAILED)
+        self.assertEqual(rejected.orderid, '')
+
+        # The genuine event still gets its own row and is applied.
+        self.client.post(reverse('payment_gateway:billdesk-webhook'), data=self.success, content_type='text/plain')
+        self.assertEqual(inbox.process_due(), {PaymentWebhookInbox.STATE_PROCESSED: 1})
+        process.assert_called_once_with(self.success)
+
+    def test_browser_return_applies_its_event_despite_backoff(self, process):
+        entry, _ = inbox.enqueue(self.success, PaymentWebhookInbox.SOURCE_WEBHOOK)
+        PaymentWebhookInbox.objects.filter(pk=entry.pk).update(attempts=1, next_attempt_at=timezone.now() + timedelta(minutes=5))
+
+        self.client.post(reverse('payment_gateway:billdesk-response'), {'transaction_response': self.success})
+        entry.refresh_from_db()
+        self.assertEqual(entry.state, PaymentWebhookInbox.STATE_PROCESSED)
+        process.assert_called_once()
+
+    def test_failures_are_retried_then_given_up(self, process):
+        process.side_effect = RuntimeError("database is slow")
+        entry, _ = inbox.enqueue(self.success, PaymentWebhookInbox.SOURCE_WEBHOOK)
+
+        self.assertEqual(inbox.process_due(max_attempts=2), {PaymentWebhookInbox.STATE_PENDING: 1})
+        entry.refresh_from_db()
+        self.assertEqual(entry.attempts, 1)
+        self.assertIn("database is slow", entry.last_error)
+        self.assertGreater(entry.next_attempt_at, timezone.now())
+        self.assertEqual(inbox.process_due(max_attempts=2), {})
+
+        PaymentWebhookInbox.objects.filter(pk=entry.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(inbox.process_due(max_attempts=2), {PaymentWebhookInbox.STATE_FAILED: 1})
+        entry.refresh_from_db()
+        self.assertEqual(entry.attempts, 2)
+
+
+class PendingPaymentReconciliationTests(TestCase):
+    def setUp(self):
+        self.gateway = _billdesk_gateway()
+        stale = timezone.now() - timedelta(hours=2)
+        for utr in ('UTR0001', 'UTR0002', 'UTR0003', 'UTR0004'):
+            self._transaction(utr, stale)
+        self._transaction('UTR0005', timezone.now())
+
+    def _transaction(self, utr, when):
+        PaymentBilldeskTransaction.objects.create(
+            utr=utr, transaction_date=when, transaction_id_no_hoa=utr, payer_id='payer',
+            payment_module_code='003', transaction_amount=Decimal('100.00'),
+        )
+
+    def _statuses(self):
+        return dict(PaymentBilldeskTransaction.objects.values_list('utr', 'payment_status'))
+
+    def test_settles_decided_payments_only(self):
+        client = reconciliation.FakeGatewayClient(
+            self.gateway, {'UTR0001': '0300', 'UTR0002': '0399', 'UTR0003': '0002', 'UTR0005': '0300'}
+        )
+        summary = reconciliation.reconcile(batch_size=2, rate=0, client=client)
+
+        self.assertEqual(summary, {'checked': 4, 'settled': 2, 'pending': 1, 'not_found': 1, 'errors': 0})
+        self.assertEqual(sorted(client.calls), ['UTR0001', 'UTR0002', 'UTR0003', 'UTR0004'])
+        self.assertEqual(
+            self._statuses(), {'UTR0001': 'S', 'UTR0002': 'F', 'UTR0003': 'P', 'UTR0004': 'P', 'UTR0005': 'P'}
+        )
+        self.assertEqual(
+            PaymentWebhookInbox.objects.filter(
+                source=PaymentWebhookInbox.SOURCE_RECONCILE, state=PaymentWebhookInbox.STATE_PROCESSED
+            ).count(),
+            2,
+        )
+
+        # Settled payments are no longer pending, so a second run only rechecks the rest.
+        client.calls.clear()
+        summary = reconciliation.reconcile(rate=0, client=client)
+        self.assertEqual(summary['checked'], 2)
+        self.assertEqual(sorted(client.calls), ['UTR0003', 'UTR0004'])
+
+    @override_settings(BILLDESK_RECONCILE_CLIENT='models.transactional.payment_gateway.reconciliation.FakeGatewayClient')
+    def test_command_reports_summary(self):
+        out = StringIO()
+        call_command('reconcile_billdesk_payments', '--limit=3', '--rate=0', stdout=out)
+        self.assertIn('Checked 3: 0 settled, 0 still pending, 3 unknown to BillDesk, 0 error(s).', out.getvalue())
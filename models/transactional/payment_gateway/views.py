@@ -26,10 +26,12 @@ from rest_framework.response import Response
 from models.transactional.new_license_application.models import NewLicenseApplication
 from auth.user.models import CustomUser
 from auth.workflow.services import WorkflowService
-from .models import PaymentBilldeskTransaction, PaymentGatewayParameters, PaymentSendHOA, MasterPaymentModule
+from .models import PaymentBilldeskTransaction, PaymentGatewayParameters, PaymentSendHOA, MasterPaymentModule, PaymentWebhookInbox
+from . import inbox
 from models.transactional.wallet.wallet_service import credit_wallet_balance, record_wallet_transaction
 from models.transactional.wallet.models import _resolve_wallet_row_licensee_id
 from models.transactional.wallet.models import WalletBalance
+from utils.pagination import KeysetPagination
 
 logger = logging.getLogger(__name__)
 
@@ -1570,10 +1572,9 @@ def billdesk_webhook(request):
         # Acknowledge with 200 so BillDesk stops retrying a malformed request
         return HttpResponse("Missing payload", status=200)
 
-    # Process the transaction idempotently
-    _process_billdesk_transaction(transaction_response)
-
+    # Store the event and acknowledge; the process_payment_webhooks worker applies it.
     # BillDesk mandates returning a 2xx status code immediately to acknowledge the event
+    inbox.enqueue(transaction_response, PaymentWebhookInbox.SOURCE_WEBHOOK)
     return HttpResponse("Webhook Received", status=200)
 
 @csrf_exempt
@@ -1586,8 +1587,10 @@ def billdesk_response(request):
     if not transaction_response:
         return HttpResponseBadRequest("Missing transaction_response parameter")
 
-    # Call the shared processor
-    _process_billdesk_transaction(transaction_response)
+    # Same inbox as the webhook. The user is waiting on this page, so apply the event
+    # now unless the webhook already has (or a worker is applying it).
+    entry, _ = inbox.enqueue(transaction_response, PaymentWebhookInbox.SOURCE_RESPONSE)
+    inbox.process_now(entry)
 
     # 2. Fetch the frontend success URL from the database
     gateway = PaymentGatewayParameters.objects.filter(
@@ -1818,6 +1821,59 @@ def sbi_epay_mock_process(request):
 #     return HttpResponse(page, content_type="text/html")
 
 
+def _user_display_name(user) -> str:
+    if not user:
+        return "N/A"
+    name = f"{getattr(user, 'first_name', '') or ''} {getattr(user, 'last_name', '') or ''}".strip()
+    return name or getattr(user, "username", None) or "N/A"
+
+
+def _applicant_names_by_reference(references) -> dict:
+    """
+    Display names keyed by upper-cased payer reference. A reference is looked up,
+    in order, as a new license application, renewal application, salesman/barman
+    application, license and finally a username or user id; one query per source.
+    """
+    from django.db.models import Q
+    from django.db.models.functions import Upper
+    from models.masters.license.models import License
+    from models.transactional.license_renewal_application.models import LicenseApplication as RenewalApplication
+    from models.transactional.salesman_barman.models import SalesmanBarmanModel
+
+    pending = {str(ref or "").strip().upper() for ref in references if str(ref or "").strip()}
+    names = {}
+
+    def staff_name(staff):
+        return f"{staff.firstName or ''} {staff.lastName or ''}".strip() or _user_display_name(staff.applicant)
+
+    sources = (
+        (NewLicenseApplication.objects.select_related("applicant"), "application_id", lambda app: _user_display_name(app.applicant)),
+        (RenewalApplication.objects.select_related("applicant"), "application_id", lambda app: _user_display_name(app.applicant)),
+        (SalesmanBarmanModel.objects.select_related("applicant"), "application_id", staff_name),
+        (License.objects.select_related("applicant"), "license_id", lambda lic: _user_display_name(lic.applicant)),
+    )
+    try:
+        for queryset, field, display in sources:
+            if not pending:
+                break
+            for row in queryset.annotate(reference_key=Upper(field)).filter(reference_key__in=pending):
+                names.setdefault(row.reference_key, display(row))
+            pending -= names.keys()
+
+        if pending:
+            user_ids = [int(ref) for ref in pending if ref.isdigit()]
+            users = CustomUser.objects.annotate(reference_key=Upper("username")).filter(
+                Q(reference_key__in=pending) | Q(id__in=user_ids)
+            )
+            for user in users:
+                for key in (user.reference_key, str(user.id)):
+                    if key in pending:
+                        names.setdefault(key, _user_display_name(user))
+    except Exception:
+        logger.warning("Could not resolve applicant names for BillDesk transactions", exc_info=True)
+    return names
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def list_billdesk_transactions(request):
@@ -1868,64 +1924,36 @@ def list_billdesk_transactions(request):
 
     queryset = queryset.order_by('-transaction_date')
 
-    # Pagination parameters
-    try:
-        page = int(request.query_params.get("page", 1))
-        page_size = int(request.query_params.get("page_size", 10))
-    except (ValueError, TypeError):
-        page = 1
-        page_size = 10
-
-    page = max(1, page)
-    page_size = max(1, min(page_size, 100))
-
-    total_count = queryset.count()
-    offset = (page - 1) * page_size
-    items = queryset[offset: offset + page_size]
-
-    # Resolve applicant names helper
-    def get_user_display_name(u):
-        if not u:
-            return "N/A"
-        name = f"{getattr(u, 'first_name', '') or ''} {getattr(u, 'last_name', '') or ''}".strip()
-        return name or getattr(u, "username", None) or "N/A"
-
-    def resolve_name(reference):
-        ref = str(reference or "").strip()
-        if not ref:
-            return "N/A"
+    paginator = KeysetPagination()
+    items = paginator.paginate_queryset(queryset, request)
+    paginated = items is not None
+    if not paginated:
+        # Legacy clients (X-Pagination: off) keep page-number pagination.
         try:
-            # Try NewLicenseApplication
-            app = NewLicenseApplication.objects.select_related("applicant").filter(application_id__iexact=ref).first()
-            if app:
-                return get_user_display_name(app.applicant)
-
-            # Try RenewalApplication
-            from models.transactional.license_renewal_application.models import LicenseApplication as RenewalApplication
-            renewal = RenewalApplication.objects.select_related("applicant").filter(application_id__iexact=ref).first()
-            if renewal:
-                return get_user_display_name(renewal.applicant)
-
-            # Try SalesmanBarmanModel
-            from models.transactional.salesman_barman.models import SalesmanBarmanModel
-            staff = SalesmanBarmanModel.objects.filter(application_id__iexact=ref).first()
-            if staff:
-                return f"{staff.firstName or ''} {staff.lastName or ''}".strip() or get_user_display_name(staff.applicant)
-
-            # Try License
-            from models.masters.license.models import License
-            license_obj = License.objects.select_related("applicant").filter(license_id__iexact=ref).first()
-            if license_obj:
-                return get_user_display_name(license_obj.applicant)
-
-            # Try direct user match
-            user_filter = Q(username__iexact=ref)
-            if ref.isdigit():
-                user_filter |= Q(id=int(ref))
-            user = CustomUser.objects.filter(user_filter).first()
-            return get_user_display_name(user) if user else "N/A"
-        except Exception:
-            return "N/A"
+            page = int(request.query_params.get("page", 1))
+            page_size = int(request.query_params.get("page_size", 10))
+        except (ValueError, TypeError):
+            page = 1
+            page_size = 10
+
+        page = max(1, page)
+        page_size = max(1, min(page_size, 100))
+
+        total_count = queryset.count()
+        offset = (page - 1) * page_size
+        items = queryset[offset: offset + page_size]
+
+    items = list(items)
+    applicant_names = _applicant_names_by_reference(
+        [tx.payer_id for tx in items] + [tx.user_id for tx in items if tx.user_id]
+    )
+    module_codes = {tx.payment_module_code for tx in items} - {"002", "999"}
+    try:
+        module_descs = dict(
+            MasterPaymentModule.objects.filter(module_code__in=module_codes).values_list("module_code", "module_desc")
+        )
+    except Exception:
+        module_descs = {}
 
     serialized_data = []
     for tx in items:
@@ -1935,18 +1963,13 @@ def list_billdesk_transactions(request):
             purpose = "Renewal Fee"
         elif tx.payment_module_code == "999":
             purpose = "Wallet Recharge"
-        else:
-            try:
-                mod = MasterPaymentModule.objects.filter(module_code=tx.payment_module_code).first()
-                if mod and mod.module_desc:
-                    purpose = mod.module_desc
-            except Exception:
-                pass
+        elif module_descs.get(tx.payment_module_code):
+            purpose = module_descs[tx.payment_module_code]
 
         # Resolve applicant name
-        applicant_name = resolve_name(tx.payer_id)
+        applicant_name = applicant_names.get(str(tx.payer_id or "").strip().upper(), "N/A")
         if applicant_name == "N/A" and tx.user_id:
-            applicant_name = resolve_name(tx.user_id)
+            applicant_name = applicant_names.get(str(tx.user_id).strip().upper(), "N/A")
 
         serialized_data.append({
             "utr": tx.utr,
@@ -1965,6 +1988,9 @@ def list_billdesk_transactions(request):
             "response_authstatus": tx.response_authstatus,
         })
 
+    if paginated:
+        return paginator.get_paginated_response(serialized_data)
+
     return Response({
         'count': total_count,
         'page': page,
@@ -0,0 +1,73 @@
+"""
+Dashboard tabs for salesman/barman registrations (see models.transactional.dashboards).
+
+The licensee and admin screens have no separate "Applied" tile, so initial-stage
+applications are also counted as pending there. Officer "approved", "rejected"
+and "objection" tabs only include applications the officer's role has acted on.
+"""
+from auth.workflow.constants import WORKFLOW_IDS
+from models.transactional.dashboards import LEGACY, WorkflowDashboard, in_stages, nothing
+
+from .models import SalesmanBarmanModel
+from .serializers import SalesmanBarmanSerializer
+
+
+def _in_progress(stages):
+    # Any non-final processing stage is in progress.
+    return stages['all'] - stages['approved'] - stages['rejected']
+
+
+def licensee_buckets(ctx):
+    stages = ctx.stages
+    pending_stages = _in_progress(stages) - stages['initial'] - stages['objection']
+    buckets = {
+        'applied': in_stages(stages['initial']),
+        'objection': in_stages(stages['objection']),
+        'approved': in_stages(stages['approved']),
+        'rejected': in_stages(stages['rejected']),
+    }
+    if ctx.purpose == LEGACY:
+        buckets['pending'] = in_stages(pending_stages)
+    else:
+        buckets['pending'] = in_stages((pending_stages - stages['payment']) | stages['initial'])
+        buckets['awaiting_payment'] = in_stages(stages['payment'])
+    return ctx.mine, buckets
+
+
+def admin_buckets(ctx):
+    stages = ctx.stages
+    pending_stages = _in_progress(stages)
+    if ctx.purpose == LEGACY:
+        pending_stages -= stages['initial']
+    return ctx.objects, {
+        'applied': in_stages(stages['initial']),
+        'pending': in_stages(pending_stages),
+        'approved': in_stages(stages['approved']),
+        'rejected': in_stages(stages['rejected']),
+    }
+
+
+def officer_buckets(ctx):
+    if not ctx.role_stages:
+        return ctx.objects, nothing('pending', 'approved', 'rejected', 'objection')
+
+    stages = ctx.stages
+    acted = ctx.acted_by_role()
+    return ctx.objects, {
+        'pending': in_stages(ctx.role_stages),
+        'approved': ~in_stages(ctx.role_stages | stages['rejected'] | stages['objection']) & acted,
+        'rejected': in_stages(stages['rejected']) & acted,
+        'objection': in_stages(stages['objection']) & acted,
+    }
+
+
+DASHBOARD = WorkflowDashboard(
+    SalesmanBarmanModel,
+    group_spec={
+        'licensee': licensee_buckets,
+        'site_admin': admin_buckets,
+        '*': officer_buckets,
+    },
+    workflow=WORKFLOW_IDS['SALESMAN_BARMAN'],
+    serializer=SalesmanBarmanSerializer,
+)
@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from auth.workflow.models import Workflow, WorkflowStage
 from models.masters.core.models import District, LicenseCategory, State, Subdivision
@@ -37,6 +37,7 @@ class SalesmanBarmanSerializerPartialUpdateTests(TestCase):
         self.assertTrue(serializer.is_valid(), serializer.errors)
 
 
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
 class SalesmanBarmanDashboardCountsTests(TestCase):
     def setUp(self):
         self.state = State.objects.create(state="Sikkim", state_code=11)
@@ -1,6 +1,6 @@
 from django.db import transaction
 from django.shortcuts import get_object_or_404
-from django.http import FileResponse, HttpResponse
+from django.http import HttpResponse
 from rest_framework.decorators import api_view, parser_classes, permission_classes
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.response import Response
@@ -9,23 +9,23 @@ from django.utils import timezone
 from auth.roles.permissions import HasAppPermission
 from auth.workflow.permissions import HasStagePermission
 from auth.workflow.models import Workflow, WorkflowStage, WorkflowTransition
-from auth.workflow.models import Transaction as WorkflowTransaction
 from auth.workflow.constants import WORKFLOW_IDS
 from auth.workflow.services import WorkflowService
 from models.masters.license.models import License, LicenseValidationToken
-from models.masters.core.models import SupplyChainTimerConfig
+from models.masters.core.timers import get_days
+from .dashboard import DASHBOARD
 from .models import SalesmanBarmanModel
 from .serializers import SalesmanBarmanSerializer
-import re
 import secrets
 import base64
 import hashlib
-import mimetypes
 from io import BytesIO
 from urllib.parse import quote
 from django.core import signing
 from PIL import Image
 from utils.qrcodegen import QrCode
+from models.transactional.media_derivatives.services import pick_available, thumbnail_data_url
+from utils.protected_media import serve_protected_file
 from models.transactional.wallet.wallet_initializer import _resolve_hoa_code
 from rest_framework.permissions import IsAuthenticated
 from django.core.exceptions import PermissionDenied
@@ -47,62 +47,6 @@ def _normalize_role(role_name):
     return aliases.get(normalized, normalized)
 
 
-def _extract_level_index(stage_name):
-    if not stage_name:
-        return None
-    match = re.match(r'^level_(\d+)$', str(stage_name).strip().lower())
-    return int(match.group(1)) if match else None
-
-
-def _get_stage_sets(workflow_id: int):
-    stages = WorkflowStage.objects.filter(workflow_id=workflow_id)
-    stage_names = set(stages.values_list('name', flat=True))
-    level_stage_names = sorted(
-        [name for name in stage_names if _extract_level_index(name) is not None],
-        key=lambda name: _extract_level_index(name) or 0
-    )
-    level_indexes = {name: _extract_level_index(name) for name in level_stage_names}
-    objection_stage_names = {name for name in stage_names if 'objection' in str(name).lower()}
-    rejected_stage_names = {name for name in stage_names if 'rejected' in str(name).lower()}
-    approved_stage_names = {
-        stage.name for stage in stages
-        if stage.is_final and 'rejected' not in stage.name.lower()
-    }
-    approved_stage_names.update({name for name in stage_names if 'approved' in str(name).lower()})
-    payment_stage_names = {name for name in stage_names if 'payment' in str(name).lower()}
-    initial_stage_names = set(stages.filter(is_initial=True).values_list('name', flat=True))
-
-    return {
-        'all': stage_names,
-        'level': set(level_stage_names),
-        'level_ordered': level_stage_names,
-        'level_indexes': level_indexes,
-        'objection': objection_stage_names,
-        'rejected': rejected_stage_names,
-        'approved': approved_stage_names,
-        'payment': payment_stage_names,
-        'initial': initial_stage_names,
-    }
-
-
-def _get_in_progress_stage_names(stage_sets: dict):
-    # Any non-final processing stage should be treated as in-progress/pending.
-    return set(stage_sets['all']) - set(stage_sets['approved']) - set(stage_sets['rejected'])
-
-
-def _get_role_stage_names(user, workflow_id: int):
-    role = getattr(user, 'role', None)
-    if not role:
-        return set()
-    return set(
-        WorkflowStage.objects.filter(
-            workflow_id=workflow_id,
-            stagepermission__role=role,
-            stagepermission__can_process=True
-        ).values_list('name', flat=True).distinct()
-    )
-
-
 def _build_role_transition_buckets(user, workflow_id: int, stage_sets: dict):
     role = getattr(user, 'role', None)
     if not role:
@@ -355,18 +299,6 @@ def _get_sb_validation_payload(request, application: SalesmanBarmanModel, licens
     return signed_code, validation_url, verification_id
 
 
-def _passport_data_url(passport_file) -> str:
-    try:
-        if not passport_file or not getattr(passport_file, "name", None) or not passport_file.storage.exists(passport_file.name):
-            return ""
-        with passport_file.open("rb") as f:
-            raw = f.read()
-        mime = mimetypes.guess_type(passport_file.name)[0] or "application/octet-stream"
-        return f"data:{mime};base64,{base64.b64encode(raw).decode('ascii')}"
-    except Exception:
-        return ""
-
-
 def _get_salesman_barman_registration_fee() -> float | None:
     from models.masters.core.models import MasterFixedFee
     fee_obj = MasterFixedFee.objects.filter(fee_code="012").only("amount").first()
@@ -508,50 +440,9 @@ def initiate_renewal(request, license_id):
     if old_app.applicant != request.user:
         return Response({"detail": "You can only renew your own license."}, status=status.HTTP_403_FORBIDDEN)
 
-    def get_timer_days(code: str, default_days: int) -> int:
-        cfg = (
-            SupplyChainTimerConfig.objects.filter(code=code, is_active=True)
-            .order_by("-updated_at", "-id")
-            .first()
-        )
-        if not cfg:
-            return int(default_days)
-
-        unit = str(getattr(cfg, "delay_unit", "") or "").lower().strip()
-        value = getattr(cfg, "delay_value", None)
-        try:
-            value_int = max(0, int(value or 0))
-        except (TypeError, ValueError):
-            value_int = 0
-
-        # Prefer configured unit/value (so changing delay_value/unit takes effect immediately),
-        # fallback to validity_period_days if unit/value are missing or not meaningful.
-        if value_int > 0 and unit:
-            if unit.endswith("s"):
-                unit = unit[:-1]
-            if unit == "day":
-                return value_int
-            if unit in ("week", "wk"):
-                return value_int * 7
-            if unit in ("month", "mon", "mo"):
-                return value_int * 30
-            if unit in ("year", "yr"):
-                return value_int * 365
-            if unit in ("hour", "hr"):
-                return max(0, value_int // 24)
-
-        days = getattr(cfg, "validity_period_days", None)
-        if days is not None:
-            try:
-                return max(0, int(days))
-            except (TypeError, ValueError):
-                return int(default_days)
-
-        return int(default_days)
-
     from datetime import timedelta
     now_dt = timezone.now()
-    reminder_days = get_timer_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
+    reminder_days = get_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
 
     # SOP: Require main license renewal first
     from django.contrib.contenttypes.models import ContentType
@@ -564,7 +455,7 @@ def initiate_renewal(request, license_id):
     )
 
     for main_lic in main_licenses:
-        main_reminder_days = get_timer_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
+        main_reminder_days = get_days("LICENSE_RENEWAL_REMINDER_TIMER", 90)
         if main_lic.valid_up_to and main_lic.valid_up_to <= now_dt + timedelta(days=main_reminder_days):
             main_renewal_exists = LicenseApplication.objects.filter(
                 old_license_id=main_lic.license_id,
@@ -735,15 +626,17 @@ def final_license_detail(request, application_id):
 
     license_obj = _resolve_sb_license_for_application(application)
     validation_code, validation_url, _verification_id = _get_sb_validation_payload(request, application, license_obj)
-    passport_file = getattr(application, "passPhoto", None)
-    passport_exists = False
+    passport_file, passport_derivative = pick_available([getattr(application, "passPhoto", None)])
+    passport_exists = passport_file is not None
     passport_url = ""
-    try:
-        passport_exists = bool(passport_file and getattr(passport_file, "name", None) and passport_file.storage.exists(passport_file.name))
-        if passport_exists and hasattr(passport_file, "url"):
+    passport_thumbnail_url = ""
+    if passport_exists:
+        try:
             passport_url = request.build_absolute_uri(passport_file.url)
-    except Exception:
-        passport_exists = False
+            if passport_derivative.has_thumbnail:
+                passport_thumbnail_url = request.build_absolute_uri(passport_derivative.thumbnail.url)
+        except Exception:
+            pass
 
     role_label = str(getattr(application, "role", "") or "Salesman").strip().title()
     license_number = license_obj.license_id if license_obj else application.application_id
@@ -780,8 +673,9 @@ def final_license_detail(request, application_id):
         "district": district,
         "modeOfOperation": role_label,
         "passportPhotoUrl": passport_url,
+        "passportPhotoThumbnailUrl": passport_thumbnail_url,
         "passportPhotoExists": passport_exists,
-        "passportPhotoDataUrl": _passport_data_url(passport_file),
+        "passportPhotoDataUrl": thumbnail_data_url(passport_derivative),
         "licenseFee": "",
         "transactionRef": "",
         "transactionDate": "",
@@ -803,16 +697,14 @@ def final_license_passport_photo(request, application_id):
     if role == "licensee" and application.applicant_id != request.user.id:
         return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    passport_file = getattr(application, "passPhoto", None)
-    try:
-        if not passport_file or not getattr(passport_file, "name", None) or not passport_file.storage.exists(passport_file.name):
-            return Response({"detail": "Photo not available."}, status=status.HTTP_404_NOT_FOUND)
-        f = passport_file.open("rb")
-    except Exception:
+    passport_file, passport_derivative = pick_available([getattr(application, "passPhoto", None)])
+    if not passport_file:
         return Response({"detail": "Photo not available."}, status=status.HTTP_404_NOT_FOUND)
 
-    mime = mimetypes.guess_type(passport_file.name)[0] or "application/octet-stream"
-    return FileResponse(f, content_type=mime)
+    try:
+        return serve_protected_file(request, passport_file, etag=passport_derivative.source_checksum)
+    except OSError:
+        return Response({"detail": "Photo not available."}, status=status.HTTP_404_NOT_FOUND)
 
 
 @permission_classes([HasAppPermission('salesman_barman_registration', 'view')])
@@ -840,198 +732,10 @@ def dashboard_counts(request):
         deactivate_all_expired_licenses()
     except Exception:
         pass
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    workflow_id = WORKFLOW_IDS['SALESMAN_BARMAN']
-    stage_sets = _get_stage_sets(workflow_id)
-    all_qs = SalesmanBarmanModel.objects.all()
-
-    if role == 'licensee':
-        base_qs = SalesmanBarmanModel.objects.filter(applicant=request.user)
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        payment_stages = set(stage_sets['payment'])
-        pending_stages = _get_in_progress_stage_names(stage_sets) - applied_stages - objection_stages - payment_stages
-        # The licensee UI does not surface an "Applied" tile; treat initial-stage apps as pending.
-        pending_for_ui = pending_stages | applied_stages
-        return Response({
-            "applied": base_qs.filter(current_stage__name__in=applied_stages).count(),
-            "pending": base_qs.filter(current_stage__name__in=pending_for_ui).count(),
-            "objection": base_qs.filter(current_stage__name__in=objection_stages).count(),
-            "approved": base_qs.filter(current_stage__name__in=stage_sets['approved']).count(),
-            "rejected": base_qs.filter(current_stage__name__in=stage_sets['rejected']).count(),
-            "awaiting_payment": base_qs.filter(current_stage__name__in=payment_stages).count(),
-        })
-
-    if role in ['site_admin']:
-        applied_stages = set(stage_sets['initial'])
-        pending_stages = _get_in_progress_stage_names(stage_sets) - applied_stages
-        pending_for_ui = pending_stages | applied_stages
-        return Response({
-            "applied": all_qs.filter(current_stage__name__in=applied_stages).count(),
-            "pending": all_qs.filter(current_stage__name__in=pending_for_ui).count(),
-            "approved": all_qs.filter(current_stage__name__in=stage_sets['approved']).count(),
-            "rejected": all_qs.filter(current_stage__name__in=stage_sets['rejected']).count(),
-        })
-
-    role_stage_names = _get_role_stage_names(request.user, workflow_id)
-    if not role_stage_names:
-        return Response({
-            "pending": 0,
-            "approved": 0,
-            "rejected": 0,
-            "objection": 0,
-        })
-
-    from django.db.models import OuterRef, Exists, Q
-
-    content_type = ContentType.objects.get_for_model(SalesmanBarmanModel)
-    role_id = getattr(getattr(request.user, 'role', None), 'id', None)
-    
-    acted_by_role = Exists(
-        WorkflowTransaction.objects.filter(
-            content_type=content_type, 
-            object_id=OuterRef('application_id'),
-            performed_by__role_id=role_id
-        )
-    )
-
-    role_id = getattr(getattr(request.user, 'role', None), 'id', None)
-    pending_stages = set(role_stage_names)
-    rejected_stages = set(stage_sets['rejected'])
-    objection_stages = set(stage_sets['objection'])
-
-    pending_count = all_qs.filter(current_stage__name__in=pending_stages).count()
-    approved_count = (
-        all_qs.exclude(current_stage__name__in=pending_stages | rejected_stages | objection_stages)
-        .annotate(_acted_by_role=acted_by_role)
-        .filter(_acted_by_role=True)
-        .count()
-    )
-    rejected_count = (
-        all_qs.filter(current_stage__name__in=rejected_stages)
-        .annotate(_acted_by_role=acted_by_role)
-        .filter(_acted_by_role=True)
-        .count()
-    )
-    objection_count = (
-        all_qs.filter(current_stage__name__in=objection_stages)
-        .annotate(_acted_by_role=acted_by_role)
-        .filter(_acted_by_role=True)
-        .count()
-    )
-
-    return Response({
-        "pending": pending_count,
-        "approved": approved_count,
-        "rejected": rejected_count,
-        "objection": objection_count,
-    })
+    return DASHBOARD.counts_response(request)
 
 @permission_classes([HasAppPermission('salesman_barman_registration', 'view'), HasStagePermission])
 @api_view(['GET'])
 @parser_classes([JSONParser])
 def application_group(request):
-    role = _normalize_role(request.user.role.name if request.user.role else None)
-    workflow_id = WORKFLOW_IDS['SALESMAN_BARMAN']
-    stage_sets = _get_stage_sets(workflow_id)
-    all_qs = SalesmanBarmanModel.objects.all()
-
-    if role == 'licensee':
-        base_qs = SalesmanBarmanModel.objects.filter(applicant=request.user)
-        applied_stages = set(stage_sets['initial'])
-        objection_stages = set(stage_sets['objection'])
-        pending_stages = _get_in_progress_stage_names(stage_sets) - applied_stages - objection_stages
-        result = {
-            "applied": SalesmanBarmanSerializer(
-                base_qs.filter(current_stage__name__in=applied_stages),
-                many=True
-            ).data,
-            "pending": SalesmanBarmanSerializer(
-                base_qs.filter(current_stage__name__in=pending_stages),
-                many=True
-            ).data,
-            "objection": SalesmanBarmanSerializer(
-                base_qs.filter(current_stage__name__in=objection_stages),
-                many=True
-            ).data,
-            "approved": SalesmanBarmanSerializer(
-                base_qs.filter(current_stage__name__in=stage_sets['approved']),
-                many=True
-            ).data,
-            "rejected": SalesmanBarmanSerializer(
-                base_qs.filter(current_stage__name__in=stage_sets['rejected']),
-                many=True
-            ).data
-        }
-        return Response(result)
-
-    if role in ['site_admin']:
-        applied_stages = set(stage_sets['initial'])
-        pending_stages = _get_in_progress_stage_names(stage_sets) - applied_stages
-        return Response({
-            "applied": SalesmanBarmanSerializer(
-                all_qs.filter(current_stage__name__in=applied_stages), many=True
-            ).data,
-            "pending": SalesmanBarmanSerializer(
-                all_qs.filter(current_stage__name__in=pending_stages), many=True
-            ).data,
-            "approved": SalesmanBarmanSerializer(
-                all_qs.filter(current_stage__name__in=stage_sets['approved']), many=True
-            ).data,
-            "rejected": SalesmanBarmanSerializer(
-                all_qs.filter(current_stage__name__in=stage_sets['rejected']), many=True
-            ).data
-        })
-
-    role_stage_names = _get_role_stage_names(request.user, workflow_id)
-    if role_stage_names:
-        from django.db.models import OuterRef, Exists, Q
-
-        content_type = ContentType.objects.get_for_model(SalesmanBarmanModel)
-        role_id = getattr(getattr(request.user, 'role', None), 'id', None)
-        
-        acted_by_role = Exists(
-            WorkflowTransaction.objects.filter(
-                content_type=content_type, 
-                object_id=OuterRef('application_id'),
-                performed_by__role_id=role_id
-            )
-        )
-
-        role_id = getattr(getattr(request.user, 'role', None), 'id', None)
-        pending_stages = set(role_stage_names)
-        rejected_stages = set(stage_sets['rejected'])
-        objection_stages = set(stage_sets['objection'])
-
-        approved_qs = (
-            all_qs.exclude(current_stage__name__in=pending_stages | rejected_stages | objection_stages)
-            .annotate(_acted_by_role=acted_by_role)
-            .filter(_acted_by_role=True)
-        )
-        rejected_qs = (
-            all_qs.filter(current_stage__name__in=rejected_stages)
-            .annotate(_acted_by_role=acted_by_role)
-            .filter(_acted_by_role=True)
-        )
-        objection_qs = (
-            all_qs.filter(current_stage__name__in=objection_stages)
-            .annotate(_acted_by_role=acted_by_role)
-            .filter(_acted_by_role=True)
-        )
-
-        return Response({
-            "pending": SalesmanBarmanSerializer(
-                all_qs.filter(current_stage__name__in=pending_stages), many=True
-            ).data,
-            "approved": SalesmanBarmanSerializer(approved_qs, many=True).data,
-            "rejected": SalesmanBarmanSerializer(rejected_qs, many=True).data,
-            "objection": SalesmanBarmanSerializer(objection_qs, many=True).data,
-        })
-
-    return Response({
-        "applied": [],
-        "pending": [],
-        "approved": [],
-        "rejected": [],
-        "objection": []
-    })
+    return DASHBOARD.group_response(request)
@@ -0,0 +1,29 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from auth.user.models import CustomUser
+from models.masters.core.models import District, State, Subdivision
+from utils.testing import QueryBudgetMixin
+
+
+class SingleWindowSearchTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        self.district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        self.subdivision = Subdivision.objects.create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=self.district
+        )
+        self.client.force_authenticate(user=self._licensee(99, first_name="Desk"))
+
+    def _licensee(self, index, first_name="Tashi"):
+        return CustomUser.objects.create_user(
+            password='password123', email=f'licensee{index}@example.com', district=self.district,
+            subdivision=self.subdivision, phone_number=f'97000000{index:02d}', first_name=first_name,
+            last_name="Bhutia", address="Gangtok",
+        )
+
+    def test_licensee_search_query_budget(self):
+        self.assert_query_budget(
+            'single_window:single-window-search', 8, self._licensee, params={'query': 'Tashi'},
+        )
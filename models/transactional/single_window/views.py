@@ -8,91 +8,13 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from auth.user.models import CustomUser
+from auth.workflow.timeline import WorkflowTimeline
 from models.masters.license.models import License
 from models.transactional.new_license_application.models import NewLicenseApplication
 from models.transactional.license_renewal_application.models import LicenseApplication as RenewalApplication
 from models.transactional.salesman_barman.models import SalesmanBarmanModel
 
 
-def get_current_run_start_time(content_type, object_id):
-    try:
-        from auth.workflow.models import Transaction
-        txs = Transaction.objects.filter(content_type=content_type, object_id=str(object_id)).order_by("timestamp")
-        start_time = None
-        for tx in txs:
-            stage_name = tx.stage.name.lower() if tx.stage else ""
-            remarks = (tx.remarks or "").lower()
-            if "applied" in stage_name or "submitted" in remarks:
-                start_time = tx.timestamp
-        return start_time
-    except Exception:
-        return None
-
-
-def serialize_workflow_history(obj):
-    hist = []
-    try:
-        from django.contrib.contenttypes.models import ContentType
-        from auth.workflow.models import Transaction
-        ct = ContentType.objects.get_for_model(obj)
-        txs = list(Transaction.objects.filter(content_type=ct, object_id=str(obj.pk)).order_by("timestamp"))
-        
-        # Find index of latest Applied transaction to show only current run's flow
-        start_idx = 0
-        for i, tx in enumerate(txs):
-            stage_name = tx.stage.name.lower() if tx.stage else ""
-            remarks = (tx.remarks or "").lower()
-            if "applied" in stage_name or "submitted" in remarks:
-                start_idx = i
-        
-        txs = txs[start_idx:]
-        for tx in txs:
-            stage_name = tx.stage.name if tx.stage else "N/A"
-            performed_by = tx.performed_by
-            actor_username = performed_by.username if performed_by else "System"
-            actor_name = f"{performed_by.first_name} {performed_by.last_name}".strip() if performed_by else "System"
-            forwarded_to_name = tx.forwarded_to.name if tx.forwarded_to else "N/A"
-            hist.append({
-                "stage": stage_name,
-                "forwarded_to": forwarded_to_name,
-                "action_by": actor_username,
-                "action_by_name": actor_name,
-                "remarks": tx.remarks or "No remarks provided.",
-                "created_at": tx.timestamp.strftime("%Y-%m-%d %H:%M:%S") if tx.timestamp else "N/A"
-            })
-    except Exception as e:
-        pass
-    return hist
-
-
-def serialize_objections(obj):
-    objs = []
-    try:
-        from django.contrib.contenttypes.models import ContentType
-        from auth.workflow.models import Objection
-        ct = ContentType.objects.get_for_model(obj)
-        
-        start_time = get_current_run_start_time(ct, obj.pk)
-        objections = Objection.objects.filter(content_type=ct, object_id=str(obj.pk))
-        if start_time:
-            objections = objections.filter(raised_on__gte=start_time)
-        objections = objections.order_by("-raised_on")
-        for ob in objections:
-            raised_by = ob.raised_by
-            objs.append({
-                "objection_remarks": ob.remarks or "",
-                "objection_by": raised_by.username if raised_by else "System",
-                "objection_by_name": f"{raised_by.first_name} {raised_by.last_name}".strip() if raised_by else "System",
-                "stage": ob.stage.name if ob.stage else "N/A",
-                "reply_remarks": ob.after_content or "No reply submitted yet.",
-                "is_resolved": ob.is_resolved,
-                "created_at": ob.raised_on.strftime("%Y-%m-%d %H:%M:%S") if ob.raised_on else "N/A"
-            })
-    except Exception as e:
-        pass
-    return objs
-
-
 def serialize_payment_transactions(app_id):
     payments = []
     if not app_id:
@@ -1051,9 +973,15 @@ def single_window_new_app_detail(request, application_id):
             })
 
     # Find renewal applications for this applicant
+    renewals = []
+    sbms = []
+    if app.applicant:
+        renewals = list(RenewalApplication.objects.filter(applicant=app.applicant).order_by("-created_at"))
+        sbms = list(SalesmanBarmanModel.objects.filter(applicant=app.applicant).order_by("-created_at"))
+    timeline = WorkflowTimeline.for_objects([app, *renewals, *sbms])
+
     renewal_list = []
     if app.applicant:
-        renewals = RenewalApplication.objects.filter(applicant=app.applicant).order_by("-created_at")
         for r in renewals:
             # Renewal pending stage
             r_pending = "N/A"
@@ -1074,15 +1002,13 @@ def single_window_new_app_detail(request, application_id):
                 "is_security_fee_paid": r.is_security_fee_paid,
                 "pending_at_role": r_pending,
                 "created_at": r.created_at.strftime("%Y-%m-%d") if r.created_at else "N/A",
-                "history": serialize_workflow_history(r),
-                "objections": serialize_objections(r),
+                **timeline.serialize(r),
                 "payments": serialize_payment_transactions(r.application_id),
             })
 
     # Find salesman/barman applications for this applicant
     sbm_list = []
     if app.applicant:
-        sbms = SalesmanBarmanModel.objects.filter(applicant=app.applicant).order_by("-created_at")
         for s in sbms:
             s_pending = "N/A"
             if s.current_stage and not s.is_approved:
@@ -1103,8 +1029,7 @@ def single_window_new_app_detail(request, application_id):
                 "pending_at_role": s_pending,
                 "created_at": s.created_at.strftime("%Y-%m-%d") if s.created_at else "N/A",
                 "license_id": s.license.license_id if s.license else (issued_license["license_id"] if issued_license else "N/A"),
-                "history": serialize_workflow_history(s),
-                "objections": serialize_objections(s),
+                **timeline.serialize(s),
                 "payments": serialize_payment_transactions(s.application_id),
             })
 
@@ -1134,8 +1059,7 @@ def single_window_new_app_detail(request, application_id):
         "renewal_applications": renewal_list,
         "salesman_barman_applications": sbm_list,
         # Workflow
-        "history": serialize_workflow_history(app),
-        "objections": serialize_objections(app),
+        **timeline.serialize(app),
         "payments": serialize_payment_transactions(app.application_id)
     }
     return Response(data)
@@ -1147,6 +1071,7 @@ def single_window_new_app_detail(request, application_id):
 @permission_classes([IsAuthenticated])
 def single_window_renewal_app_detail(request, application_id):
     app = get_object_or_404(RenewalApplication, application_id=application_id)
+    timeline = WorkflowTimeline.for_objects([app])
 
     data = {
         "application_id": app.application_id,
@@ -1161,8 +1086,7 @@ def single_window_renewal_app_detail(request, application_id):
         "is_security_fee_paid": app.is_security_fee_paid,
         "created_at": app.created_at.strftime("%Y-%m-%d %H:%M:%S") if app.created_at else "N/A",
         "updated_at": app.updated_at.strftime("%Y-%m-%d %H:%M:%S") if app.updated_at else "N/A",
-        "history": serialize_workflow_history(app),
-        "objections": serialize_objections(app),
+        **timeline.serialize(app),
         "payments": serialize_payment_transactions(app.application_id)
     }
     return Response(data)
@@ -1195,6 +1119,7 @@ def single_window_license_detail(request, license_id):
 @permission_classes([IsAuthenticated])
 def single_window_salesman_barman_detail(request, application_id):
     app = get_object_or_404(SalesmanBarmanModel, application_id=application_id)
+    timeline = WorkflowTimeline.for_objects([app])
 
     data = {
         "application_id": app.application_id,
@@ -1216,8 +1141,7 @@ def single_window_salesman_barman_detail(request, application_id):
         "print_count": app.print_count,
         "created_at": app.created_at.strftime("%Y-%m-%d %H:%M:%S") if app.created_at else "N/A",
         "updated_at": app.updated_at.strftime("%Y-%m-%d %H:%M:%S") if app.updated_at else "N/A",
-        "history": serialize_workflow_history(app),
-        "objections": serialize_objections(app),
+        **timeline.serialize(app),
         "payments": serialize_payment_transactions(app.application_id)
     }
     return Response(data)
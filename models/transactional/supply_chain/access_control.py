@@ -1,8 +1,21 @@
+from collections import namedtuple
+
 from auth.workflow.models import StagePermission, WorkflowTransition
 from models.masters.license.models import License
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from models.transactional.new_license_application.models import NewLicenseApplication
-from django.db.models import Q
+
+from utils.cache_versions import bump_version, get_versions
+
+LICENSE_SCOPES_VERSION = 'license_scopes'
+LICENSE_SCOPE_TIMEOUT = 10 * 60
+
+# Active license issued to the user, with the text the token heuristics match on.
+LicenseRow = namedtuple(
+    'LicenseRow',
+    ['license_id', 'category_id', 'sub_category_id', 'category_text', 'subcategory_text'],
+)
 
 
 def _normalize_token(value):
@@ -66,6 +79,16 @@ def _license_matches_tokens(license_obj, category_tokens=None, subcategory_token
     return False
 
 
+def _license_row_matches_tokens(row, category_tokens=None, subcategory_tokens=None) -> bool:
+    category_tokens = [str(t or '').strip().lower() for t in (category_tokens or []) if str(t or '').strip()]
+    subcategory_tokens = [str(t or '').strip().lower() for t in (subcategory_tokens or []) if str(t or '').strip()]
+    if category_tokens and any(token in row.category_text for token in category_tokens):
+        return True
+    if subcategory_tokens and any(token in row.subcategory_text for token in subcategory_tokens):
+        return True
+    return False
+
+
 def resolve_user_license_id_by_category_subcategory(
     user,
     *,
@@ -74,46 +97,39 @@ def resolve_user_license_id_by_category_subcategory(
     category_tokens=None,
     subcategory_tokens=None,
     requested_license_id: str = '',
+    scope=None,
 ) -> str:
     """
     Resolve an active License.license_id for a user, preferring a requested id when it matches.
 
     Used by supply-chain flows to pick the correct manufacturing license when a user has
-    multiple licenses across categories/subcategories.
+    multiple licenses across categories/subcategories. Pass the request's `LicenseScope`
+    as `scope` to resolve from it instead of querying licenses again.
     """
     if not user:
         return ''
+    if scope is None:
+        scope = LicenseScope.for_user(user)
 
-    base_qs = License.objects.filter(applicant=user, is_active=True)
-    if license_category_id:
-        base_qs = base_qs.filter(license_category_id=license_category_id)
-    if license_sub_category_id:
-        base_qs = base_qs.filter(license_sub_category_id=license_sub_category_id)
+    candidates = [
+        row for row in scope.applicant_licenses
+        if (not license_category_id or row.category_id == license_category_id)
+        and (not license_sub_category_id or row.sub_category_id == license_sub_category_id)
+    ]
 
     requested_license_id = str(requested_license_id or '').strip()
     if requested_license_id:
-        requested_aliases = _expand_license_aliases(requested_license_id)
-        match = base_qs.filter(license_id__in=requested_aliases).order_by('-issue_date', '-license_id').first()
-        if match and match.license_id:
-            return str(match.license_id).strip()
+        requested_aliases = set(_expand_license_aliases(requested_license_id))
+        for row in candidates:
+            if row.license_id in requested_aliases:
+                return row.license_id
 
     if category_tokens or subcategory_tokens:
-        token_q = Q()
-        for token in (category_tokens or []):
-            token = str(token or '').strip()
-            if token:
-                token_q |= Q(license_category__license_category__icontains=token)
-        for token in (subcategory_tokens or []):
-            token = str(token or '').strip()
-            if token:
-                token_q |= Q(license_sub_category__description__icontains=token)
-        if token_q:
-            token_match = base_qs.filter(token_q).order_by('-issue_date', '-license_id').first()
-            if token_match and token_match.license_id:
-                return str(token_match.license_id).strip()
-
-    latest = base_qs.order_by('-issue_date', '-license_id').first()
-    return str(getattr(latest, 'license_id', '') or '').strip()
+        for row in candidates:
+            if _license_row_matches_tokens(row, category_tokens, subcategory_tokens):
+                return row.license_id
+
+    return candidates[0].license_id if candidates else ''
 
 
 def resolve_manufacturing_license_id_from_license_id(raw_license_id: str) -> str:
@@ -152,11 +168,12 @@ def resolve_manufacturing_license_id_from_license_id(raw_license_id: str) -> str
     return resolved or str(current.license_id).strip()
 
 
-def _is_oic_scoped_user(user):
+def _is_oic_scoped_user(user, scope=None):
     role_token = _normalize_token(getattr(getattr(user, 'role', None), 'name', ''))
+    has_assignment = scope.has_oic_assignment if scope is not None else hasattr(user, 'oic_assignment')
     return (
         bool(getattr(user, 'is_oic_managed', False))
-        or hasattr(user, 'oic_assignment')
+        or has_assignment
         or role_token in {'officerincharge', 'offcierincharge', 'oic'}
     )
 
@@ -209,69 +226,163 @@ def has_workflow_access(user, workflow_id):
     return False
 
 
-def scope_by_profile_or_workflow(user, queryset, workflow_id, licensee_field='licensee_id'):
-    # Licensee/OIC-style users are scoped by mapped license identifiers.
-    scoped_values = set()
+def _user_version_name(user_id):
+    return f"license_scope:{user_id}"
 
-    is_oic_user = _is_oic_scoped_user(user)
 
-    # OIC users must be scoped to mapped assignment/license IDs, not their own profile ID.
-    if is_oic_user and hasattr(user, 'oic_assignment'):
-        assignment = getattr(user, 'oic_assignment')
-        mapped_values = [
-            getattr(assignment, 'licensee_id', ''),
-            getattr(getattr(assignment, 'license', None), 'license_id', ''),
-            getattr(getattr(assignment, 'approved_application', None), 'application_id', ''),
+class LicenseScope:
+    """
+    License identifiers a user is scoped to in supply-chain flows.
+
+    `scoped_values` holds every alias of the license ids mapped to the user
+    (OIC assignment, manufacturing units, licenses issued to them or to their
+    new license applications); `applicant_licenses` lists the user's active
+    licenses, newest first. Built once per request via `get_license_scope` and
+    cached per user under a version bumped by `signals.connect_license_scope_signals`.
+    """
+
+    def __init__(self, user_id, scoped_values=(), applicant_licenses=(), has_oic_assignment=False):
+        self.user_id = user_id
+        self.scoped_values = frozenset(scoped_values)
+        self.applicant_licenses = tuple(applicant_licenses)
+        self.has_oic_assignment = has_oic_assignment
+
+    @classmethod
+    def build(cls, user):
+        scoped_values = set()
+
+        # OIC users must be scoped to mapped assignment/license IDs, not their own profile ID.
+        assignment = getattr(user, 'oic_assignment', None)
+        if assignment is not None:
+            mapped_values = [
+                getattr(assignment, 'licensee_id', ''),
+                getattr(assignment, 'license_id', ''),
+                getattr(getattr(assignment, 'approved_application', None), 'application_id', ''),
+            ]
+            for raw_value in mapped_values:
+                scoped_values.update(_expand_license_aliases(raw_value))
+
+        # Fallback: users with mapped manufacturing units but no active supply-chain profile
+        # should still see their own records.
+        if hasattr(user, 'manufacturing_units'):
+            unit_licensee_ids = (
+                user.manufacturing_units.exclude(licensee_id__isnull=True)
+                .exclude(licensee_id='')
+                .values_list('licensee_id', flat=True)
+            )
+            for value in unit_licensee_ids:
+                scoped_values.update(_expand_license_aliases(value))
+
+        # Include formal license IDs (e.g., NA/1101/2025-26/0001) issued to this user.
+        qs_by_applicant = License.objects.filter(applicant=user, is_active=True)
+        applicant_licenses = [
+            LicenseRow(
+                str(license_id or '').strip(),
+                category_id,
+                sub_category_id,
+                str(category_text or '').lower(),
+                str(subcategory_text or '').lower(),
+            )
+            for license_id, category_id, sub_category_id, category_text, subcategory_text in (
+                qs_by_applicant.order_by('-issue_date', '-license_id').values_list(
+                    'license_id',
+                    'license_category_id',
+                    'license_sub_category_id',
+                    'license_category__license_category',
+                    'license_sub_category__description',
+                )
+            )
         ]
-        for raw_value in mapped_values:
-            for alias in _expand_license_aliases(raw_value):
-                scoped_values.add(alias)
-
-    # Fallback: users with mapped manufacturing units but no active supply-chain profile
-    # should still see their own records.
-    if hasattr(user, 'manufacturing_units'):
-        unit_licensee_ids = list(
-            user.manufacturing_units.exclude(licensee_id__isnull=True)
-            .exclude(licensee_id='')
-            .values_list('licensee_id', flat=True)
-        )
-        for value in unit_licensee_ids:
-            for alias in _expand_license_aliases(value):
-                scoped_values.add(alias)
-
-    # Include formal license IDs (e.g., NA/1101/2025-26/0001) issued to this user.
-    qs_by_applicant = License.objects.filter(applicant=user, is_active=True)
-
-    # Compatibility fallback: match license by source_object_id from user's new applications,
-    # same style as MyLicensesListView.
-    try:
-        new_app_ct = ContentType.objects.get_for_model(NewLicenseApplication)
-        user_app_ids = NewLicenseApplication.objects.filter(
-            applicant=user
-        ).values_list('application_id', flat=True)
-        qs_by_source_object = License.objects.filter(
-            source_content_type=new_app_ct,
-            source_object_id__in=user_app_ids,
-            is_active=True
+
+        # Compatibility fallback: match license by source_object_id from user's new applications,
+        # same style as MyLicensesListView.
+        try:
+            new_app_ct = ContentType.objects.get_for_model(NewLicenseApplication)
+            user_app_ids = NewLicenseApplication.objects.filter(
+                applicant=user
+            ).values_list('application_id', flat=True)
+            qs_by_source_object = License.objects.filter(
+                source_content_type=new_app_ct,
+                source_object_id__in=user_app_ids,
+                is_active=True
+            )
+            license_qs = (qs_by_applicant | qs_by_source_object).distinct()
+        except Exception:
+            license_qs = qs_by_applicant
+
+        license_ids = (
+            license_qs.exclude(license_id__isnull=True)
+            .exclude(license_id='')
+            .values_list('license_id', flat=True)
         )
-        license_qs = (qs_by_applicant | qs_by_source_object).distinct()
-    except Exception:
-        license_qs = qs_by_applicant
-
-    license_ids = list(
-        license_qs.exclude(license_id__isnull=True)
-        .exclude(license_id='')
-        .values_list('license_id', flat=True)
-    )
-    for value in license_ids:
-        for alias in _expand_license_aliases(value):
-            scoped_values.add(alias)
+        for value in license_ids:
+            scoped_values.update(_expand_license_aliases(value))
+
+        return cls(user.pk, scoped_values, applicant_licenses, has_oic_assignment=assignment is not None)
+
+    @staticmethod
+    def cache_key(user_id):
+        """Cache key for the user's scope, or None when the cache is unavailable."""
+        user_version = _user_version_name(user_id)
+        versions = get_versions(user_version, LICENSE_SCOPES_VERSION)
+        if None in versions.values():
+            return None
+        return f"supply_chain:license_scope:{user_id}:{versions[user_version]}:{versions[LICENSE_SCOPES_VERSION]}"
+
+    @classmethod
+    def for_user(cls, user):
+        if not getattr(user, 'pk', None):
+            return cls(None)
+
+        key = cls.cache_key(user.pk)
+        if key is not None:
+            try:
+                scope = cache.get(key)
+            except Exception:
+                scope = None
+            if isinstance(scope, cls):
+                return scope
+
+        scope = cls.build(user)
+        if key is not None:
+            try:
+                cache.set(key, scope, timeout=LICENSE_SCOPE_TIMEOUT)
+            except Exception:
+                pass
+        return scope
+
+
+def get_license_scope(request):
+    """The `LicenseScope` of `request.user`, computed at most once per request."""
+    user = getattr(request, 'user', None)
+    user_id = getattr(user, 'pk', None)
+    memo = getattr(request, '_license_scope', None)
+    if memo is not None and memo.user_id == user_id:
+        return memo
+    scope = LicenseScope.for_user(user)
+    request._license_scope = scope
+    return scope
+
+
+def invalidate_license_scope(user_id):
+    if user_id:
+        bump_version(_user_version_name(user_id))
+
+
+def invalidate_license_scopes():
+    bump_version(LICENSE_SCOPES_VERSION)
+
+
+def scope_by_profile_or_workflow(user, queryset, workflow_id, licensee_field='licensee_id', scope=None):
+    # Licensee/OIC-style users are scoped by mapped license identifiers.
+    if scope is None:
+        scope = LicenseScope.for_user(user)
 
-    if scoped_values:
-        return queryset.filter(**{f'{licensee_field}__in': list(scoped_values)})
+    if scope.scoped_values:
+        return queryset.filter(**{f'{licensee_field}__in': sorted(scope.scoped_values)})
 
     # OIC users without an assignment should not see cross-license records.
-    if is_oic_user:
+    if _is_oic_scoped_user(user, scope):
         return queryset.none()
 
     # Licensee users without mapped IDs must not fall back to workflow-wide access.
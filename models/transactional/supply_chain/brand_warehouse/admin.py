@@ -3,8 +3,9 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.http import HttpResponseRedirect
 from django.contrib import messages
-from .models import BrandWarehouse, BrandWarehouseArrival, BrandWarehouseUtilization
+from .models import BrandWarehouse, BrandWarehouseArrival, BrandWarehouseStockMovement, BrandWarehouseUtilization
 from .production_models import ProductionBatch
+from .stock_ledger import MovementType, record_stock_change, save_stock_edit
 
 
 @admin.register(BrandWarehouse)
@@ -100,6 +101,16 @@ class BrandWarehouseAdmin(admin.ModelAdmin):
         )
     restore_selected.short_description = "Restore selected deleted entries"
     
+    def save_model(self, request, obj, form, change):
+        """Ledger stock levels set or edited in the admin"""
+        notes = f"Admin: {request.user.username}"
+        if not change:
+            super().save_model(request, obj, form, change)
+            record_stock_change(obj, 0, MovementType.OPENING, notes=notes)
+            return
+        stock = obj.current_stock if 'current_stock' in form.changed_data else None
+        save_stock_edit(obj, lambda: super(BrandWarehouseAdmin, self).save_model(request, obj, form, change), stock, notes=notes)
+    
     def delete_model(self, request, obj):
         """Override delete to use soft delete"""
         obj.soft_delete(deleted_by=request.user.username)
@@ -152,6 +163,29 @@ class BrandWarehouseArrivalAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(BrandWarehouseStockMovement)
+class BrandWarehouseStockMovementAdmin(admin.ModelAdmin):
+    """
+    Read-only admin for the append-only stock ledger
+    """
+    list_display = [
+        'brand_warehouse', 'movement_type', 'quantity',
+        'previous_stock', 'new_stock', 'reference_no', 'created_at'
+    ]
+    list_filter = ['movement_type', 'created_at']
+    search_fields = ['reference_no', 'brand_warehouse__brand__brand_name']
+    list_select_related = ['brand_warehouse__brand', 'brand_warehouse__factory']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(BrandWarehouseUtilization)
 class BrandWarehouseUtilizationAdmin(admin.ModelAdmin):
     """
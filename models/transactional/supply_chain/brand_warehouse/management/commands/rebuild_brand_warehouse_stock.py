@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from models.transactional.supply_chain.brand_warehouse.stock_ledger import rebuild_stock_from_ledger
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild brand_warehouse.current_stock (and status) from the stock movement ledger "
+        "in a single UPDATE. Only warehouses whose stock differs from their ledger sum change."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Print drifted warehouses without writing to DB.'
+        )
+        parser.add_argument(
+            '--brand-id',
+            type=int,
+            action='append',
+            dest='brand_ids',
+            help='Rebuild only this brand warehouse ID (repeatable).'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = bool(options.get('dry_run'))
+        drifted = rebuild_stock_from_ledger(options.get('brand_ids'), dry_run=dry_run)
+
+        prefix = "[DRY-RUN] " if dry_run else ""
+        for warehouse_id, stock_before, ledger_stock in drifted:
+            self.stdout.write(
+                f"{prefix}brand_warehouse.id={warehouse_id}: current_stock {stock_before} -> {ledger_stock}"
+            )
+
+        verb = "would be rebuilt" if dry_run else "rebuilt"
+        self.stdout.write(self.style.SUCCESS(f"{len(drifted)} warehouse(s) {verb} from the stock ledger."))
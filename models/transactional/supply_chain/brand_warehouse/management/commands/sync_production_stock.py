@@ -4,6 +4,8 @@ from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 
+from models.transactional.supply_chain.brand_warehouse.stock_ledger import set_stock_level
+
 
 class Command(BaseCommand):
     help = 'Sync production batches with brand warehouse stock to fix any inconsistencies'
@@ -87,9 +89,7 @@ class Command(BaseCommand):
                         with transaction.atomic():
                             # Update the brand warehouse stock
                             old_stock = brand_warehouse.current_stock
-                            brand_warehouse.current_stock = expected_stock
-                            brand_warehouse.save(update_fields=['current_stock', 'updated_at'])
-                            brand_warehouse.update_status()
+                            set_stock_level(brand_warehouse, expected_stock, notes='Synced with production batches')
                             
                             self.stdout.write(f"   ✅ Updated stock: {old_stock} → {expected_stock}")
                             total_synced += 1
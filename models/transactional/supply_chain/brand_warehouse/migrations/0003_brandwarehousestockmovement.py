@@ -0,0 +1,58 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:38
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def seed_opening_balances(apps, schema_editor):
+    """Open the ledger with each warehouse's stock at migration time."""
+    BrandWarehouse = apps.get_model('brand_warehouse', 'BrandWarehouse')
+    BrandWarehouseStockMovement = apps.get_model('brand_warehouse', 'BrandWarehouseStockMovement')
+    rows = BrandWarehouse._base_manager.exclude(current_stock=0).values_list('id', 'current_stock')
+    BrandWarehouseStockMovement.objects.bulk_create(
+        (
+            BrandWarehouseStockMovement(
+                brand_warehouse_id=warehouse_id,
+                movement_type='OPENING',
+                quantity=stock,
+                previous_stock=0,
+                new_stock=stock,
+                notes='Opening balance when the stock ledger was introduced',
+            )
+            for warehouse_id, stock in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brand_warehouse', '0002_update_capacity_size_fk_to_masterliquorcapacity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BrandWarehouseStockMovement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('movement_type', models.CharField(choices=[('OPENING', 'Opening Balance'), ('ARRIVAL', 'Arrival'), ('PRODUCTION', 'Production'), ('UTILIZATION', 'Utilization'), ('CANCELLATION_REFUND', 'Cancellation Refund'), ('ADJUSTMENT', 'Adjustment')], db_column='movement_type', help_text='What moved the stock', max_length=30)),
+                ('quantity', models.IntegerField(db_column='quantity', help_text='Signed change applied to current stock (in units/bottles)')),
+                ('previous_stock', models.IntegerField(db_column='previous_stock', help_text='Stock before this movement')),
+                ('new_stock', models.IntegerField(db_column='new_stock', help_text='Stock after this movement')),
+                ('reference_no', models.CharField(blank=True, db_column='reference_no', default='', help_text='Permit, register or batch reference behind the movement', max_length=100)),
+                ('notes', models.TextField(blank=True, db_column='notes', default='')),
+                ('created_at', models.DateTimeField(db_column='created_at', default=django.utils.timezone.now)),
+                ('brand_warehouse', models.ForeignKey(db_column='brand_warehouse_id', help_text='Related brand warehouse entry', on_delete=django.db.models.deletion.CASCADE, related_name='stock_movements', to='brand_warehouse.brandwarehouse')),
+            ],
+            options={
+                'verbose_name': 'Brand Warehouse Stock Movement',
+                'verbose_name_plural': 'Brand Warehouse Stock Movements',
+                'db_table': 'brand_warehouse_stock_movement',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['brand_warehouse', 'created_at'], name='brand_wareh_brand_w_f52fc1_idx'), models.Index(fields=['reference_no'], name='brand_wareh_referen_344673_idx')],
+            },
+        ),
+        migrations.RunPython(seed_opening_balances, migrations.RunPython.noop),
+    ]
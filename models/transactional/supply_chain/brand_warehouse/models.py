@@ -39,6 +39,9 @@ class BrandWarehouse(models.Model):
         ('DEFENCE', 'Defence'),
     ]
 
+    # Utilization statuses that count towards `total_utilized`.
+    UTILIZED_STATUSES = ['APPROVED', 'IN_TRANSIT', 'DELIVERED']
+
     # Basic Information
     factory = models.ForeignKey(
         'liquor_data.MasterFactoryList',
@@ -286,8 +289,11 @@ class BrandWarehouse(models.Model):
     @property
     def total_utilized(self):
         """Calculate total quantity utilized from all utilization records"""
+        annotated = getattr(self, 'utilized_quantity', None)
+        if annotated is not None:
+            return annotated
         return self.utilizations.filter(
-            status__in=['APPROVED', 'IN_TRANSIT', 'DELIVERED']
+            status__in=self.UTILIZED_STATUSES
         ).aggregate(
             total=models.Sum('quantity')
         )['total'] or 0
@@ -315,12 +321,9 @@ class BrandWarehouse(models.Model):
         """
         Add stock to brand warehouse and create arrival record
         """
-        previous_stock = self.current_stock
-        self.current_stock += quantity
-        self.save(update_fields=['current_stock', 'updated_at'])
-        
-        # Update status after stock change
-        self.update_status()
+        from .stock_ledger import MovementType, apply_stock_movement
+
+        movement = apply_stock_movement(self, quantity, MovementType.ARRIVAL, reference_no=reference_no)
         
         # Create arrival record
         BrandWarehouseArrival.objects.create(
@@ -329,8 +332,8 @@ class BrandWarehouse(models.Model):
             reference_no=reference_no,
             source_type=source_type,
             quantity_added=quantity,
-            previous_stock=previous_stock,
-            new_stock=self.current_stock,
+            previous_stock=movement.previous_stock,
+            new_stock=movement.new_stock,
             arrival_date=timezone.now()
         )
         
@@ -627,7 +630,7 @@ class BrandWarehouseUtilization(models.Model):
         
         if not is_new:
             old_instance = BrandWarehouseUtilization.objects.get(pk=self.pk)
-            old_quantity = old_instance.quantity if old_instance.status in ['APPROVED', 'IN_TRANSIT', 'DELIVERED'] else 0
+            old_quantity = old_instance.quantity if old_instance.status in BrandWarehouse.UTILIZED_STATUSES else 0
         
         # Save with one retry after sequence sync for duplicate-PK collisions.
         saved = False
@@ -648,24 +651,24 @@ class BrandWarehouseUtilization(models.Model):
             return
         
         # Update brand warehouse stock
-        if self.status in ['APPROVED', 'IN_TRANSIT', 'DELIVERED']:
+        if self.status in BrandWarehouse.UTILIZED_STATUSES:
             new_quantity = self.quantity
             stock_change = new_quantity - old_quantity
             
             if stock_change != 0:
-                # Capture snapshots
-                self.previous_stock = self.brand_warehouse.current_stock
-                self.brand_warehouse.current_stock = max(0, self.brand_warehouse.current_stock - stock_change)
-                self.new_stock = self.brand_warehouse.current_stock
-                
-                # Save both objects
-                self.brand_warehouse.save() 
-                self.brand_warehouse.update_status()
+                from .stock_ledger import MovementType, apply_stock_movement
+
+                movement = apply_stock_movement(
+                    self.brand_warehouse,
+                    -stock_change,
+                    MovementType.UTILIZATION,
+                    reference_no=self.permit_no,
+                    floor_at_zero=True,
+                )
+                self.previous_stock = movement.previous_stock
+                self.new_stock = movement.new_stock
                 
-                # Update snapshots in self without triggering another save if possible, 
-                # but we are already in save(), so we update fields and super().save() was called above.
-                # Actually super().save() was called at line 448.
-                # We need to save self AGAIN to persist snapshots.
+                # super().save() already ran; persist the stock snapshots on this row.
                 BrandWarehouseUtilization.objects.filter(pk=self.pk).update(
                     previous_stock=self.previous_stock,
                     new_stock=self.new_stock
@@ -789,3 +792,74 @@ class BrandWarehouseTpCancellation(models.Model):
 
     def __str__(self):
         return f"Cancellation {self.reference_no} - {self.quantity_cases} cases"
+
+
+class BrandWarehouseStockMovement(models.Model):
+    """
+    Append-only ledger of every change to BrandWarehouse.current_stock.
+
+    Rows are written by `stock_ledger` in the same statement that moves the
+    stock, so summing `quantity` per warehouse always gives its current stock.
+    """
+    class MovementType(models.TextChoices):
+        OPENING = 'OPENING', 'Opening Balance'
+        ARRIVAL = 'ARRIVAL', 'Arrival'
+        PRODUCTION = 'PRODUCTION', 'Production'
+        UTILIZATION = 'UTILIZATION', 'Utilization'
+        CANCELLATION_REFUND = 'CANCELLATION_REFUND', 'Cancellation Refund'
+        ADJUSTMENT = 'ADJUSTMENT', 'Adjustment'
+
+    brand_warehouse = models.ForeignKey(
+        BrandWarehouse,
+        on_delete=models.CASCADE,
+        related_name='stock_movements',
+        db_column='brand_warehouse_id',
+        help_text='Related brand warehouse entry'
+    )
+    movement_type = models.CharField(
+        max_length=30,
+        choices=MovementType.choices,
+        db_column='movement_type',
+        help_text='What moved the stock'
+    )
+    quantity = models.IntegerField(
+        db_column='quantity',
+        help_text='Signed change applied to current stock (in units/bottles)'
+    )
+    previous_stock = models.IntegerField(
+        db_column='previous_stock',
+        help_text='Stock before this movement'
+    )
+    new_stock = models.IntegerField(
+        db_column='new_stock',
+        help_text='Stock after this movement'
+    )
+    reference_no = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        db_column='reference_no',
+        help_text='Permit, register or batch reference behind the movement'
+    )
+    notes = models.TextField(
+        blank=True,
+        default='',
+        db_column='notes',
+    )
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        db_column='created_at'
+    )
+
+    class Meta:
+        db_table = 'brand_warehouse_stock_movement'
+        ordering = ['-created_at', '-id']
+        verbose_name = 'Brand Warehouse Stock Movement'
+        verbose_name_plural = 'Brand Warehouse Stock Movements'
+        indexes = [
+            models.Index(fields=['brand_warehouse', 'created_at']),
+            models.Index(fields=['reference_no']),
+        ]
+
+    def __str__(self):
+        return f"{self.movement_type} {self.quantity:+d} ({self.reference_no or self.brand_warehouse_id})"
@@ -127,25 +127,26 @@ class ProductionBatch(models.Model):
         is_new = self.pk is None
         
         if is_new:
+            from .stock_ledger import MovementType, apply_stock_movement
+
             # Use transaction to ensure atomicity
             with transaction.atomic():
                 # For new production batches, update the brand warehouse stock
-                self.stock_before = self.brand_warehouse.current_stock
-                self.stock_after = self.stock_before + self.quantity_produced
-                
                 logger.info(f"🏭 Production Batch: Updating stock for {self.brand_warehouse.brand_name}")
-                logger.info(f"   Previous stock: {self.stock_before}")
                 logger.info(f"   Production quantity: {self.quantity_produced}")
-                logger.info(f"   New stock: {self.stock_after}")
-                
-                # Update brand warehouse stock
-                self.brand_warehouse.current_stock = self.stock_after
-                self.brand_warehouse.save(update_fields=['current_stock', 'updated_at'])
-                
-                # Update status based on new stock level
-                self.brand_warehouse.update_status()
+
+                movement = apply_stock_movement(
+                    self.brand_warehouse,
+                    self.quantity_produced,
+                    MovementType.PRODUCTION,
+                    reference_no=self.batch_reference,
+                )
+                self.stock_before = movement.previous_stock
+                self.stock_after = movement.new_stock
                 
-                logger.info(f"✅ Brand warehouse stock updated successfully: {self.brand_warehouse.current_stock} units")
+                logger.info(f"✅ Brand warehouse stock updated successfully: {self.stock_before} → {self.stock_after} units")
+                super().save(*args, **kwargs)
+            return
         
         super().save(*args, **kwargs)
 
@@ -1,9 +1,17 @@
 from rest_framework import serializers
 from .models import BrandWarehouse, BrandWarehouseUtilization, BrandWarehouseArrival, BrandWarehouseTpCancellation
-from .services import BrandWarehouseStockService
+from .services import NEW_BRAND_DAYS, RECENT_ARRIVALS_LIMIT, BrandWarehouseStockService
 from models.masters.supply_chain.liquor_data.models import MasterLiquorCapacity
 
 
+def _last_arrival_date(obj):
+    """`last_arrival_date` annotation from `with_listing_summary`, or a lookup for plain rows."""
+    if hasattr(obj, 'last_arrival_date'):
+        return obj.last_arrival_date
+    last_arrival = obj.arrivals.first()
+    return last_arrival.arrival_date if last_arrival else None
+
+
 class BrandWarehouseArrivalSerializer(serializers.ModelSerializer):
     """
     Serializer for Brand Warehouse Arrival records
@@ -272,17 +280,18 @@ class BrandWarehouseSerializer(serializers.ModelSerializer):
 
     def get_recent_arrivals(self, obj):
         """Get recent arrivals (last 10)"""
-        recent = obj.arrivals.all()[:10]
+        recent = getattr(obj, 'recent_arrival_list', None)
+        if recent is None:
+            recent = obj.arrivals.all()[:RECENT_ARRIVALS_LIMIT]
         return BrandWarehouseArrivalSerializer(recent, many=True).data
 
     def get_is_new(self, obj):
         """Check if brand has recent stock updates (NEW tag)"""
-        return BrandWarehouseStockService.check_if_brand_is_new(obj, days=7)
+        return BrandWarehouseStockService.check_if_brand_is_new(obj, days=NEW_BRAND_DAYS)
 
     def get_last_arrival_date(self, obj):
         """Get the date of the last arrival"""
-        last_arrival = obj.arrivals.first()
-        return last_arrival.arrival_date if last_arrival else None
+        return _last_arrival_date(obj)
 
     def get_liquor_data_details(self, obj):
         """Backward-compatible structure built from brand_warehouse columns."""
@@ -417,16 +426,18 @@ class BrandWarehouseSummarySerializer(serializers.ModelSerializer):
 
     def get_utilization_count(self, obj):
         """Get count of utilization records"""
+        annotated = getattr(obj, 'utilization_count', None)
+        if annotated is not None:
+            return annotated
         return obj.utilizations.count()
 
     def get_is_new(self, obj):
         """Check if brand has recent stock updates (NEW tag)"""
-        return BrandWarehouseStockService.check_if_brand_is_new(obj, days=7)
+        return BrandWarehouseStockService.check_if_brand_is_new(obj, days=NEW_BRAND_DAYS)
 
     def get_last_arrival_date(self, obj):
         """Get the date of the last arrival"""
-        last_arrival = obj.arrivals.first()
-        return last_arrival.arrival_date if last_arrival else None
+        return _last_arrival_date(obj)
 
     def get_pack_sizes_info(self, obj):
         """Get pack size information for this brand"""
@@ -1,8 +1,10 @@
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Prefetch, Q, Subquery, Sum, Window
+from django.db.models.functions import Coalesce, RowNumber
 from django.utils import timezone
 from datetime import timedelta
-from .models import BrandWarehouse, BrandWarehouseArrival
+from .models import BrandWarehouse, BrandWarehouseArrival, BrandWarehouseUtilization
+from .stock_ledger import MovementType, apply_stock_movement, set_stock_level
 from models.masters.supply_chain.liquor_data.models import (
     MasterLiquorType,
     MasterLiquorCapacity,
@@ -16,6 +18,9 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+NEW_BRAND_DAYS = 7
+RECENT_ARRIVALS_LIMIT = 10
+
 
 class BrandWarehouseStockService:
     """
@@ -185,6 +190,57 @@ class BrandWarehouseStockService:
         ranked.sort(key=lambda x: x[0], reverse=True)
         return [name for _, name in ranked[:5]]
     
+    @staticmethod
+    def with_listing_summary(queryset, new_days=NEW_BRAND_DAYS, recent_arrivals=RECENT_ARRIVALS_LIMIT):
+        """
+        Annotate brand warehouse rows with their listing summary fields.
+
+        Adds `last_arrival_date`, `utilization_count`, `utilized_quantity` and
+        `is_new` as correlated subqueries, and prefetches only the latest
+        `recent_arrivals` arrivals per warehouse into `recent_arrival_list`, so
+        a listing costs the same number of queries however much arrival and
+        utilization history has built up.
+        """
+        cutoff_date = timezone.now() - timedelta(days=new_days)
+        arrivals = BrandWarehouseArrival.objects.filter(brand_warehouse=OuterRef('pk'))
+        utilizations = BrandWarehouseUtilization.objects.filter(brand_warehouse=OuterRef('pk')).order_by()
+
+        recent_arrivals_qs = (
+            BrandWarehouseArrival.objects.annotate(
+                recent_rank=Window(
+                    RowNumber(),
+                    partition_by=[F('brand_warehouse_id')],
+                    order_by=[F('arrival_date').desc(), F('id').desc()],
+                )
+            )
+            .filter(recent_rank__lte=recent_arrivals)
+            .order_by('-arrival_date', '-id')
+        )
+
+        return queryset.annotate(
+            last_arrival_date=Subquery(arrivals.order_by('-arrival_date').values('arrival_date')[:1]),
+            utilization_count=Coalesce(
+                Subquery(
+                    utilizations.values('brand_warehouse').annotate(total=Count('pk')).values('total'),
+                    output_field=IntegerField(),
+                ),
+                0,
+            ),
+            utilized_quantity=Coalesce(
+                Subquery(
+                    utilizations.filter(status__in=BrandWarehouse.UTILIZED_STATUSES)
+                    .values('brand_warehouse')
+                    .annotate(total=Sum('quantity'))
+                    .values('total'),
+                    output_field=IntegerField(),
+                ),
+                0,
+            ),
+            is_new=Exists(arrivals.filter(arrival_date__gte=cutoff_date)),
+        ).prefetch_related(
+            Prefetch('arrivals', queryset=recent_arrivals_qs, to_attr='recent_arrival_list')
+        )
+
     @staticmethod
     def get_all_brands_with_stock():
         """
@@ -213,9 +269,11 @@ class BrandWarehouseStockService:
         """
         try:
             # Return only Sikkim Distilleries Ltd Brand Warehouse entries
-            return BrandWarehouse.objects.filter(
-                factory__factory_name__icontains='Sikkim Distilleries Ltd'
-            ).prefetch_related('arrivals', 'utilizations')
+            return BrandWarehouseStockService.with_listing_summary(
+                BrandWarehouse.objects.filter(
+                    factory__factory_name__icontains='Sikkim Distilleries Ltd'
+                ).select_related('liquor_type', 'brand', 'factory', 'capacity_size')
+            )
             
         except Exception as e:
             logger.error(f"Error getting Sikkim brands: {str(e)}")
@@ -330,8 +388,7 @@ class BrandWarehouseStockService:
                     total_stock = sum(int(row.current_stock or 0) for row in duplicate_rows)
 
                     if keeper.current_stock != total_stock:
-                        keeper.current_stock = total_stock
-                        keeper.save(update_fields=['current_stock', 'updated_at'])
+                        set_stock_level(keeper, total_stock, notes='Merged duplicate warehouse rows')
 
                     archived = to_archive.update(
                         is_deleted=True,
@@ -433,6 +490,10 @@ class BrandWarehouseStockService:
                     logger.error(f"Could not find/create brand warehouse for {distillery_name} - {brand_name} ({capacity_ml}ml)")
                     return False
                 
+                # Lock the warehouse row so concurrent approvals of the same
+                # register entry serialize on the duplicate check below.
+                BrandWarehouse.objects.select_for_update().filter(pk=brand_warehouse.pk).exists()
+
                 # CRITICAL: Check if arrival record already exists to prevent duplicates
                 existing_arrival = BrandWarehouseArrival.objects.filter(
                     brand_warehouse=brand_warehouse,
@@ -445,13 +506,11 @@ class BrandWarehouseStockService:
                     logger.warning(f"   Existing arrival ID: {existing_arrival.id}, Quantity: {existing_arrival.quantity_added}")
                     return True  # Return True since the stock was already updated correctly
                 
-                # Update current_stock by adding the issued quantity
-                previous_stock = brand_warehouse.current_stock
-                brand_warehouse.current_stock += issued_qty
-                brand_warehouse.save(update_fields=['current_stock', 'updated_at'])
-                
-                # Update status based on new stock level
-                brand_warehouse.update_status()
+                # Update current_stock (and status) by adding the issued quantity
+                movement = apply_stock_movement(
+                    brand_warehouse, issued_qty, MovementType.ARRIVAL, reference_no=reference_no
+                )
+                previous_stock = movement.previous_stock
                 
                 # Create arrival record for tracking
                 arrival = BrandWarehouseArrival.objects.create(
@@ -515,6 +574,10 @@ class BrandWarehouseStockService:
         Returns:
             bool: True if brand has recent arrivals
         """
+        annotated = getattr(brand_warehouse, 'is_new', None)
+        if annotated is not None and days == NEW_BRAND_DAYS:
+            return annotated
+
         cutoff_date = timezone.now() - timedelta(days=days)
         
         recent_arrivals = brand_warehouse.arrivals.filter(
@@ -538,10 +601,9 @@ class BrandWarehouseStockService:
             brands_with_tags = {}
             
             for brand in all_brands:
-                is_new = BrandWarehouseStockService.check_if_brand_is_new(brand, days=7)
                 brands_with_tags[brand.id] = {
-                    'is_new': is_new,
-                    'last_arrival': brand.arrivals.first().arrival_date if brand.arrivals.exists() else None
+                    'is_new': brand.is_new,
+                    'last_arrival': brand.last_arrival_date,
                 }
             
             return brands_with_tags
@@ -753,9 +815,7 @@ class BrandWarehouseStockService:
                             
                             # Update stock
                             old_stock = brand_warehouse.current_stock
-                            brand_warehouse.current_stock = total_production
-                            brand_warehouse.save(update_fields=['current_stock', 'updated_at'])
-                            brand_warehouse.update_status()
+                            set_stock_level(brand_warehouse, total_production, notes='Synced with production batches')
                             
                             sync_results['total_synced'] += 1
                             sync_results['details'].append({
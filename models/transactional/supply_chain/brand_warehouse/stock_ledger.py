@@ -0,0 +1,216 @@
+"""
+Race-free stock movements for BrandWarehouse.
+
+Every change to `current_stock` goes through `apply_stock_movement` (a signed
+delta) or `set_stock_level` (an absolute level). Both lock the warehouse row,
+move its stock, recompute `status` with the same CASE rules as
+`BrandWarehouse.update_status` and append the matching
+`BrandWarehouseStockMovement` row in a single UPDATE ... RETURNING statement,
+so concurrent register approvals and permit submissions cannot lose updates.
+
+Edits of other warehouse fields go through `save_stock_edit`, which saves them
+without writing back a stale `current_stock`.
+
+`rebuild_stock_from_ledger` recomputes `current_stock` from the ledger sums in
+one UPDATE; it backs the `rebuild_brand_warehouse_stock` command.
+"""
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import BrandWarehouse, BrandWarehouseStockMovement
+
+MovementType = BrandWarehouseStockMovement.MovementType
+
+_WAREHOUSE_TABLE = BrandWarehouse._meta.db_table
+_MOVEMENT_TABLE = BrandWarehouseStockMovement._meta.db_table
+
+_STATUS_CASE = """
+    CASE
+        WHEN {stock} = 0 THEN 'OUT_OF_STOCK'
+        WHEN {stock} <= bw.reorder_level THEN 'LOW_STOCK'
+        WHEN {stock} > bw.max_capacity THEN 'OVERSTOCKED'
+        ELSE 'IN_STOCK'
+    END
+"""
+
+_MOVE_SQL = """
+WITH locked AS (
+    SELECT id, current_stock FROM {warehouse} WHERE id = %(warehouse_id)s FOR UPDATE
+), moved AS (
+    UPDATE {warehouse} bw
+    SET current_stock = {new_stock}, status = {status}, updated_at = %(now)s
+    FROM locked
+    WHERE bw.id = locked.id
+    RETURNING bw.id, locked.current_stock AS previous_stock, bw.current_stock AS new_stock, bw.status
+)
+INSERT INTO {movement} (
+    brand_warehouse_id, movement_type, quantity, previous_stock, new_stock, reference_no, notes, created_at
+)
+SELECT id, %(movement_type)s, new_stock - previous_stock, previous_stock, new_stock,
+       %(reference_no)s, %(notes)s, %(now)s
+FROM moved
+RETURNING id, quantity, previous_stock, new_stock, (SELECT status FROM moved)
+"""
+
+_LEDGER_TOTALS_SQL = """
+WITH totals AS (
+    SELECT brand_warehouse_id, SUM(quantity) AS stock
+    FROM {movement}
+    {where}
+    GROUP BY brand_warehouse_id
+), drift AS (
+    SELECT bw.id, bw.current_stock AS stock_before, totals.stock AS ledger_stock
+    FROM {warehouse} bw
+    JOIN totals ON totals.brand_warehouse_id = bw.id
+    WHERE bw.current_stock <> totals.stock
+    {lock}
+)
+"""
+
+_REBUILD_SQL = """
+UPDATE {warehouse} bw
+SET current_stock = drift.ledger_stock, status = {status}, updated_at = %(now)s
+FROM drift
+WHERE bw.id = drift.id
+RETURNING bw.id, drift.stock_before, bw.current_stock
+"""
+
+
+def _move(brand_warehouse, new_stock_sql, movement_type, reference_no, notes, **params):
+    now = timezone.now()
+    sql = _MOVE_SQL.format(
+        warehouse=_WAREHOUSE_TABLE,
+        movement=_MOVEMENT_TABLE,
+        new_stock=new_stock_sql,
+        status=_STATUS_CASE.format(stock=new_stock_sql),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {
+            'warehouse_id': brand_warehouse.pk,
+            'movement_type': movement_type,
+            'reference_no': str(reference_no or '')[:100],
+            'notes': notes or '',
+            'now': now,
+            **params,
+        })
+        row = cursor.fetchone()
+    if row is None:
+        raise BrandWarehouse.DoesNotExist(f"Brand warehouse {brand_warehouse.pk} does not exist")
+
+    movement_id, quantity, previous_stock, new_stock, status = row
+    brand_warehouse.current_stock = new_stock
+    brand_warehouse.status = status
+    brand_warehouse.updated_at = now
+    return BrandWarehouseStockMovement(
+        id=movement_id,
+        brand_warehouse=brand_warehouse,
+        movement_type=movement_type,
+        quantity=quantity,
+        previous_stock=previous_stock,
+        new_stock=new_stock,
+        reference_no=str(reference_no or '')[:100],
+        notes=notes or '',
+        created_at=now,
+    )
+
+
+def apply_stock_movement(brand_warehouse, quantity, movement_type, reference_no='', notes='', floor_at_zero=False):
+    """
+    Add `quantity` (negative to deduct) to a warehouse's stock and record it.
+
+    With `floor_at_zero` the stock stops at 0 and the ledger row records the
+    change actually applied. Updates `current_stock`, `status` and `updated_at`
+    on `brand_warehouse` in place and returns the new movement.
+    """
+    new_stock_sql = 'locked.current_stock + %(quantity)s'
+    if floor_at_zero:
+        new_stock_sql = f'GREATEST({new_stock_sql}, 0)'
+    return _move(
+        brand_warehouse, new_stock_sql, movement_type, reference_no, notes,
+        quantity=int(quantity),
+    )
+
+
+def set_stock_level(brand_warehouse, stock, movement_type=MovementType.ADJUSTMENT, reference_no='', notes=''):
+    """Set a warehouse's stock to `stock`, recording the difference as a movement."""
+    return _move(
+        brand_warehouse, '%(stock)s::integer', movement_type, reference_no, notes,
+        stock=int(stock),
+    )
+
+
+def record_stock_change(brand_warehouse, previous_stock, movement_type=MovementType.ADJUSTMENT, reference_no='', notes=''):
+    """
+    Record a stock change that was already saved on the row (e.g. a warehouse
+    created or edited through the API). Returns None when nothing changed.
+    """
+    quantity = int(brand_warehouse.current_stock or 0) - int(previous_stock or 0)
+    if not quantity:
+        return None
+    return BrandWarehouseStockMovement.objects.create(
+        brand_warehouse=brand_warehouse,
+        movement_type=movement_type,
+        quantity=quantity,
+        previous_stock=int(previous_stock or 0),
+        new_stock=int(brand_warehouse.current_stock or 0),
+        reference_no=str(reference_no or '')[:100],
+        notes=notes or '',
+    )
+
+
+def save_stock_edit(brand_warehouse, save, stock=None, reference_no='', notes=''):
+    """
+    Save an edit of an existing warehouse and, if `stock` is given, set its
+    stock level through the ledger.
+
+    `save()` persists the other edited fields (e.g. `serializer.save`). It runs
+    with the row locked and with `current_stock`/`status` reloaded, so it writes
+    back the stock the ledger holds rather than the value read with the form.
+    Returns the stock movement, or None when the level did not change.
+    """
+    with transaction.atomic():
+        current = (
+            type(brand_warehouse)._base_manager.select_for_update()
+            .values('current_stock', 'status')
+            .get(pk=brand_warehouse.pk)
+        )
+        brand_warehouse.current_stock = current['current_stock']
+        brand_warehouse.status = current['status']
+        save()
+        if stock is None or int(stock) == int(brand_warehouse.current_stock or 0):
+            return None
+        return set_stock_level(brand_warehouse, stock, reference_no=reference_no, notes=notes)
+
+
+def rebuild_stock_from_ledger(warehouse_ids=None, dry_run=False):
+    """
+    Reset `current_stock` (and status) to the ledger sum for every warehouse
+    whose stock has drifted from it, in one UPDATE.
+
+    Returns `(warehouse_id, stock_before, ledger_stock)` for each drifted row.
+    Warehouses without ledger rows are left untouched.
+    """
+    params = {'now': timezone.now()}
+    where = ''
+    if warehouse_ids is not None:
+        where = 'WHERE brand_warehouse_id = ANY(%(warehouse_ids)s)'
+        params['warehouse_ids'] = list(warehouse_ids)
+
+    totals = _LEDGER_TOTALS_SQL.format(
+        movement=_MOVEMENT_TABLE,
+        warehouse=_WAREHOUSE_TABLE,
+        where=where,
+        lock='' if dry_run else 'FOR UPDATE OF bw',
+    )
+    if dry_run:
+        sql = totals + 'SELECT id, stock_before, ledger_stock FROM drift ORDER BY id'
+    else:
+        sql = totals + _REBUILD_SQL.format(
+            warehouse=_WAREHOUSE_TABLE,
+            status=_STATUS_CASE.format(stock='drift.ledger_stock'),
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return sorted(rows)
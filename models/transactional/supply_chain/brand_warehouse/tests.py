@@ -0,0 +1,127 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from .models import BrandWarehouse, BrandWarehouseArrival, BrandWarehouseStockMovement, BrandWarehouseUtilization
+from .serializers import BrandWarehouseSerializer, BrandWarehouseSummarySerializer
+from .services import BrandWarehouseStockService
+from .stock_ledger import MovementType, apply_stock_movement, rebuild_stock_from_ledger
+from .views import BrandWarehouseViewSet
+
+
+class BrandWarehouseListingSummaryTests(TestCase):
+    def _warehouse(self, arrivals, utilizations):
+        warehouse = BrandWarehouse.objects.create(license_id='NLI/1', current_stock=100, max_capacity=200)
+        now = timezone.now()
+        BrandWarehouseArrival.objects.bulk_create(
+            BrandWarehouseArrival(
+                brand_warehouse=warehouse, reference_no=f"ARR/{index}",
+                quantity_added=1, previous_stock=0, new_stock=1,
+                arrival_date=now - timedelta(days=arrivals - index),
+            )
+            for index in range(arrivals)
+        )
+        BrandWarehouseUtilization.objects.bulk_create(
+            BrandWarehouseUtilization(
+                brand_warehouse=warehouse, permit_no=f"TP/{index}", date=now.date(),
+                distributor='Distributor', depot_address='Depot', vehicle='NL01',
+                quantity=5, status='APPROVED' if index % 2 else 'PENDING',
+            )
+            for index in range(utilizations)
+        )
+        return warehouse
+
+    def test_summary_fields_come_from_annotations(self):
+        warehouse = self._warehouse(arrivals=15, utilizations=4)
+        self._warehouse(arrivals=0, utilizations=0)
+
+        rows = list(BrandWarehouseStockService.with_listing_summary(BrandWarehouse.objects.order_by('id')))
+        with self.assertNumQueries(0):
+            data = BrandWarehouseSummarySerializer(rows, many=True).data
+            recent = BrandWarehouseSerializer(context={}).get_recent_arrivals(rows[0])
+
+        self.assertEqual(data[0]['utilization_count'], 4)
+        self.assertEqual(data[0]['total_utilized'], 10)
+        self.assertTrue(data[0]['is_new'])
+        self.assertEqual(
+            data[0]['last_arrival_date'],
+            warehouse.arrivals.order_by('-arrival_date').first().arrival_date,
+        )
+        self.assertEqual([row['reference_no'] for row in recent], [f"ARR/{index}" for index in range(14, 4, -1)])
+        self.assertEqual(
+            (data[1]['utilization_count'], data[1]['total_utilized'], data[1]['is_new'], data[1]['last_arrival_date']),
+            (0, 0, False, None),
+        )
+
+
+class StockLedgerTests(TestCase):
+    def setUp(self):
+        self.warehouse = BrandWarehouse.objects.create(
+            license_id='NLI/1', current_stock=0, max_capacity=100, reorder_level=10, status='OUT_OF_STOCK',
+        )
+
+    def test_movements_update_stock_and_status_in_one_statement(self):
+        with self.assertNumQueries(2):
+            self.warehouse.add_stock(50, 'ARR/1')
+        self.assertEqual((self.warehouse.current_stock, self.warehouse.status), (50, 'IN_STOCK'))
+
+        stale = BrandWarehouse.objects.get(pk=self.warehouse.pk)
+        apply_stock_movement(self.warehouse, 60, MovementType.ARRIVAL, reference_no='ARR/2')
+        with self.assertNumQueries(1):
+            movement = apply_stock_movement(stale, -200, MovementType.UTILIZATION, floor_at_zero=True)
+        self.assertEqual((movement.previous_stock, movement.new_stock, movement.quantity), (110, 0, -110))
+
+        self.warehouse.refresh_from_db()
+        self.assertEqual((self.warehouse.current_stock, self.warehouse.status), (0, 'OUT_OF_STOCK'))
+        self.assertEqual(
+            list(self.warehouse.stock_movements.order_by('id').values_list('movement_type', 'quantity')),
+            [('ARRIVAL', 50), ('ARRIVAL', 60), ('UTILIZATION', -110)],
+        )
+
+    def test_utilization_deducts_through_the_ledger(self):
+        self.warehouse.add_stock(40, 'ARR/1')
+        utilization = BrandWarehouseUtilization.objects.create(
+            brand_warehouse=self.warehouse, permit_no='TP/1', date=timezone.now().date(),
+            distributor='Distributor', depot_address='Depot', vehicle='NL01', quantity=35, status='APPROVED',
+        )
+        self.warehouse.refresh_from_db()
+        self.assertEqual((self.warehouse.current_stock, self.warehouse.status), (5, 'LOW_STOCK'))
+        self.assertEqual(
+            BrandWarehouseUtilization.objects.values_list('previous_stock', 'new_stock').get(pk=utilization.pk),
+            (40, 5),
+        )
+
+    def test_rebuild_resets_drifted_stock_from_ledger(self):
+        self.warehouse.add_stock(30, 'ARR/1')
+        BrandWarehouse.objects.filter(pk=self.warehouse.pk).update(current_stock=999, status='OVERSTOCKED')
+
+        self.assertEqual(rebuild_stock_from_ledger(dry_run=True), [(self.warehouse.pk, 999, 30)])
+        self.assertEqual(rebuild_stock_from_ledger(), [(self.warehouse.pk, 999, 30)])
+        self.assertEqual(rebuild_stock_from_ledger(), [])
+
+        self.warehouse.refresh_from_db()
+        self.assertEqual((self.warehouse.current_stock, self.warehouse.status), (30, 'IN_STOCK'))
+        self.assertEqual(BrandWarehouseStockMovement.objects.count(), 1)
+
+    def test_api_edit_keeps_concurrent_movements(self):
+        self.warehouse.add_stock(30, 'ARR/1')
+        stale = BrandWarehouse.objects.get(pk=self.warehouse.pk)
+        apply_stock_movement(self.warehouse, 20, MovementType.ARRIVAL, reference_no='ARR/2')
+
+        serializer = BrandWarehouseSerializer(stale, data={'max_capacity': 200}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        BrandWarehouseViewSet().perform_update(serializer)
+        stale.refresh_from_db()
+        self.assertEqual((stale.current_stock, stale.max_capacity), (50, 200))
+        self.assertEqual(BrandWarehouseStockMovement.objects.count(), 2)
+
+        stale = BrandWarehouse.objects.get(pk=self.warehouse.pk)
+        apply_stock_movement(self.warehouse, -10, MovementType.UTILIZATION)
+        serializer = BrandWarehouseSerializer(stale, data={'current_stock': 45}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        BrandWarehouseViewSet().perform_update(serializer)
+        movement = BrandWarehouseStockMovement.objects.latest('id')
+        self.assertEqual((movement.previous_stock, movement.new_stock, movement.quantity), (40, 45, 5))
+        stale.refresh_from_db()
+        self.assertEqual(stale.current_stock, 45)
@@ -21,6 +21,7 @@ from .production_serializers import (
 )
 from .production_models import ProductionBatch
 from .services import BrandWarehouseStockService
+from .stock_ledger import MovementType, record_stock_change, save_stock_edit
 
 
 def _normalize_role_token(role_name: str) -> str:
@@ -300,7 +301,7 @@ class BrandWarehouseViewSet(viewsets.ModelViewSet):
     ViewSet for Brand Warehouse CRUD operations and custom actions
     Ensures ALL Sikkim brands are always shown (no brands go missing)
     """
-    queryset = BrandWarehouse.objects.all().prefetch_related('utilizations', 'arrivals')
+    queryset = BrandWarehouse.objects.all()
     permission_classes = [IsAuthenticated]
 
     def get_serializer_class(self):
@@ -315,7 +316,9 @@ class BrandWarehouseViewSet(viewsets.ModelViewSet):
         """
         Return brand warehouse queryset with server-side license scoping.
         """
-        queryset = BrandWarehouse.objects.all().select_related('liquor_type', 'brand', 'factory').prefetch_related('utilizations', 'arrivals')
+        queryset = BrandWarehouseStockService.with_listing_summary(
+            BrandWarehouse.objects.all().select_related('liquor_type', 'brand', 'factory', 'capacity_size')
+        )
 
         scoped_to_unit, active_license_id = _get_scope_context(self.request.user)
 
@@ -361,6 +364,16 @@ class BrandWarehouseViewSet(viewsets.ModelViewSet):
             
         return queryset.order_by('factory__factory_name', 'brand__brand_name', 'capacity_size__size_ml')
 
+    def perform_create(self, serializer):
+        """Open the stock ledger for warehouses created with stock on hand."""
+        instance = serializer.save()
+        record_stock_change(instance, 0, MovementType.OPENING, notes='Created through the API')
+
+    def perform_update(self, serializer):
+        """Save the edit; a stock level sent with it is applied through the ledger."""
+        stock = serializer.validated_data.pop('current_stock', None)
+        save_stock_edit(serializer.instance, serializer.save, stock, notes='Edited through the API')
+
     def list(self, request, *args, **kwargs):
         """
         List brand warehouse entries.
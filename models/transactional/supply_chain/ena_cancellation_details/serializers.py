@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import EnaCancellationDetail
+from auth.workflow.action_resolver import WorkflowActionListSerializer, get_action_resolver
 from auth.workflow.constants import WORKFLOW_IDS
 import logging
 import re
@@ -14,6 +15,7 @@ class EnaCancellationDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = EnaCancellationDetail
         fields = '__all__'
+        list_serializer_class = WorkflowActionListSerializer
         extra_kwargs = {
             'our_ref_no': {'required': False},
         }
@@ -112,27 +114,15 @@ class EnaCancellationDetailSerializer(serializers.ModelSerializer):
             status_code = 'CN_00'
             
         # Query Workflow Transitions (New Logic)
-        from auth.workflow.models import WorkflowTransition, WorkflowStage
-        
+        resolver = get_action_resolver(self.context)
         current_stage = obj.current_stage
         if not current_stage:
             # Fallback
-            try:
-                current_stage = WorkflowStage.objects.get(
-                    workflow_id=WORKFLOW_IDS['ENA_CANCELLATION'],
-                    name=obj.status
-                )
-            except WorkflowStage.DoesNotExist:
+            current_stage = resolver.stage_by_name(WORKFLOW_IDS['ENA_CANCELLATION'], obj.status)
+            if not current_stage:
                 return []
-        
-        transitions = WorkflowTransition.objects.filter(from_stage=current_stage)
-        actions = []
-        for t in transitions:
-            cond = t.condition or {}
-            if cond.get('role') == role:
-                action = cond.get('action')
-                if action:
-                    actions.append(action)
+
+        actions = resolver.actions(current_stage, lambda cond: cond.get('role') == role)
 
         # Add VIEW_PERMIT_SLIP using stage semantics instead of hardcoded stage id.
         current_stage_obj = obj.current_stage
@@ -168,16 +158,7 @@ class EnaCancellationDetailSerializer(serializers.ModelSerializer):
     allowed_action_configs = serializers.SerializerMethodField()
 
     def get_allowed_action_configs(self, obj):
-        actions = self.get_allowed_actions(obj)
-        if not actions:
-            return []
-        
-        from auth.workflow.services import WorkflowService
-        configs = []
-        for action_name in actions:
-            config = WorkflowService.get_action_config(action_name)
-            configs.append(config)
-        return configs
+        return get_action_resolver(self.context).action_configs(self.get_allowed_actions(obj))
 
     def create(self, validated_data):
         existing_refs = EnaCancellationDetail.objects.values_list('our_ref_no', flat=True)
@@ -10,6 +10,7 @@ from .models import EnaCancellationDetail
 from .serializers import EnaCancellationDetailSerializer, CancellationCreateSerializer
 from auth.workflow.constants import WORKFLOW_IDS
 from models.transactional.supply_chain.access_control import (
+    get_license_scope,
     has_workflow_access,
     scope_by_profile_or_workflow,
     transition_matches,
@@ -606,7 +607,8 @@ class EnaCancellationDetailViewSet(viewsets.ModelViewSet):
             self.request.user,
             queryset,
             WORKFLOW_IDS['ENA_CANCELLATION'],
-            licensee_field='licensee_id'
+            licensee_field='licensee_id',
+            scope=get_license_scope(self.request),
         )
 
         our_ref_no = self.request.query_params.get('our_ref_no', None)
@@ -667,6 +669,7 @@ class EnaCancellationDetailViewSet(viewsets.ModelViewSet):
             category_tokens=['manufactur'],
             subcategory_tokens=['distiller', 'brew', 'winery', 'beer'],
             requested_license_id=str(serializer.validated_data.get('licensee_id') or ''),
+            scope=get_license_scope(request),
         ) or serializer.validated_data.get('licensee_id')
         if not licensee_id:
             return Response({'error': 'licensee_id is required.'}, status=status.HTTP_400_BAD_REQUEST)
@@ -913,6 +916,7 @@ class EnaCancellationDetailViewSet(viewsets.ModelViewSet):
                 EnaCancellationDetail.objects.filter(pk=cancellation.pk),
                 WORKFLOW_IDS['ENA_CANCELLATION'],
                 licensee_field='licensee_id',
+                scope=get_license_scope(request),
             ).exists():
                 return Response({'error': 'Unauthorized role for this workflow'}, status=status.HTTP_403_FORBIDDEN)
             
@@ -1022,6 +1026,7 @@ class EnaCancellationDetailViewSet(viewsets.ModelViewSet):
                 EnaCancellationDetail.objects.filter(pk=cancellation.pk),
                 WORKFLOW_IDS['ENA_CANCELLATION'],
                 licensee_field='licensee_id',
+                scope=get_license_scope(request),
             ).exists():
                 return Response({'error': 'Unauthorized role for this workflow'}, status=status.HTTP_403_FORBIDDEN)
 
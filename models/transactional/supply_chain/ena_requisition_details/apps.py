@@ -3,4 +3,10 @@ from django.apps import AppConfig
 class EnaRequisitionDetailsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'models.transactional.supply_chain.ena_requisition_details'
-    verbose_name = 'ena_requisition_details'
\ No newline at end of file
+    verbose_name = 'ena_requisition_details'
+
+    def ready(self):
+        # The shared supply_chain package is not an installed app; its license
+        # scope invalidation is wired up here.
+        from models.transactional.supply_chain.signals import connect_license_scope_signals
+        connect_license_scope_signals()
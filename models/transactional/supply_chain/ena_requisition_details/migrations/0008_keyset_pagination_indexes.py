@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-19 19:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ena_requisition_details', '0007_alter_requisitionbulkliterdetail_table_and_more'),
+        ('workflow', '0007_transaction_actor_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enarequisitiondetail',
+            index=models.Index(fields=['created_at', 'id'], name='ena_requisi_created_fb88a3_idx'),
+        ),
+    ]
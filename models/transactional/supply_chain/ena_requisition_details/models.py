@@ -49,6 +49,9 @@ class EnaRequisitionDetail(models.Model):
     class Meta:
         db_table = 'ena_requisition_detail'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     # def __str__(self) -> str:
     #     return f"ENA Req {self.requisition_number} ({self.application_id})"
@@ -0,0 +1,233 @@
+"""
+Per-response prefetch for `EnaRequisitionDetailSerializer`.
+
+The serializer needs, for every requisition, its bulk-liter arrival details and
+review audit, the issuing license (for the establishment name), the latest
+rejection and workflow transaction, cancellations raised against it and any
+active revalidation for the licensee. `RequisitionPrefetch.ensure(rows)` loads
+those for all rows not loaded yet with one IN-query each, so rendering a page
+is pure Python per row. The instance lives in the serializer context; list
+serializers prime it with the whole page, single-object serializers with the
+one row they render.
+"""
+import logging
+from datetime import timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models.functions import Upper
+from django.db.utils import OperationalError, ProgrammingError
+from django.utils import timezone
+
+from auth.workflow.models import Rejection, Transaction
+from models.masters.license.models import License
+from models.transactional.supply_chain.access_control import resolve_manufacturing_license_id_from_license_id
+
+from .models import EnaRequisitionDetail, RequisitionBulkLiterDetail, RequisitionBulkLiterReviewAudit
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_CONTEXT_KEY = 'requisition_prefetch'
+
+REVALIDATION_LOOKBACK_DAYS = 90
+FINISHED_REVALIDATION_STATUS_CODES = ['RV_09', 'RV_APPROVED', 'RV_REJECTED', 'RV_CANCELLED']
+
+
+def expand_license_aliases(raw_license_id):
+    token = str(raw_license_id or '').strip()
+    if not token:
+        return []
+
+    aliases = [token]
+    if token.startswith('NLI/'):
+        aliases.append(f"NA/{token[4:]}")
+    elif token.startswith('NA/'):
+        aliases.append(f"NLI/{token[3:]}")
+    return aliases
+
+
+class RequisitionPrefetch:
+    def __init__(self):
+        self._loaded_ids = set()
+        self._bulk_details = {}
+        self._review_audits = {}
+        self._licenses = {}
+        self._loaded_license_keys = set()
+        self._latest_rejections = {}
+        self._latest_transactions = {}
+        self._cancellations = {}
+        self._loaded_refs = set()
+        self._active_revalidation_licensees = set()
+        self._active_revalidation_permits = set()
+        self._loaded_revalidation_keys = set()
+        self._manufacturing_license_ids = {}
+        self._spirit_prices = {}
+
+    def ensure(self, rows):
+        """Load related data for every requisition in `rows` not loaded yet."""
+        rows = [row for row in rows if row.pk is not None and row.pk not in self._loaded_ids]
+        if not rows:
+            return
+        ids = [row.pk for row in rows]
+        self._loaded_ids.update(ids)
+
+        for requisition_id in ids:
+            self._bulk_details[requisition_id] = []
+        details = RequisitionBulkLiterDetail.objects.filter(requisition_id__in=ids).order_by('-updated_at')
+        for detail in details:
+            self._bulk_details[detail.requisition_id].append(detail)
+
+        try:
+            audits = RequisitionBulkLiterReviewAudit.objects.filter(requisition_id__in=ids)
+            self._review_audits.update({audit.requisition_id: audit for audit in audits})
+        except (ProgrammingError, OperationalError):
+            pass
+
+        self._load_licenses(rows)
+        self._load_latest_workflow_rows(ids)
+        self._load_cancellations(rows)
+        self._load_active_revalidations(rows)
+
+    def _load_licenses(self, rows):
+        keys = {
+            alias.upper()
+            for row in rows
+            for alias in expand_license_aliases(getattr(row, 'licensee_id', ''))
+        } - self._loaded_license_keys
+        if not keys:
+            return
+        self._loaded_license_keys.update(keys)
+        licenses = (
+            License.objects.annotate(license_key=Upper('license_id'))
+            .filter(license_key__in=keys)
+            .select_related('source_content_type')
+            .prefetch_related('source_application')
+        )
+        for license_obj in licenses:
+            self._licenses.setdefault(license_obj.license_key, license_obj)
+
+    def _load_latest_workflow_rows(self, ids):
+        content_type = ContentType.objects.get_for_model(EnaRequisitionDetail)
+        object_ids = [str(requisition_id) for requisition_id in ids]
+        rejections = (
+            Rejection.objects.filter(content_type=content_type, object_id__in=object_ids)
+            .select_related('rejected_by__role')
+            .order_by('object_id', '-rejected_on')
+            .distinct('object_id')
+        )
+        self._latest_rejections.update({rejection.object_id: rejection for rejection in rejections})
+
+        transactions = (
+            Transaction.objects.filter(content_type=content_type, object_id__in=object_ids)
+            .select_related('performed_by__role', 'forwarded_by', 'stage')
+            .order_by('object_id', '-timestamp')
+            .distinct('object_id')
+        )
+        self._latest_transactions.update({txn.object_id: txn for txn in transactions})
+
+    def _load_cancellations(self, rows):
+        from models.transactional.supply_chain.ena_cancellation_details.models import EnaCancellationDetail
+
+        refs = {str(row.our_ref_no) for row in rows if getattr(row, 'our_ref_no', None)} - self._loaded_refs
+        if not refs:
+            return
+        self._loaded_refs.update(refs)
+        for ref_no in refs:
+            self._cancellations[ref_no] = []
+        cancellations = EnaCancellationDetail.objects.filter(
+            models.Q(requisition_ref_no__in=refs) | models.Q(our_ref_no__in=refs)
+        ).select_related('current_stage')
+        for cancellation in cancellations:
+            for ref_no in {cancellation.requisition_ref_no, cancellation.our_ref_no}:
+                if ref_no in refs:
+                    self._cancellations[ref_no].append(cancellation)
+
+    def _load_active_revalidations(self, rows):
+        from models.transactional.supply_chain.ena_revalidation_details.models import EnaRevalidationDetail
+
+        licensee_ids, permit_tokens = set(), set()
+        for row in rows:
+            licensee_id, permit_token = self._revalidation_keys(row)
+            if licensee_id:
+                licensee_ids.add(licensee_id)
+            elif permit_token:
+                permit_tokens.add(permit_token)
+        licensee_ids -= {key for kind, key in self._loaded_revalidation_keys if kind == 'licensee'}
+        permit_tokens -= {key for kind, key in self._loaded_revalidation_keys if kind == 'permits'}
+        if not licensee_ids and not permit_tokens:
+            return
+        self._loaded_revalidation_keys.update(('licensee', key) for key in licensee_ids)
+        self._loaded_revalidation_keys.update(('permits', key) for key in permit_tokens)
+
+        ninety_days_ago = timezone.now() - timedelta(days=REVALIDATION_LOOKBACK_DAYS)
+        active = (
+            EnaRevalidationDetail.objects.filter(created_at__gte=ninety_days_ago)
+            .filter(models.Q(licensee_id__in=licensee_ids) | models.Q(details_permits_number__in=permit_tokens))
+            .exclude(status_code__in=FINISHED_REVALIDATION_STATUS_CODES)
+            .exclude(status__icontains='cancelled')
+            .exclude(status__icontains='rejected')
+            .exclude(current_stage__is_final=True)
+            .values_list('licensee_id', 'details_permits_number')
+        )
+        for licensee_id, permit_token in active:
+            if licensee_id in licensee_ids:
+                self._active_revalidation_licensees.add(licensee_id)
+            if permit_token in permit_tokens:
+                self._active_revalidation_permits.add(permit_token)
+
+    @staticmethod
+    def _revalidation_keys(row):
+        return (
+            str(getattr(row, 'licensee_id', '') or '').strip(),
+            str(getattr(row, 'details_permits_number', '') or '').strip(),
+        )
+
+    def bulk_details(self, requisition):
+        """Arrival details of a requisition, most recently updated first."""
+        return self._bulk_details.get(requisition.pk, [])
+
+    def review_audit(self, requisition):
+        return self._review_audits.get(requisition.pk)
+
+    def license(self, license_id):
+        return self._licenses.get(str(license_id or '').strip().upper())
+
+    def latest_rejection(self, requisition):
+        return self._latest_rejections.get(str(requisition.pk))
+
+    def latest_transaction(self, requisition):
+        return self._latest_transactions.get(str(requisition.pk))
+
+    def cancellations(self, ref_no):
+        """Cancellations raised against a requisition ref, or None if the ref was not prefetched."""
+        return self._cancellations.get(str(ref_no or ''))
+
+    def has_active_revalidation(self, requisition):
+        licensee_id, permit_token = self._revalidation_keys(requisition)
+        if licensee_id:
+            return licensee_id in self._active_revalidation_licensees
+        if permit_token:
+            return permit_token in self._active_revalidation_permits
+        return False
+
+    def manufacturing_license_id(self, raw_license_id):
+        raw_license_id = str(raw_license_id or '').strip()
+        if raw_license_id not in self._manufacturing_license_ids:
+            self._manufacturing_license_ids[raw_license_id] = resolve_manufacturing_license_id_from_license_id(
+                raw_license_id
+            )
+        return self._manufacturing_license_ids[raw_license_id]
+
+    def spirit_price(self, key, resolve):
+        """Bulk spirit price per BL memoized by (kind, strength, licensee)."""
+        if key not in self._spirit_prices:
+            self._spirit_prices[key] = resolve()
+        return self._spirit_prices[key]
+
+
+def get_requisition_prefetch(context) -> RequisitionPrefetch:
+    prefetch = context.get(PREFETCH_CONTEXT_KEY)
+    if prefetch is None:
+        prefetch = RequisitionPrefetch()
+        context[PREFETCH_CONTEXT_KEY] = prefetch
+    return prefetch
@@ -1,23 +1,30 @@
 from rest_framework import serializers
 from django.db import transaction, models
 from decimal import Decimal, InvalidOperation, ROUND_DOWN, ROUND_HALF_UP
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.utils import ProgrammingError, OperationalError
-from django.contrib.contenttypes.models import ContentType
 from .models import EnaRequisitionDetail, RequisitionBulkLiterDetail, RequisitionBulkLiterReviewAudit
+from .prefetch import expand_license_aliases, get_requisition_prefetch
+from auth.workflow.action_resolver import WorkflowActionListSerializer, get_action_resolver
 from auth.workflow.constants import WORKFLOW_IDS
-from auth.workflow.models import Rejection
-from models.masters.license.models import License
 import logging
 import re
 from models.transactional.supply_chain.access_control import (
     condition_role_matches,
-    resolve_manufacturing_license_id_from_license_id,
+    get_license_scope,
     resolve_user_license_id_by_category_subcategory,
 )
 
 logger = logging.getLogger(__name__)
 
+
+class EnaRequisitionListSerializer(WorkflowActionListSerializer):
+    """Loads related rows for the whole page before serializing it."""
+
+    def to_representation(self, data):
+        rows = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        get_requisition_prefetch(self.context).ensure(rows)
+        return super().to_representation(rows)
+
+
 class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
     allowed_actions = serializers.SerializerMethodField()
     allowed_action_configs = serializers.SerializerMethodField()
@@ -37,14 +44,21 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = EnaRequisitionDetail
         fields = '__all__'
+        list_serializer_class = EnaRequisitionListSerializer
         extra_kwargs = {
             'status': {'required': False},
             'status_code': {'required': False},
             'our_ref_no': {'required': False},  # Auto-generated
         }
         
+    def _prefetch(self, obj):
+        prefetch = get_requisition_prefetch(self.context)
+        prefetch.ensure([obj])
+        return prefetch
+
     def to_representation(self, instance):
         """Override to ensure all fields are always included"""
+        prefetch = self._prefetch(instance)
         data = super().to_representation(instance)
         
         # Explicitly ensure critical fields are included with proper values
@@ -75,16 +89,13 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         try:
             raw_licensee_id = str(getattr(instance, 'licensee_id', '') or '').strip()
             if raw_licensee_id:
-                data['licensee_id'] = resolve_manufacturing_license_id_from_license_id(raw_licensee_id)
+                data['licensee_id'] = prefetch.manufacturing_license_id(raw_licensee_id)
         except Exception:
             data['licensee_id'] = str(getattr(instance, 'licensee_id', '') or '')
         # Arrival details summary (permit-wise partial approvals supported)
-        try:
-            details_qs = RequisitionBulkLiterDetail.objects.filter(requisition=instance).order_by('-updated_at')
-        except Exception:
-            details_qs = RequisitionBulkLiterDetail.objects.none()
+        details = prefetch.bulk_details(instance)
 
-        if details_qs.exists():
+        if details:
             data['has_arrival_details'] = True
 
             # Determine total permits for the requisition.
@@ -121,9 +132,8 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
                 cancel_requested_permits = {token for token in cancel_requested_permits if token in permitted}
                 cancelled_permits = {token for token in cancelled_permits if token in permitted}
 
-            approved_details = details_qs.filter(approval_status=RequisitionBulkLiterDetail.ApprovalStatus.APPROVED)
-            pending_details = details_qs.filter(approval_status=RequisitionBulkLiterDetail.ApprovalStatus.PENDING)
-            rejected_details = details_qs.filter(approval_status=RequisitionBulkLiterDetail.ApprovalStatus.REJECTED)
+            approved_details = [row for row in details if row.approval_status == RequisitionBulkLiterDetail.ApprovalStatus.APPROVED]
+            pending_details = [row for row in details if row.approval_status == RequisitionBulkLiterDetail.ApprovalStatus.PENDING]
 
             def _permits_in_detail(detail_row):
                 tanker_rows = detail_row.tanker_details or []
@@ -146,7 +156,7 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
 
             # Compute effective/latest status per permit (APPROVED > PENDING > REJECTED).
             permit_status_by_permit = {}
-            for row in details_qs:
+            for row in details:
                 status_token = str(getattr(row, 'approval_status', '') or '').upper()
                 for token in _permits_in_detail(row):
                     if token in cancelled_permits:
@@ -184,7 +194,7 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
                 except Exception:
                     pass
 
-            latest_row = details_qs.first()
+            latest_row = details[0]
             # Inventory total should include APPROVED + PENDING (exclude rejected).
             inventory_total = (approved_total + pending_total)
             inventory_tankers = (approved_tanker_count + pending_tanker_count)
@@ -264,14 +274,12 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
             data['arrival_reviewed_at'] = None
             data['arrival_reviewed_by'] = ''
             data['arrival_review_remarks'] = ''
-            try:
-                audit = instance.bulk_liter_review_audit
+            audit = prefetch.review_audit(instance)
+            if audit is not None:
                 data['arrival_approval_status'] = audit.last_status or ''
                 data['arrival_reviewed_at'] = audit.reviewed_at.isoformat() if audit.reviewed_at else None
                 data['arrival_reviewed_by'] = audit.reviewed_by or ''
                 data['arrival_review_remarks'] = audit.review_remarks or ''
-            except (ObjectDoesNotExist, ProgrammingError, OperationalError):
-                pass
         
         # Ensure status_code is set - derive from stage if not set
         if not instance.status_code or instance.status_code == 'RQ_00':
@@ -281,25 +289,10 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         
         return data
 
-    def _expand_license_aliases(self, raw_license_id):
-        token = str(raw_license_id or '').strip()
-        if not token:
-            return []
-
-        aliases = [token]
-        if token.startswith('NLI/'):
-            aliases.append(f"NA/{token[4:]}")
-        elif token.startswith('NA/'):
-            aliases.append(f"NLI/{token[3:]}")
-        return aliases
-
     def get_establishment_name(self, obj):
-        for license_id in self._expand_license_aliases(getattr(obj, 'licensee_id', '')):
-            license_obj = (
-                License.objects.filter(license_id__iexact=license_id)
-                .select_related('source_content_type')
-                .first()
-            )
+        prefetch = self._prefetch(obj)
+        for license_id in expand_license_aliases(getattr(obj, 'licensee_id', '')):
+            license_obj = prefetch.license(license_id)
             if not license_obj:
                 continue
 
@@ -323,14 +316,9 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         if stored_role:
             return self._humanize_role_name(stored_role)
 
+        prefetch = self._prefetch(obj)
         try:
-            content_type = ContentType.objects.get_for_model(obj.__class__)
-            latest_rejection = (
-                Rejection.objects.filter(content_type=content_type, object_id=str(obj.pk))
-                .select_related('rejected_by__role')
-                .order_by('-rejected_on')
-                .first()
-            )
+            latest_rejection = prefetch.latest_rejection(obj)
             if latest_rejection:
                 role_name = str(getattr(getattr(latest_rejection.rejected_by, 'role', None), 'name', '') or '').strip()
                 if role_name:
@@ -349,11 +337,7 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         # Fallback: requisition reject flow uses WorkflowService.advance_stage(),
         # which always writes a Transaction with performed_by/forwarded_by role.
         try:
-            latest_txn = (
-                obj.transactions.select_related('performed_by__role', 'forwarded_by', 'stage')
-                .order_by('-timestamp')
-                .first()
-            )
+            latest_txn = prefetch.latest_transaction(obj)
             if not latest_txn:
                 return ''
 
@@ -380,24 +364,15 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
             return stored_reason
 
         # Fallback for historical rows where reason may only exist in workflow rejection remarks.
+        prefetch = self._prefetch(obj)
         try:
-            content_type = ContentType.objects.get_for_model(obj.__class__)
-            latest_rejection = (
-                Rejection.objects.filter(content_type=content_type, object_id=str(obj.pk))
-                .order_by('-rejected_on')
-                .values_list('remarks', flat=True)
-                .first()
-            )
-            rejection_reason = str(latest_rejection or '').strip()
+            latest_rejection = prefetch.latest_rejection(obj)
+            rejection_reason = str(getattr(latest_rejection, 'remarks', '') or '').strip()
             if rejection_reason:
                 return rejection_reason
 
-            latest_txn_remarks = (
-                obj.transactions.order_by('-timestamp')
-                .values_list('remarks', flat=True)
-                .first()
-            )
-            txn_reason = str(latest_txn_remarks or '').strip()
+            latest_txn = prefetch.latest_transaction(obj)
+            txn_reason = str(getattr(latest_txn, 'remarks', '') or '').strip()
             if txn_reason and txn_reason.lower() not in {'action: reject', 'reject'}:
                 return txn_reason
             return ''
@@ -492,18 +467,14 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
             # Fallback for simple exact matches if not caught above
             role = cleaned_role_name
         
-        # Query Workflow Transitions
-        from auth.workflow.models import WorkflowTransition
-        
         current_stage = obj.current_stage
         if not current_stage:
             current_stage = self._resolve_stage_for_object(obj)
             if not current_stage:
                 return []
 
-        transitions = WorkflowTransition.objects.filter(from_stage=current_stage).select_related('to_stage')
         actions = []
-        for t in transitions:
+        for t in get_action_resolver(self.context).outgoing(current_stage):
             cond = t.condition or {}
             if not condition_role_matches(cond, request.user):
                 continue
@@ -533,19 +504,15 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         if bool(getattr(stage, 'is_final', False)):
             return True
 
-        from auth.workflow.models import WorkflowTransition
-        has_outgoing = WorkflowTransition.objects.filter(from_stage=stage).exists()
-        return not has_outgoing
+        return not get_action_resolver(self.context).has_outgoing(stage)
 
     def _normalize_stage_token(self, value):
         token = ''.join(ch for ch in str(value or '').lower() if ch.isalnum())
         return token
 
     def _resolve_stage_for_object(self, obj):
-        from auth.workflow.models import WorkflowStage
-
         workflow_id = getattr(obj, 'workflow_id', None) or WORKFLOW_IDS['ENA_REQUISITION']
-        stages = list(WorkflowStage.objects.filter(workflow_id=workflow_id))
+        stages = get_action_resolver(self.context).workflow_stages(workflow_id)
         if not stages:
             return None
 
@@ -741,17 +708,24 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         merged = f"{status_token} {stage_token}"
         return 'reject' in merged
 
-    def _approved_cancelled_permit_numbers_for_requisition(self, requisition_ref_no):
-        if not requisition_ref_no:
-            return set()
+    def _cancellations_for_requisition(self, requisition_ref_no):
+        rows = get_requisition_prefetch(self.context).cancellations(requisition_ref_no)
+        if rows is not None:
+            return rows
 
         from models.transactional.supply_chain.ena_cancellation_details.models import EnaCancellationDetail
 
-        rows = EnaCancellationDetail.objects.filter(
+        return EnaCancellationDetail.objects.filter(
             models.Q(requisition_ref_no=requisition_ref_no) |
             models.Q(our_ref_no=requisition_ref_no)
         ).select_related('current_stage')
 
+    def _approved_cancelled_permit_numbers_for_requisition(self, requisition_ref_no):
+        if not requisition_ref_no:
+            return set()
+
+        rows = self._cancellations_for_requisition(requisition_ref_no)
+
         approved_numbers = set()
         for row in rows:
             if not self._is_commissioner_approved_cancellation(row):
@@ -766,12 +740,7 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         if not requisition_ref_no:
             return set()
 
-        from models.transactional.supply_chain.ena_cancellation_details.models import EnaCancellationDetail
-
-        rows = EnaCancellationDetail.objects.filter(
-            models.Q(requisition_ref_no=requisition_ref_no) |
-            models.Q(our_ref_no=requisition_ref_no)
-        ).select_related('current_stage')
+        rows = self._cancellations_for_requisition(requisition_ref_no)
 
         requested_numbers = set()
         for row in rows:
@@ -806,48 +775,7 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         A revalidation is considered active if it's not in a final/completed state.
         """
         try:
-            from models.transactional.supply_chain.ena_revalidation_details.models import EnaRevalidationDetail
-            
-            # Check for revalidations with the same licensee_id and similar reference pattern
-            # or created recently (within last 90 days) for the same licensee
-            from django.utils import timezone
-            from datetime import timedelta
-            
-            ninety_days_ago = timezone.now() - timedelta(days=90)
-
-            licensee_id = str(getattr(obj, 'licensee_id', '') or '').strip()
-            details_token = str(getattr(obj, 'details_permits_number', '') or '').strip()
-
-            # Look for revalidations that:
-            # 1. Belong to the same licensee (preferred)
-            # 2. Or match permit number batch when licensee is missing
-            # 3. Were created recently (within 90 days)
-            # 4. Are not in a final/completed state (status_code not ending in approved/rejected/cancelled)
-            base_qs = EnaRevalidationDetail.objects.filter(created_at__gte=ninety_days_ago)
-            if licensee_id:
-                base_qs = base_qs.filter(licensee_id=licensee_id)
-            elif details_token:
-                base_qs = base_qs.filter(details_permits_number=details_token)
-            else:
-                return False
-
-            active_revalidations = base_qs.exclude(
-                status_code__in=['RV_09', 'RV_APPROVED', 'RV_REJECTED', 'RV_CANCELLED']
-            ).exclude(
-                status__icontains='cancelled'
-            ).exclude(
-                status__icontains='rejected'
-            )
-            
-            # Additional check: if current_stage.is_final is True, it's not active
-            active_count = 0
-            for revalidation in active_revalidations:
-                if revalidation.current_stage and getattr(revalidation.current_stage, 'is_final', False):
-                    continue
-                active_count += 1
-            
-            return active_count > 0
-            
+            return self._prefetch(obj).has_active_revalidation(obj)
         except Exception as e:
             logger.exception("Error checking active revalidation for requisition=%s", getattr(obj, "id", None))
             return False
@@ -907,6 +835,7 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
                 category_tokens=['manufactur'],
                 subcategory_tokens=['distiller', 'brew', 'winery', 'beer'],
                 requested_license_id=str(validated_data.get('licensee_id') or ''),
+                scope=get_license_scope(request),
             )
             if resolved:
                 validated_data['licensee_id'] = resolved
@@ -995,20 +924,18 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
         if not spirit_kind:
             return 0.0
 
+        price_bl = get_requisition_prefetch(self.context).spirit_price(
+            (spirit_kind.lower(), strength.lower(), licensee_id),
+            lambda: self._resolve_spirit_price_bl(spirit_kind, strength, licensee_id),
+        )
+        if price_bl is None:
+            return 0.0
+        return price_bl * total_bl
+
+    def _resolve_spirit_price_bl(self, spirit_kind, strength, licensee_id):
         try:
             from models.masters.supply_chain.bulk_spirit.models import BulkSpiritType
 
-            def _expand_aliases(value: str) -> list[str]:
-                value = str(value or '').strip()
-                if not value:
-                    return []
-                aliases = [value]
-                if value.startswith('NLI/'):
-                    aliases.append(f"NA/{value[4:]}")
-                elif value.startswith('NA/'):
-                    aliases.append(f"NLI/{value[3:]}")
-                return aliases
-
             qs = BulkSpiritType.objects.filter(
                 bulk_spirit_kind_type__iexact=spirit_kind
             )
@@ -1017,17 +944,17 @@ class EnaRequisitionDetailSerializer(serializers.ModelSerializer):
 
             # Prefer license-specific bulk spirit pricing when configured.
             if licensee_id:
-                row = qs.filter(license_id__in=_expand_aliases(licensee_id)).order_by('sprit_id').first()
+                row = qs.filter(license_id__in=expand_license_aliases(licensee_id)).order_by('sprit_id').first()
             else:
                 row = None
             if row is None:
                 row = qs.order_by('sprit_id').first()
             if row and row.price_bl is not None:
-                return float(row.price_bl) * total_bl
+                return float(row.price_bl)
         except Exception:
             pass
 
-        return 0.0
+        return None
 
 
 class RequisitionBulkLiterDetailSerializer(serializers.ModelSerializer):
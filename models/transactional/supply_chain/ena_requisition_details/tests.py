@@ -0,0 +1,213 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from auth.user.models import OICOfficerAssignment
+from auth.workflow.models import Workflow, WorkflowStage
+from models.masters.core.models import (
+    District, LicenseCategory, LicenseSubcategory, LicenseType, PoliceStation, State, Subdivision,
+)
+from models.masters.license.models import License
+from models.masters.supply_chain.profile.models import UserManufacturingUnit
+from models.transactional.supply_chain.access_control import get_license_scope, scope_by_profile_or_workflow
+from utils.pagination import Cursor, KeysetPagination, encode_cursor
+
+from models.transactional.new_license_application.models import NewLicenseApplication
+
+from .models import EnaRequisitionDetail, RequisitionBulkLiterDetail
+from .serializers import EnaRequisitionDetailSerializer
+
+
+def _requisition(ref_no, licensee_id):
+    now = timezone.now()
+    return EnaRequisitionDetail.objects.create(
+        requisiton_number_of_permits=1,
+        details_permits_number=f"{ref_no}/1",
+        our_ref_no=ref_no,
+        requisition_date=now,
+        lifted_from_distillery_name='Distillery',
+        branch_purpose='Purpose',
+        via_route='Route',
+        grain_ena_number=Decimal('100.00'),
+        status='Submitted',
+        state='Nagaland',
+        totalbl=Decimal('100.00'),
+        approval_date=now,
+        lifted_from='Distillery',
+        purpose_name='Purpose',
+        check_post_name='Check Post',
+        licensee_id=licensee_id,
+    )
+
+
+class RequisitionPrefetchTests(TestCase):
+    def _list_queries(self):
+        rows = EnaRequisitionDetail.objects.select_related('current_stage', 'workflow')
+        with CaptureQueriesContext(connection) as ctx:
+            data = EnaRequisitionDetailSerializer(rows, many=True).data
+        return data, len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        first = _requisition('REQ/1', 'NLI/1')
+        RequisitionBulkLiterDetail.objects.create(
+            requisition=first, reference_no='REQ/1', total_bulk_liter=Decimal('10.00'),
+        )
+        self._list_queries()  # warm the content type cache
+        data, one_row_queries = self._list_queries()
+        self.assertEqual(len(data), 1)
+
+        for index in range(2, 6):
+            _requisition(f"REQ/{index}", "NLI/1")
+        data, many_row_queries = self._list_queries()
+        self.assertEqual(len(data), 5)
+        self.assertEqual(many_row_queries, one_row_queries)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class LicenseScopeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        subdivision = Subdivision.objects.create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=district,
+        )
+        self.district, self.subdivision = district, subdivision
+        self.user = get_user_model().objects.create_user(
+            email='scope@example.com', first_name='Scope', last_name='User', phone_number='9999999912',
+            district=district, subdivision=subdivision, address='Gangtok', password='password123',
+        )
+        UserManufacturingUnit.objects.create(user=self.user, manufacturing_unit_name='Unit', licensee_id='NLI/1')
+        _requisition('REQ/1', 'NA/1')
+        _requisition('REQ/2', 'NLI/2')
+
+    def _request(self, user=None):
+        request = RequestFactory().get('/')
+        # A fresh user, so `oic_assignment` is not read from an instance cache.
+        request.user = self.user if user is None else get_user_model().objects.get(pk=user.pk)
+        return request
+
+    def _oic_assignment(self, officer, licensee_id):
+        category = LicenseCategory.objects.create(license_category='Distillery')
+        subcategory = LicenseSubcategory.objects.create(description='Distillery', category=category)
+        workflow = Workflow.objects.create(name='License Approval')
+        application = NewLicenseApplication.objects.create(
+            application_id='NLA/225/2026-27/0001', workflow=workflow,
+            current_stage=WorkflowStage.objects.create(workflow=workflow, name='approved', is_final=True),
+            license_type=LicenseType.objects.create(license_type='Manufacturing'), license_category=category,
+            license_sub_category=subcategory, establishment_name='Distillery', mode_of_operation='Self',
+            site_type='New', applicant_name='Applicant', father_husband_name='Father', dob='2000-01-01',
+            gender='Male', nationality='Indian', residential_status='Resident',
+            present_address='Address', permanent_address='Address', pan='ABCDE1234F',
+            email='applicant@example.com', mobile_number='9999999999', has_sikkim_certificate='Yes',
+            has_excise_license='No', criminal_conviction='No', site_district=self.district,
+            site_subdivision=self.subdivision,
+            police_station=PoliceStation.objects.create(police_station='Gangtok PS', subdivision_code=self.subdivision),
+            location_category='Urban', location_name='Gangtok', ward_name='Ward 1',
+            business_address='Business Address', road_name='Road 1', pin_code='737101',
+            construction_type='Permanent', site_owned='Yes', noc_obtained='Yes',
+        )
+        license = License.objects.create(
+            license_id=licensee_id, source_content_type=ContentType.objects.get_for_model(NewLicenseApplication),
+            source_object_id=application.application_id, source_type='new_license_application',
+            license_category=category, excise_district=self.district,
+            valid_up_to=timezone.now() + timedelta(days=30),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            return OICOfficerAssignment.objects.create(
+                officer=officer, approved_application=application, license=license,
+                licensee_id=licensee_id, establishment_name='Distillery',
+            )
+
+    def _scoped_refs(self, request):
+        queryset = scope_by_profile_or_workflow(
+            request.user, EnaRequisitionDetail.objects.all(), 1, scope=get_license_scope(request),
+        )
+        return sorted(queryset.values_list('our_ref_no', flat=True))
+
+    def test_scope_is_built_once_per_request_and_cached(self):
+        request = self._request()
+        self.assertEqual(self._scoped_refs(request), ['REQ/1'])
+        with self.assertNumQueries(1):
+            self.assertEqual(self._scoped_refs(request), ['REQ/1'])
+        with self.assertNumQueries(1):
+            self.assertEqual(self._scoped_refs(self._request()), ['REQ/1'])
+
+    def test_manufacturing_unit_change_invalidates_scope(self):
+        self.assertEqual(self._scoped_refs(self._request()), ['REQ/1'])
+        with self.captureOnCommitCallbacks(execute=True):
+            UserManufacturingUnit.objects.create(user=self.user, manufacturing_unit_name='Unit 2', licensee_id='NLI/2')
+        self.assertEqual(self._scoped_refs(self._request()), ['REQ/1', 'REQ/2'])
+
+    def test_oic_reassignment_drops_previous_officer_scope(self):
+        officer = get_user_model().objects.create_user(
+            email='oic@example.com', first_name='Oic', last_name='User', phone_number='9999999913',
+            district=self.district, subdivision=self.subdivision, address='Gangtok', password='password123',
+        )
+        assignment = self._oic_assignment(officer, 'NLI/2')
+        self.assertEqual(self._scoped_refs(self._request(officer)), ['REQ/2'])
+        self.assertEqual(self._scoped_refs(self._request(self.user)), ['REQ/1'])
+
+
+        with self.captureOnCommitCallbacks(execute=True):
+            assignment.officer = self.user
+            assignment.save()
+        self.assertEqual(self._scoped_refs(self._request(officer)), [])
+        self.assertEqual(self._scoped_refs(self._request(self.user)), ['REQ/1', 'REQ/2'])
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        created_at = timezone.now()
+        for index in range(1, 6):
+            _requisition(f"REQ/{index}", 'NLI/1')
+        # Two rows share a timestamp so the primary key has to break the tie.
+        EnaRequisitionDetail.objects.filter(our_ref_no__in=['REQ/2', 'REQ/3']).update(created_at=created_at)
+
+    def _page(self, url, **headers):
+        paginator = KeysetPagination()
+        request = Request(APIRequestFactory().get(url, **headers))
+        rows = paginator.paginate_queryset(EnaRequisitionDetail.objects.all(), request)
+        if rows is None:
+            return None, None
+        return [row.our_ref_no for row in rows], paginator.get_paginated_response([]).data
+
+    def test_pages_walk_forward_and_back_without_gaps(self):
+        seen = []
+        url = '/requisitions/?page_size=2'
+        pages = []
+        while url:
+            refs, data = self._page(url)
+            pages.append((refs, data))
+            seen.extend(refs)
+            url = data['next']
+        expected = list(EnaRequisitionDetail.objects.order_by('-created_at', '-id').values_list('our_ref_no', flat=True))
+        self.assertEqual(seen, expected)
+        self.assertEqual([len(refs) for refs, _ in pages], [2, 2, 1])
+
+        refs, _ = self._page(pages[2][1]['previous'])
+        self.assertEqual(refs, pages[1][0])
+
+    def test_page_size_is_capped_and_legacy_header_disables_paging(self):
+        with self.settings(KEYSET_PAGINATION_MAX_PAGE_SIZE=3):
+            refs, data = self._page('/requisitions/?page_size=1000&include_count=approx')
+        self.assertEqual(len(refs), 3)
+        self.assertIsInstance(data['count'], int)
+        self.assertTrue(data['count_is_approximate'])
+
+        self.assertEqual(self._page('/requisitions/', HTTP_X_PAGINATION='off'), (None, None))
+
+    def test_tampered_cursor_is_not_found(self):
+        cursor = encode_cursor(Cursor(['not-a-date', 'abc'], False))
+        with self.assertRaises(NotFound):
+            self._page(f'/requisitions/?cursor={cursor}')
@@ -21,6 +21,7 @@ from .models import (
 from .serializers import EnaRequisitionDetailSerializer, RequisitionBulkLiterDetailSerializer
 from auth.workflow.constants import WORKFLOW_IDS
 from models.transactional.supply_chain.access_control import (
+    get_license_scope,
     has_workflow_access,
     scope_by_profile_or_workflow,
     transition_matches,
@@ -189,12 +190,13 @@ class EnaRequisitionDetailListCreateAPIView(generics.ListCreateAPIView):
     serializer_class = EnaRequisitionDetailSerializer
 
     def get_queryset(self):
-        queryset = EnaRequisitionDetail.objects.all()
+        queryset = EnaRequisitionDetail.objects.select_related('current_stage', 'workflow')
         queryset = scope_by_profile_or_workflow(
             self.request.user,
             queryset,
             WORKFLOW_IDS['ENA_REQUISITION'],
-            licensee_field='licensee_id'
+            licensee_field='licensee_id',
+            scope=get_license_scope(self.request),
         )
         queryset = _filter_commissioner_visible_requisitions(self.request.user, queryset)
 
@@ -216,12 +218,13 @@ class EnaRequisitionDetailRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDe
     serializer_class = EnaRequisitionDetailSerializer
 
     def get_queryset(self):
-        queryset = EnaRequisitionDetail.objects.all()
+        queryset = EnaRequisitionDetail.objects.select_related('current_stage', 'workflow')
         queryset = scope_by_profile_or_workflow(
             self.request.user,
             queryset,
             WORKFLOW_IDS['ENA_REQUISITION'],
-            licensee_field='licensee_id'
+            licensee_field='licensee_id',
+            scope=get_license_scope(self.request),
         )
         return queryset
     
@@ -290,7 +293,8 @@ class RequisitionArrivalBulkLiterDetailAPIView(APIView):
             request.user,
             EnaRequisitionDetail.objects.all(),
             WORKFLOW_IDS['ENA_REQUISITION'],
-            licensee_field='licensee_id'
+            licensee_field='licensee_id',
+            scope=get_license_scope(request),
         )
         return queryset.get(pk=pk)
 
@@ -632,7 +636,8 @@ class RequisitionArrivalBulkLiterDetailsListAPIView(APIView):
                 request.user,
                 EnaRequisitionDetail.objects.all(),
                 WORKFLOW_IDS['ENA_REQUISITION'],
-                licensee_field='licensee_id'
+                licensee_field='licensee_id',
+                scope=get_license_scope(request),
             )
             requisition_ids = list(requisitions.values_list('id', flat=True))
             if not requisition_ids:
@@ -752,7 +757,8 @@ class RequisitionArrivalBulkLiterReviewAPIView(APIView):
                 request.user,
                 EnaRequisitionDetail.objects.all(),
                 WORKFLOW_IDS['ENA_REQUISITION'],
-                licensee_field='licensee_id'
+                licensee_field='licensee_id',
+                scope=get_license_scope(request),
             )
             detail = RequisitionBulkLiterDetail.objects.select_related('requisition').get(
                 pk=detail_id,
@@ -1072,49 +1078,9 @@ class PerformRequisitionActionAPIView(APIView):
         Delay after requisition approval before auto-creating revalidation.
         Source: public.timer (SupplyChainTimerConfig) code=ENA_REVALIDATION_ACTIVATION
         """
-        default_seconds = 10
-        try:
-            from models.masters.core.models import SupplyChainTimerConfig
+        from models.masters.core.timers import get_seconds
 
-            cfg = (
-                SupplyChainTimerConfig.objects
-                .filter(code='ENA_REVALIDATION_ACTIVATION', is_active=True)
-                .order_by('-updated_at', '-id')
-                .first()
-            )
-            if not cfg:
-                return default_seconds
-
-            unit = str(getattr(cfg, 'delay_unit', '') or '').lower().strip()
-            value = int(getattr(cfg, 'delay_value', 0) or 0)
-            if value < 0:
-                value = 0
-
-            if unit.endswith('s'):
-                unit = unit[:-1]
-            unit_aliases = {
-                'sec': SupplyChainTimerConfig.TIMER_UNIT_SECOND,
-                'secs': SupplyChainTimerConfig.TIMER_UNIT_SECOND,
-                'min': SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
-                'mins': SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
-                'hr': SupplyChainTimerConfig.TIMER_UNIT_HOUR,
-                'hrs': SupplyChainTimerConfig.TIMER_UNIT_HOUR,
-                'mon': getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'),
-                'mos': getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'),
-            }
-            unit = unit_aliases.get(unit, unit)
-
-            multipliers = {
-                SupplyChainTimerConfig.TIMER_UNIT_SECOND: 1,
-                SupplyChainTimerConfig.TIMER_UNIT_MINUTE: 60,
-                SupplyChainTimerConfig.TIMER_UNIT_HOUR: 60 * 60,
-                SupplyChainTimerConfig.TIMER_UNIT_DAY: 24 * 60 * 60,
-                getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'): 30 * 24 * 60 * 60,
-            }
-            multiplier = multipliers.get(unit, 1)
-            return max(0, value * multiplier)
-        except Exception:
-            return default_seconds
+        return get_seconds('ENA_REVALIDATION_ACTIVATION', 10)
 
     def _schedule_revalidation_activation(self, requisition, approved_at):
         delay_seconds = self._resolve_revalidation_activation_delay_seconds()
@@ -1360,6 +1326,7 @@ class PerformRequisitionActionAPIView(APIView):
                     EnaRequisitionDetail.objects.filter(pk=requisition.pk),
                     WORKFLOW_IDS['ENA_REQUISITION'],
                     licensee_field='licensee_id',
+                    scope=get_license_scope(request),
                 ).exists()
                 if not in_scope:
                     raise PermissionDenied("You are not allowed to modify this requisition.")
@@ -1369,6 +1336,7 @@ class PerformRequisitionActionAPIView(APIView):
                 EnaRequisitionDetail.objects.filter(pk=requisition.pk),
                 WORKFLOW_IDS['ENA_REQUISITION'],
                 licensee_field='licensee_id',
+                scope=get_license_scope(request),
             ).exists():
                 return Response({
                     'status': 'error',
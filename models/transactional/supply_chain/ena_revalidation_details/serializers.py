@@ -5,9 +5,11 @@ from datetime import timedelta
 from django.db import connection
 from rest_framework import serializers
 
+from auth.workflow.action_resolver import WorkflowActionListSerializer, get_action_resolver
 from auth.workflow.constants import WORKFLOW_IDS
 from models.transactional.supply_chain.access_control import (
     condition_role_matches,
+    get_license_scope,
     resolve_user_license_id_by_category_subcategory,
 )
 
@@ -25,6 +27,7 @@ class EnaRevalidationDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = EnaRevalidationDetail
         fields = '__all__'
+        list_serializer_class = WorkflowActionListSerializer
         extra_kwargs = {
             'our_ref_no': {'required': False},
         }
@@ -42,21 +45,20 @@ class EnaRevalidationDetailSerializer(serializers.ModelSerializer):
         if not raw_status:
             return None
 
-        from auth.workflow.models import WorkflowStage
-
-        exact_stage = WorkflowStage.objects.filter(
-            workflow_id=workflow_id,
-            name=raw_status,
-        ).first()
+        resolver = get_action_resolver(self.context)
+        exact_stage = resolver.stage_by_name(workflow_id, raw_status)
         if exact_stage:
             return exact_stage
 
         status_token = self._normalize_status_token(raw_status)
         if status_token.startswith('importpermitextends45days'):
-            return WorkflowStage.objects.filter(
-                workflow_id=workflow_id,
-                name__istartswith='IMPORT PERMIT EXTENDS 45 DAYS',
-            ).order_by('id').first()
+            return next(
+                (
+                    stage for stage in resolver.workflow_stages(workflow_id)
+                    if stage.name.lower().startswith('import permit extends 45 days')
+                ),
+                None,
+            )
 
         return None
 
@@ -236,20 +238,13 @@ class EnaRevalidationDetailSerializer(serializers.ModelSerializer):
         if not role:
             return []
 
-        from auth.workflow.models import WorkflowTransition
-
         current_stage = self._resolve_stage(obj, current_stage=obj.current_stage)
         if not current_stage:
             return []
 
-        transitions = WorkflowTransition.objects.filter(from_stage=current_stage)
-        actions = []
-        for transition in transitions:
-            cond = transition.condition or {}
-            if condition_role_matches(cond, request.user):
-                action = cond.get('action')
-                if action:
-                    actions.append(action)
+        actions = get_action_resolver(self.context).actions(
+            current_stage, lambda cond: condition_role_matches(cond, request.user)
+        )
 
         status_token = self._normalize_status_token(effective_status)
         current_stage_token = self._normalize_status_token(current_stage.name)
@@ -273,17 +268,7 @@ class EnaRevalidationDetailSerializer(serializers.ModelSerializer):
         return list(set(actions))
 
     def get_allowed_action_configs(self, obj):
-        actions = self.get_allowed_actions(obj)
-        if not actions:
-            return []
-
-        from auth.workflow.services import WorkflowService
-
-        configs = []
-        for action_name in actions:
-            config = WorkflowService.get_action_config(action_name)
-            configs.append(config)
-        return configs
+        return get_action_resolver(self.context).action_configs(self.get_allowed_actions(obj))
 
     def create(self, validated_data):
         validated_data.pop('our_ref_no', None)
@@ -312,6 +297,7 @@ class EnaRevalidationDetailSerializer(serializers.ModelSerializer):
                 category_tokens=['manufactur'],
                 subcategory_tokens=['distiller', 'brew', 'winery', 'beer'],
                 requested_license_id=str(validated_data.get('licensee_id') or ''),
+                scope=get_license_scope(request),
             )
             if resolved:
                 validated_data['licensee_id'] = resolved
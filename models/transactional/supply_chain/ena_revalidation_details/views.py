@@ -14,6 +14,7 @@ from models.transactional.supply_chain.ena_requisition_details.models import Ena
 from models.transactional.supply_chain.ena_requisition_details.models import EnaRevalidationActivationSchedule
 from auth.workflow.constants import WORKFLOW_IDS
 from models.transactional.supply_chain.access_control import (
+    get_license_scope,
     has_workflow_access,
     scope_by_profile_or_workflow,
     transition_matches,
@@ -58,49 +59,9 @@ class EnaRevalidationDetailViewSet(viewsets.ModelViewSet):
         return True
 
     def _resolve_revalidation_activation_delay_seconds(self) -> int:
-        default_seconds = 10
-        try:
-            from models.masters.core.models import SupplyChainTimerConfig
+        from models.masters.core.timers import get_seconds
 
-            cfg = (
-                SupplyChainTimerConfig.objects
-                .filter(code='ENA_REVALIDATION_ACTIVATION', is_active=True)
-                .order_by('-updated_at', '-id')
-                .first()
-            )
-            if not cfg:
-                return default_seconds
-
-            unit = str(getattr(cfg, 'delay_unit', '') or '').lower().strip()
-            value = int(getattr(cfg, 'delay_value', 0) or 0)
-            if value < 0:
-                value = 0
-
-            if unit.endswith('s'):
-                unit = unit[:-1]
-            unit_aliases = {
-                'sec': SupplyChainTimerConfig.TIMER_UNIT_SECOND,
-                'secs': SupplyChainTimerConfig.TIMER_UNIT_SECOND,
-                'min': SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
-                'mins': SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
-                'hr': SupplyChainTimerConfig.TIMER_UNIT_HOUR,
-                'hrs': SupplyChainTimerConfig.TIMER_UNIT_HOUR,
-                'mon': getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'),
-                'mos': getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'),
-            }
-            unit = unit_aliases.get(unit, unit)
-
-            multipliers = {
-                SupplyChainTimerConfig.TIMER_UNIT_SECOND: 1,
-                SupplyChainTimerConfig.TIMER_UNIT_MINUTE: 60,
-                SupplyChainTimerConfig.TIMER_UNIT_HOUR: 60 * 60,
-                SupplyChainTimerConfig.TIMER_UNIT_DAY: 24 * 60 * 60,
-                getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'): 30 * 24 * 60 * 60,
-            }
-            multiplier = multipliers.get(unit, 1)
-            return max(0, value * multiplier)
-        except Exception:
-            return default_seconds
+        return get_seconds('ENA_REVALIDATION_ACTIVATION', 10)
 
     def _find_existing_revalidation_for_requisition(self, requisition):
         details_token = str(getattr(requisition, 'details_permits_number', '') or '').strip()
@@ -221,6 +182,7 @@ class EnaRevalidationDetailViewSet(viewsets.ModelViewSet):
             EnaRequisitionDetail.objects.filter(updated_at__gte=now - timedelta(days=90)),
             WORKFLOW_IDS['ENA_REQUISITION'],
             licensee_field='licensee_id',
+            scope=get_license_scope(self.request),
         )
         eligible_req_ids = list(scoped_reqs.values_list('id', flat=True)[:5000])
 
@@ -530,7 +492,8 @@ class EnaRevalidationDetailViewSet(viewsets.ModelViewSet):
             self.request.user,
             queryset,
             WORKFLOW_IDS['ENA_REVALIDATION'],
-            licensee_field='licensee_id'
+            licensee_field='licensee_id',
+            scope=get_license_scope(self.request),
         )
 
     def get_serializer_context(self):   
@@ -714,6 +677,7 @@ class EnaRevalidationDetailViewSet(viewsets.ModelViewSet):
                 EnaRevalidationDetail.objects.filter(pk=revalidation.pk),
                 WORKFLOW_IDS['ENA_REVALIDATION'],
                 licensee_field='licensee_id',
+                scope=get_license_scope(request),
             ).exists():
                 return Response({'error': 'Unauthorized role for this workflow'}, status=status.HTTP_403_FORBIDDEN)
 
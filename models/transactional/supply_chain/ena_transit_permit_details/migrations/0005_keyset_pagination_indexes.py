@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-19 19:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ena_transit_permit_details', '0004_update_size_ml_fk_to_masterliquorcapacity'),
+        ('liquor_data', '0003_alter_masterliquorcapacity_options'),
+        ('workflow', '0007_transaction_actor_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enatransitpermitdetail',
+            index=models.Index(fields=['created_at', 'id'], name='transit_per_created_9eb388_idx'),
+        ),
+    ]
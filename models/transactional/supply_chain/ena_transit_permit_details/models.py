@@ -69,6 +69,9 @@ class EnaTransitPermitDetail(models.Model):
     class Meta:
         db_table = 'transit_permit_details'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
 
 from django.conf import settings
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import EnaTransitPermitDetail
+from auth.workflow.action_resolver import WorkflowActionListSerializer, get_action_resolver
 from auth.workflow.constants import WORKFLOW_IDS
 from models.transactional.supply_chain.access_control import condition_role_matches
 from decimal import Decimal
@@ -78,6 +79,7 @@ class EnaTransitPermitDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = EnaTransitPermitDetail
         fields = '__all__'
+        list_serializer_class = WorkflowActionListSerializer
 
     def get_size_ml(self, obj) -> int:
         try:
@@ -291,7 +293,7 @@ class EnaTransitPermitDetailSerializer(serializers.ModelSerializer):
     def get_allowed_actions(self, obj):
         """
         Returns a list of allowed actions based on user role and current workflow stage.
-        Queries WorkflowTransition table to dynamically determine allowed actions.
+        Transitions come from the response-wide workflow action resolver.
         """
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
@@ -301,69 +303,34 @@ class EnaTransitPermitDetailSerializer(serializers.ModelSerializer):
         if not user_role:
             return []
 
-        # Query Workflow Transitions
-        from auth.workflow.models import WorkflowTransition, WorkflowStage
-
-        current_stage = obj.current_stage
-        if not current_stage:
-            current_stage = WorkflowStage.objects.filter(
-                workflow_id=WORKFLOW_IDS['TRANSIT_PERMIT'],
-                is_initial=True
-            ).first()
-            if not current_stage:
+        resolver = get_action_resolver(self.context)
+        current_stage_id = obj.current_stage_id
+        if not current_stage_id:
+            initial_stage = resolver.initial_stage(WORKFLOW_IDS['TRANSIT_PERMIT'])
+            if not initial_stage:
                 return []
+            current_stage_id = initial_stage.id
 
-        transitions = WorkflowTransition.objects.filter(from_stage=current_stage)
-        actions = []
-        for t in transitions:
-            cond = t.condition or {}
-            if not condition_role_matches(cond, request.user):
-                continue
-
-            action = cond.get('action')
-            if action:
-                actions.append(str(action).upper())
-
-        return list(set(actions))  # Unique actions
+        actions = resolver.actions(current_stage_id, lambda cond: condition_role_matches(cond, request.user))
+        return list({str(action).upper() for action in actions})  # Unique actions
 
     def get_current_stage_entry_actions(self, obj):
         """
         Returns actions that can move *into* the current stage.
         Useful for UI categorization without relying on stage-name strings.
         """
-        if not obj.current_stage:
+        if not obj.current_stage_id:
             return []
 
-        from auth.workflow.models import WorkflowTransition
-
-        actions = []
-        incoming = WorkflowTransition.objects.filter(
-            workflow_id=WORKFLOW_IDS['TRANSIT_PERMIT'],
-            to_stage=obj.current_stage
-        )
-        for t in incoming:
-            cond = t.condition or {}
-            action = cond.get('action')
-            if action:
-                actions.append(str(action).upper())
-
-        return sorted(list(set(actions)))
+        return sorted(get_action_resolver(self.context).entry_actions(
+            obj.current_stage_id, workflow_id=WORKFLOW_IDS['TRANSIT_PERMIT']
+        ))
     
     # New Field: Returns Full UI Config for Actions
     allowed_action_configs = serializers.SerializerMethodField()
 
     def get_allowed_action_configs(self, obj):
-        actions = self.get_allowed_actions(obj)
-        if not actions:
-            return []
-        
-        from auth.workflow.services import WorkflowService
-        configs = []
-        for action_name in actions:
-            config = WorkflowService.get_action_config(action_name)
-            configs.append(config)
-        
-        return configs
+        return get_action_resolver(self.context).action_configs(self.get_allowed_actions(obj))
 
 class TransitPermitProductSerializer(serializers.Serializer):
     """
@@ -17,6 +17,7 @@ from .serializers import (
 from .models import EnaTransitPermitDetail
 from auth.workflow.constants import WORKFLOW_IDS
 from models.transactional.supply_chain.access_control import (
+    get_license_scope,
     has_workflow_access,
     scope_by_profile_or_workflow,
     transition_matches,
@@ -776,7 +777,8 @@ class GetTransitPermitAPIView(generics.ListAPIView):
             self.request.user,
             queryset,
             WORKFLOW_IDS['TRANSIT_PERMIT'],
-            licensee_field='licensee_id'
+            licensee_field='licensee_id',
+            scope=get_license_scope(self.request),
         )
 
         # Support both `bill_no` and camelCase `billNo` to match the public endpoint.
@@ -798,7 +800,8 @@ class GetTransitPermitDetailAPIView(generics.RetrieveAPIView):
             self.request.user,
             queryset,
             WORKFLOW_IDS['TRANSIT_PERMIT'],
-            licensee_field='licensee_id'
+            licensee_field='licensee_id',
+            scope=get_license_scope(self.request),
         )
 
 
@@ -1284,6 +1287,10 @@ class PerformTransitPermitActionAPIView(views.APIView):
                 BrandWarehouseUtilization,
                 BrandWarehouseTpCancellation,
             )
+            from models.transactional.supply_chain.brand_warehouse.stock_ledger import (
+                MovementType,
+                apply_stock_movement,
+            )
             from django.db import connection as _db_conn
 
             # Reset sequence to avoid primary key conflicts from manual DB operations
@@ -1297,12 +1304,14 @@ class PerformTransitPermitActionAPIView(views.APIView):
             if utilizations.exists():
                 for utilization in utilizations:
                     warehouse = utilization.brand_warehouse
-                    previous_stock = warehouse.current_stock
-
-                    warehouse.current_stock += utilization.quantity
-                    warehouse.save()
-                    warehouse.update_status()
-                    new_stock = warehouse.current_stock
+                    movement = apply_stock_movement(
+                        warehouse,
+                        utilization.quantity,
+                        MovementType.CANCELLATION_REFUND,
+                        reference_no=permit.bill_no,
+                    )
+                    previous_stock = movement.previous_stock
+                    new_stock = movement.new_stock
 
                     utilization.status = 'CANCELLED'
                     utilization.save()
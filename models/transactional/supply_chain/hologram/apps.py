@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class HologramConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'models.transactional.supply_chain.hologram'
+
+    def ready(self):
+        import models.transactional.supply_chain.hologram.signals
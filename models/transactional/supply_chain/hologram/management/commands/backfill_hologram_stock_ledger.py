@@ -0,0 +1,49 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from models.transactional.supply_chain.hologram.models import HologramMonthlyStockLedger
+from models.transactional.supply_chain.hologram.stock_ledger import ALL_LICENSES, monthly_movements
+
+
+class Command(BaseCommand):
+    help = 'Rebuild hologram_monthly_stock_ledger from rolls arrivals and approved daily register entries'
+
+    def handle(self, *args, **options):
+        # (license_id, hologram_type) -> {month: [arrivals, issued, wastage]}
+        scopes = defaultdict(lambda: defaultdict(lambda: [0, 0, 0]))
+        for (license_id, hologram_type, month), values in monthly_movements().items():
+            if not hologram_type or month is None:
+                continue
+            targets = [ALL_LICENSES] + ([license_id] if license_id else [])
+            for scope in targets:
+                bucket = scopes[(scope, hologram_type)][month]
+                for idx, value in enumerate(values):
+                    bucket[idx] += value
+
+        rows = []
+        for (license_id, hologram_type), months in scopes.items():
+            balance = 0
+            for month in sorted(months):
+                arrivals, issued, wastage = months[month]
+                closing = balance + arrivals - issued - wastage
+                rows.append(HologramMonthlyStockLedger(
+                    license_id=license_id,
+                    hologram_type=hologram_type,
+                    month=month,
+                    opening=balance,
+                    arrivals=arrivals,
+                    issued=issued,
+                    wastage=wastage,
+                    closing=closing,
+                ))
+                balance = closing
+
+        with transaction.atomic():
+            HologramMonthlyStockLedger.objects.all().delete()
+            HologramMonthlyStockLedger.objects.bulk_create(rows, batch_size=1000)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Rebuilt {len(rows)} ledger rows across {len(scopes)} license/type scopes"
+        ))
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from models.transactional.supply_chain.hologram.models import HologramRequest, HologramRequestSla
+from models.transactional.supply_chain.hologram.sla import (
+    compute_request_sla,
+    resolve_action_stage_ids,
+    resolve_deadline_time,
+)
+
+
+class Command(BaseCommand):
+    help = 'Backfill/rebuild hologram_request_sla rows used by the commissioner dashboard'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ref-no', dest='ref_no', help='Only rebuild the SLA row for this request reference number')
+
+    def handle(self, *args, **options):
+        requests = HologramRequest.objects.select_related('current_stage').order_by('id')
+        if options.get('ref_no'):
+            requests = requests.filter(ref_no=options['ref_no'])
+
+        # Workflow transitions and the deadline timer are shared by every request.
+        approval_to_stage_ids, reject_to_stage_ids = resolve_action_stage_ids()
+        deadline_time = resolve_deadline_time()
+
+        total = requests.count()
+        self.stdout.write(f"Rebuilding SLA rows for {total} hologram requests...")
+
+        updated = 0
+        for req in requests.iterator(chunk_size=500):
+            values = compute_request_sla(req, approval_to_stage_ids, reject_to_stage_ids, deadline_time)
+            HologramRequestSla.objects.update_or_create(hologram_request=req, defaults=values)
+            updated += 1
+            if updated % 100 == 0:
+                self.stdout.write(f"  Progress: {updated}/{total}")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Successfully rebuilt {updated} SLA rows"))
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hologram', '0006_alter_hologramserialrange_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HologramRequestSla',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('license_id', models.CharField(blank=True, db_index=True, max_length=100, null=True)),
+                ('submitted_at', models.DateTimeField(blank=True, null=True)),
+                ('approved_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('completion_date', models.DateField(blank=True, null=True)),
+                ('deadline', models.DateTimeField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('APPLIED', 'Applied'), ('UNDER_PROCESS', 'Under Process'), ('COMPLETED', 'Completed'), ('REJECTED', 'Rejected')], default='APPLIED', max_length=20)),
+                ('status_message', models.CharField(blank=True, max_length=100, null=True)),
+                ('completed_on_time', models.BooleanField(blank=True, null=True)),
+                ('officer_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('hologram_request', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='sla', to='hologram.hologramrequest')),
+            ],
+            options={
+                'db_table': 'hologram_request_sla',
+                'ordering': ['-submitted_at', '-id'],
+                'indexes': [models.Index(fields=['status', 'deadline'], name='hologram_re_status_1814fd_idx'), models.Index(fields=['submitted_at'], name='hologram_re_submitt_8de1e1_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.7 on 2026-10-19 18:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hologram', '0007_hologramrequestsla'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HologramMonthlyStockLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('license_id', models.CharField(blank=True, default='', max_length=100)),
+                ('hologram_type', models.CharField(max_length=50)),
+                ('month', models.DateField(help_text='First day of the ledger month')),
+                ('opening', models.IntegerField(default=0)),
+                ('arrivals', models.IntegerField(default=0)),
+                ('issued', models.IntegerField(default=0)),
+                ('wastage', models.IntegerField(default=0)),
+                ('closing', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'hologram_monthly_stock_ledger',
+                'ordering': ['license_id', 'hologram_type', 'month'],
+                'constraints': [models.UniqueConstraint(fields=('license_id', 'hologram_type', 'month'), name='uniq_hologram_stock_ledger_month')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.7 on 2026-10-19 19:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hologram', '0008_hologrammonthlystockledger'),
+        ('hologram_supplier', '0002_seed_default_supplier'),
+        ('license', '0003_license_issue_valid_datetime'),
+        ('profile', '0002_delete_supplychainuserprofile'),
+        ('workflow', '0007_transaction_actor_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='dailyhologramregister',
+            name='daily_holog_usage_d_c68e2c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='dailyhologramregister',
+            index=models.Index(fields=['usage_date', 'id'], name='daily_holog_usage_d_5a0195_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hologramprocurement',
+            index=models.Index(fields=['date', 'id'], name='hologram_pr_date_c26b6e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hologramrequest',
+            index=models.Index(fields=['submission_date', 'id'], name='hologram_re_submiss_302c81_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hologramrollsdetails',
+            index=models.Index(fields=['received_date', 'id'], name='hologram_ro_receive_e7ec24_idx'),
+        ),
+    ]
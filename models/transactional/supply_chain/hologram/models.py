@@ -70,6 +70,7 @@ class HologramProcurement(models.Model):
         indexes = [
             models.Index(fields=['licensee']),
             models.Index(fields=['current_stage']),
+            models.Index(fields=['date', 'id']),
         ]
 
     def __str__(self):
@@ -120,6 +121,9 @@ class HologramRequest(models.Model):
     class Meta:
         db_table = 'hologram_request'
         ordering = ['-submission_date']
+        indexes = [
+            models.Index(fields=['submission_date', 'id']),
+        ]
 
     def __str__(self):
         return f"{self.ref_no} - {self.hologram_type}"
@@ -197,6 +201,7 @@ class HologramRollsDetails(models.Model):
             models.Index(fields=['type']),
             models.Index(fields=['status']),
             models.Index(fields=['procurement']),
+            models.Index(fields=['received_date', 'id']),
         ]
     
     def __str__(self):
@@ -384,7 +389,7 @@ class DailyHologramRegister(models.Model):
             models.Index(fields=['licensee', 'approval_status']),
             models.Index(fields=['license_id', 'approval_status']),
             models.Index(fields=['cartoon_number', 'hologram_type']),
-            models.Index(fields=['usage_date']),
+            models.Index(fields=['usage_date', 'id']),
         ]
 
     def __str__(self):
@@ -533,3 +538,89 @@ class HologramUsageHistory(models.Model):
             if resolved:
                 self.license_id = resolved
         super().save(*args, **kwargs)
+
+
+class HologramRequestSla(models.Model):
+    """
+    Maintained SLA snapshot for a hologram request.
+
+    Rows are refreshed from workflow transactions and daily register entries
+    (see `sla.refresh_request_sla`) so the commissioner dashboard can read
+    them with a single filtered query instead of re-deriving them per request.
+    Time-dependent states (overdue, "no action taken") are derived at read time
+    from `deadline` and the request usage date.
+    """
+    STATUS_APPLIED = 'APPLIED'
+    STATUS_UNDER_PROCESS = 'UNDER_PROCESS'
+    STATUS_COMPLETED = 'COMPLETED'
+    STATUS_REJECTED = 'REJECTED'
+
+    STATUS_CHOICES = [
+        (STATUS_APPLIED, 'Applied'),
+        (STATUS_UNDER_PROCESS, 'Under Process'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_REJECTED, 'Rejected'),
+    ]
+
+    hologram_request = models.OneToOneField(HologramRequest, on_delete=models.CASCADE, related_name='sla')
+    # Denormalized license for OIC/licensee scoping on the dashboard.
+    license_id = models.CharField(max_length=100, blank=True, null=True, db_index=True)
+
+    submitted_at = models.DateTimeField(null=True, blank=True)
+    approved_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    # Usage date of the last daily register entry that completed the request.
+    completion_date = models.DateField(null=True, blank=True)
+    deadline = models.DateTimeField(null=True, blank=True)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_APPLIED)
+    status_message = models.CharField(max_length=100, blank=True, null=True)
+    completed_on_time = models.BooleanField(null=True, blank=True)
+    officer_name = models.CharField(max_length=255, blank=True, null=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'hologram_request_sla'
+        ordering = ['-submitted_at', '-id']
+        indexes = [
+            models.Index(fields=['status', 'deadline']),
+            models.Index(fields=['submitted_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.hologram_request_id} - {self.status}"
+
+
+class HologramMonthlyStockLedger(models.Model):
+    """
+    Persisted monthly hologram stock balance per (license, hologram type, month).
+
+    `license_id=''` holds the all-licensee totals used when a report is not
+    scoped to one license. Rows are rolled forward by `stock_ledger.refresh_month`
+    and can be rebuilt with the `backfill_hologram_stock_ledger` command.
+    """
+    license_id = models.CharField(max_length=100, blank=True, default='')
+    hologram_type = models.CharField(max_length=50)  # LOCAL/EXPORT/DEFENCE
+    month = models.DateField(help_text='First day of the ledger month')
+
+    opening = models.IntegerField(default=0)
+    arrivals = models.IntegerField(default=0)
+    issued = models.IntegerField(default=0)
+    wastage = models.IntegerField(default=0)
+    closing = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'hologram_monthly_stock_ledger'
+        ordering = ['license_id', 'hologram_type', 'month']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['license_id', 'hologram_type', 'month'],
+                name='uniq_hologram_stock_ledger_month',
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.license_id or 'ALL'} {self.hologram_type} {self.month:%Y-%m}: {self.closing}"
@@ -3,6 +3,7 @@ from datetime import timedelta
 from django.utils import timezone
 from .models import HologramProcurement, HologramRequest
 from auth.workflow.models import Transaction, Objection
+from auth.workflow.action_resolver import WorkflowActionListSerializer, get_action_resolver
 import logging
 
 logger = logging.getLogger(__name__)
@@ -67,6 +68,7 @@ class HologramProcurementSerializer(serializers.ModelSerializer):
     class Meta:
         model = HologramProcurement
         fields = '__all__'
+        list_serializer_class = WorkflowActionListSerializer
         read_only_fields = ('ref_no', 'date', 'workflow', 'current_stage', 'payment_status', 'manufacturing_unit', 'licensee', 'license', 'arrival_date')
 
     def to_representation(self, instance):
@@ -189,34 +191,19 @@ class HologramProcurementSerializer(serializers.ModelSerializer):
             return []
 
         # Find allowed transitions from current stage for this role
-        from auth.workflow.models import WorkflowTransition
-        if not obj.current_stage:
+        if not obj.current_stage_id:
             return []
-            
-        transitions = WorkflowTransition.objects.filter(from_stage=obj.current_stage)
-        actions = []
-        for t in transitions:
-            cond = t.condition or {}
-            if _condition_role_matches(cond, request):
-                action = cond.get('action')
-                if action:
-                    actions.append(action)
+
+        actions = get_action_resolver(self.context).actions(
+            obj.current_stage_id, lambda cond: _condition_role_matches(cond, request)
+        )
         return list(set(actions))
 
     # New Field: Returns Full UI Config for Actions
     allowed_action_configs = serializers.SerializerMethodField()
 
     def get_allowed_action_configs(self, obj):
-        actions = self.get_allowed_actions(obj)
-        if not actions:
-            return []
-        
-        from auth.workflow.services import WorkflowService
-        configs = []
-        for action_name in actions:
-            config = WorkflowService.get_action_config(action_name)
-            configs.append(config)
-        return configs
+        return get_action_resolver(self.context).action_configs(self.get_allowed_actions(obj))
 
 class HologramRequestSerializer(serializers.ModelSerializer):
     licensee_name = serializers.CharField(source='licensee.manufacturing_unit_name', read_only=True)
@@ -235,6 +222,7 @@ class HologramRequestSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = HologramRequest
+        list_serializer_class = WorkflowActionListSerializer
         fields = [
             'id', 'ref_no', 'submission_date', 'usage_date', 'quantity', 'hologram_type',
             'issued_assets', 'rolls_assigned', 'licensee', 'license_id', 'licensee_name',
@@ -409,18 +397,9 @@ class HologramRequestSerializer(serializers.ModelSerializer):
             return []
 
     def get_current_stage_entry_actions(self, obj):
-        if not obj.current_stage:
+        if not obj.current_stage_id:
             return []
-
-        from auth.workflow.models import WorkflowTransition
-        transitions = WorkflowTransition.objects.filter(to_stage=obj.current_stage)
-        actions = []
-        for t in transitions:
-            cond = t.condition or {}
-            action = cond.get('action')
-            if action:
-                actions.append(str(action).upper())
-        return list(dict.fromkeys(actions))
+        return get_action_resolver(self.context).entry_actions(obj.current_stage_id)
 
     def get_allowed_actions(self, obj):
         request = self.context.get('request')
@@ -430,34 +409,19 @@ class HologramRequestSerializer(serializers.ModelSerializer):
         if _get_user_role_id(request) is None and not getattr(request.user, 'role', None):
             return []
 
-        from auth.workflow.models import WorkflowTransition
-        if not obj.current_stage:
+        if not obj.current_stage_id:
             return []
-            
-        transitions = WorkflowTransition.objects.filter(from_stage=obj.current_stage)
-        actions = []
-        for t in transitions:
-            cond = t.condition or {}
-            if _condition_role_matches(cond, request):
-                action = cond.get('action')
-                if action:
-                    actions.append(action)
+
+        actions = get_action_resolver(self.context).actions(
+            obj.current_stage_id, lambda cond: _condition_role_matches(cond, request)
+        )
         return list(set(actions))
 
     # New Field: Returns Full UI Config for Actions
     allowed_action_configs = serializers.SerializerMethodField()
 
     def get_allowed_action_configs(self, obj):
-        actions = self.get_allowed_actions(obj)
-        if not actions:
-            return []
-        
-        from auth.workflow.services import WorkflowService
-        configs = []
-        for action_name in actions:
-            config = WorkflowService.get_action_config(action_name)
-            configs.append(config)
-        return configs
+        return get_action_resolver(self.context).action_configs(self.get_allowed_actions(obj))
 
 class TransactionSerializer(serializers.ModelSerializer):
     performed_by_name = serializers.CharField(source='performed_by.username', read_only=True)
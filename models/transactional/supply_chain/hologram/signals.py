@@ -0,0 +1,105 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from auth.workflow.models import Transaction
+from .models import DailyHologramRegister, HologramRequest, HologramRollsDetails
+from .sla import schedule_request_sla_refresh
+from .stock_ledger import schedule_month_refresh
+
+# Fields whose change can move a row's contribution to the monthly stock ledger.
+REGISTER_LEDGER_FIELDS = {'approval_status', 'issued_qty', 'wastage_qty', 'usage_date', 'hologram_type', 'license_id'}
+ROLL_LEDGER_FIELDS = {'total_count', 'received_date', 'type', 'license_id'}
+
+
+@receiver(post_save, sender=HologramRequest)
+def refresh_sla_on_request_save(sender, instance, **kwargs):
+    schedule_request_sla_refresh(instance.pk)
+
+
+@receiver(post_save, sender=Transaction)
+def refresh_sla_on_transaction_save(sender, instance, created, **kwargs):
+    if not created:
+        return
+    if instance.content_type_id != ContentType.objects.get_for_model(HologramRequest).id:
+        return
+    schedule_request_sla_refresh(instance.object_id)
+
+
+@receiver(post_save, sender=DailyHologramRegister)
+@receiver(post_delete, sender=DailyHologramRegister)
+def refresh_sla_on_register_change(sender, instance, **kwargs):
+    request_id = instance.hologram_request_id
+    if not request_id and instance.reference_no:
+        request_id = (
+            HologramRequest.objects.filter(ref_no=instance.reference_no)
+            .values_list('id', flat=True)
+            .first()
+        )
+    schedule_request_sla_refresh(request_id)
+
+
+def _register_ledger_scope(register):
+    license_id = register.license_id or getattr(register.licensee, 'licensee_id', '')
+    return license_id, register.hologram_type, register.usage_date
+
+
+def _roll_ledger_scope(roll):
+    license_id = roll.license_id or getattr(getattr(getattr(roll, 'procurement', None), 'licensee', None), 'licensee_id', '')
+    return license_id, roll.type, roll.received_date
+
+
+def _schedule_scope_refreshes(instance, scope):
+    """Refresh the ledger month `instance` now counts in, and the one it counted in before this save."""
+    previous = getattr(instance, '_ledger_previous_scope', None)
+    instance._ledger_previous_scope = None
+    schedule_month_refresh(*scope)
+    if previous is not None and previous != scope:
+        schedule_month_refresh(*previous)
+
+
+@receiver(pre_save, sender=DailyHologramRegister)
+def remember_register_ledger_scope(sender, instance, update_fields=None, **kwargs):
+    instance._ledger_previous_scope = None
+    if instance.pk is None or (update_fields is not None and not REGISTER_LEDGER_FIELDS.intersection(update_fields)):
+        return
+    previous = sender._base_manager.select_related('licensee').filter(pk=instance.pk).first()
+    if previous is not None:
+        instance._ledger_previous_scope = _register_ledger_scope(previous)
+
+
+@receiver(pre_save, sender=HologramRollsDetails)
+def remember_roll_ledger_scope(sender, instance, update_fields=None, **kwargs):
+    instance._ledger_previous_scope = None
+    if instance.pk is None or (update_fields is not None and not ROLL_LEDGER_FIELDS.intersection(update_fields)):
+        return
+    previous = sender._base_manager.select_related('procurement__licensee').filter(pk=instance.pk).first()
+    if previous is not None:
+        instance._ledger_previous_scope = _roll_ledger_scope(previous)
+
+
+@receiver(post_save, sender=DailyHologramRegister)
+def roll_forward_ledger_on_register_save(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and not REGISTER_LEDGER_FIELDS.intersection(update_fields):
+        return
+    if created and instance.approval_status != DailyHologramRegister.APPROVAL_STATUS_APPROVED:
+        return
+    _schedule_scope_refreshes(instance, _register_ledger_scope(instance))
+
+
+@receiver(post_save, sender=HologramRollsDetails)
+def roll_forward_ledger_on_roll_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not ROLL_LEDGER_FIELDS.intersection(update_fields):
+        return
+    _schedule_scope_refreshes(instance, _roll_ledger_scope(instance))
+
+
+@receiver(post_delete, sender=DailyHologramRegister)
+def roll_forward_ledger_on_register_delete(sender, instance, **kwargs):
+    if instance.approval_status == DailyHologramRegister.APPROVAL_STATUS_APPROVED:
+        schedule_month_refresh(*_register_ledger_scope(instance))
+
+
+@receiver(post_delete, sender=HologramRollsDetails)
+def roll_forward_ledger_on_roll_delete(sender, instance, **kwargs):
+    schedule_month_refresh(*_roll_ledger_scope(instance))
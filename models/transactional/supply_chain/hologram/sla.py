@@ -0,0 +1,174 @@
+"""
+Maintenance of `HologramRequestSla` rows.
+
+The commissioner dashboard reads SLA state from `hologram_request_sla` instead of
+re-deriving it per request. Rows are refreshed whenever a workflow transaction,
+the request itself or one of its daily register entries is saved.
+"""
+from datetime import datetime, time
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction as db_transaction
+from django.db.models import Q
+from django.utils import timezone
+import logging
+
+from auth.workflow.constants import WORKFLOW_IDS
+from auth.workflow.models import Transaction, WorkflowTransition
+from .models import DailyHologramRegister, HologramRequest, HologramRequestSla
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_TIMER_CODE = 'HOLOGRAM_DAILY_ENTRY_DEADLINE_TIME'
+DEFAULT_DEADLINE_MINUTES = 17 * 60  # 5:00 PM fallback only
+
+_REJECTION_STAGE_HINTS = (
+    'reject',
+    'not approved', 'not_approved', 'notapproved',
+    'no action', 'no_action', 'noaction',
+    'auto reject', 'auto_reject',
+)
+
+
+def resolve_deadline_time():
+    """
+    Daily register deadline (time of day) from public.timer.
+
+    Store as minutes-from-midnight (recommended): delay_unit=minute, delay_value=1020 for 5:00 PM.
+    """
+    from models.masters.core.timers import get_time_of_day
+
+    return get_time_of_day(DEADLINE_TIMER_CODE, DEFAULT_DEADLINE_MINUTES)
+
+
+def resolve_action_stage_ids():
+    """
+    Return (approval_to_stage_ids, reject_to_stage_ids) for the hologram request workflow.
+
+    DB-driven: any transition entering a stage via ISSUE/APPROVE counts as approval.
+    """
+    approval_to_stage_ids = set()
+    reject_to_stage_ids = set()
+    transitions = WorkflowTransition.objects.filter(
+        workflow_id=WORKFLOW_IDS['HOLOGRAM_REQUEST']
+    ).only('to_stage_id', 'condition')
+    for transition in transitions:
+        action_name = str((transition.condition or {}).get('action') or '').strip().lower()
+        if action_name in {'issue', 'approve'}:
+            approval_to_stage_ids.add(transition.to_stage_id)
+        elif 'reject' in action_name:
+            reject_to_stage_ids.add(transition.to_stage_id)
+    return approval_to_stage_ids, reject_to_stage_ids
+
+
+def _rejection_message(stage_name_lc):
+    if 'no action' in stage_name_lc or 'no_action' in stage_name_lc or 'noaction' in stage_name_lc:
+        return 'No action was taken'
+    if 'not approved' in stage_name_lc or 'not_approved' in stage_name_lc or 'notapproved' in stage_name_lc:
+        return 'Not approved on usage date'
+    return 'Rejected'
+
+
+def compute_request_sla(req, approval_to_stage_ids, reject_to_stage_ids, deadline_time):
+    """Build the `HologramRequestSla` field values for one request."""
+    transactions = Transaction.objects.filter(
+        content_type=ContentType.objects.get_for_model(HologramRequest),
+        object_id=str(req.pk),
+    ).order_by('timestamp', 'id')
+
+    submission_txn = transactions.filter(stage__is_initial=True).only('timestamp').first()
+    if approval_to_stage_ids:
+        approval_txn = transactions.filter(stage_id__in=approval_to_stage_ids).only('timestamp').first()
+    else:
+        approval_txn = transactions.exclude(stage__is_initial=True).only('timestamp').first()
+
+    last_entry = (
+        DailyHologramRegister.objects.filter(Q(hologram_request=req) | Q(reference_no=req.ref_no))
+        .select_related('licensee')
+        .order_by('-created_at', '-id')
+        .first()
+    )
+
+    stage = req.current_stage
+    stage_name_lc = str(getattr(stage, 'name', '') or '').strip().lower()
+
+    status = HologramRequestSla.STATUS_UNDER_PROCESS
+    if stage and stage.is_initial:
+        status = HologramRequestSla.STATUS_APPLIED
+    elif req.current_stage_id and req.current_stage_id in reject_to_stage_ids:
+        status = HologramRequestSla.STATUS_REJECTED
+    elif stage and stage.is_final:
+        status = HologramRequestSla.STATUS_COMPLETED
+
+    # Some auto-rejection stages are not labeled with action="reject" in WorkflowTransition.
+    if status != HologramRequestSla.STATUS_REJECTED and any(h in stage_name_lc for h in _REJECTION_STAGE_HINTS):
+        status = HologramRequestSla.STATUS_REJECTED
+
+    # Daily register entries mean the request is completed.
+    if last_entry is not None:
+        status = HologramRequestSla.STATUS_COMPLETED
+
+    values = {
+        'license_id': req.license_id,
+        'submitted_at': submission_txn.timestamp if submission_txn else req.submission_date,
+        'approved_at': approval_txn.timestamp if approval_txn else None,
+        'completed_at': None,
+        'completion_date': None,
+        'deadline': None,
+        'status': status,
+        'status_message': _rejection_message(stage_name_lc) if status == HologramRequestSla.STATUS_REJECTED else None,
+        'completed_on_time': None,
+        'officer_name': None,
+    }
+
+    if approval_txn:
+        # Deadline is the configured time on the approval date.
+        deadline = datetime.combine(approval_txn.timestamp.date(), deadline_time)
+        if timezone.is_naive(deadline):
+            deadline = timezone.make_aware(deadline)
+        values['deadline'] = deadline
+
+        if status == HologramRequestSla.STATUS_COMPLETED and last_entry is not None:
+            # On-time vs late is decided on the OIC save timestamp (created_at).
+            completed_at = last_entry.created_at
+            if completed_at is None and last_entry.usage_date:
+                completed_at = datetime.combine(last_entry.usage_date, time.min)
+            if completed_at is not None and timezone.is_naive(completed_at):
+                completed_at = timezone.make_aware(completed_at)
+
+            values['completed_at'] = completed_at
+            values['completion_date'] = last_entry.usage_date
+            values['completed_on_time'] = completed_at <= deadline if completed_at else None
+            if last_entry.licensee:
+                values['officer_name'] = last_entry.licensee.manufacturing_unit_name
+
+    return values
+
+
+def refresh_request_sla(request_id):
+    """Recompute and persist the SLA row for one hologram request."""
+    req = (
+        HologramRequest.objects.select_related('current_stage')
+        .filter(pk=request_id)
+        .first()
+    )
+    if req is None:
+        return None
+    approval_to_stage_ids, reject_to_stage_ids = resolve_action_stage_ids()
+    values = compute_request_sla(req, approval_to_stage_ids, reject_to_stage_ids, resolve_deadline_time())
+    sla, _ = HologramRequestSla.objects.update_or_create(hologram_request=req, defaults=values)
+    return sla
+
+
+def schedule_request_sla_refresh(request_id):
+    """Refresh the SLA row once the surrounding DB transaction commits."""
+    if not request_id:
+        return
+
+    def _refresh():
+        try:
+            refresh_request_sla(request_id)
+        except Exception:
+            logger.exception("Failed to refresh hologram request SLA for request_id=%s", request_id)
+
+    db_transaction.on_commit(_refresh)
@@ -0,0 +1,231 @@
+"""
+Monthly hologram stock ledger.
+
+Each `HologramMonthlyStockLedger` row stores opening, arrivals, issued, wastage and
+closing for one (license, hologram type, month). Arrivals come from
+`HologramRollsDetails.total_count` (by `received_date`), issued/wastage from approved
+`DailyHologramRegister` entries (by `usage_date`).
+
+When a month changes, only that month is re-aggregated; the change in its closing
+balance is then pushed into every later month with a single UPDATE. Reads never
+write: a month without a row is computed on the fly (see `get_month`).
+"""
+from datetime import date
+
+from django.db import IntegrityError, transaction as db_transaction
+from django.db.models import DateField, F, Sum, Value
+from django.db.models.functions import Coalesce, NullIf, TruncMonth
+import logging
+
+from .models import DailyHologramRegister, HologramMonthlyStockLedger, HologramRollsDetails
+
+logger = logging.getLogger(__name__)
+
+# Ledger scope holding totals across every license.
+ALL_LICENSES = ''
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def next_month_start(value):
+    if value.month == 12:
+        return date(value.year + 1, 1, 1)
+    return date(value.year, value.month + 1, 1)
+
+
+def normalize_scope(license_id, hologram_type):
+    """Ledger key for a (license, hologram type) pair; types are stored uppercase."""
+    return str(license_id or '').strip(), str(hologram_type or '').strip().upper()
+
+
+def register_queryset(license_id, hologram_type):
+    """Approved register entries counted by the ledger for a scope."""
+    license_id, hologram_type = normalize_scope(license_id, hologram_type)
+    queryset = DailyHologramRegister.objects.filter(
+        hologram_type__iexact=hologram_type,
+        approval_status=DailyHologramRegister.APPROVAL_STATUS_APPROVED,
+    )
+    if license_id:
+        queryset = queryset.annotate(
+            ledger_license_id=Coalesce(NullIf('license_id', Value('')), 'licensee__licensee_id')
+        ).filter(ledger_license_id=license_id)
+    return queryset
+
+
+def arrival_queryset(license_id, hologram_type):
+    """Received rolls counted by the ledger for a scope."""
+    license_id, hologram_type = normalize_scope(license_id, hologram_type)
+    queryset = HologramRollsDetails.objects.filter(type__iexact=hologram_type)
+    if license_id:
+        queryset = queryset.annotate(
+            ledger_license_id=Coalesce(NullIf('license_id', Value('')), 'procurement__licensee__licensee_id')
+        ).filter(ledger_license_id=license_id)
+    return queryset
+
+
+def _month_movements(license_id, hologram_type, month):
+    start, end = month, next_month_start(month)
+    usage = register_queryset(license_id, hologram_type).filter(
+        usage_date__gte=start, usage_date__lt=end
+    ).aggregate(issued=Sum('issued_qty'), wastage=Sum('wastage_qty'))
+    arrivals = arrival_queryset(license_id, hologram_type).filter(
+        received_date__date__gte=start, received_date__date__lt=end
+    ).aggregate(total=Sum('total_count'))['total']
+    return arrivals or 0, usage['issued'] or 0, usage['wastage'] or 0
+
+
+def _opening_balance(license_id, hologram_type, month):
+    previous = (
+        HologramMonthlyStockLedger.objects.filter(
+            license_id=license_id, hologram_type=hologram_type, month__lt=month
+        )
+        .order_by('-month')
+        .values_list('closing', flat=True)
+        .first()
+    )
+    if previous is not None:
+        return previous
+    # No earlier ledger row yet: derive the opening from source rows once.
+    return _source_balance(license_id, hologram_type, month)
+
+
+def _source_balance(license_id, hologram_type, month):
+    """Stock on hand before `month`, summed from source rows."""
+    received = arrival_queryset(license_id, hologram_type).filter(
+        received_date__date__lt=month
+    ).aggregate(total=Sum('total_count'))['total'] or 0
+    used = register_queryset(license_id, hologram_type).filter(
+        usage_date__lt=month
+    ).aggregate(issued=Sum('issued_qty'), wastage=Sum('wastage_qty'))
+    return received - (used['issued'] or 0) - (used['wastage'] or 0)
+
+
+def refresh_month(license_id, hologram_type, month):
+    """Re-aggregate one ledger month and roll the closing difference forward."""
+    license_id, hologram_type = normalize_scope(license_id, hologram_type)
+    month = month_start(month)
+
+    with db_transaction.atomic():
+        row = (
+            HologramMonthlyStockLedger.objects.select_for_update()
+            .filter(license_id=license_id, hologram_type=hologram_type, month=month)
+            .first()
+        )
+        created = row is None
+        if created:
+            opening = _opening_balance(license_id, hologram_type, month)
+            try:
+                with db_transaction.atomic():
+                    row = HologramMonthlyStockLedger.objects.create(
+                        license_id=license_id, hologram_type=hologram_type, month=month,
+                        opening=opening, closing=opening,
+                    )
+            except IntegrityError:
+                # A concurrent refresh created the month first; wait for it and re-aggregate its row.
+                created = False
+                row = HologramMonthlyStockLedger.objects.select_for_update().get(
+                    license_id=license_id, hologram_type=hologram_type, month=month
+                )
+
+        previous_closing = row.closing
+        row.arrivals, row.issued, row.wastage = _month_movements(license_id, hologram_type, month)
+        row.closing = row.opening + row.arrivals - row.issued - row.wastage
+        row.save()
+
+        later = HologramMonthlyStockLedger.objects.filter(
+            license_id=license_id, hologram_type=hologram_type, month__gt=month
+        )
+        if created:
+            # Later rows were opened from source totals that may predate this change;
+            # realign them against the current source balance at the next ledger month.
+            following = later.order_by('month').values_list('month', 'opening').first()
+            delta = 0
+            if following is not None:
+                delta = _source_balance(license_id, hologram_type, following[0]) - following[1]
+        else:
+            delta = row.closing - previous_closing
+        if delta:
+            later.update(opening=F('opening') + delta, closing=F('closing') + delta)
+    return row
+
+
+def get_month(license_id, hologram_type, month):
+    """
+    Ledger row for a month.
+
+    Read-only: a month without a stored row is returned as an unsaved instance computed
+    from the previous ledger row (or source rows) and the month's own movements.
+    """
+    license_id, hologram_type = normalize_scope(license_id, hologram_type)
+    month = month_start(month)
+    row = HologramMonthlyStockLedger.objects.filter(
+        license_id=license_id, hologram_type=hologram_type, month=month,
+    ).first()
+    if row is not None:
+        return row
+
+    opening = _opening_balance(license_id, hologram_type, month)
+    arrivals, issued, wastage = _month_movements(license_id, hologram_type, month)
+    return HologramMonthlyStockLedger(
+        license_id=license_id, hologram_type=hologram_type, month=month,
+        opening=opening, arrivals=arrivals, issued=issued, wastage=wastage,
+        closing=opening + arrivals - issued - wastage,
+    )
+
+
+def schedule_month_refresh(license_id, hologram_type, value):
+    """Refresh the license scope and the all-licensee scope after commit."""
+    if not hologram_type or not value:
+        return
+    scopes = {ALL_LICENSES, str(license_id or '').strip()}
+
+    def _refresh():
+        for scope in scopes:
+            try:
+                refresh_month(scope, hologram_type, value)
+            except Exception:
+                logger.exception(
+                    "Failed to refresh hologram stock ledger license_id=%s type=%s month=%s",
+                    scope, hologram_type, value,
+                )
+
+    db_transaction.on_commit(_refresh)
+
+
+def monthly_movements():
+    """
+    Source movements grouped by (license_id, hologram_type, month) for backfilling.
+
+    Returns {(license_id, hologram_type, month): [arrivals, issued, wastage]}.
+    """
+    movements = {}
+    usage_rows = (
+        DailyHologramRegister.objects.filter(approval_status=DailyHologramRegister.APPROVAL_STATUS_APPROVED)
+        .annotate(
+            ledger_license_id=Coalesce(NullIf('license_id', Value('')), 'licensee__licensee_id'),
+            ledger_month=TruncMonth('usage_date'),
+        )
+        .values('ledger_license_id', 'hologram_type', 'ledger_month')
+        .annotate(issued=Sum('issued_qty'), wastage=Sum('wastage_qty'))
+    )
+    for item in usage_rows:
+        key = (item['ledger_license_id'] or '', str(item['hologram_type'] or '').upper(), item['ledger_month'])
+        bucket = movements.setdefault(key, [0, 0, 0])
+        bucket[1] += item['issued'] or 0
+        bucket[2] += item['wastage'] or 0
+
+    arrival_rows = (
+        HologramRollsDetails.objects.exclude(type__isnull=True)
+        .annotate(
+            ledger_license_id=Coalesce(NullIf('license_id', Value('')), 'procurement__licensee__licensee_id'),
+            ledger_month=TruncMonth('received_date', output_field=DateField()),
+        )
+        .values('ledger_license_id', 'type', 'ledger_month')
+        .annotate(total=Sum('total_count'))
+    )
+    for item in arrival_rows:
+        key = (item['ledger_license_id'] or '', str(item['type'] or '').upper(), item['ledger_month'])
+        movements.setdefault(key, [0, 0, 0])[0] += item['total'] or 0
+    return movements
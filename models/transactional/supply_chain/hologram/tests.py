@@ -0,0 +1,270 @@
+from datetime import date, datetime, timedelta
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from auth.roles.models import Role
+from auth.user.models import CustomUser
+from auth.workflow.constants import WORKFLOW_IDS
+from auth.workflow.models import Transaction, Workflow, WorkflowStage, WorkflowTransition
+from models.masters.core.models import District, State, Subdivision
+from models.masters.supply_chain.profile.models import UserManufacturingUnit
+from utils.testing import QueryBudgetMixin
+
+from . import stock_ledger
+from .models import (
+    DailyHologramRegister,
+    HologramMonthlyStockLedger,
+    HologramProcurement,
+    HologramRequest,
+    HologramRequestSla,
+    HologramRollsDetails,
+)
+
+
+class HologramRequestSlaTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        subdivision = Subdivision.objects.create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=district
+        )
+        self.user = CustomUser.objects.create_user(
+            password='password123',
+            email='commissioner@example.com',
+            role=Role.objects.create(name='commissioner'),
+            district=district,
+            subdivision=subdivision,
+            phone_number="9999999911",
+            first_name="Commissioner",
+            last_name="User",
+            address="Test address",
+        )
+        self.unit = UserManufacturingUnit.objects.create(
+            user=self.user, manufacturing_unit_name="Test Distillery", licensee_id="NA/225/0001"
+        )
+
+        self.workflow = Workflow.objects.create(id=WORKFLOW_IDS['HOLOGRAM_REQUEST'], name='Hologram Request')
+        self.submitted = WorkflowStage.objects.create(workflow=self.workflow, name='Submitted', is_initial=True)
+        self.approved = WorkflowStage.objects.create(workflow=self.workflow, name='Approved by OIC')
+        WorkflowTransition.objects.create(
+            workflow=self.workflow, from_stage=self.submitted, to_stage=self.approved, condition={'action': 'APPROVE'}
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def _create_request(self, ref_no, usage_date):
+        with self.captureOnCommitCallbacks(execute=True):
+            req = HologramRequest.objects.create(
+                ref_no=ref_no,
+                licensee=self.unit,
+                license_id=self.unit.licensee_id,
+                usage_date=usage_date,
+                quantity=100,
+                workflow=self.workflow,
+                current_stage=self.submitted,
+            )
+            self._log_transaction(req, self.submitted)
+        return req
+
+    def _log_transaction(self, req, stage):
+        Transaction.objects.create(
+            content_type=ContentType.objects.get_for_model(HologramRequest),
+            object_id=str(req.pk),
+            performed_by=self.user,
+            stage=stage,
+        )
+
+    def test_sla_row_follows_request_lifecycle(self):
+        req = self._create_request('HQR/1101/0001', timezone.localdate())
+        sla = HologramRequestSla.objects.get(hologram_request=req)
+        self.assertEqual(sla.status, HologramRequestSla.STATUS_APPLIED)
+        self.assertIsNotNone(sla.submitted_at)
+        self.assertIsNone(sla.deadline)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            req.current_stage = self.approved
+            req.save(update_fields=['current_stage'])
+            self._log_transaction(req, self.approved)
+        sla.refresh_from_db()
+        self.assertEqual(sla.status, HologramRequestSla.STATUS_UNDER_PROCESS)
+        self.assertIsNotNone(sla.approved_at)
+        self.assertIsNotNone(sla.deadline)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DailyHologramRegister.objects.create(
+                licensee=self.unit,
+                reference_no=req.ref_no,
+                usage_date=req.usage_date,
+                brand_details='Test Brand',
+                issued_qty=10,
+            )
+        sla.refresh_from_db()
+        self.assertEqual(sla.status, HologramRequestSla.STATUS_COMPLETED)
+        self.assertIsNotNone(sla.completed_at)
+        self.assertEqual(sla.officer_name, 'Test Distillery')
+
+    def test_overview_reads_sla_table(self):
+        self._create_request('HQR/1101/0002', timezone.localdate())
+        self._create_request('HQR/1101/0003', timezone.localdate() - timedelta(days=2))
+
+        url = reverse('supply_chain:commissioner-dashboard-daily-register-overview')
+        resp = self.client.get(url, {'page_size': 1})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data['summary']['totalEntries'], 2)
+        self.assertEqual(resp.data['summary']['applied'], 1)
+        self.assertEqual(resp.data['count'], 2)
+        self.assertEqual(len(resp.data['entries']), 1)
+
+        # Initial-stage requests past their usage date are reported as rejected.
+        resp = self.client.get(url, {'status': 'REJECTED'})
+        self.assertEqual(resp.data['count'], 1)
+        self.assertEqual(resp.data['entries'][0]['referenceNo'], 'HQR/1101/0003')
+        self.assertEqual(resp.data['entries'][0]['statusMessage'], 'No action was taken')
+
+        resp = self.client.get(url, {'date_from': 'not-a-date'})
+        self.assertEqual(resp.status_code, 400)
+        resp = self.client.get(url, {'date_to': '2026-02-30'})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_overview_query_budget(self):
+        self.assert_query_budget(
+            'supply_chain:commissioner-dashboard-daily-register-overview',
+            5,
+            lambda index: self._create_request(f'HQR/1101/01{index:02d}', timezone.localdate()),
+        )
+
+
+class HologramMonthlyStockLedgerTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state="Sikkim", state_code=11, is_active=True)
+        district = District.objects.create(district="Gangtok", district_code=225, is_active=True, state_code=state)
+        subdivision = Subdivision.objects.create(
+            subdivision="Gangtok Subdivision", subdivision_code=1553, is_active=True, district_code=district
+        )
+        user = CustomUser.objects.create_user(
+            password='password123',
+            email='oic@example.com',
+            district=district,
+            subdivision=subdivision,
+            phone_number="9999999912",
+            first_name="Oic",
+            last_name="User",
+            address="Test address",
+        )
+        self.license_id = 'NA/225/0001'
+        self.unit = UserManufacturingUnit.objects.create(
+            user=user, manufacturing_unit_name="Test Distillery", licensee_id=self.license_id
+        )
+        self.procurement = HologramProcurement.objects.create(
+            ref_no='HPR/0001', licensee=self.unit, manufacturing_unit=self.unit.manufacturing_unit_name
+        )
+
+    def _receive(self, carton, count, received):
+        with self.captureOnCommitCallbacks(execute=True):
+            return HologramRollsDetails.objects.create(
+                procurement=self.procurement,
+                license_id=self.license_id,
+                carton_number=carton,
+                type='LOCAL',
+                total_count=count,
+                available=count,
+                received_date=timezone.make_aware(datetime.combine(received, datetime.min.time())),
+            )
+
+    def _approve_usage(self, usage_date, issued, wastage):
+        with self.captureOnCommitCallbacks(execute=True):
+            return DailyHologramRegister.objects.create(
+                licensee=self.unit,
+                reference_no='HQR/0001',
+                hologram_type='LOCAL',
+                usage_date=usage_date,
+                issued_qty=issued,
+                wastage_qty=wastage,
+                approval_status=DailyHologramRegister.APPROVAL_STATUS_APPROVED,
+            )
+
+    def test_ledger_rolls_forward_and_matches_backfill(self):
+        self._receive('C-1', 1000, date(2026, 1, 5))
+        self._approve_usage(date(2026, 1, 10), 300, 20)
+        self._receive('C-2', 500, date(2026, 2, 3))
+        self._approve_usage(date(2026, 2, 10), 100, 0)
+
+        jan = stock_ledger.get_month(self.license_id, 'LOCAL', date(2026, 1, 1))
+        feb = stock_ledger.get_month(self.license_id, 'LOCAL', date(2026, 2, 1))
+        self.assertEqual((jan.opening, jan.arrivals, jan.issued, jan.wastage, jan.closing), (0, 1000, 300, 20, 680))
+        self.assertEqual((feb.opening, feb.closing), (680, 1080))
+
+        # A late January approval is pushed into February's opening balance.
+        self._approve_usage(date(2026, 1, 20), 80, 0)
+        feb.refresh_from_db()
+        self.assertEqual((feb.opening, feb.closing), (600, 1000))
+
+        expected = {
+            (row.license_id, row.month): (row.opening, row.arrivals, row.issued, row.wastage, row.closing)
+            for row in HologramMonthlyStockLedger.objects.all()
+        }
+        call_command('backfill_hologram_stock_ledger', stdout=StringIO())
+        rebuilt = {
+            (row.license_id, row.month): (row.opening, row.arrivals, row.issued, row.wastage, row.closing)
+            for row in HologramMonthlyStockLedger.objects.all()
+        }
+        self.assertEqual(rebuilt, expected)
+
+    def _closings(self, hologram_type='LOCAL'):
+        return list(
+            HologramMonthlyStockLedger.objects.filter(license_id=self.license_id, hologram_type=hologram_type)
+            .order_by('month')
+            .values_list('month', 'closing')
+        )
+
+    def test_moved_and_deleted_rows_leave_their_old_month(self):
+        roll = self._receive('C-1', 1000, date(2026, 1, 5))
+        usage = self._approve_usage(date(2026, 1, 10), 300, 0)
+        stock_ledger.refresh_month(self.license_id, 'LOCAL', date(2026, 2, 1))
+        self.assertEqual(self._closings(), [(date(2026, 1, 1), 700), (date(2026, 2, 1), 700)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            usage.usage_date = date(2026, 2, 10)
+            usage.save()
+        self.assertEqual(self._closings(), [(date(2026, 1, 1), 1000), (date(2026, 2, 1), 700)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            usage.hologram_type = 'EXPORT'
+            usage.save(update_fields=['hologram_type'])
+        self.assertEqual(self._closings(), [(date(2026, 1, 1), 1000), (date(2026, 2, 1), 1000)])
+        self.assertEqual(self._closings('EXPORT'), [(date(2026, 2, 1), -300)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            usage.delete()
+        self.assertEqual(self._closings('EXPORT'), [(date(2026, 2, 1), 0)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            roll.delete()
+        self.assertEqual(self._closings(), [(date(2026, 1, 1), 0), (date(2026, 2, 1), 0)])
+
+    def test_get_month_is_read_only(self):
+        self._receive('C-1', 1000, date(2026, 1, 5))
+        HologramMonthlyStockLedger.objects.all().delete()
+
+        april = stock_ledger.get_month(self.license_id, 'local', date(2026, 4, 1))
+        self.assertEqual((april.opening, april.closing), (1000, 1000))
+        self.assertFalse(HologramMonthlyStockLedger.objects.exists())
+
+    def test_new_month_row_realigns_later_months(self):
+        self._receive('C-1', 1000, date(2026, 1, 5))
+        self._approve_usage(date(2026, 2, 10), 100, 0)
+        HologramMonthlyStockLedger.objects.all().delete()
+        april = stock_ledger.refresh_month(self.license_id, 'LOCAL', date(2026, 4, 1))
+        self.assertEqual(april.opening, 900)
+
+        # February has no row yet; creating it must not count its earlier usage twice.
+        self._approve_usage(date(2026, 2, 20), 50, 0)
+        april.refresh_from_db()
+        self.assertEqual((april.opening, april.closing), (850, 850))
+        self.assertEqual(self._closings(), [(date(2026, 2, 1), 850), (date(2026, 4, 1), 850)])
@@ -2,7 +2,7 @@ from rest_framework import viewsets, status, permissions, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
-from django.utils.dateparse import parse_datetime
+from django.utils.dateparse import parse_date, parse_datetime
 from django.shortcuts import get_object_or_404
 from django.http import HttpResponse
 from django.db import transaction as db_transaction, models
@@ -15,7 +15,7 @@ from auth.workflow.models import Workflow, WorkflowStage, WorkflowTransition, Tr
 from auth.workflow.constants import WORKFLOW_IDS
 from models.masters.supply_chain.profile.models import UserManufacturingUnit
 from models.masters.supply_chain.hologram_supplier.models import MasterHologramSupplier
-from models.transactional.supply_chain.access_control import scope_by_profile_or_workflow
+from models.transactional.supply_chain.access_control import get_license_scope, scope_by_profile_or_workflow
 from utils.simple_pdf import PdfPage, build_text_pdf, paginate_lines
 
 HOLOGRAM_REF_PREFIX = 'HQR'
@@ -419,7 +419,8 @@ class HologramProcurementViewSet(viewsets.ModelViewSet):
                 user=user,
                 queryset=queryset,
                 workflow_id=WORKFLOW_IDS['HOLOGRAM_PROCUREMENT'],
-                licensee_field='licensee__licensee_id'
+                licensee_field='licensee__licensee_id',
+                scope=get_license_scope(self.request),
             )
 
         visible_stage_ids = _get_visible_stage_ids_for_user(
@@ -1485,14 +1486,16 @@ class HologramRequestViewSet(viewsets.ModelViewSet):
                 user=user,
                 queryset=queryset,
                 workflow_id=WORKFLOW_IDS['HOLOGRAM_REQUEST'],
-                licensee_field='license_id'
+                licensee_field='license_id',
+                scope=get_license_scope(self.request),
             )
             # Backward compatibility for historical rows without license_id populated.
             scoped_by_profile_license = scope_by_profile_or_workflow(
                 user=user,
                 queryset=queryset,
                 workflow_id=WORKFLOW_IDS['HOLOGRAM_REQUEST'],
-                licensee_field='licensee__licensee_id'
+                licensee_field='licensee__licensee_id',
+                scope=get_license_scope(self.request),
             )
             return queryset.filter(
                 models.Q(id__in=scoped_by_request_license.values('id')) |
@@ -1875,14 +1878,16 @@ class DailyHologramRegisterViewSet(viewsets.ModelViewSet):
                 user=user,
                 queryset=DailyHologramRegister.objects.all(),
                 workflow_id=WORKFLOW_IDS['HOLOGRAM_REQUEST'],
-                licensee_field='license_id'
+                licensee_field='license_id',
+                scope=get_license_scope(self.request),
             )
             # Backward compatibility for old rows without daily.license_id populated.
             scoped_by_profile_license = scope_by_profile_or_workflow(
                 user=user,
                 queryset=DailyHologramRegister.objects.all(),
                 workflow_id=WORKFLOW_IDS['HOLOGRAM_REQUEST'],
-                licensee_field='licensee__licensee_id'
+                licensee_field='licensee__licensee_id',
+                scope=get_license_scope(self.request),
             )
             return DailyHologramRegister.objects.filter(
                 models.Q(id__in=scoped_by_daily_license.values('id')) |
@@ -2869,14 +2874,16 @@ class HologramRollsDetailsViewSet(viewsets.ReadOnlyModelViewSet):
                 user=user,
                 queryset=HologramRollsDetails.objects.all(),
                 workflow_id=WORKFLOW_IDS['HOLOGRAM_PROCUREMENT'],
-                licensee_field='license_id'
+                licensee_field='license_id',
+                scope=get_license_scope(self.request),
             )
             # Backward compatibility for historical rows without license_id populated.
             scoped_by_procurement = scope_by_profile_or_workflow(
                 user=user,
                 queryset=HologramRollsDetails.objects.all(),
                 workflow_id=WORKFLOW_IDS['HOLOGRAM_PROCUREMENT'],
-                licensee_field='procurement__licensee__licensee_id'
+                licensee_field='procurement__licensee__licensee_id',
+                scope=get_license_scope(self.request),
             )
             return HologramRollsDetails.objects.filter(
                 models.Q(id__in=scoped_by_roll_license.values('id')) |
@@ -3078,323 +3085,219 @@ class CommissionerDashboardViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def daily_register_overview(self, request):
         """
-        Get complete overview of all hologram requests for commissioner dashboard
+        Get overview of hologram requests for commissioner dashboard
         Shows: Applied, Under Process, Completed On Time, Completed Late, Overdue
+
+        Reads the maintained `hologram_request_sla` table.
+        Query params: date_from / date_to (submission date), status, page, page_size.
         """
-        from django.db.models import Q
-        from datetime import datetime, time
-        from django.utils import timezone as django_timezone
-        from models.masters.core.models import SupplyChainTimerConfig
-        
-        try:
-            workflow_id = WORKFLOW_IDS['HOLOGRAM_REQUEST']
-            request_transitions = WorkflowTransition.objects.filter(workflow_id=workflow_id).only('to_stage_id', 'condition')
-            approval_to_stage_ids = set()
-            reject_to_stage_ids = set()
-            for transition in request_transitions:
-                action_name = str((transition.condition or {}).get('action') or '').strip().lower()
-                if action_name in {'issue', 'approve'}:
-                    approval_to_stage_ids.add(transition.to_stage_id)
-                elif action_name == 'reject' or 'reject' in action_name:
-                    reject_to_stage_ids.add(transition.to_stage_id)
-
-            # Get all hologram requests
-            requests = HologramRequest.objects.select_related(
-                'licensee', 'workflow', 'current_stage'
-            ).prefetch_related('transactions').all()
-
-            # Deadline time is configurable in DB (public.timer).
-            # Store as minutes-from-midnight (recommended): delay_unit=minute, delay_value=1020 for 5:00 PM.
-            deadline_timer_code = 'HOLOGRAM_DAILY_ENTRY_DEADLINE_TIME'
-            default_deadline_minutes = 17 * 60  # 5:00 PM fallback only
-            deadline_minutes = default_deadline_minutes
+        from datetime import datetime
+        from django.db.models import Case, CharField, Count, Q, Value, When
+        from .models import HologramRequestSla
+        from .sla import resolve_deadline_time
+
+        now = timezone.now()
+        today = timezone.localdate()
+        open_statuses = [HologramRequestSla.STATUS_APPLIED, HologramRequestSla.STATUS_UNDER_PROCESS]
+
+        # Business rule: a request still in the initial stage past its usage date is treated as
+        # rejected (no OIC action taken). This is time-dependent, so it is applied at read time.
+        queryset = HologramRequestSla.objects.annotate(
+            effective_status=Case(
+                When(
+                    status=HologramRequestSla.STATUS_APPLIED,
+                    hologram_request__usage_date__lt=today,
+                    then=Value(HologramRequestSla.STATUS_REJECTED),
+                ),
+                default='status',
+                output_field=CharField(),
+            )
+        )
+
+        date_bounds = {}
+        for param in ('date_from', 'date_to'):
+            raw = request.query_params.get(param)
+            if not raw:
+                continue
             try:
-                cfg = (
-                    SupplyChainTimerConfig.objects.filter(code=deadline_timer_code, is_active=True)
-                    .order_by('-updated_at', '-id')
-                    .first()
+                date_bounds[param] = parse_date(raw)
+            except ValueError:
+                date_bounds[param] = None
+            if date_bounds[param] is None:
+                return Response(
+                    {'error': f'{param} must be a valid date (YYYY-MM-DD).'},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
-                if cfg:
-                    unit = str(getattr(cfg, 'delay_unit', '') or '').lower().strip()
-                    value = int(getattr(cfg, 'delay_value', 0) or 0)
-                    if value < 0:
-                        value = 0
-
-                    if unit.endswith('s'):
-                        unit = unit[:-1]
-                    unit_aliases = {
-                        'sec': SupplyChainTimerConfig.TIMER_UNIT_SECOND,
-                        'secs': SupplyChainTimerConfig.TIMER_UNIT_SECOND,
-                        'min': SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
-                        'mins': SupplyChainTimerConfig.TIMER_UNIT_MINUTE,
-                        'hr': SupplyChainTimerConfig.TIMER_UNIT_HOUR,
-                        'hrs': SupplyChainTimerConfig.TIMER_UNIT_HOUR,
-                        'mon': getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'),
-                        'mos': getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'),
-                    }
-                    unit = unit_aliases.get(unit, unit)
-
-                    if unit == SupplyChainTimerConfig.TIMER_UNIT_MINUTE:
-                        deadline_minutes = value
-                    elif unit == SupplyChainTimerConfig.TIMER_UNIT_HOUR:
-                        deadline_minutes = value * 60
-                    elif unit == SupplyChainTimerConfig.TIMER_UNIT_SECOND:
-                        deadline_minutes = int(round(value / 60))
-                    elif unit == SupplyChainTimerConfig.TIMER_UNIT_DAY:
-                        deadline_minutes = value * 24 * 60
-                    elif unit == getattr(SupplyChainTimerConfig, 'TIMER_UNIT_MONTH', 'month'):
-                        deadline_minutes = value * 30 * 24 * 60
-            except Exception:
-                deadline_minutes = default_deadline_minutes
+        if 'date_from' in date_bounds:
+            queryset = queryset.filter(submitted_at__date__gte=date_bounds['date_from'])
+        if 'date_to' in date_bounds:
+            queryset = queryset.filter(submitted_at__date__lte=date_bounds['date_to'])
+
+        overdue_q = Q(effective_status__in=open_statuses, deadline__lt=now)
+        status_filter = str(request.query_params.get('status') or '').strip().upper()
+        if status_filter == 'OVERDUE':
+            queryset = queryset.filter(overdue_q)
+        elif status_filter:
+            queryset = queryset.filter(effective_status=status_filter)
+
+        summary = queryset.aggregate(
+            totalEntries=Count('id'),
+            applied=Count('id', filter=Q(effective_status=HologramRequestSla.STATUS_APPLIED)),
+            underProcess=Count('id', filter=Q(effective_status=HologramRequestSla.STATUS_UNDER_PROCESS)),
+            completedOnTime=Count('id', filter=Q(effective_status=HologramRequestSla.STATUS_COMPLETED, completed_on_time=True)),
+            completedLate=Count('id', filter=Q(effective_status=HologramRequestSla.STATUS_COMPLETED, completed_on_time=False)),
+            overdue=Count('id', filter=overdue_q),
+        )
 
-            deadline_minutes = int(deadline_minutes or 0) % (24 * 60)
-            deadline_time = time(hour=deadline_minutes // 60, minute=deadline_minutes % 60)
-            deadline_label = datetime.combine(datetime.today().date(), deadline_time).strftime('%I:%M %p')
+        # Pagination parameters
+        try:
+            page = int(request.query_params.get('page', 1))
+            page_size = int(request.query_params.get('page_size', 50))
+        except (ValueError, TypeError):
+            page = 1
+            page_size = 50
+        page = max(1, page)
+        page_size = max(1, min(page_size, 200))
+
+        total_count = summary['totalEntries']
+        offset = (page - 1) * page_size
+        rows = list(
+            queryset.select_related(
+                'hologram_request',
+                'hologram_request__licensee',
+                'hologram_request__current_stage',
+            ).order_by('-submitted_at', '-id')[offset: offset + page_size]
+        )
 
-            result_data = []
-            
-            for req in requests:
-                
-                # Get submission transaction
-                submission_txn = req.transactions.filter(
-                    stage__is_initial=True
-                ).order_by('timestamp').first()
-                
-                # DB-driven approval transaction: any transition entering a stage via ISSUE/APPROVE action.
-                if approval_to_stage_ids:
-                    approval_txn = req.transactions.filter(
-                        stage_id__in=approval_to_stage_ids
-                    ).order_by('timestamp').first()
+        # Register entries for the completed requests on this page, in one query.
+        completed_rows = [
+            row for row in rows
+            if row.effective_status == HologramRequestSla.STATUS_COMPLETED and row.approved_at
+        ]
+        entries_by_request = {row.hologram_request_id: [] for row in completed_rows}
+        if completed_rows:
+            request_id_by_ref = {row.hologram_request.ref_no: row.hologram_request_id for row in completed_rows}
+            daily_entries = DailyHologramRegister.objects.filter(
+                Q(hologram_request_id__in=entries_by_request.keys()) | Q(reference_no__in=request_id_by_ref.keys())
+            ).prefetch_related('rolls_used').order_by('created_at', 'id')
+            for entry in daily_entries:
+                request_ids = {entry.hologram_request_id, request_id_by_ref.get(entry.reference_no)}
+                for request_id in request_ids:
+                    if request_id in entries_by_request:
+                        entries_by_request[request_id].append(entry)
+
+        deadline_label = datetime.combine(today, resolve_deadline_time()).strftime('%I:%M %p')
+
+        result_data = []
+        for row in rows:
+            req = row.hologram_request
+            status = row.effective_status
+            status_message = row.status_message
+            if status != row.status:
+                status_message = 'No action was taken'
+
+            is_overdue = False
+            time_remaining = None
+            completion_time = row.completed_at.strftime('%H:%M:%S') if row.completed_at else None
+            if row.deadline and status == HologramRequestSla.STATUS_COMPLETED:
+                if row.completed_on_time is False:
+                    time_remaining = f"Completed Late (saved at {completion_time})"
+                elif row.completed_on_time is True:
+                    time_remaining = f"Completed On Time (saved at {completion_time})"
+            elif row.deadline and status in open_statuses:
+                # OIC has not saved daily entry yet; track remaining time vs configured deadline
+                if now > row.deadline:
+                    is_overdue = True
+                    overdue_seconds = int((now - row.deadline).total_seconds())
+                    time_remaining = (
+                        f"Overdue by {overdue_seconds // 3600}h {(overdue_seconds % 3600) // 60}m "
+                        f"(deadline {deadline_label})"
+                    )
                 else:
-                    approval_txn = req.transactions.exclude(stage__is_initial=True).order_by('timestamp').first()
-                
-                
-                # Get daily register entries for this request
-                daily_entries = DailyHologramRegister.objects.filter(
-                    Q(hologram_request=req) | Q(reference_no=req.ref_no)
-                ).select_related('licensee').prefetch_related('rolls_used').order_by('created_at', 'id')
-                
-                
-                # Determine status using stage metadata + transition-derived action mapping.
-                status = 'UNDER_PROCESS'
-                status_message = None
-                completed_on_time = None
-                is_overdue = False
-                time_remaining = None
-                deadline = None
-                completion_date = None
-                completion_time = None
-                officer_name = None
-                brands_entered = []
-                
-                stage_name = ''
-                try:
-                    stage_name = (req.current_stage.name if req.current_stage else '') or ''
-                except Exception:
-                    stage_name = ''
-                stage_name_lc = str(stage_name).strip().lower()
-
-                if req.current_stage and req.current_stage.is_initial:
-                    status = 'APPLIED'
-                elif req.current_stage_id and req.current_stage_id in reject_to_stage_ids:
-                    status = 'REJECTED'
-                elif req.current_stage and req.current_stage.is_final:
-                    status = 'COMPLETED'
-
-                # Some auto-rejection stages are not labeled with action="reject" in WorkflowTransition.
-                # Fall back to stage name heuristics so the commissioner dashboard doesn't show them as "Awaiting Approval".
-                if status != 'REJECTED' and stage_name_lc:
-                    rejection_hints = (
-                        'reject' in stage_name_lc or
-                        'rejected' in stage_name_lc or
-                        'not approved' in stage_name_lc or
-                        'not_approved' in stage_name_lc or
-                        'notapproved' in stage_name_lc or
-                        'no action' in stage_name_lc or
-                        'no_action' in stage_name_lc or
-                        'noaction' in stage_name_lc or
-                        'no action taken' in stage_name_lc or
-                        'no_action_taken' in stage_name_lc or
-                        'auto reject' in stage_name_lc or
-                        'auto_reject' in stage_name_lc
+                    remaining_seconds = int((row.deadline - now).total_seconds())
+                    time_remaining = (
+                        f"{remaining_seconds // 3600}h {(remaining_seconds % 3600) // 60}m remaining "
+                        f"(deadline {deadline_label})"
                     )
-                    if rejection_hints:
-                        status = 'REJECTED'
-
-                # Override status if we have daily register entries (means it's completed)
-                if daily_entries.exists():
-                    status = 'COMPLETED'
-
-                # Business rule: if request is still in initial stage past its usage date, treat as rejected (no OIC action taken).
-                # This covers "Not approved on usage date / no action taken" cases where workflow transitions aren't recorded as action="reject".
-                try:
-                    if status == 'APPLIED' and getattr(req, 'usage_date', None):
-                        today = django_timezone.localdate()
-                        if req.usage_date < today:
-                            status = 'REJECTED'
-                            status_message = 'No action was taken'
-                except Exception:
-                    pass
 
-                if status == 'REJECTED':
-                    if ('no action' in stage_name_lc) or ('no_action' in stage_name_lc) or ('noaction' in stage_name_lc):
-                        status_message = 'No action was taken'
-                    elif 'not approved' in stage_name_lc or 'not_approved' in stage_name_lc or 'notapproved' in stage_name_lc:
-                        status_message = 'Not approved on usage date'
-                    else:
-                        status_message = 'Rejected'
-                
-                # Calculate deadline and SLA if approved
-                if approval_txn:
-                    # Deadline is configurable time on approval date
-                    approval_date = approval_txn.timestamp.date()
-                    deadline_naive = datetime.combine(approval_date, deadline_time)
-                    deadline = django_timezone.make_aware(deadline_naive) if django_timezone.is_naive(deadline_naive) else deadline_naive
-                    
-                    now = django_timezone.now()
+            brands_entered = []
+            for entry in entries_by_request.get(row.hologram_request_id, []):
+                if not entry.brand_details:
+                    continue
+                rolls_assigned = [{
+                    'rollId': roll.id,
+                    'cartoonNumber': roll.carton_number,
+                    'rollNumber': roll.carton_number,
+                    'quantity': roll.available,
+                    'fromSerial': roll.from_serial,
+                    'toSerial': roll.to_serial,
+                } for roll in entry.rolls_used.all()]
+
+                serial_ranges = []
+                for r in (entry.issued_ranges or []):
+                    serial_ranges.append({
+                        'from': r.get('fromSerial') or r.get('from') or r.get('issuedFromSerial') or '',
+                        'to': r.get('toSerial') or r.get('to') or r.get('issuedToSerial') or '',
+                        'count': r.get('quantity') or r.get('count') or 0,
+                        'type': 'ISSUED',
+                    })
+                for r in (entry.wastage_ranges or []):
+                    serial_ranges.append({
+                        'from': r.get('fromSerial') or r.get('from') or r.get('wastageFromSerial') or '',
+                        'to': r.get('toSerial') or r.get('to') or r.get('wastageToSerial') or '',
+                        'count': r.get('quantity') or r.get('count') or 0,
+                        'type': 'WASTAGE',
+                    })
 
-                    # Completed: decide on-time vs late based on OIC save timestamp (created_at)
-                    if status == 'COMPLETED' and daily_entries.exists():
-                        last_entry = daily_entries.order_by('-created_at', '-id').first()
-                        completion_datetime = last_entry.created_at if last_entry and last_entry.created_at else None
-                        
-                        if completion_datetime is None and last_entry and last_entry.usage_date:
-                            fallback_naive = datetime.combine(last_entry.usage_date, datetime.strptime('00:00', '%H:%M').time())
-                            completion_datetime = django_timezone.make_aware(fallback_naive) if django_timezone.is_naive(fallback_naive) else fallback_naive
-                        elif completion_datetime is not None and django_timezone.is_naive(completion_datetime):
-                            completion_datetime = django_timezone.make_aware(completion_datetime)
-                        
-                        completion_date = last_entry.usage_date.isoformat() if last_entry and last_entry.usage_date else None
-                        completion_time = completion_datetime.strftime('%H:%M:%S') if completion_datetime else None
-                        completed_on_time = completion_datetime <= deadline if completion_datetime else None
-                        is_overdue = False
-                        if completed_on_time is False:
-                            time_remaining = f"Completed Late (saved at {completion_time})"
-                        elif completed_on_time is True:
-                            time_remaining = f"Completed On Time (saved at {completion_time})"
-                        
-                        # Get officer who entered the data
-                        if last_entry and last_entry.licensee:
-                            officer_name = last_entry.licensee.manufacturing_unit_name
-                        
-                        # Get brands entered with allocated/issued/wastage and roll details
-                        for entry in daily_entries:
-                            rolls_assigned = []
-                            for roll in entry.rolls_used.all():
-                                rolls_assigned.append({
-                                    'rollId': roll.id,
-                                    'cartoonNumber': roll.carton_number,
-                                    'rollNumber': roll.roll_no,
-                                    'quantity': roll.available,
-                                    'fromSerial': roll.from_serial,
-                                    'toSerial': roll.to_serial,
-                                })
-
-                            serial_ranges = []
-                            for r in (entry.issued_ranges or []):
-                                serial_ranges.append({
-                                    'from': r.get('fromSerial') or r.get('from') or r.get('issuedFromSerial') or '',
-                                    'to': r.get('toSerial') or r.get('to') or r.get('issuedToSerial') or '',
-                                    'count': r.get('quantity') or r.get('count') or 0,
-                                    'type': 'ISSUED',
-                                })
-                            for r in (entry.wastage_ranges or []):
-                                serial_ranges.append({
-                                    'from': r.get('fromSerial') or r.get('from') or r.get('wastageFromSerial') or '',
-                                    'to': r.get('toSerial') or r.get('to') or r.get('wastageToSerial') or '',
-                                    'count': r.get('quantity') or r.get('count') or 0,
-                                    'type': 'WASTAGE',
-                                })
-
-                            if entry.brand_details:
-                                brands_entered.append({
-                                    'brand': entry.brand_details,
-                                    'brandCode': entry.brand_details,
-                                    'bottleSize': entry.bottle_size or '',
-                                    'allocatedQty': entry.hologram_qty or 0,
-                                    'issuedQty': entry.issued_qty or 0,
-                                    'wastageQty': entry.wastage_qty or 0,
-                                    'damageReason': entry.damage_reason or '',
-                                    'rollRange': entry.roll_range or '',
-                                    'quantity': entry.issued_qty or 0,  # backward-compatible
-                                    'usageDate': entry.usage_date.isoformat(),
-                                    'savedAt': entry.created_at.isoformat() if entry.created_at else '',
-                                    'rollsAssigned': rolls_assigned,
-                                    'serialRanges': serial_ranges,
-                                })
-                    elif status in {'UNDER_PROCESS', 'APPLIED'}:
-                        # OIC has not saved daily entry yet; track remaining time vs configured deadline
-                        if now > deadline:
-                            is_overdue = True
-                            overdue_seconds = int((now - deadline).total_seconds())
-                            overdue_hours = overdue_seconds // 3600
-                            overdue_minutes = (overdue_seconds % 3600) // 60
-                            time_remaining = f"Overdue by {overdue_hours}h {overdue_minutes}m (deadline {deadline_label})"
-                        else:
-                            remaining_seconds = int((deadline - now).total_seconds())
-                            hours_left = remaining_seconds // 3600
-                            minutes_left = (remaining_seconds % 3600) // 60
-                            time_remaining = f"{hours_left}h {minutes_left}m remaining (deadline {deadline_label})"
-                
-                
-                result_data.append({
-                    'id': req.id,
-                    'referenceNo': req.ref_no,
-                    'distilleryName': req.licensee.manufacturing_unit_name if req.licensee else 'Unknown',
-                    'submissionDate': submission_txn.timestamp.isoformat() if submission_txn else req.submission_date.isoformat(),
-                    'submissionTime': submission_txn.timestamp.strftime('%H:%M:%S') if submission_txn else '00:00:00',
-                    'approvalDate': approval_txn.timestamp.date().isoformat() if approval_txn else None,
-                    'approvalTime': approval_txn.timestamp.strftime('%H:%M:%S') if approval_txn else None,
-                    'usageDate': req.usage_date.isoformat(),
-                    'hologramType': req.hologram_type,
-                    'quantity': req.quantity,
-                    'status': status,
-                    'statusMessage': status_message,
-                    'completedOnTime': completed_on_time,
-                    'isOverdue': is_overdue,
-                    'timeRemaining': time_remaining,
-                    'deadline': deadline.isoformat() if deadline else None,
-                    'completionDate': completion_date,
-                    'completionTime': completion_time,
-                    'officerName': officer_name,
-                    'brandsEntered': brands_entered,
-                    'currentStage': req.current_stage.name if req.current_stage else 'Unknown'
+                brands_entered.append({
+                    'brand': entry.brand_details,
+                    'brandCode': entry.brand_details,
+                    'bottleSize': entry.bottle_size or '',
+                    'allocatedQty': entry.hologram_qty or 0,
+                    'issuedQty': entry.issued_qty or 0,
+                    'wastageQty': entry.wastage_qty or 0,
+                    'damageReason': entry.damage_reason or '',
+                    'rollRange': entry.roll_range or '',
+                    'quantity': entry.issued_qty or 0,  # backward-compatible
+                    'usageDate': entry.usage_date.isoformat(),
+                    'savedAt': entry.created_at.isoformat() if entry.created_at else '',
+                    'rollsAssigned': rolls_assigned,
+                    'serialRanges': serial_ranges,
                 })
-            
-            # Calculate summary statistics
-            total_entries = len(result_data)
-            applied_count = sum(1 for r in result_data if r['status'] == 'APPLIED')
-            under_process_count = sum(1 for r in result_data if r['status'] == 'UNDER_PROCESS')
-            completed_on_time_count = sum(1 for r in result_data if r['status'] == 'COMPLETED' and r['completedOnTime'] is True)
-            completed_late_count = sum(1 for r in result_data if r['status'] == 'COMPLETED' and r['completedOnTime'] is False)
-            overdue_count = sum(1 for r in result_data if r['isOverdue'])
-            
-            
-            return Response({
-                'summary': {
-                    'totalEntries': total_entries,
-                    'applied': applied_count,
-                    'underProcess': under_process_count,
-                    'completedOnTime': completed_on_time_count,
-                    'completedLate': completed_late_count,
-                    'overdue': overdue_count
-                },
-                'entries': result_data
+
+            submitted_at = row.submitted_at or req.submission_date
+            result_data.append({
+                'id': req.id,
+                'referenceNo': req.ref_no,
+                'distilleryName': req.licensee.manufacturing_unit_name if req.licensee else 'Unknown',
+                'submissionDate': submitted_at.isoformat(),
+                'submissionTime': submitted_at.strftime('%H:%M:%S'),
+                'approvalDate': row.approved_at.date().isoformat() if row.approved_at else None,
+                'approvalTime': row.approved_at.strftime('%H:%M:%S') if row.approved_at else None,
+                'usageDate': req.usage_date.isoformat(),
+                'hologramType': req.hologram_type,
+                'quantity': req.quantity,
+                'status': status,
+                'statusMessage': status_message,
+                'completedOnTime': row.completed_on_time if status == HologramRequestSla.STATUS_COMPLETED else None,
+                'isOverdue': is_overdue,
+                'timeRemaining': time_remaining,
+                'deadline': row.deadline.isoformat() if row.deadline else None,
+                'completionDate': row.completion_date.isoformat() if row.completion_date else None,
+                'completionTime': completion_time,
+                'officerName': row.officer_name,
+                'brandsEntered': brands_entered,
+                'currentStage': req.current_stage.name if req.current_stage else 'Unknown'
             })
-        except Exception as e:
-            import traceback
-            return Response({
-                'error': str(e),
-                'summary': {
-                    'totalEntries': 0,
-                    'applied': 0,
-                    'underProcess': 0,
-                    'completedOnTime': 0,
-                    'completedLate': 0,
-                    'overdue': 0
-                },
-                'entries': []
-            }, status=500)
+
+        return Response({
+            'summary': summary,
+            'entries': result_data,
+            'count': total_count,
+            'page': page,
+            'page_size': page_size,
+            'total_pages': (total_count + page_size - 1) // page_size,
+        })
 
 
 class HologramMonthlyReportViewSet(viewsets.ViewSet):
@@ -3413,16 +3316,13 @@ class HologramMonthlyReportViewSet(viewsets.ViewSet):
         - year: Year (e.g., '2026')
         - hologram_type: Type (LOCAL, EXPORT, DEFENCE)
         - licensee_id: Optional licensee ID filter
-        - force_refresh: Set to 'true' to bypass cache and get fresh data
+
+        Balances come from the monthly stock ledger (see stock_ledger.py); only the
+        month's own arrival and register rows are loaded for the statement.
         """
-        from django.db.models import Sum, Q
-        from datetime import datetime
-        import calendar
-        from django.core.cache import cache
-        import logging
-        
-        logger = logging.getLogger(__name__)
-        
+        from datetime import date
+        from . import stock_ledger
+
         # Get query parameters
         month_param = request.query_params.get('month', '').lower()
         year_param = request.query_params.get('year', str(timezone.now().year))
@@ -3447,127 +3347,46 @@ class HologramMonthlyReportViewSet(viewsets.ViewSet):
         
         month_num = month_map.get(month_param, timezone.now().month)
         year_num = int(year_param)
+        report_month = date(year_num, month_num, 1)
         
         # Get scoped license from user if not provided.
         # Prefer denormalized license_id (NA/NLI format), keep legacy profile-id fallback.
-        legacy_profile_id = None
         unit = _get_or_create_active_manufacturing_unit(request.user)
         scoped_license_id = _resolve_request_license_id(profile=unit, acting_user=request.user)
         if not licensee_id:
             licensee_id = scoped_license_id or ''
-        
-        # Build query filters
-        filters = Q(
-            usage_date__year=year_num,
-            usage_date__month=month_num,
-            hologram_type=hologram_type,
-            approval_status='APPROVED'
+
+        normalized_license = str(licensee_id or '').strip()
+        if normalized_license and not (any(ch.isalpha() for ch in normalized_license) or '/' in normalized_license):
+            # Legacy numeric manufacturing-unit id: the ledger is keyed by license id.
+            normalized_license = (
+                UserManufacturingUnit.objects.filter(pk=normalized_license)
+                .values_list('licensee_id', flat=True)
+                .first()
+            ) or normalized_license
+
+        ledger = stock_ledger.get_month(normalized_license, hologram_type, report_month)
+        opening_stock = ledger.opening
+        fresh_arrivals = ledger.arrivals
+        total_utilized = ledger.issued
+        total_wastage = ledger.wastage
+        closing_balance = ledger.closing
+
+        # Month detail rows (same scope rules as the ledger)
+        next_month = stock_ledger.next_month_start(report_month)
+        daily_entries = list(
+            stock_ledger.register_queryset(normalized_license, hologram_type)
+            .filter(usage_date__gte=report_month, usage_date__lt=next_month)
+            .order_by('usage_date', 'id')
         )
-        
-        if licensee_id:
-            normalized_license = str(licensee_id).strip()
-            if any(ch.isalpha() for ch in normalized_license) or '/' in normalized_license:
-                filters &= (Q(license_id=normalized_license) | Q(licensee__licensee_id=normalized_license))
-            else:
-                filters &= Q(licensee_id=normalized_license)
-        
-        # Get approved daily register entries for the month
-        daily_entries = DailyHologramRegister.objects.filter(filters).order_by('usage_date', 'id')
-        
-        # Calculate previous month's closing balance
-        prev_month = month_num - 1 if month_num > 1 else 12
-        prev_year = year_num if month_num > 1 else year_num - 1
-        
-        # Get previous month's data
-        prev_filters = Q(
-            usage_date__year=prev_year,
-            usage_date__month=prev_month,
-            hologram_type=hologram_type,
-            approval_status='APPROVED'
+        arrivals = list(
+            stock_ledger.arrival_queryset(normalized_license, hologram_type)
+            .filter(received_date__date__gte=report_month, received_date__date__lt=next_month)
         )
-        if licensee_id:
-            normalized_license = str(licensee_id).strip()
-            if any(ch.isalpha() for ch in normalized_license) or '/' in normalized_license:
-                prev_filters &= (Q(license_id=normalized_license) | Q(licensee__licensee_id=normalized_license))
-            else:
-                prev_filters &= Q(licensee_id=normalized_license)
-        
-        prev_entries = DailyHologramRegister.objects.filter(prev_filters)
-        
-        # Calculate previous month totals
-        prev_utilized = prev_entries.aggregate(total=Sum('issued_qty'))['total'] or 0
-        prev_wastage = prev_entries.aggregate(total=Sum('wastage_qty'))['total'] or 0
-        
-        # Get fresh arrivals for current month (from HologramRollsDetails)
-        arrival_filters = Q(
-            received_date__year=year_num,
-            received_date__month=month_num,
-            type=hologram_type
-        )
-        if licensee_id:
-            normalized_license = str(licensee_id).strip()
-            if any(ch.isalpha() for ch in normalized_license) or '/' in normalized_license:
-                arrival_filters &= (Q(license_id=normalized_license) | Q(procurement__licensee__licensee_id=normalized_license))
-            else:
-                arrival_filters &= Q(procurement__licensee_id=normalized_license)
-        
-        arrivals = HologramRollsDetails.objects.filter(arrival_filters)
-        fresh_arrivals = arrivals.aggregate(total=Sum('total_count'))['total'] or 0
-        arrival_count = arrivals.count()
-        
-        # Calculate current month totals
-        total_utilized = daily_entries.aggregate(total=Sum('issued_qty'))['total'] or 0
-        total_wastage = daily_entries.aggregate(total=Sum('wastage_qty'))['total'] or 0
-        utilization_count = daily_entries.filter(issued_qty__gt=0).count()
-        wastage_count = daily_entries.filter(wastage_qty__gt=0).count()
-        
-        # Get opening stock (previous month's closing balance)
-        # This should come from the previous month's report or initial procurement
-        opening_stock = 0
-        
-        # Try to get from previous month's closing
-        if prev_month and prev_year:
-            # Get all rolls up to previous month
-            all_prev_rolls = HologramRollsDetails.objects.filter(
-                Q(received_date__year__lt=prev_year) |
-                Q(received_date__year=prev_year, received_date__month__lte=prev_month),
-                type=hologram_type
-            )
-            if licensee_id:
-                normalized_license = str(licensee_id).strip()
-                if any(ch.isalpha() for ch in normalized_license) or '/' in normalized_license:
-                    all_prev_rolls = all_prev_rolls.filter(
-                        Q(license_id=normalized_license) | Q(procurement__licensee__licensee_id=normalized_license)
-                    )
-                else:
-                    all_prev_rolls = all_prev_rolls.filter(procurement__licensee_id=normalized_license)
-            
-            total_received = all_prev_rolls.aggregate(total=Sum('total_count'))['total'] or 0
-            
-            # Get all usage up to previous month
-            all_prev_usage = DailyHologramRegister.objects.filter(
-                Q(usage_date__year__lt=prev_year) |
-                Q(usage_date__year=prev_year, usage_date__month__lte=prev_month),
-                hologram_type=hologram_type,
-                approval_status='APPROVED'
-            )
-            if licensee_id:
-                normalized_license = str(licensee_id).strip()
-                if any(ch.isalpha() for ch in normalized_license) or '/' in normalized_license:
-                    all_prev_usage = all_prev_usage.filter(
-                        Q(license_id=normalized_license) | Q(licensee__licensee_id=normalized_license)
-                    )
-                else:
-                    all_prev_usage = all_prev_usage.filter(licensee_id=normalized_license)
-            
-            total_prev_utilized = all_prev_usage.aggregate(total=Sum('issued_qty'))['total'] or 0
-            total_prev_wastage = all_prev_usage.aggregate(total=Sum('wastage_qty'))['total'] or 0
-            
-            opening_stock = total_received - total_prev_utilized - total_prev_wastage
-        
-        # Calculate closing balance
-        closing_balance = opening_stock + fresh_arrivals - total_utilized - total_wastage
-        
+        arrival_count = len(arrivals)
+        utilization_count = sum(1 for entry in daily_entries if (entry.issued_qty or 0) > 0)
+        wastage_count = sum(1 for entry in daily_entries if (entry.wastage_qty or 0) > 0)
+
         # Build statement rows
         statement_rows = []
         
@@ -3591,11 +3410,11 @@ class HologramMonthlyReportViewSet(viewsets.ViewSet):
             })
         
         # Add utilization/wastage rows
-        for date, entries in sorted(entries_by_date.items()):
+        for usage_date, entries in sorted(entries_by_date.items()):
             for entry in entries:
                 row = {
                     'rowType': 'UTILIZATION',
-                    'label': f"Utilization - {date.strftime('%d %b %Y')}",
+                    'label': f"Utilization - {usage_date.strftime('%d %b %Y')}",
                     'brandDetails': entry.brand_details or '-',
                     'bottleSize': entry.bottle_size or '-',
                     'utilizationFrom': entry.issued_from or '-',
@@ -3659,7 +3478,7 @@ class HologramMonthlyReportViewSet(viewsets.ViewSet):
                 'closingBalance': closing_balance
             },
             'statementRows': statement_rows,
-            'approvedEntriesCount': daily_entries.count(),
+            'approvedEntriesCount': len(daily_entries),
             'previousMonthBalance': opening_stock
         }
         
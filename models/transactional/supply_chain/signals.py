@@ -0,0 +1,54 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from auth.user.models import OICOfficerAssignment
+from models.masters.license.models import License
+from models.masters.supply_chain.profile.models import UserManufacturingUnit
+
+from .access_control import invalidate_license_scope, invalidate_license_scopes
+
+
+def _license_changed(sender, instance, **kwargs):
+    # A license can widen the scope of its applicant and of the applicant of its
+    # source application, so every cached scope is dropped.
+    transaction.on_commit(invalidate_license_scopes)
+
+
+def _remember_oic_officer(sender, instance, **kwargs):
+    # A reassignment must also drop the scope of the officer it is taken from.
+    instance._previous_officer_id = (
+        sender._base_manager.filter(pk=instance.pk).values_list('officer_id', flat=True).first()
+        if instance.pk else None
+    )
+
+
+def _oic_assignment_changed(sender, instance, **kwargs):
+    officer_ids = {instance.officer_id, getattr(instance, '_previous_officer_id', None)} - {None}
+    instance._previous_officer_id = None
+
+    def invalidate():
+        for officer_id in officer_ids:
+            invalidate_license_scope(officer_id)
+
+    transaction.on_commit(invalidate)
+
+
+def _manufacturing_unit_changed(sender, instance, **kwargs):
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_license_scope(user_id))
+
+
+SCOPE_RECEIVERS = (
+    (License, _license_changed),
+    (OICOfficerAssignment, _oic_assignment_changed),
+    (UserManufacturingUnit, _manufacturing_unit_changed),
+)
+
+
+def connect_license_scope_signals():
+    """Drop cached `LicenseScope`s when the data they are built from changes."""
+    for model, receiver in SCOPE_RECEIVERS:
+        label = model._meta.label_lower
+        post_save.connect(receiver, sender=model, dispatch_uid=f'license_scope_save_{label}')
+        post_delete.connect(receiver, sender=model, dispatch_uid=f'license_scope_delete_{label}')
+    pre_save.connect(_remember_oic_officer, sender=OICOfficerAssignment, dispatch_uid='license_scope_pre_save_oic')
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-19 19:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallet', '0006_link_legacy_wallet_utrs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wallettransaction',
+            index=models.Index(fields=['created_at', 'wallet_transaction_id'], name='wallet_tran_created_a91620_idx'),
+        ),
+    ]
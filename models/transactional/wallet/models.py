@@ -302,6 +302,9 @@ class WalletTransaction(models.Model):
 
     class Meta:
         db_table = "wallet_transactions"
+        indexes = [
+            models.Index(fields=["created_at", "wallet_transaction_id"]),
+        ]
 
     def save(self, *args, **kwargs):
         self.licensee_id = _resolve_wallet_row_licensee_id(self.licensee_id, getattr(self, "user_id", "") or "")
@@ -9,6 +9,8 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from utils.pagination import KeysetPagination
+
 from .models import (
     WalletBalance,
     WalletTransaction,
@@ -145,6 +147,20 @@ def _safe_limit(raw_limit=None, default: int = 100, max_limit: int = 1000) -> in
         return default
 
 
+def _wallet_transactions_response(request, qs, effective_id, default_limit: int):
+    paginator = KeysetPagination()
+    page = paginator.paginate_queryset(qs, request)
+    if page is not None:
+        response = paginator.get_paginated_response(WalletTransactionSerializer(page, many=True).data)
+        response.data["licensee_id"] = effective_id
+        return response
+
+    # Legacy clients (X-Pagination: off) keep the capped, unpaginated list.
+    limit = _safe_limit(request.query_params.get("limit"), default=default_limit)
+    qs = qs[:limit]
+    return Response({"licensee_id": effective_id, "count": len(qs), "results": WalletTransactionSerializer(qs, many=True).data})
+
+
 def _normalize_wallet_type(wallet_type: str) -> str:
     value = str(wallet_type or "").strip().lower()
     if value in {"education", "educationcess", "education_cess", "education-cess"}:
@@ -266,10 +282,7 @@ def wallet_recharge_list(request, licensee_id):
     if head_of_account:
         qs = qs.filter(head_of_account=head_of_account)
 
-    limit = _safe_limit(request.query_params.get("limit"), default=200)
-    qs = qs[:limit]
-
-    return Response({"licensee_id": effective_id, "count": len(qs), "results": WalletTransactionSerializer(qs, many=True).data})
+    return _wallet_transactions_response(request, qs, effective_id, default_limit=200)
 
 
 @api_view(["GET"])
@@ -303,10 +316,7 @@ def wallet_history_list(request, licensee_id):
     if entry_type:
         qs = qs.filter(entry_type__iexact=entry_type)
 
-    limit = _safe_limit(request.query_params.get("limit"), default=500)
-    qs = qs[:limit]
-
-    return Response({"licensee_id": effective_id, "count": len(qs), "results": WalletTransactionSerializer(qs, many=True).data})
+    return _wallet_transactions_response(request, qs, effective_id, default_limit=500)
 
 
 @api_view(["POST"])
@@ -0,0 +1,57 @@
+"""
+Version counters kept in the shared cache (Redis).
+
+A version counter lets process-local or cached data be invalidated across all
+workers: readers remember the version they built their data for, writers bump
+the counter. Cache outages are tolerated: `get_version` returns None and callers
+should then treat any locally held data as stale.
+"""
+from django.core.cache import cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = 'version'
+
+
+def _version_key(name: str) -> str:
+    return f"{VERSION_KEY_PREFIX}:{name}"
+
+
+def get_version(name: str):
+    """Current version for `name` (initialized to 1), or None if the cache is unavailable."""
+    key = _version_key(name)
+    try:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, 1, timeout=None)
+            version = cache.get(key)
+        return version
+    except Exception:
+        logger.warning("Cache unavailable while reading version %s", name, exc_info=True)
+        return None
+
+
+def get_versions(*names: str) -> dict:
+    """Current versions for several counters in one cache round trip."""
+    keys = {_version_key(name): name for name in names}
+    try:
+        found = cache.get_many(list(keys))
+    except Exception:
+        logger.warning("Cache unavailable while reading versions %s", names, exc_info=True)
+        return {name: None for name in names}
+    versions = {}
+    for key, name in keys.items():
+        versions[name] = found[key] if key in found else get_version(name)
+    return versions
+
+
+def bump_version(name: str):
+    """Invalidate everything built for the current version of `name`."""
+    key = _version_key(name)
+    try:
+        cache.add(key, 1, timeout=None)
+        return cache.incr(key)
+    except Exception:
+        logger.warning("Cache unavailable while bumping version %s", name, exc_info=True)
+        return None
@@ -0,0 +1,174 @@
+"""
+camelCase JSON renderer and parser (the project's DEFAULT_RENDERER_CLASSES /
+DEFAULT_PARSER_CLASSES entries).
+
+Drop-in replacements for `djangorestframework_camel_case`'s
+`CamelCaseJSONRenderer` and `CamelCaseJSONParser` with identical output. The
+library converts every key of every payload with a regex; here each key is
+converted once per process and remembered (`camelize_key`/`underscore_key`,
+bounded LRUs), so a list of 10k rows with 20 fields costs 20 regex runs, not
+200k. Field names are the same across rows and endpoints, so the caches stay
+small; keys of free-form dict fields are simply cached too.
+
+With `orjson` installed the renderer encodes with it. `orjson` differs from
+`json.dumps` on a few inputs, so those payloads take the stdlib path instead:
+floats `repr` writes with an exponent (and NaN/inf), integers outside 64 bits,
+non-string keys and anything `rest_framework`'s encoder would turn into a
+container. Datetimes, decimals etc. are handed to that encoder, so they come
+out exactly as before. Indented output (browsable API, `; indent=`) also uses
+the stdlib path.
+"""
+from functools import lru_cache
+import json
+
+from django.conf import settings
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case import util
+from djangorestframework_camel_case.settings import api_settings as camel_settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+KEY_CACHE_SIZE = 8192
+
+# `repr(float)` switches to exponent notation outside this range; orjson writes those differently.
+_PLAIN_FLOAT_MIN = 1e-4
+_PLAIN_FLOAT_MAX = 1e16
+
+_LEAF_TYPES = (str, int, bool, type(None))
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def camelize_key(key):
+    return util.camelize_re.sub(util.underscore_to_camel, key)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def underscore_key(key, no_underscore_before_number=False):
+    return util.camel_to_underscore(key, no_underscore_before_number=no_underscore_before_number)
+
+
+def _options():
+    options = camel_settings.JSON_UNDERSCOREIZE
+    # ignore_fields/ignore_keys need per-key checks; leave them to the library.
+    simple = not options.get("ignore_fields") and not options.get("ignore_keys")
+    return options, simple
+
+
+def _plain_float(value):
+    return value == 0 or _PLAIN_FLOAT_MIN <= abs(value) < _PLAIN_FLOAT_MAX
+
+
+class _Camelizer:
+    """`util.camelize` with cached keys; notes floats orjson would write differently."""
+
+    __slots__ = ("orjson_safe",)
+
+    def __init__(self):
+        self.orjson_safe = True
+
+    def __call__(self, data):
+        data_type = type(data)
+        if data_type in _LEAF_TYPES:
+            return data
+        if data_type is float:
+            if self.orjson_safe and not _plain_float(data):
+                self.orjson_safe = False
+            return data
+        if isinstance(data, Promise):
+            data = force_str(data)
+        if isinstance(data, dict):
+            result = {}
+            for key, value in data.items():
+                if isinstance(key, Promise):
+                    key = force_str(key)
+                if isinstance(key, str) and "_" in key:
+                    key = camelize_key(key)
+                result[key] = self(value)
+            return result
+        if isinstance(data, str):
+            return data
+        if data_type is list or data_type is tuple:
+            return [self(item) for item in data]
+        if util.is_iterable(data):
+            return [self(item) for item in data]
+        return data
+
+
+def camelize(data):
+    options, simple = _options()
+    if not simple:
+        return util.camelize(data, **options)
+    return _Camelizer()(data)
+
+
+def underscoreize(data, no_underscore_before_number=False):
+    """`util.underscoreize` for parsed JSON (dicts, lists and scalars) with cached keys."""
+    if isinstance(data, dict):
+        return {
+            underscore_key(key, no_underscore_before_number) if isinstance(key, str) else key:
+                underscoreize(value, no_underscore_before_number)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [underscoreize(item, no_underscore_before_number) for item in data]
+    return data
+
+
+_drf_encoder = encoders.JSONEncoder()
+
+
+def _orjson_default(obj):
+    value = _drf_encoder.default(obj)
+    if isinstance(value, str) or (type(value) is float and _plain_float(value)):
+        return value
+    raise TypeError("needs the stdlib encoder")
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        options, simple = _options()
+        if not simple:
+            return super().render(util.camelize(data, **options), accepted_media_type, renderer_context)
+
+        camelizer = _Camelizer()
+        data = camelizer(data)
+        if orjson is not None and camelizer.orjson_safe and self._orjson_compatible(accepted_media_type, renderer_context):
+            try:
+                ret = orjson.dumps(data, default=_orjson_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            except TypeError:
+                pass
+            else:
+                return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+        return super().render(data, accepted_media_type, renderer_context)
+
+    def _orjson_compatible(self, accepted_media_type, renderer_context):
+        # orjson writes compact, non-ASCII-escaped output only.
+        return (
+            self.compact and self.strict and not self.ensure_ascii
+            and self.get_indent(accepted_media_type, renderer_context or {}) is None
+        )
+
+
+class CamelCaseJSONParser(JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            data = json.loads(stream.read().decode(encoding))
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+        options, simple = _options()
+        if not simple:
+            return util.underscoreize(data, **options)
+        return underscoreize(data, bool(options.get("no_underscore_before_number")))
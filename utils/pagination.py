@@ -0,0 +1,250 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+`KeysetPagination` is the project-wide `DEFAULT_PAGINATION_CLASS`. Pages are
+read with ``WHERE (ordering columns) < (last row's values)`` instead of
+``OFFSET``, so page 1000 costs the same as page 1 as long as the ordering is
+backed by an index.
+
+The ordering is, in order of preference: the view's `keyset_ordering`, the
+queryset's ``order_by()``, the model's ``Meta.ordering``, and finally
+``-created_at`` (when the model has one). The primary key is always appended
+as a tie breaker. Orderings that cannot be compared safely (expressions,
+related or nullable fields) fall back to the default.
+
+Query parameters:
+
+- ``cursor``: opaque position returned as ``next``/``previous``.
+- ``page_size``: capped at `KEYSET_PAGINATION_MAX_PAGE_SIZE`.
+- ``include_count=approx``: adds an approximate ``count`` (``pg_class.reltuples``
+  for unfiltered lists, the planner's row estimate otherwise).
+
+Clients that still expect the old unpaginated list send ``X-Pagination: off``.
+"""
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_MAX_PAGE_SIZE = 200
+LEGACY_HEADER = 'HTTP_X_PAGINATION'
+LEGACY_VALUES = {'off', 'none', 'legacy'}
+COUNT_VALUES = {'approx', 'approximate', '1', 'true'}
+
+Cursor = namedtuple('Cursor', ['values', 'reverse'])
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        # isoformat keeps microseconds; anything coarser would skip rows.
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def encode_cursor(cursor):
+    payload = json.dumps({'v': [_encode_value(v) for v in cursor.values], 'r': int(cursor.reverse)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(encoded, model, fields):
+    """
+    `Cursor` for `encoded` with values converted by `fields`' model fields;
+    raises `NotFound` for anything we did not issue.
+    """
+    try:
+        padded = encoded + '=' * (-len(encoded) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        values, reverse = payload['v'], bool(payload['r'])
+    except (TypeError, ValueError, KeyError, binascii.Error, UnicodeDecodeError):
+        raise NotFound('Invalid cursor')
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise NotFound('Invalid cursor')
+    try:
+        values = [model._meta.get_field(name).to_python(value) for (name, _), value in zip(fields, values)]
+    except (ValidationError, TypeError, ValueError):
+        raise NotFound('Invalid cursor')
+    return Cursor(values, reverse)
+
+
+def _default_ordering(model):
+    fields = []
+    try:
+        created_at = model._meta.get_field('created_at')
+    except FieldDoesNotExist:
+        created_at = None
+    if created_at is not None and created_at.concrete and not created_at.null:
+        fields.append((created_at.attname, True))
+    fields.append((model._meta.pk.attname, True))
+    return fields
+
+
+def resolve_ordering(queryset, ordering=None):
+    """
+    `[(attname, descending), ...]` to paginate `queryset` by, ending with the
+    primary key.
+    """
+    model = queryset.model
+    if ordering is None:
+        ordering = queryset.query.order_by
+        if not ordering and queryset.query.default_ordering:
+            ordering = model._meta.ordering
+
+    pk = model._meta.pk
+    fields = []
+    for item in ordering or ():
+        if not isinstance(item, str) or '__' in item or item.lstrip('-') == '?':
+            return _default_ordering(model)
+        name = item.lstrip('-')
+        try:
+            field = pk if name == 'pk' else model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return _default_ordering(model)
+        if not field.concrete or field.null or field.is_relation:
+            return _default_ordering(model)
+        fields.append((field.attname, item.startswith('-')))
+        if field.primary_key:
+            return fields
+
+    if not fields:
+        return _default_ordering(model)
+    fields.append((pk.attname, fields[-1][1]))
+    return fields
+
+
+def approximate_count(queryset):
+    """Row estimate for `queryset` without scanning it."""
+    if queryset.query.is_empty():
+        return 0
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been vacuumed or analyzed.
+        if row and row[0] >= 0:
+            return int(row[0])
+        return queryset.count()
+
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    count_query_param = 'include_count'
+
+    def __init__(self):
+        self.page_size = api_settings.PAGE_SIZE or DEFAULT_PAGE_SIZE
+        self.max_page_size = getattr(settings, 'KEYSET_PAGINATION_MAX_PAGE_SIZE', DEFAULT_MAX_PAGE_SIZE)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, TypeError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def _order_by(self, reverse):
+        return ['-' + name if descending != reverse else name for name, descending in self.fields]
+
+    def _beyond(self, values, reverse):
+        # (a, b, pk) < (x, y, z) spelled out for mixed directions. The leading
+        # range on the first column lets the index bound the scan.
+        condition = Q()
+        equal = {}
+        for (name, descending), value in zip(self.fields, values):
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        first_name, first_descending = self.fields[0]
+        first_lookup = 'lte' if first_descending != reverse else 'gte'
+        return Q(**{f'{first_name}__{first_lookup}': values[0]}) & condition
+
+    def _position(self, obj):
+        return [getattr(obj, name) for name, _ in self.fields]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.META.get(LEGACY_HEADER, '').strip().lower() in LEGACY_VALUES:
+            return None
+        if not isinstance(queryset, QuerySet):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = resolve_ordering(queryset, getattr(view, 'keyset_ordering', None))
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        cursor = decode_cursor(encoded, queryset.model, self.fields) if encoded else None
+        reverse = bool(cursor and cursor.reverse)
+
+        page_qs = queryset.order_by(*self._order_by(reverse))
+        if cursor is not None:
+            page_qs = page_qs.filter(self._beyond(cursor.values, reverse))
+        rows = list(page_qs[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = True if reverse else has_more
+        has_previous = has_more if reverse else cursor is not None
+        self.next_cursor = Cursor(self._position(rows[-1]), False) if rows and has_next else None
+        self.previous_cursor = Cursor(self._position(rows[0]), True) if rows and has_previous else None
+
+        self.count = None
+        if str(request.query_params.get(self.count_query_param, '')).strip().lower() in COUNT_VALUES:
+            self.count = approximate_count(queryset)
+        return rows
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encode_cursor(cursor))
+
+    def get_paginated_response(self, data):
+        payload = {
+            'next': self._link(self.next_cursor),
+            'previous': self._link(self.previous_cursor),
+        }
+        if self.count is not None:
+            payload['count'] = self.count
+            payload['count_is_approximate'] = True
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'count': {'type': 'integer'},
+                'count_is_approximate': {'type': 'boolean'},
+                'results': schema,
+            },
+        }
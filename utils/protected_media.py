@@ -0,0 +1,93 @@
+"""
+Serving uploaded files from permission-checked views.
+
+Views do their access check and then return `serve_protected_file(request,
+field_file)`. Depending on `PROTECTED_MEDIA_SERVER` the transfer is handed to
+the front web server or streamed by Django:
+
+- ``'nginx'``: an empty response with ``X-Accel-Redirect`` pointing at
+  `PROTECTED_MEDIA_INTERNAL_URL` + the storage name. nginx needs a matching
+  internal location, e.g.::
+
+      location /protected-media/ {
+          internal;
+          alias /srv/excise/media/;
+      }
+
+- ``'sendfile'``: an empty response with ``X-Sendfile`` set to the file's
+  absolute path (Apache mod_xsendfile, lighttpd).
+- ``'django'`` (development default): a `RangedFileResponse` from
+  django-ranged-response, so Range requests still work without a front server.
+
+Every mode sends ``ETag``, ``Last-Modified``, ``Accept-Ranges`` and a private
+``Cache-Control``, and answers conditional GETs with 304 before touching the
+file contents.
+"""
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from ranged_response import RangedFileResponse
+
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+
+def _stat(field_file):
+    storage = field_file.storage
+    try:
+        path = storage.path(field_file.name)
+    except NotImplementedError:
+        return None, storage.size(field_file.name), storage.get_modified_time(field_file.name).timestamp()
+    stat = os.stat(path)
+    return path, stat.st_size, stat.st_mtime
+
+
+def serve_protected_file(request, field_file, etag=None, max_age=DEFAULT_MAX_AGE, as_attachment=False):
+    """
+    Response for an uploaded file the caller has already authorised.
+
+    `etag` defaults to one derived from the file's size and modification time;
+    pass a content checksum when one is known. Raises `OSError` when the file
+    is missing from storage.
+    """
+    path, size, mtime = _stat(field_file)
+    etag = quote_etag(etag) if etag else f'W/"{int(mtime):x}-{size:x}"'
+    last_modified = int(mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _transfer_response(request, field_file, path, size)
+
+    filename = os.path.basename(field_file.name)
+    disposition = 'attachment' if as_attachment else 'inline'
+    response['Content-Disposition'] = f"{disposition}; filename*=UTF-8''{quote(filename)}"
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    response['Cache-Control'] = f'private, max-age={int(max_age)}'
+    return response
+
+
+def _transfer_response(request, field_file, path, size):
+    content_type = mimetypes.guess_type(field_file.name)[0] or 'application/octet-stream'
+    server = getattr(settings, 'PROTECTED_MEDIA_SERVER', 'django')
+
+    if server == 'nginx':
+        response = HttpResponse(content_type=content_type)
+        internal_url = getattr(settings, 'PROTECTED_MEDIA_INTERNAL_URL', '/protected-media/')
+        response['X-Accel-Redirect'] = f"{internal_url.rstrip('/')}/{quote(field_file.name)}"
+        return response
+
+    if server == 'sendfile' and path:
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = path
+        return response
+
+    response = RangedFileResponse(request, field_file.storage.open(field_file.name, 'rb'), content_type=content_type)
+    if 'Content-Range' not in response:
+        response['Content-Length'] = str(size)
+    return response
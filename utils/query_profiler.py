@@ -0,0 +1,139 @@
+"""
+Per-endpoint query profiling.
+
+`QueryProfilerMiddleware` wraps each request in `connection.execute_wrapper`
+and records, per resolved URL name, the number of queries, repeated SQL
+fingerprints (the usual sign of an N+1), time spent in the database and total
+time. Samples go into a per-process ring buffer (`profiles`) that admins read
+from ``/transactional/logs/query-profile/``.
+
+Enable with ``QUERY_PROFILER_ENABLED=1``; when disabled the middleware removes
+itself at startup.
+"""
+import re
+import threading
+import time
+from collections import Counter, deque
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.utils import timezone
+
+_IN_LIST = re.compile(r'\bIN \((?:%s, )*%s\)', re.IGNORECASE)
+_NUMBER = re.compile(r'\b\d+\b')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_SPACE = re.compile(r'\s+')
+
+TOP_DUPLICATES = 5
+
+
+def fingerprint(sql):
+    """`sql` with literals and IN-list lengths folded, so N+1 variants collide."""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _SPACE.sub(' ', sql).strip()
+
+
+class QueryRecorder:
+    """`execute_wrapper` callable that counts and times queries."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    def duplicates(self, limit=TOP_DUPLICATES):
+        return [
+            {'fingerprint': sql, 'count': count}
+            for sql, count in self.fingerprints.most_common(limit)
+            if count > 1
+        ]
+
+
+class ProfileBuffer:
+    """Bounded, thread-safe buffer of the most recent request samples."""
+
+    def __init__(self, size):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, sample):
+        with self._lock:
+            self._samples.append(sample)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def samples(self, view_name=None):
+        with self._lock:
+            samples = list(self._samples)
+        if view_name:
+            samples = [sample for sample in samples if sample['view_name'] == view_name]
+        return samples
+
+    def summary(self, view_name=None):
+        """Per-view aggregates, heaviest endpoints (by max query count) first."""
+        grouped = {}
+        for sample in self.samples(view_name):
+            grouped.setdefault(sample['view_name'], []).append(sample)
+
+        rows = []
+        for name, samples in grouped.items():
+            worst = max(samples, key=lambda sample: sample['queries'])
+            count = len(samples)
+            rows.append({
+                'view_name': name,
+                'requests': count,
+                'avg_queries': round(sum(sample['queries'] for sample in samples) / count, 1),
+                'max_queries': worst['queries'],
+                'avg_db_ms': round(sum(sample['db_ms'] for sample in samples) / count, 2),
+                'avg_total_ms': round(sum(sample['total_ms'] for sample in samples) / count, 2),
+                'max_total_ms': max(sample['total_ms'] for sample in samples),
+                'duplicates': worst['duplicates'],
+            })
+        rows.sort(key=lambda row: row['max_queries'], reverse=True)
+        return rows
+
+
+profiles = ProfileBuffer(getattr(settings, 'QUERY_PROFILER_BUFFER_SIZE', 500))
+
+
+class QueryProfilerMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, 'QUERY_PROFILER_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        total_time = time.perf_counter() - started
+
+        match = getattr(request, 'resolver_match', None)
+        if match is not None:
+            profiles.record({
+                'view_name': match.view_name or match.route,
+                'route': match.route,
+                'method': request.method,
+                'status': response.status_code,
+                'queries': recorder.queries,
+                'duplicates': recorder.duplicates(),
+                'db_ms': round(recorder.db_time * 1000, 2),
+                'total_ms': round(total_time * 1000, 2),
+                'at': timezone.now().isoformat(),
+            })
+        return response
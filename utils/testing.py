@@ -0,0 +1,46 @@
+"""Test helpers shared by app test suites."""
+from django.db import connection
+from django.urls import reverse
+
+from utils.query_profiler import QueryRecorder
+
+
+class QueryBudgetMixin:
+    """
+    `assert_query_budget` for `TestCase`s with a `self.client` that is already
+    authenticated for the endpoint under test.
+    """
+
+    def assert_query_budget(self, view_name, max_queries, add_row, *, params=None, args=None, kwargs=None, sizes=(1, 5)):
+        """
+        GET `view_name` after growing the data set to each of `sizes` rows with
+        `add_row(index)`. Fails when a response needs more than `max_queries`
+        queries or when the query count grows with the number of rows.
+        """
+        url = reverse(view_name, args=args, kwargs=kwargs)
+        # Warm process-level caches (content types, workflow stages) first.
+        self.client.get(url, params)
+
+        counts = []
+        created = 0
+        for size in sizes:
+            while created < size:
+                add_row(created)
+                created += 1
+            recorder = QueryRecorder()
+            with connection.execute_wrapper(recorder):
+                response = self.client.get(url, params)
+            self.assertLess(response.status_code, 400, f"{view_name} returned {response.status_code}")
+            counts.append((size, recorder.queries, recorder.duplicates()))
+
+        for size, queries, duplicates in counts:
+            self.assertLessEqual(
+                queries, max_queries,
+                f"{view_name} ran {queries} queries for {size} rows (budget {max_queries}); repeated: {duplicates}",
+            )
+        (first_size, first_queries, _), (last_size, last_queries, duplicates) = counts[0], counts[-1]
+        self.assertLessEqual(
+            last_queries, first_queries,
+            f"{view_name} ran {first_queries} queries for {first_size} rows but {last_queries} for {last_size}; "
+            f"repeated: {duplicates}",
+        )